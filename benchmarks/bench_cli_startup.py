@@ -0,0 +1,109 @@
+"""
+Benchmark for command line cold start time of each MFA subcommand
+
+For every subcommand registered on :data:`~montreal_forced_aligner.command_line.mfa.mfa_cli`, starts a
+fresh interpreter that imports the CLI and resolves that command, measuring wall time and the
+modules with the largest cumulative import time via ``python -X importtime``.  Results are reported
+as JSON.
+
+With ``--record``, measured times plus headroom are saved as the budget.  Otherwise, if a budget
+file exists, the benchmark exits with a non-zero status when any command's cold start exceeds its
+budget, so it can be used as a regression check.
+
+Example
+-------
+
+.. code-block:: bash
+
+   python benchmarks/bench_cli_startup.py --record
+   python benchmarks/bench_cli_startup.py
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import subprocess
+import sys
+import time
+import typing
+
+from montreal_forced_aligner.command_line.mfa import mfa_cli
+
+DEFAULT_BUDGET_PATH = pathlib.Path(__file__).with_name("cli_startup_budget.json")
+
+RESOLVE_COMMAND = (
+    "from montreal_forced_aligner.command_line.mfa import mfa_cli; "
+    "mfa_cli.get_command(None, {command!r})"
+)
+
+
+def parse_import_times(stderr: str, top: int) -> list[dict[str, float]]:
+    """Parse ``-X importtime`` output into the modules with the largest cumulative import times"""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        modules.append(
+            {
+                "module": name.strip(),
+                "self_seconds": int(self_time) / 1e6,
+                "cumulative_seconds": int(cumulative) / 1e6,
+            }
+        )
+    modules.sort(key=lambda x: -x["cumulative_seconds"])
+    return modules[:top]
+
+
+def measure(command: str, repeats: int, top: int) -> dict[str, typing.Any]:
+    """Measure the best cold start time over several fresh interpreters for a command"""
+    best = None
+    profile = None
+    for _ in range(repeats):
+        begin = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", RESOLVE_COMMAND.format(command=command)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        duration = time.perf_counter() - begin
+        if best is None or duration < best:
+            best = duration
+            profile = parse_import_times(proc.stderr, top)
+    return {"seconds": best, "slowest_imports": profile}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--commands", nargs="*", default=None)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget_path", type=pathlib.Path, default=DEFAULT_BUDGET_PATH)
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--headroom", type=float, default=0.25)
+    parser.add_argument("--output_path", type=pathlib.Path, default=None)
+    args = parser.parse_args()
+
+    commands = args.commands or mfa_cli.list_commands(None)
+    results = {c: measure(c, args.repeats, args.top) for c in commands}
+    regressions = {}
+    if args.record:
+        budget = {c: round(r["seconds"] * (1 + args.headroom), 3) for c, r in results.items()}
+        args.budget_path.write_text(json.dumps(budget, indent=2, sort_keys=True), encoding="utf8")
+    elif args.budget_path.exists():
+        budget = json.loads(args.budget_path.read_text(encoding="utf8"))
+        for c, r in results.items():
+            if c in budget and r["seconds"] > budget[c]:
+                regressions[c] = {"seconds": r["seconds"], "budget": budget[c]}
+    output = json.dumps({"commands": results, "regressions": regressions}, indent=2)
+    print(output)
+    if args.output_path is not None:
+        args.output_path.write_text(output, encoding="utf8")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark for phone boundary fine tuning throughput
+
+Aligns a corpus with a pretrained acoustic model, then times
+:meth:`~montreal_forced_aligner.alignment.base.CorpusAligner.fine_tune_alignments` and reports
+phone boundaries refined per second as JSON.
+
+The benchmark only uses the public aligner API, so a baseline can be recorded from an earlier
+checkout with ``--record`` and compared against after a change.  When a baseline file exists,
+the speedup relative to it is included in the report.
+
+Example
+-------
+
+.. code-block:: bash
+
+   git worktree add ../mfa_baseline <baseline_commit>
+   PYTHONPATH=../mfa_baseline python benchmarks/bench_fine_tune.py ~/corpora/librispeech english_us_arpa english_us_arpa --record
+   python benchmarks/bench_fine_tune.py ~/corpora/librispeech english_us_arpa english_us_arpa
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import time
+
+import sqlalchemy
+
+from montreal_forced_aligner import config
+from montreal_forced_aligner.alignment import PretrainedAligner
+from montreal_forced_aligner.db import PhoneInterval
+from montreal_forced_aligner.models import AcousticModel, DictionaryModel
+
+DEFAULT_BASELINE_PATH = pathlib.Path(__file__).with_name("fine_tune_baseline.json")
+
+
+def count_boundaries(aligner: PretrainedAligner) -> int:
+    """Count phone boundaries that fine tuning refines, one fewer than intervals per utterance"""
+    workflow_id = aligner.current_workflow.id
+    with aligner.session() as session:
+        num_intervals, num_utterances = (
+            session.query(
+                sqlalchemy.func.count(PhoneInterval.id),
+                sqlalchemy.func.count(sqlalchemy.distinct(PhoneInterval.utterance_id)),
+            )
+            .filter(PhoneInterval.workflow_id == workflow_id)
+            .one()
+        )
+    return num_intervals - num_utterances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("corpus_directory", type=pathlib.Path)
+    parser.add_argument("dictionary_path", type=str)
+    parser.add_argument("acoustic_model_path", type=str)
+    parser.add_argument("--num_jobs", type=int, default=config.NUM_JOBS)
+    parser.add_argument("--baseline_path", type=pathlib.Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--output_path", type=pathlib.Path, default=None)
+    args = parser.parse_args()
+    config.NUM_JOBS = args.num_jobs
+    config.CLEAN = True
+    config.QUIET = True
+    dictionary_path = args.dictionary_path
+    if not pathlib.Path(dictionary_path).exists():
+        dictionary_path = DictionaryModel.get_pretrained_path(dictionary_path)
+    acoustic_model_path = args.acoustic_model_path
+    if not pathlib.Path(acoustic_model_path).exists():
+        acoustic_model_path = AcousticModel.get_pretrained_path(acoustic_model_path)
+    aligner = PretrainedAligner(
+        corpus_directory=args.corpus_directory,
+        dictionary_path=dictionary_path,
+        acoustic_model_path=acoustic_model_path,
+        fine_tune=False,
+    )
+    try:
+        aligner.align()
+        num_boundaries = count_boundaries(aligner)
+        begin = time.perf_counter()
+        aligner.fine_tune_alignments()
+        duration = time.perf_counter() - begin
+        results = {
+            "num_utterances": aligner.num_utterances,
+            "num_jobs": config.NUM_JOBS,
+            "num_boundaries": num_boundaries,
+            "seconds": duration,
+            "boundaries_per_second": num_boundaries / duration if duration else None,
+        }
+    finally:
+        aligner.cleanup()
+    if args.record:
+        args.baseline_path.write_text(json.dumps(results, indent=2), encoding="utf8")
+    elif args.baseline_path.exists():
+        baseline = json.loads(args.baseline_path.read_text(encoding="utf8"))
+        results["baseline_boundaries_per_second"] = baseline["boundaries_per_second"]
+        if baseline["boundaries_per_second"] and results["boundaries_per_second"]:
+            results["speedup"] = (
+                results["boundaries_per_second"] / baseline["boundaries_per_second"]
+            )
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output_path is not None:
+        args.output_path.write_text(output, encoding="utf8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark for text normalization throughput of SimpleTokenizer
+
+Tokenizes a text corpus with :class:`~montreal_forced_aligner.tokenization.simple.SimpleTokenizer`
+with and without word-level caching, checks that both produce identical output, and reports
+tokens per second as JSON.  Text is read from a file with one utterance per line, or generated
+synthetically from a Zipfian vocabulary if no file is given.
+
+Example
+-------
+
+.. code-block:: bash
+
+   python benchmarks/bench_tokenizer.py --text_path ~/corpora/lm_text.txt --dictionary_path ~/dictionaries/english.dict
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import random
+import time
+
+import pywrapfst
+
+from montreal_forced_aligner.dictionary.mixins import DictionaryMixin
+from montreal_forced_aligner.tokenization.simple import SimpleTokenizer
+
+
+def synthetic_corpus(
+    num_utterances: int, vocabulary_size: int, seed: int = 1234
+) -> tuple[list[str], list[str]]:
+    """Generate utterances and a vocabulary with Zipfian word frequencies"""
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocabulary = sorted(
+        {"".join(rng.choices(letters, k=rng.randint(2, 9))) for _ in range(vocabulary_size)}
+    )
+    weights = [1 / (i + 1) for i in range(len(vocabulary))]
+    extras = ["[laughter]", "<cutoff-wor>", "{noise}", "it's", "l'homme", "well-known", "uh,"]
+    utterances = []
+    for _ in range(num_utterances):
+        words = rng.choices(vocabulary, weights=weights, k=rng.randint(3, 25))
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(extras))
+        utterance = " ".join(words)
+        utterances.append(utterance[0].upper() + utterance[1:] + rng.choice([".", "?", "!"]))
+    return utterances, vocabulary
+
+
+def build_tokenizer(words: list[str], word_cache_size: int) -> SimpleTokenizer:
+    """Construct a tokenizer with default MFA punctuation settings over a vocabulary"""
+    defaults = DictionaryMixin()
+    word_table = pywrapfst.SymbolTable()
+    word_table.add_symbol("<eps>")
+    for w in words:
+        word_table.add_symbol(w)
+    return SimpleTokenizer(
+        word_table=word_table,
+        word_break_markers=defaults.word_break_markers,
+        punctuation=defaults.punctuation,
+        clitic_markers=defaults.clitic_markers,
+        compound_markers=defaults.compound_markers,
+        brackets=defaults.brackets,
+        laughter_word=defaults.laughter_word,
+        oov_word=defaults.oov_word,
+        bracketed_word=defaults.bracketed_word,
+        cutoff_word=defaults.cutoff_word,
+        ignore_case=defaults.ignore_case,
+        word_cache_size=word_cache_size,
+    )
+
+
+def run(tokenizer: SimpleTokenizer, utterances: list[str], repeats: int) -> tuple[float, list]:
+    """Tokenize all utterances and return the best time over repeats along with the output"""
+    best = None
+    output = None
+    for _ in range(repeats):
+        tokenizer.word_cache.clear()
+        begin = time.perf_counter()
+        output = [tokenizer(u) for u in utterances]
+        duration = time.perf_counter() - begin
+        if best is None or duration < best:
+            best = duration
+    return best, output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--text_path", type=pathlib.Path, default=None)
+    parser.add_argument("--dictionary_path", type=pathlib.Path, default=None)
+    parser.add_argument("--num_utterances", type=int, default=100000)
+    parser.add_argument("--vocabulary_size", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output_path", type=pathlib.Path, default=None)
+    args = parser.parse_args()
+
+    utterances, vocabulary = synthetic_corpus(args.num_utterances, args.vocabulary_size)
+    if args.text_path is not None:
+        with open(args.text_path, encoding="utf8") as f:
+            utterances = [line.strip() for line in f if line.strip()]
+    if args.dictionary_path is not None:
+        with open(args.dictionary_path, encoding="utf8") as f:
+            vocabulary = sorted({line.split()[0] for line in f if line.strip()})
+
+    uncached_time, uncached_output = run(
+        build_tokenizer(vocabulary, word_cache_size=0), utterances, args.repeats
+    )
+    cached_time, cached_output = run(
+        build_tokenizer(vocabulary, word_cache_size=100000), utterances, args.repeats
+    )
+    num_tokens = sum(len(x[0].split()) for x in cached_output)
+    results = {
+        "num_utterances": len(utterances),
+        "num_tokens": num_tokens,
+        "uncached_seconds": uncached_time,
+        "cached_seconds": cached_time,
+        "uncached_tokens_per_second": num_tokens / uncached_time,
+        "cached_tokens_per_second": num_tokens / cached_time,
+        "speedup": uncached_time / cached_time,
+        "identical_output": uncached_output == cached_output,
+    }
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output_path is not None:
+        args.output_path.write_text(output, encoding="utf8")
+
+
+if __name__ == "__main__":
+    main()
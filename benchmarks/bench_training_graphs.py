@@ -0,0 +1,105 @@
+"""
+Benchmark for compiling training graphs with and without transcript-level graph caching
+
+Compiles training graphs for a corpus twice, once with :class:`kalpy.decoder.training_graphs.TrainingGraphCompiler`
+and once with :class:`~montreal_forced_aligner.alignment.multiprocessing.CachedTrainingGraphCompiler`,
+checks that the resulting graph archives are identical, and reports timings as JSON.
+
+Example
+-------
+
+.. code-block:: bash
+
+   python benchmarks/bench_training_graphs.py ~/corpora/librispeech english_us_arpa english_us_arpa --num_jobs 10
+"""
+from __future__ import annotations
+
+import argparse
+import filecmp
+import json
+import pathlib
+import shutil
+import time
+
+from montreal_forced_aligner import config
+from montreal_forced_aligner.alignment import PretrainedAligner
+from montreal_forced_aligner.data import WorkflowType
+from montreal_forced_aligner.models import AcousticModel, DictionaryModel
+
+
+def compile_graphs(aligner: PretrainedAligner, cache_graphs: bool) -> float:
+    """Compile training graphs for the aligner's corpus and return the time taken"""
+    aligner.cache_training_graphs = cache_graphs
+    begin = time.time()
+    aligner.compile_train_graphs()
+    return time.time() - begin
+
+
+def graph_archives(aligner: PretrainedAligner) -> list[pathlib.Path]:
+    """Training graph archives for all jobs of the aligner"""
+    paths = []
+    for j in aligner.jobs:
+        paths.extend(
+            j.construct_path_dictionary(aligner.working_directory, "fsts", "ark").values()
+        )
+    return sorted(p for p in paths if p.exists())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("corpus_directory", type=pathlib.Path)
+    parser.add_argument("dictionary_path", type=str)
+    parser.add_argument("acoustic_model_path", type=str)
+    parser.add_argument("--num_jobs", type=int, default=config.NUM_JOBS)
+    parser.add_argument("--output_path", type=pathlib.Path, default=None)
+    args = parser.parse_args()
+    config.NUM_JOBS = args.num_jobs
+    config.CLEAN = True
+    config.QUIET = True
+    dictionary_path = args.dictionary_path
+    if not pathlib.Path(dictionary_path).exists():
+        dictionary_path = DictionaryModel.get_pretrained_path(dictionary_path)
+    acoustic_model_path = args.acoustic_model_path
+    if not pathlib.Path(acoustic_model_path).exists():
+        acoustic_model_path = AcousticModel.get_pretrained_path(acoustic_model_path)
+    aligner = PretrainedAligner(
+        corpus_directory=args.corpus_directory,
+        dictionary_path=dictionary_path,
+        acoustic_model_path=acoustic_model_path,
+    )
+    try:
+        aligner.setup()
+        aligner.create_new_current_workflow(WorkflowType.alignment, "graph_benchmark")
+        aligner.acoustic_model.export_model(aligner.working_directory)
+
+        baseline_time = compile_graphs(aligner, cache_graphs=False)
+        baseline_directory = aligner.working_directory.joinpath("uncached_graphs")
+        baseline_directory.mkdir(parents=True, exist_ok=True)
+        for path in graph_archives(aligner):
+            shutil.move(path, baseline_directory.joinpath(path.name))
+
+        cached_time = compile_graphs(aligner, cache_graphs=True)
+        mismatches = [
+            path.name
+            for path in graph_archives(aligner)
+            if not filecmp.cmp(path, baseline_directory.joinpath(path.name), shallow=False)
+        ]
+        results = {
+            "num_utterances": aligner.num_utterances,
+            "num_jobs": config.NUM_JOBS,
+            "uncached_seconds": baseline_time,
+            "cached_seconds": cached_time,
+            "speedup": baseline_time / cached_time if cached_time else None,
+            "identical_graphs": not mismatches,
+            "mismatched_archives": mismatches,
+        }
+    finally:
+        aligner.cleanup()
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output_path is not None:
+        args.output_path.write_text(output, encoding="utf8")
+
+
+if __name__ == "__main__":
+    main()
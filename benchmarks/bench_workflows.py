@@ -0,0 +1,397 @@
+"""
+Benchmark for the core MFA workflows over synthetic corpora of increasing size
+
+Generates synthetic corpora offline for each requested scale: speakers with tone and noise WAV files
+where every phone is a distinct tone, transcripts as lab files or TextGrids, and a pronunciation
+dictionary with a regular spelling to pronunciation mapping.  Then each workflow is run through the
+Python API in a fresh process: validating the corpus, training an acoustic model, aligning with
+the trained model and exporting TextGrids, and training a G2P model and generating pronunciations
+for the corpus.  Stage timings from the pipeline profiler, total time and peak memory are reported
+as JSON, along with the scaling exponent of each workflow's run time with respect to the number of
+utterances.
+
+Generated corpora are kept in the data directory and reused by later runs with the same
+parameters.  With ``--record``, results are saved as the baseline.  Otherwise, if a baseline file
+exists, the benchmark exits with a non-zero status when any workflow at any scale is slower than
+its baseline by more than the tolerance.
+
+Example
+-------
+
+.. code-block:: bash
+
+   python benchmarks/bench_workflows.py ~/mfa_benchmarks --scales 500 5000 50000 --record
+   python benchmarks/bench_workflows.py ~/mfa_benchmarks --scales 500 5000 50000 --workflows align
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import multiprocessing as mp
+import pathlib
+import random
+import sys
+import time
+import typing
+import wave
+
+import numpy as np
+
+DEFAULT_BASELINE_PATH = pathlib.Path(__file__).with_name("workflow_baseline.json")
+
+WORKFLOWS = ["validate", "train", "align", "g2p"]
+
+WORKFLOW_DEPENDENCIES = {"align": "train"}
+
+LETTER_PHONES = {
+    "a": ["AA"],
+    "b": ["B"],
+    "d": ["D"],
+    "e": ["EH"],
+    "f": ["F"],
+    "g": ["G"],
+    "i": ["IY"],
+    "k": ["K"],
+    "l": ["L"],
+    "m": ["M"],
+    "n": ["N"],
+    "o": ["OW"],
+    "p": ["P"],
+    "r": ["R"],
+    "s": ["S"],
+    "t": ["T"],
+    "u": ["UW"],
+    "v": ["V"],
+    "x": ["K", "S"],
+    "z": ["Z"],
+}
+
+PHONE_FREQUENCIES = {
+    p: 150.0 * 1.12**i
+    for i, p in enumerate(sorted({p for x in LETTER_PHONES.values() for p in x}))
+}
+
+
+def synthesize_utterance(
+    pronunciations: list[list[str]], rng: np.random.Generator, sample_rate: int
+) -> np.ndarray:
+    """Synthesize an utterance as a tone per phone with pauses between words over background noise"""
+    segments = [np.zeros(int(rng.uniform(0.1, 0.3) * sample_rate))]
+    for pronunciation in pronunciations:
+        for phone in pronunciation:
+            duration = rng.uniform(0.04, 0.12)
+            t = np.arange(int(duration * sample_rate)) / sample_rate
+            frequency = PHONE_FREQUENCIES[phone] * rng.uniform(0.97, 1.03)
+            envelope = np.minimum(1.0, np.minimum(t, duration - t) / 0.01)
+            segments.append(0.5 * envelope * np.sin(2 * np.pi * frequency * t))
+        segments.append(np.zeros(int(rng.uniform(0.02, 0.2) * sample_rate)))
+    segments.append(np.zeros(int(rng.uniform(0.1, 0.3) * sample_rate)))
+    signal = np.concatenate(segments)
+    signal += rng.normal(0, 0.02, signal.shape[0])
+    return (np.clip(signal, -1, 1) * 32767).astype(np.int16)
+
+
+def write_wav(path: pathlib.Path, samples: np.ndarray, sample_rate: int) -> None:
+    """Write 16-bit mono samples to a WAV file"""
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(samples.tobytes())
+
+
+def write_textgrid(path: pathlib.Path, speaker: str, text: str, duration: float) -> None:
+    """Write a TextGrid with a single utterance interval on a tier named for the speaker"""
+    from praatio import textgrid
+
+    tg = textgrid.Textgrid()
+    tg.addTier(textgrid.IntervalTier(speaker, [(0.05, duration - 0.05, text)], 0, duration))
+    tg.save(str(path), format="long_textgrid", includeBlankSpaces=True)
+
+
+def generate_corpus(
+    directory: pathlib.Path,
+    num_utterances: int,
+    utterances_per_speaker: int,
+    vocabulary_size: int,
+    textgrid_fraction: float,
+    oov_rate: float,
+    sample_rate: int,
+    seed: int,
+) -> tuple[pathlib.Path, pathlib.Path]:
+    """
+    Generate a synthetic corpus and dictionary, reusing a previously generated one with the same
+    parameters
+    """
+    parameters = {
+        "num_utterances": num_utterances,
+        "utterances_per_speaker": utterances_per_speaker,
+        "vocabulary_size": vocabulary_size,
+        "textgrid_fraction": textgrid_fraction,
+        "oov_rate": oov_rate,
+        "sample_rate": sample_rate,
+        "seed": seed,
+    }
+    corpus_directory = directory.joinpath(f"synthetic_{num_utterances}")
+    dictionary_path = directory.joinpath(f"synthetic_{num_utterances}.dict")
+    manifest_path = directory.joinpath(f"synthetic_{num_utterances}.json")
+    if manifest_path.exists():
+        if json.loads(manifest_path.read_text(encoding="utf8")) == parameters:
+            return corpus_directory, dictionary_path
+    corpus_directory.mkdir(parents=True, exist_ok=True)
+    py_rng = random.Random(seed)
+    rng = np.random.default_rng(seed)
+    letters = sorted(LETTER_PHONES)
+    vocabulary = set()
+    while len(vocabulary) < vocabulary_size:
+        vocabulary.add("".join(py_rng.choices(letters, k=py_rng.randint(2, 8))))
+    vocabulary = sorted(vocabulary)
+    py_rng.shuffle(vocabulary)
+    num_oovs = int(len(vocabulary) * oov_rate)
+    dictionary_words = sorted(vocabulary[num_oovs:])
+    with open(dictionary_path, "w", encoding="utf8") as f:
+        for word in dictionary_words:
+            f.write(f"{word}\t{' '.join(p for c in word for p in LETTER_PHONES[c])}\n")
+    weights = [1 / (i + 1) for i in range(len(vocabulary))]
+    num_speakers = math.ceil(num_utterances / utterances_per_speaker)
+    for s in range(num_speakers):
+        speaker = f"speaker_{s:05d}"
+        speaker_directory = corpus_directory.joinpath(speaker)
+        speaker_directory.mkdir(exist_ok=True)
+        for u in range(min(utterances_per_speaker, num_utterances - s * utterances_per_speaker)):
+            words = py_rng.choices(vocabulary, weights=weights, k=py_rng.randint(3, 12))
+            samples = synthesize_utterance(
+                [[p for c in w for p in LETTER_PHONES[c]] for w in words], rng, sample_rate
+            )
+            name = f"{speaker}_{u:05d}"
+            write_wav(speaker_directory.joinpath(name + ".wav"), samples, sample_rate)
+            text = " ".join(words)
+            if py_rng.random() < textgrid_fraction:
+                write_textgrid(
+                    speaker_directory.joinpath(name + ".TextGrid"),
+                    speaker,
+                    text,
+                    samples.shape[0] / sample_rate,
+                )
+            else:
+                speaker_directory.joinpath(name + ".lab").write_text(text, encoding="utf8")
+    manifest_path.write_text(json.dumps(parameters, indent=2), encoding="utf8")
+    return corpus_directory, dictionary_path
+
+
+def run_workflow(
+    workflow: str,
+    corpus_directory: pathlib.Path,
+    dictionary_path: pathlib.Path,
+    model_directory: pathlib.Path,
+    num_jobs: int,
+) -> None:
+    """Run a workflow through the Python API"""
+    from montreal_forced_aligner import config
+
+    config.NUM_JOBS = num_jobs
+    config.CLEAN = True
+    config.QUIET = True
+    config.PIPELINE_REPORT = True
+    acoustic_model_path = model_directory.joinpath("acoustic_model.zip")
+    if workflow == "validate":
+        from montreal_forced_aligner.validation.corpus_validator import TrainingValidator
+
+        worker = TrainingValidator(
+            corpus_directory=corpus_directory, dictionary_path=dictionary_path
+        )
+        try:
+            worker.validate()
+        finally:
+            worker.cleanup()
+    elif workflow == "train":
+        from montreal_forced_aligner.acoustic_modeling import TrainableAligner
+
+        worker = TrainableAligner(
+            corpus_directory=corpus_directory,
+            dictionary_path=dictionary_path,
+            training_configuration=[
+                ("monophone", {"num_iterations": 10}),
+                ("triphone", {"num_iterations": 10, "num_leaves": 500, "max_gaussians": 4000}),
+            ],
+        )
+        try:
+            worker.train()
+            worker.export_model(acoustic_model_path)
+        finally:
+            worker.cleanup()
+    elif workflow == "align":
+        from montreal_forced_aligner.alignment import PretrainedAligner
+
+        worker = PretrainedAligner(
+            corpus_directory=corpus_directory,
+            dictionary_path=dictionary_path,
+            acoustic_model_path=acoustic_model_path,
+        )
+        try:
+            worker.align()
+            worker.export_files(model_directory.joinpath("alignments"))
+        finally:
+            worker.cleanup()
+    elif workflow == "g2p":
+        from montreal_forced_aligner.g2p.generator import PyniniCorpusGenerator
+        from montreal_forced_aligner.g2p.trainer import PyniniTrainer
+        from montreal_forced_aligner.profiling import PROFILER
+
+        g2p_model_path = model_directory.joinpath("g2p_model.zip")
+        worker = PyniniTrainer(dictionary_path=dictionary_path)
+        try:
+            worker.setup()
+            worker.train()
+            worker.export_model(g2p_model_path)
+        finally:
+            worker.cleanup()
+        # Constructing a worker resets the profiler, so keep the training stages
+        training_records = PROFILER.records
+        worker = PyniniCorpusGenerator(
+            corpus_directory=corpus_directory, g2p_model_path=g2p_model_path
+        )
+        PROFILER.records = training_records + PROFILER.records
+        try:
+            worker.setup()
+            worker.export_pronunciations(model_directory.joinpath("g2p_pronunciations.dict"))
+        finally:
+            worker.cleanup()
+
+
+def profile_workflow(result_path: pathlib.Path, *args) -> None:
+    """Run a workflow and save its total time, peak memory and profiled stages"""
+    from montreal_forced_aligner.profiling import PROFILER
+    from montreal_forced_aligner.utils import get_peak_memory_usage
+
+    begin = time.perf_counter()
+    run_workflow(*args)
+    total_time = time.perf_counter() - begin
+    peak_rss, peak_child_rss = get_peak_memory_usage()
+    result = {
+        "seconds": total_time,
+        "peak_rss_mb": peak_rss,
+        "peak_child_rss_mb": peak_child_rss,
+        "stages": PROFILER.summary(),
+    }
+    result_path.write_text(json.dumps(result, indent=2), encoding="utf8")
+
+
+def measure(
+    workflow: str,
+    corpus_directory: pathlib.Path,
+    dictionary_path: pathlib.Path,
+    model_directory: pathlib.Path,
+    num_jobs: int,
+) -> dict[str, typing.Any]:
+    """Run a workflow in a fresh process so that peak memory usage is specific to the workflow"""
+    model_directory.mkdir(parents=True, exist_ok=True)
+    result_path = model_directory.joinpath(f"{workflow}_result.json")
+    result_path.unlink(missing_ok=True)
+    proc = mp.get_context("spawn").Process(
+        target=profile_workflow,
+        args=(result_path, workflow, corpus_directory, dictionary_path, model_directory, num_jobs),
+    )
+    proc.start()
+    proc.join()
+    if proc.exitcode != 0 or not result_path.exists():
+        return {"error": f"{workflow} exited with status {proc.exitcode}"}
+    return json.loads(result_path.read_text(encoding="utf8"))
+
+
+def scaling_exponents(results: dict[str, dict[str, dict]]) -> dict[str, float]:
+    """Fit the exponent of run time against number of utterances in log-log space per workflow"""
+    exponents = {}
+    workflows = {w for r in results.values() for w in r}
+    for workflow in sorted(workflows):
+        points = [
+            (int(scale), r[workflow]["seconds"])
+            for scale, r in results.items()
+            if "seconds" in r.get(workflow, {})
+        ]
+        if len(points) < 2:
+            continue
+        x = np.log([p[0] for p in points])
+        y = np.log([p[1] for p in points])
+        exponents[workflow] = float(np.polyfit(x, y, 1)[0])
+    return exponents
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("data_directory", type=pathlib.Path)
+    parser.add_argument("--scales", type=int, nargs="+", default=[500, 5000, 50000])
+    parser.add_argument("--workflows", nargs="+", choices=WORKFLOWS, default=WORKFLOWS)
+    parser.add_argument("--num_jobs", type=int, default=3)
+    parser.add_argument("--utterances_per_speaker", type=int, default=50)
+    parser.add_argument("--vocabulary_size", type=int, default=5000)
+    parser.add_argument("--textgrid_fraction", type=float, default=0.5)
+    parser.add_argument("--oov_rate", type=float, default=0.01)
+    parser.add_argument("--sample_rate", type=int, default=16000)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--baseline_path", type=pathlib.Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--output_path", type=pathlib.Path, default=None)
+    args = parser.parse_args()
+
+    workflows = list(args.workflows)
+    for workflow, dependency in WORKFLOW_DEPENDENCIES.items():
+        if workflow in workflows and dependency not in workflows:
+            workflows.insert(workflows.index(workflow), dependency)
+    results = {}
+    for scale in sorted(args.scales):
+        begin = time.perf_counter()
+        corpus_directory, dictionary_path = generate_corpus(
+            args.data_directory,
+            scale,
+            args.utterances_per_speaker,
+            min(args.vocabulary_size, scale * 2),
+            args.textgrid_fraction,
+            args.oov_rate,
+            args.sample_rate,
+            args.seed,
+        )
+        generation_time = time.perf_counter() - begin
+        model_directory = args.data_directory.joinpath(f"synthetic_{scale}_models")
+        results[str(scale)] = {
+            w: measure(w, corpus_directory, dictionary_path, model_directory, args.num_jobs)
+            for w in workflows
+        }
+        results[str(scale)]["generation_seconds"] = generation_time
+    workflow_results = {
+        scale: {w: r for w, r in x.items() if w in WORKFLOWS} for scale, x in results.items()
+    }
+    regressions = {}
+    if args.record:
+        args.baseline_path.write_text(json.dumps(results, indent=2), encoding="utf8")
+    elif args.baseline_path.exists():
+        baseline = json.loads(args.baseline_path.read_text(encoding="utf8"))
+        for scale, r in workflow_results.items():
+            for workflow, result in r.items():
+                previous = baseline.get(scale, {}).get(workflow, {})
+                if "seconds" not in result or "seconds" not in previous:
+                    continue
+                if result["seconds"] > previous["seconds"] * (1 + args.tolerance):
+                    regressions[f"{workflow}:{scale}"] = {
+                        "seconds": result["seconds"],
+                        "baseline": previous["seconds"],
+                    }
+    output = json.dumps(
+        {
+            "scales": results,
+            "scaling_exponents": scaling_exponents(workflow_results),
+            "regressions": regressions,
+        },
+        indent=2,
+    )
+    print(output)
+    if args.output_path is not None:
+        args.output_path.write_text(output, encoding="utf8")
+    if regressions or any("error" in r for x in workflow_results.values() for r in x.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
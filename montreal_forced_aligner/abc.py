@@ -42,6 +42,8 @@ from montreal_forced_aligner.exceptions import (
     MultiprocessingError,
 )
 from montreal_forced_aligner.helper import comma_join, load_configuration, mfa_open
+from montreal_forced_aligner.journal import JobJournal
+from montreal_forced_aligner.profiling import PROFILER
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -72,6 +74,48 @@ class KaldiFunction(metaclass=abc.ABCMeta):
     Abstract class for running Kaldi functions
     """
 
+    #: Flag for whether most of a job's time is spent in compiled code that releases the GIL,
+    #: so that jobs can run in threads
+    releases_gil: bool = False
+    #: Expected memory usage of a single job in MB, None if unknown
+    job_memory_mb: Optional[float] = None
+
+    @classmethod
+    def estimate_job_memory(cls, args: MfaArguments) -> Optional[float]:
+        """
+        Estimate the memory a job needs before running it
+
+        Parameters
+        ----------
+        args: :class:`~montreal_forced_aligner.data.MfaArguments`
+            Arguments for the job
+
+        Returns
+        -------
+        float or None
+            Memory usage in MB, None if unknown
+        """
+        return cls.job_memory_mb
+
+    @classmethod
+    def job_outputs(cls, args: MfaArguments) -> Optional[List[Path]]:
+        """
+        Files written by a finished job, for recording it in a
+        :class:`~montreal_forced_aligner.journal.JobJournal`
+
+        Parameters
+        ----------
+        args: :class:`~montreal_forced_aligner.data.MfaArguments`
+            Arguments for the job
+
+        Returns
+        -------
+        list[:class:`~pathlib.Path`] or None
+            Files written by the job, None if the job's results are returned to the main
+            process and so it cannot be skipped when resuming
+        """
+        return None
+
     def __init__(self, args: MfaArguments):
         self.args = args
         self.db_string = None
@@ -91,8 +135,11 @@ class KaldiFunction(metaclass=abc.ABCMeta):
                 yield session
         else:
             db_engine = sqlalchemy.create_engine(self.db_string)
-            with sqlalchemy.orm.Session(db_engine) as session:
-                yield session
+            try:
+                with sqlalchemy.orm.Session(db_engine) as session:
+                    yield session
+            finally:
+                db_engine.dispose()
 
     def run(self):
         """Run the function, calls subclassed object's ``_run`` with error handling"""
@@ -168,8 +215,10 @@ class TemporaryDirectoryMixin(metaclass=abc.ABCMeta):
         ...
 
     def clean_working_directory(self) -> None:
-        """Clean up previous runs"""
+        """Clean up previous runs, along with the job journals of their working directories"""
         shutil.rmtree(self.output_directory, ignore_errors=True)
+        if hasattr(self, "_journals"):
+            self._journals = {}
 
     @property
     def corpus_output_directory(self) -> Path:
@@ -345,8 +394,11 @@ class DatabaseMixin(TemporaryDirectoryMixin, metaclass=abc.ABCMeta):
                 )
                 log_dir = os.path.join(new_workflow.working_directory, "log")
                 os.makedirs(log_dir, exist_ok=True)
+                JobJournal.delete(new_workflow.working_directory)
                 session.add(new_workflow)
             else:
+                if new_workflow.dirty and not new_workflow.done:
+                    JobJournal.delete(new_workflow.working_directory)
                 new_workflow.current = True
             session.commit()
 
@@ -573,6 +625,7 @@ class TopLevelMfaWorker(MfaWorker, TemporaryDirectoryMixin, metaclass=abc.ABCMet
         super().__init__(**kwargs)
         self.initialized = False
         self.start_time = time.time()
+        PROFILER.reset()
         self.setup_logger()
         if skipped:
             logger.warning(f"Skipped the following configuration keys: {comma_join(skipped)}")
@@ -728,10 +781,34 @@ class TopLevelMfaWorker(MfaWorker, TemporaryDirectoryMixin, metaclass=abc.ABCMet
                             self.delete_database()
                     self.clean_working_directory()
             self.save_worker_config()
+            self.export_pipeline_report()
             self.cleanup_logger()
         except (NameError, ValueError):  # already cleaned up
             pass
 
+    def export_pipeline_report(self) -> None:
+        """
+        Export per-stage timing, memory and throughput information collected by
+        :data:`~montreal_forced_aligner.profiling.PROFILER` to the output directory
+        """
+        if not PROFILER.enabled or not PROFILER.records:
+            return
+        self.output_directory.mkdir(parents=True, exist_ok=True)
+        PROFILER.export_json(
+            self.output_directory.joinpath("pipeline_report.json"),
+            identifier=self.identifier,
+            command=" ".join(sys.argv),
+            num_jobs=config.NUM_JOBS,
+            use_mp=config.USE_MP,
+            use_threading=config.USE_THREADING,
+            total_time=time.time() - self.start_time,
+        )
+        if config.PROMETHEUS_REPORT:
+            PROFILER.export_prometheus(self.output_directory.joinpath("pipeline_report.prom"))
+        logger.debug(
+            f"Exported pipeline report to {self.output_directory.joinpath('pipeline_report.json')}"
+        )
+
     def save_worker_config(self) -> None:
         """Export worker configuration to its working directory"""
         if not os.path.exists(self.output_directory):
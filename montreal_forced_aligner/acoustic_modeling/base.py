@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 import logging
+import shutil
 import time
 from abc import abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 import sqlalchemy.engine
-from _kalpy.gmm import AccumAmDiagGmm
+from _kalpy.gmm import AccumAmDiagGmm, AmDiagGmm
+from _kalpy.hmm import TransitionModel
 from _kalpy.matrix import DoubleVector
 from kalpy.gmm.utils import read_gmm_model, write_gmm_model
 from kalpy.utils import kalpy_logger
@@ -17,14 +19,30 @@ from sqlalchemy.orm import Session
 from montreal_forced_aligner import config
 from montreal_forced_aligner.abc import MfaWorker, ModelExporterMixin, TrainerMixin
 from montreal_forced_aligner.alignment import AlignMixin
-from montreal_forced_aligner.alignment.multiprocessing import AccStatsArguments, AccStatsFunction
+from montreal_forced_aligner.alignment.multiprocessing import (
+    AccStatsArguments,
+    AccStatsFunction,
+    AlignAccStatsArguments,
+    AlignAccStatsFunction,
+    SumAccsArguments,
+    SumAccsFunction,
+    read_gmm_accs,
+)
 from montreal_forced_aligner.corpus.acoustic_corpus import AcousticCorpusPronunciationMixin
 from montreal_forced_aligner.corpus.features import FeatureConfigMixin
 from montreal_forced_aligner.data import PhoneType
 from montreal_forced_aligner.db import CorpusWorkflow, Phone, Utterance
 from montreal_forced_aligner.exceptions import KaldiProcessingError
+from montreal_forced_aligner.executor import StageExecutor
+from montreal_forced_aligner.journal import JournalStep
 from montreal_forced_aligner.models import AcousticModel
-from montreal_forced_aligner.utils import log_kaldi_errors, parse_logs, run_kaldi_function
+from montreal_forced_aligner.profiling import PROFILER
+from montreal_forced_aligner.utils import (
+    get_peak_memory_usage,
+    log_kaldi_errors,
+    parse_logs,
+    run_kaldi_function,
+)
 
 if TYPE_CHECKING:
     from montreal_forced_aligner.abc import MetaDict
@@ -61,6 +79,14 @@ class AcousticModelTrainingMixin(
         Exponent for number of gaussians according to occurrence counts, defaults to 0.25
     initial_gaussians : int
         Initial number of gaussians, defaults to 0
+    accumulator_reduction : str
+        How to sum accumulators from jobs, either "serial" to send them to the main process
+        or "tree" to write them to disk and sum them pairwise in parallel, defaults to "serial"
+
+    Raises
+    ------
+    ValueError
+        If accumulator_reduction is not "serial" or "tree"
 
     See Also
     --------
@@ -94,8 +120,14 @@ class AcousticModelTrainingMixin(
         power: float = 0.25,
         initial_gaussians: int = 0,
         optional: bool = False,
+        accumulator_reduction: str = "serial",
         **kwargs,
     ):
+        if accumulator_reduction not in {"serial", "tree"}:
+            raise ValueError(
+                f'Invalid accumulator reduction "{accumulator_reduction}", '
+                'must be either "serial" or "tree"'
+            )
         super().__init__(**kwargs)
         self.identifier = identifier
         self.worker = worker
@@ -107,8 +139,10 @@ class AcousticModelTrainingMixin(
         self.boost_silence = boost_silence
         self.training_complete = False
         self.optional = optional
+        self.accumulator_reduction = accumulator_reduction
         self.realignment_iterations = []  # Gets set later
         self.final_gaussian_iteration = 0  # Gets set later
+        self.overlap_time_saved = 0.0
 
     @property
     def db_string(self) -> str:
@@ -133,10 +167,98 @@ class AcousticModelTrainingMixin(
                     self.working_log_directory.joinpath(f"acc.{self.iteration}.{j.id}.log"),
                     self.working_directory,
                     self.model_path,
+                    self.accumulator_directory if self.accumulator_reduction == "tree" else None,
                 )
             )
         return arguments
 
+    def align_acc_stats_arguments(self) -> List[AlignAccStatsArguments]:
+        """
+        Generate Job arguments for :class:`~montreal_forced_aligner.alignment.multiprocessing.AlignAccStatsFunction`
+
+        Returns
+        -------
+        list[:class:`~montreal_forced_aligner.alignment.multiprocessing.AlignAccStatsArguments`]
+            Arguments for processing
+        """
+        arguments = []
+        for j in self.jobs:
+            arguments.append(
+                AlignAccStatsArguments(
+                    j.id,
+                    self.session if config.USE_THREADING else self.db_string,
+                    self.working_log_directory.joinpath(f"align_acc.{self.iteration}.{j.id}.log"),
+                    self.working_directory,
+                    self.model_path,
+                    self.align_options,
+                    self.accumulator_directory if self.accumulator_reduction == "tree" else None,
+                    self.alignments_reused,
+                )
+            )
+        return arguments
+
+    @property
+    def alignments_reused(self) -> bool:
+        """
+        Flag for whether alignments generated in the current iteration are read by a later
+        step, which is the case unless the next iteration realigns
+        """
+        return (
+            self.iteration >= self.num_iterations
+            or self.iteration + 1 not in self.realignment_iterations
+        )
+
+    @property
+    def accumulator_directory(self) -> Path:
+        """Directory for accumulator files of the current iteration"""
+        return self.working_directory.joinpath(f"accs.{self.iteration}")
+
+    def tree_reduce_accs(self, acc_paths: List[Path]) -> Path:
+        """
+        Sum accumulator files pairwise in parallel until a single file remains
+
+        See Also
+        --------
+        :class:`~montreal_forced_aligner.alignment.multiprocessing.SumAccsFunction`
+            Multiprocessing helper function for each pair
+
+        Parameters
+        ----------
+        acc_paths: list[:class:`~pathlib.Path`]
+            Accumulator files written by each job
+
+        Returns
+        -------
+        :class:`~pathlib.Path`
+            Path to the summed accumulators
+        """
+        acc_paths = sorted(acc_paths)
+        level = 0
+        while len(acc_paths) > 1:
+            arguments = []
+            next_paths = []
+            for i in range(0, len(acc_paths) - 1, 2):
+                output_path = self.accumulator_directory.joinpath(f"sum.{level}.{i // 2}.acc")
+                arguments.append(
+                    SumAccsArguments(
+                        i // 2,
+                        self.session if config.USE_THREADING else self.db_string,
+                        self.working_log_directory.joinpath(
+                            f"sum_accs.{self.iteration}.{level}.{i // 2}.log"
+                        ),
+                        acc_paths[i : i + 2],
+                        output_path,
+                    )
+                )
+                next_paths.append(output_path)
+            if len(acc_paths) % 2:
+                next_paths.append(acc_paths[-1])
+            for _ in run_kaldi_function(SumAccsFunction, arguments):
+                pass
+            acc_paths = next_paths
+            level += 1
+        return acc_paths[0]
+
     @property
     def previous_aligner(self) -> AcousticCorpusPronunciationMixin:
         """Previous aligner seeding training"""
@@ -284,6 +406,8 @@ class AcousticModelTrainingMixin(
             Multiprocessing helper function for each job
         :meth:`.AcousticModelTrainingMixin.acc_stats_arguments`
             Job method for generating arguments for the helper function
+        :meth:`.AcousticModelTrainingMixin.tree_reduce_accs`
+            Summing accumulators when :attr:`.accumulator_reduction` is "tree"
         :kaldi_src:`gmm-sum-accs`
             Relevant Kaldi binary
         :kaldi_src:`gmm-est`
@@ -293,23 +417,107 @@ class AcousticModelTrainingMixin(
         :kaldi_steps:`train_deltas`
             Reference Kaldi script
         """
-        logger.info("Accumulating statistics...")
-        arguments = self.acc_stats_arguments()
+        self.update_gmm_model(self.accumulate_gmm_stats())
+
+    def accumulate_gmm_stats(
+        self, realign: bool = False
+    ) -> Tuple[TransitionModel, AmDiagGmm, DoubleVector, AccumAmDiagGmm]:
+        """
+        Accumulate transition and GMM statistics for the current model over all jobs
+
+        When realigning, each job aligns its utterances and accumulates statistics from the
+        new alignments in a single pass with
+        :class:`~montreal_forced_aligner.alignment.multiprocessing.AlignAccStatsFunction`,
+        writing alignment archives only if :attr:`.alignments_reused`
+
+        With tree reduction, accumulators are written to disk and jobs that finished before a
+        restart are skipped, using the accumulators recorded in the :attr:`.journal`
+
+        Parameters
+        ----------
+        realign: bool
+            Flag for whether to realign utterances with the current model before accumulating
+
+        Returns
+        -------
+        :class:`_hmm.TransitionModel`
+            Current transition model
+        :class:`_gmm.AmDiagGmm`
+            Current acoustic model
+        :class:`_matrix.DoubleVector`
+            Transition statistics
+        :class:`_gmm.AccumAmDiagGmm`
+            GMM statistics
+        """
+        if realign:
+            logger.info("Generating alignments and accumulating statistics...")
+            function = AlignAccStatsFunction
+            arguments = self.align_acc_stats_arguments()
+        else:
+            logger.info("Accumulating statistics...")
+            function = AccStatsFunction
+            arguments = self.acc_stats_arguments()
 
         transition_model, acoustic_model = read_gmm_model(self.model_path)
         transition_accs = DoubleVector()
         gmm_accs = AccumAmDiagGmm()
         transition_model.InitStats(transition_accs)
         gmm_accs.init(acoustic_model)
+        if self.accumulator_reduction == "tree":
+            self.accumulator_directory.mkdir(parents=True, exist_ok=True)
+        acc_paths = []
+        reduction_time = 0
+        journal_step = self.journal.step(
+            f"accumulate_gmm_stats.{self.iteration}", self.journal_inputs()
+        )
         for result in run_kaldi_function(
-            AccStatsFunction, arguments, total_count=self.num_current_utterances
+            function,
+            arguments,
+            total_count=self.num_current_utterances,
+            journal=journal_step,
         ):
             if isinstance(result, tuple):
+                begin = time.time()
                 job_transition_accs, job_gmm_accs = result
 
                 transition_accs.AddVec(1.0, job_transition_accs)
                 gmm_accs.Add(1.0, job_gmm_accs)
+                reduction_time += time.time() - begin
+            elif isinstance(result, Path):
+                acc_paths.append(result)
+        for job_name in journal_step.skipped_jobs:
+            acc_paths.extend(x for x in journal_step.outputs(job_name) if x.suffix == ".acc")
+        if acc_paths:
+            begin = time.time()
+            transition_accs, gmm_accs = read_gmm_accs([self.tree_reduce_accs(acc_paths)])
+            reduction_time += time.time() - begin
+        if self.accumulator_reduction == "tree":
+            shutil.rmtree(self.accumulator_directory, ignore_errors=True)
+        main_memory, worker_memory = get_peak_memory_usage()
+        logger.debug(
+            f"Summing accumulators for iteration {self.iteration} ({self.accumulator_reduction}) "
+            f"took {reduction_time:.3f} seconds"
+        )
+        if main_memory is not None:
+            logger.debug(
+                f"Peak memory usage: {main_memory:.1f} MB for the main process, "
+                f"{worker_memory:.1f} MB for workers"
+            )
+        return transition_model, acoustic_model, transition_accs, gmm_accs
+
+    def update_gmm_model(
+        self,
+        statistics: Tuple[TransitionModel, AmDiagGmm, DoubleVector, AccumAmDiagGmm],
+    ) -> None:
+        """
+        Re-estimate the model from accumulated statistics and write it to :attr:`.next_model_path`
 
+        Parameters
+        ----------
+        statistics: tuple[:class:`_hmm.TransitionModel`, :class:`_gmm.AmDiagGmm`, :class:`_matrix.DoubleVector`, :class:`_gmm.AccumAmDiagGmm`]
+            Output of :meth:`.AcousticModelTrainingMixin.accumulate_gmm_stats`
+        """
+        transition_model, acoustic_model, transition_accs, gmm_accs = statistics
         log_path = self.working_log_directory.joinpath(f"update.{self.iteration}.log")
         with kalpy_logger("kalpy.train", log_path) as train_logger:
             train_logger.debug(f"Model path: {self.model_path}")
@@ -353,18 +561,48 @@ class AcousticModelTrainingMixin(
             or self.working_directory.joinpath("done").exists()
         )
 
+    def run_stage_tasks(self, executor: StageExecutor) -> Dict[str, Any]:
+        """
+        Run the tasks of a stage and keep track of the wall time saved by overlapping them
+
+        Parameters
+        ----------
+        executor: :class:`~montreal_forced_aligner.executor.StageExecutor`
+            Executor with tasks added
+
+        Returns
+        -------
+        dict[str, Any]
+            Results of each task
+        """
+        results = executor.run()
+        self.overlap_time_saved += executor.time_saved
+        return results
+
+    def iteration_journal_step(self) -> JournalStep:
+        """
+        Journal step for the current iteration, complete once the next model has been written
+
+        Returns
+        -------
+        :class:`~montreal_forced_aligner.journal.JournalStep`
+            Journal step for the iteration
+        """
+        return self.journal.step(f"iteration.{self.iteration}", self.journal_inputs())
+
     def train_iteration(self) -> None:
         """Perform an iteration of training"""
-        if self.next_model_path.exists():
+        journal_step = self.iteration_journal_step()
+        if journal_step.is_complete():
             self.iteration += 1
             if self.iteration <= self.final_gaussian_iteration:
                 self.increment_gaussians()
             return
-        if self.iteration in self.realignment_iterations:
-            self.align_iteration()
-        self.acc_stats()
-
+        self.update_gmm_model(
+            self.accumulate_gmm_stats(realign=self.iteration in self.realignment_iterations)
+        )
         parse_logs(self.working_log_directory)
+        journal_step.complete(outputs=[self.next_model_path])
         if self.iteration <= self.final_gaussian_iteration:
             self.increment_gaussians()
         self.iteration += 1
@@ -389,7 +627,8 @@ class AcousticModelTrainingMixin(
             for iteration in range(1, self.num_iterations + 1):
                 logger.info(f"{self.identifier} - Iteration {iteration} of {self.num_iterations}")
                 self.iteration = iteration
-                self.train_iteration()
+                with PROFILER.stage(self.identifier, "training_iteration"):
+                    self.train_iteration()
             self.finalize_training()
         except Exception as e:
             if not isinstance(e, KeyboardInterrupt):
@@ -404,6 +643,7 @@ class AcousticModelTrainingMixin(
             raise
         logger.info("Training complete!")
         logger.debug(f"Training took {time.time() - begin:.3f} seconds")
+        logger.debug(f"Overlapping independent steps saved {self.overlap_time_saved:.3f} seconds")
 
     @property
     def exported_model_path(self) -> Path:
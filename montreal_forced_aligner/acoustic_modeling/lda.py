@@ -74,6 +74,8 @@ class LdaAccStatsFunction(KaldiFunction):
         Arguments for the function
     """
 
+    releases_gil = True
+
     def __init__(self, args: LdaAccStatsArguments):
         super().__init__(args)
         self.working_directory = args.working_directory
@@ -363,10 +365,7 @@ class LdaTrainer(TriphoneTrainer):
             return
         self.lda_acc_stats()
         self._setup_tree(initial_mix_up=False)
-
-        self.compile_train_graphs()
-
-        self.convert_alignments()
+        self.compile_graphs_and_convert_alignments()
         os.rename(self.model_path, self.next_model_path)
 
     def calc_lda_mllt(self) -> None:
@@ -440,18 +439,22 @@ class LdaTrainer(TriphoneTrainer):
         """
         Run a single LDA training iteration
         """
-        if os.path.exists(self.next_model_path):
+        journal_step = self.iteration_journal_step()
+        if journal_step.is_complete():
             if self.iteration <= self.final_gaussian_iteration:
                 self.increment_gaussians()
             self.iteration += 1
             return
-        if self.iteration in self.realignment_iterations:
-            self.align_iteration()
+        realign = self.iteration in self.realignment_iterations
         if self.iteration in self.mllt_iterations:
+            if realign:
+                self.align_iteration()
+                realign = False
             self.calc_lda_mllt()
 
-        self.acc_stats()
+        self.update_gmm_model(self.accumulate_gmm_stats(realign=realign))
         parse_logs(self.working_log_directory)
+        journal_step.complete(outputs=[self.next_model_path])
         if self.iteration <= self.final_gaussian_iteration:
             self.increment_gaussians()
         self.iteration += 1
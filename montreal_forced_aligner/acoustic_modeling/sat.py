@@ -65,6 +65,8 @@ class AccStatsTwoFeatsFunction(KaldiFunction):
         Arguments for the function
     """
 
+    releases_gil = True
+
     def __init__(self, args: AccStatsTwoFeatsArguments):
         super().__init__(args)
         self.working_directory = args.working_directory
@@ -246,10 +248,7 @@ class SatTrainer(TriphoneTrainer):
         self.uses_speaker_adaptation = True
         self.worker.uses_speaker_adaptation = True
         self._setup_tree(init_from_previous=self.quick, initial_mix_up=self.quick)
-
-        self.convert_alignments()
-
-        self.compile_train_graphs()
+        self.compile_graphs_and_convert_alignments()
         os.rename(self.model_path, self.next_model_path)
 
         self.iteration = 1
@@ -280,17 +279,21 @@ class SatTrainer(TriphoneTrainer):
         """
         Run a single training iteration
         """
-        if os.path.exists(self.next_model_path):
+        journal_step = self.iteration_journal_step()
+        if journal_step.is_complete():
             if self.iteration <= self.final_gaussian_iteration:
                 self.increment_gaussians()
             self.iteration += 1
             return
-        if self.iteration in self.realignment_iterations:
-            self.align_iteration()
+        realign = self.iteration in self.realignment_iterations
         if self.iteration in self.fmllr_iterations:
+            if realign:
+                self.align_iteration()
+                realign = False
             self.calc_fmllr()
 
-        self.acc_stats()
+        self.update_gmm_model(self.accumulate_gmm_stats(realign=realign))
+        journal_step.complete(outputs=[self.next_model_path])
 
         if self.iteration <= self.final_gaussian_iteration:
             self.increment_gaussians()
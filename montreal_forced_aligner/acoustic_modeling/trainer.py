@@ -11,6 +11,7 @@ import typing
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+import sqlalchemy
 from _kalpy.hmm import AlignmentToPosterior
 from _kalpy.matrix import DoubleVector
 from kalpy.gmm.data import AlignmentArchive
@@ -32,12 +33,14 @@ from montreal_forced_aligner.db import (
     PhoneInterval,
     Speaker,
     Utterance,
+    Word,
     WordInterval,
     bulk_update,
 )
 from montreal_forced_aligner.exceptions import ConfigError, KaldiProcessingError
 from montreal_forced_aligner.helper import load_configuration, mfa_open, parse_old_features
 from montreal_forced_aligner.models import AcousticModel, DictionaryModel
+from montreal_forced_aligner.profiling import PROFILER, profile_stage
 from montreal_forced_aligner.transcription.transcriber import TranscriberMixin
 from montreal_forced_aligner.utils import log_kaldi_errors, run_kaldi_function
 
@@ -322,36 +325,75 @@ class TrainableAligner(TranscriberMixin, TopLevelMfaWorker, ModelExporterMixin):
             session.commit()
 
     def filter_training_utterances(self):
+        """
+        Mark utterances as ignored for training if they have no transcription, are shorter than
+        :attr:`~TrainableAligner.minimum_utterance_length` words, or contain no words in their
+        speaker's dictionary
+
+        On PostgreSQL, utterances are marked with a single update statement per dictionary that
+        splits the normalized text into words in the database, otherwise utterances are checked
+        in a single pass over their text
+        """
         logger.info("Filtering utterances for training...")
+        begin = time.time()
         with self.session() as session:
             dictionaries = session.query(Dictionary)
             for d in dictionaries:
-                update_mapping = []
-                word_mapping = d.word_mapping
-                utterances = (
-                    session.query(Utterance.id, Utterance.normalized_text)
-                    .join(Utterance.speaker)
-                    .filter(Utterance.ignored == False)  # noqa
-                    .filter(Speaker.dictionary_id == d.id)
-                )
-                for u_id, text in utterances:
-                    if not text:
-                        update_mapping.append({"id": u_id, "ignored": True})
-                        continue
-                    words = text.split()
-                    if (
-                        self.minimum_utterance_length > 1
-                        and len(words) < self.minimum_utterance_length
-                    ):
-                        update_mapping.append({"id": u_id, "ignored": True})
-                        continue
-                    if any(x in word_mapping for x in words):
-                        continue
-                    update_mapping.append({"id": u_id, "ignored": True})
-                if update_mapping:
-                    bulk_update(session, Utterance, update_mapping)
-                    session.commit()
+                speaker_ids = sqlalchemy.select(Speaker.id).where(Speaker.dictionary_id == d.id)
+                if config.USE_POSTGRES:
+                    words = sqlalchemy.func.array_remove(
+                        sqlalchemy.func.regexp_split_to_array(Utterance.normalized_text, r"\s+"),
+                        "",
+                    )
+                    known_words = sqlalchemy.select(Word.id).where(
+                        Word.included == True,  # noqa
+                        Word.word == sqlalchemy.any_(words),
+                    )
+                    if d.name != "default":
+                        known_words = known_words.where(Word.dictionary_id == d.id)
+                    ignorable = [
+                        Utterance.normalized_text == None,  # noqa
+                        sqlalchemy.not_(known_words.exists()),
+                    ]
+                    if self.minimum_utterance_length > 1:
+                        ignorable.append(
+                            sqlalchemy.func.cardinality(words) < self.minimum_utterance_length
+                        )
+                    session.execute(
+                        sqlalchemy.update(Utterance)
+                        .execution_options(synchronize_session=False)
+                        .values(ignored=True)
+                        .where(Utterance.ignored == False)  # noqa
+                        .where(Utterance.speaker_id.in_(speaker_ids))
+                        .where(sqlalchemy.or_(*ignorable))
+                    )
+                else:
+                    word_mapping = d.word_mapping.keys()
+                    utterances = (
+                        session.query(Utterance.id, Utterance.normalized_text)
+                        .filter(Utterance.ignored == False)  # noqa
+                        .filter(Utterance.speaker_id.in_(speaker_ids))
+                    )
+                    ignored_ids = []
+                    for u_id, text in utterances.yield_per(10000):
+                        words = text.split() if text else []
+                        if (
+                            not words
+                            or len(words) < self.minimum_utterance_length
+                            or word_mapping.isdisjoint(words)
+                        ):
+                            ignored_ids.append(u_id)
+                    for i in range(0, len(ignored_ids), 10000):
+                        session.execute(
+                            sqlalchemy.update(Utterance)
+                            .execution_options(synchronize_session=False)
+                            .values(ignored=True)
+                            .where(Utterance.id.in_(ignored_ids[i : i + 10000]))
+                        )
+                session.commit()
+        logger.debug(f"Filtering utterances took {time.time() - begin:.3f} seconds")
 
+    @profile_stage()
     def setup(self) -> None:
         """Setup for acoustic model training"""
         super().setup()
@@ -519,16 +561,18 @@ class TrainableAligner(TranscriberMixin, TopLevelMfaWorker, ModelExporterMixin):
         from kalpy.utils import generate_write_specifier
 
         with self.session() as session:
-            utterance_ids = set(
-                x[0]
-                for x in session.query(Utterance.id)
-                .filter(Utterance.in_subset == True, Utterance.duration_deviation > 10)  # noqa
-                .all()
+            query = session.query(Utterance.id, Utterance.kaldi_id).filter(
+                Utterance.in_subset == True, Utterance.duration_deviation > 10  # noqa
             )
+            utterance_ids = set()
+            update_mappings = []
+            for u_id, kaldi_id in query:
+                utterance_ids.add(kaldi_id)
+                update_mappings.append({"id": u_id, "in_subset": False})
             logger.debug(
                 f"Removing {len(utterance_ids)} utterances from subset due to large duration deviations"
             )
-            bulk_update(session, Utterance, [{"id": x, "in_subset": False} for x in utterance_ids])
+            bulk_update(session, Utterance, update_mappings)
             session.commit()
             for j in self.jobs:
                 ali_paths = j.construct_path_dictionary(self.working_directory, "ali", "ark")
@@ -566,6 +610,7 @@ class TrainableAligner(TranscriberMixin, TopLevelMfaWorker, ModelExporterMixin):
                         for line in feat_lines:
                             feat_file.write(line)
 
+    @profile_stage()
     def train(self) -> None:
         """
         Run through the training configurations to produce a final acoustic model
@@ -597,26 +642,22 @@ class TrainableAligner(TranscriberMixin, TopLevelMfaWorker, ModelExporterMixin):
                     or not self.current_workflow.working_directory.exists()
                 ):
                     self.align()
-                    with self.session() as session:
-                        session.query(WordInterval).delete()
-                        session.query(PhoneInterval).delete()
-                        session.commit()
-                    self.collect_alignments()
-                    self.analyze_alignments()
+                    self.analyze_alignment_archives()
                     if self.current_subset != 0:
                         self.quality_check_subset()
                 else:
                     logger.debug(f"Skipping {self.current_aligner.identifier} alignments")
 
             self.set_current_workflow(trainer.identifier)
-            if trainer.identifier.startswith("pronunciation_probabilities"):
-                with self.session() as session:
-                    session.query(WordInterval).delete()
-                    session.query(PhoneInterval).delete()
-                    session.commit()
-                trainer.train_pronunciation_probabilities()
-            else:
-                trainer.train()
+            with PROFILER.stage(trainer.identifier, "training_stage"):
+                if trainer.identifier.startswith("pronunciation_probabilities"):
+                    with self.session() as session:
+                        session.query(WordInterval).delete()
+                        session.query(PhoneInterval).delete()
+                        session.commit()
+                    trainer.train_pronunciation_probabilities()
+                else:
+                    trainer.train()
             previous = trainer
             self.final_identifier = trainer.identifier
         self.current_subset = None
@@ -640,6 +681,10 @@ class TrainableAligner(TranscriberMixin, TopLevelMfaWorker, ModelExporterMixin):
         if not os.path.exists(new_phone_lm_path) and os.path.exists(phone_lm_path):
             shutil.copyfile(phone_lm_path, new_phone_lm_path)
         logger.info(f"Completed training in {time.time() - begin} seconds!")
+        time_saved = sum(
+            getattr(x, "overlap_time_saved", 0.0) for x in self.training_configs.values()
+        )
+        logger.info(f"Overlapping independent training steps saved {time_saved:.3f} seconds")
 
     def transition_acc_arguments(self) -> List[TransitionAccArguments]:
         """
@@ -705,6 +750,7 @@ class TrainableAligner(TranscriberMixin, TopLevelMfaWorker, ModelExporterMixin):
         self.analyze_alignments()
         self.train_phone_lm()
 
+    @profile_stage()
     def export_files(
         self,
         output_directory: Path,
@@ -744,6 +790,7 @@ class TrainableAligner(TranscriberMixin, TopLevelMfaWorker, ModelExporterMixin):
             options = super().align_options
         return options
 
+    @profile_stage()
     def align(self) -> None:
         """
         Multiprocessing function that aligns based on the current model.
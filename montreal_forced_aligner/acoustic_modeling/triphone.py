@@ -22,6 +22,7 @@ from montreal_forced_aligner.abc import KaldiFunction, MetaDict
 from montreal_forced_aligner.acoustic_modeling.base import AcousticModelTrainingMixin
 from montreal_forced_aligner.data import MfaArguments, PhoneType
 from montreal_forced_aligner.db import Job, Phone
+from montreal_forced_aligner.executor import StageExecutor
 from montreal_forced_aligner.utils import run_kaldi_function, thread_logger
 
 __all__ = [
@@ -71,6 +72,11 @@ class ConvertAlignmentsFunction(KaldiFunction):
         Arguments for the function
     """
 
+    @classmethod
+    def job_outputs(cls, args: ConvertAlignmentsArguments) -> typing.List[Path]:
+        """Converted alignment archives of the job"""
+        return [x for x in args.new_ali_paths.values() if x.exists()]
+
     def __init__(self, args: ConvertAlignmentsArguments):
         super().__init__(args)
         self.dictionaries = args.dictionaries
@@ -302,7 +308,10 @@ class TriphoneTrainer(AcousticModelTrainingMixin):
         logger.info("Converting alignments...")
         arguments = self.convert_alignments_arguments()
         for _ in run_kaldi_function(
-            ConvertAlignmentsFunction, arguments, total_count=self.num_current_utterances
+            ConvertAlignmentsFunction,
+            arguments,
+            total_count=self.num_current_utterances,
+            journal=self.journal.step("convert_alignments", self.journal_inputs()),
         ):
             pass
 
@@ -339,11 +348,19 @@ class TriphoneTrainer(AcousticModelTrainingMixin):
         if self.initialized:
             return
         self._setup_tree()
+        self.compile_graphs_and_convert_alignments()
+        os.rename(self.model_path, self.next_model_path)
 
-        self.compile_train_graphs()
+    def compile_graphs_and_convert_alignments(self) -> None:
+        """
+        Compile training graphs for the new tree while converting the previous alignments to it
 
-        self.convert_alignments()
-        os.rename(self.model_path, self.next_model_path)
+        Both steps only depend on the new tree and model, so they run concurrently
+        """
+        executor = StageExecutor(f"{self.identifier} initialization")
+        executor.add_task("compile_train_graphs", self.compile_train_graphs)
+        executor.add_task("convert_alignments", self.convert_alignments)
+        self.run_stage_tasks(executor)
 
     def tree_stats(self) -> typing.List:
         """
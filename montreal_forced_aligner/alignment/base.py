@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import collections
 import csv
-import functools
 import io
 import logging
 import math
@@ -14,11 +13,12 @@ import shutil
 import subprocess
 import time
 import typing
-from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from queue import Empty
 from typing import Dict, List, Optional
 
+import numpy as np
+import scipy.sparse
 import sqlalchemy
 from kalpy.feat.mfcc import MfccComputer
 from kalpy.feat.pitch import PitchComputer
@@ -34,20 +34,21 @@ from montreal_forced_aligner.alignment.mixins import AlignMixin
 from montreal_forced_aligner.alignment.multiprocessing import (
     AlignmentExtractionArguments,
     AlignmentExtractionFunction,
+    AlignmentStatisticsArguments,
+    AlignmentStatisticsFunction,
     AnalyzeAlignmentsArguments,
-    AnalyzeAlignmentsFunction,
     ExportTextGridArguments,
     ExportTextGridProcessWorker,
     FineTuneArguments,
     FineTuneFunction,
     GeneratePronunciationsArguments,
-    GeneratePronunciationsFunction,
+    PronunciationCountFunction,
+    alignment_quality_statement,
 )
 from montreal_forced_aligner.corpus.acoustic_corpus import AcousticCorpusPronunciationMixin
 from montreal_forced_aligner.data import (
     CtmInterval,
     PhoneType,
-    PronunciationProbabilityCounter,
     TextFileType,
     WordType,
     WorkflowType,
@@ -69,14 +70,18 @@ from montreal_forced_aligner.db import (
     Word,
     WordInterval,
     bulk_update,
+    bulk_update_columns,
 )
 from montreal_forced_aligner.exceptions import AlignmentExportError, KaldiProcessingError
 from montreal_forced_aligner.helper import (
-    align_phones,
+    batch_align_phones,
     format_correction,
+    format_corrections,
+    format_probabilities,
     format_probability,
     mfa_open,
 )
+from montreal_forced_aligner.profiling import profile_stage
 from montreal_forced_aligner.textgrid import (
     construct_textgrid_output,
     output_textgrid_writing_errors,
@@ -154,6 +159,15 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
         }
 
     def analyze_alignments_arguments(self) -> List[AnalyzeAlignmentsArguments]:
+        """
+        Generate Job arguments for
+        :class:`~montreal_forced_aligner.alignment.multiprocessing.AnalyzeTranscriptsFunction`
+
+        Returns
+        -------
+        list[:class:`~montreal_forced_aligner.alignment.multiprocessing.AnalyzeAlignmentsArguments`]
+            Arguments for processing
+        """
         return [
             AnalyzeAlignmentsArguments(
                 j.id,
@@ -166,9 +180,15 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
         ]
 
     def analyze_alignments(self):
-        if not config.USE_POSTGRES:
-            logger.warning("Alignment analysis not available without using postgresql")
-            return
+        """
+        Compute phone duration statistics and per-utterance alignment quality measures,
+        and export them to ``alignment_analysis.csv`` in the working directory
+
+        See Also
+        --------
+        :func:`~montreal_forced_aligner.alignment.multiprocessing.alignment_quality_statement`
+            Statement for calculating utterance speech log-likelihood and duration deviation
+        """
         workflow = self.current_workflow
         if not workflow.alignments_collected:
             self.collect_alignments()
@@ -178,30 +198,32 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
             update_mappings = []
             query = session.query(
                 PhoneInterval.phone_id,
-                sqlalchemy.func.avg(PhoneInterval.duration),
-                sqlalchemy.func.stddev_samp(PhoneInterval.duration),
+                sqlalchemy.func.count(),
+                sqlalchemy.func.sum(PhoneInterval.duration),
+                sqlalchemy.func.sum(PhoneInterval.duration * PhoneInterval.duration),
             ).group_by(PhoneInterval.phone_id)
-            for p_id, mean_duration, sd_duration in query:
+            for p_id, count, duration_sum, duration_squared_sum in query:
+                mean_duration = duration_sum / count
+                sd_duration = None
+                if count > 1:
+                    variance = (duration_squared_sum - count * mean_duration**2) / (count - 1)
+                    sd_duration = math.sqrt(max(variance, 0.0))
                 update_mappings.append(
                     {"id": p_id, "mean_duration": mean_duration, "sd_duration": sd_duration}
                 )
             bulk_update(session, Phone, update_mappings)
             session.commit()
 
-            arguments = self.analyze_alignments_arguments()
-            update_mappings = []
-            for utt_id, speech_log_likelihood, duration_deviation in run_kaldi_function(
-                AnalyzeAlignmentsFunction, arguments, total_count=self.num_current_utterances
-            ):
-                update_mappings.append(
-                    {
-                        "id": utt_id,
-                        "speech_log_likelihood": speech_log_likelihood,
-                        "duration_deviation": duration_deviation,
-                    }
+            quality = alignment_quality_statement(workflow.id).subquery()
+            session.execute(
+                sqlalchemy.update(Utterance)
+                .values(
+                    speech_log_likelihood=quality.c.speech_log_likelihood,
+                    duration_deviation=quality.c.duration_deviation,
                 )
-
-            bulk_update(session, Utterance, update_mappings)
+                .where(Utterance.id == quality.c.utterance_id)
+                .execution_options(synchronize_session=False)
+            )
             session.commit()
 
             csv_path = self.working_directory.joinpath("alignment_analysis.csv")
@@ -231,8 +253,119 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
                     .join(Utterance.file)
                     .join(Utterance.speaker)
                 )
-                for row in utterances:
-                    writer.writerow([*row])
+                writer.writerows(utterances.yield_per(10000))
+        logger.debug(f"Analyzed alignment quality in {time.time() - begin:.3f} seconds")
+
+    def alignment_statistics_arguments(self) -> List[AlignmentStatisticsArguments]:
+        """
+        Generate Job arguments for
+        :class:`~montreal_forced_aligner.alignment.multiprocessing.AlignmentStatisticsFunction`
+
+        Returns
+        -------
+        list[:class:`~montreal_forced_aligner.alignment.multiprocessing.AlignmentStatisticsArguments`]
+            Arguments for processing
+        """
+        transition_model = read_transition_model(str(self.alignment_model_path))
+        return [
+            AlignmentStatisticsArguments(
+                j.id,
+                getattr(self, "session" if config.USE_THREADING else "db_string", ""),
+                self.working_log_directory.joinpath(f"alignment_statistics.{j.id}.log"),
+                transition_model,
+                self.phone_symbol_table_path,
+                round(self.frame_shift / 1000, 4),
+            )
+            for j in self.jobs
+        ]
+
+    def analyze_alignment_archives(self) -> None:
+        """
+        Compute phone duration statistics and per-utterance alignment quality measures directly
+        from the current alignment archives, without collecting alignments into the database
+
+        Used for intermediate alignments in training, where only utterance quality is needed,
+        see :meth:`.CorpusAligner.analyze_alignments` for analyzing collected alignments
+
+        See Also
+        --------
+        :class:`~montreal_forced_aligner.alignment.multiprocessing.AlignmentStatisticsFunction`
+            Multiprocessing helper function for each job
+        :meth:`.CorpusAligner.alignment_statistics_arguments`
+            Job method for generating arguments for the helper function
+        """
+        logger.info("Analyzing alignment quality...")
+        begin = time.time()
+        statistics_paths = []
+        counts = 0
+        duration_sums = 0
+        duration_squared_sums = 0
+        for result in run_kaldi_function(
+            AlignmentStatisticsFunction,
+            self.alignment_statistics_arguments(),
+            total_count=self.num_current_utterances,
+        ):
+            if isinstance(result, int):
+                continue
+            path, phone_counts, phone_duration_sums, phone_duration_squared_sums = result
+            statistics_paths.append(path)
+            counts = counts + phone_counts
+            duration_sums = duration_sums + phone_duration_sums
+            duration_squared_sums = duration_squared_sums + phone_duration_squared_sums
+        if not statistics_paths:
+            return
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_durations = duration_sums / counts
+            sd_durations = np.sqrt(
+                np.maximum(
+                    (duration_squared_sums - counts * mean_durations**2) / (counts - 1), 0.0
+                )
+            )
+        sd_durations[counts < 2] = np.nan
+        with self.session() as session:
+            bulk_update(
+                session,
+                Phone,
+                [
+                    {
+                        "id": p_id,
+                        "mean_duration": float(mean_durations[p_id]),
+                        "sd_duration": None
+                        if np.isnan(sd_durations[p_id])
+                        else float(sd_durations[p_id]),
+                    }
+                    for p_id in np.flatnonzero(counts).tolist()
+                ],
+            )
+            session.commit()
+            valid_phones = np.nan_to_num(sd_durations) > 0
+            for path in statistics_paths:
+                with np.load(path) as data:
+                    phone_ids = data["phone_ids"]
+                    interval_counts = data["interval_counts"]
+                    z_scores = np.full(phone_ids.shape[0], -np.inf)
+                    valid = valid_phones[phone_ids]
+                    z_scores[valid] = np.abs(
+                        (data["durations"][valid] - mean_durations[phone_ids[valid]])
+                        / sd_durations[phone_ids[valid]]
+                    )
+                    has_intervals = interval_counts > 0
+                    starts = (np.cumsum(interval_counts) - interval_counts)[has_intervals]
+                    duration_deviations = np.full(interval_counts.shape[0], -np.inf)
+                    if starts.shape[0]:
+                        duration_deviations[has_intervals] = np.maximum.reduceat(z_scores, starts)
+                    analyzed = np.isfinite(duration_deviations)
+                    bulk_update_columns(
+                        session,
+                        Utterance,
+                        {
+                            "id": data["utterance_ids"][analyzed],
+                            "speech_log_likelihood": data["speech_log_likelihoods"][analyzed],
+                            "duration_deviation": duration_deviations[analyzed],
+                        },
+                    )
+                session.commit()
+                path.unlink()
         logger.debug(f"Analyzed alignment quality in {time.time() - begin:.3f} seconds")
 
     def alignment_extraction_arguments(self) -> List[AlignmentExtractionArguments]:
@@ -341,6 +474,7 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
             for j in self.jobs
         ]
 
+    @profile_stage()
     def align(self, workflow_name=None) -> None:
         """Run the aligner"""
         self.alignment_mode = True
@@ -352,6 +486,8 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
         if wf.done:
             logger.info("Alignment already done, skipping.")
             return
+        if wf.dirty:
+            self.reset_journal()
         begin = time.time()
         acoustic_model = getattr(self, "acoustic_model", None)
         if acoustic_model is not None:
@@ -408,13 +544,94 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
             raise
         logger.debug(f"Generated alignments in {time.time() - begin:.3f} seconds")
 
+    def _pronunciation_count_index(
+        self, session: sqlalchemy.orm.Session, dictionary: Dictionary
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Construct arrays for accumulating pronunciation counts of a dictionary
+
+        Every pronunciation in the dictionary gets an index, followed by indices for the utterance
+        initial and final symbols, the cutoff model, and a final index for any pronunciations
+        not in the dictionary
+
+        Parameters
+        ----------
+        session: :class:`sqlalchemy.orm.Session`
+            Session to use
+        dictionary: :class:`~montreal_forced_aligner.db.Dictionary`
+            Pronunciation dictionary
+
+        Returns
+        -------
+        dict[str, Any]
+            Mapping of word pronunciations to indices, pronunciation attribute arrays, and empty
+            count matrix and bigram count matrix
+        """
+        in_vocabulary = sqlalchemy.or_(
+            sqlalchemy.and_(Word.word_type.in_(WordType.speech_types()), Word.count > 0),
+            Word.word.in_(
+                [
+                    dictionary.cutoff_word,
+                    dictionary.oov_word,
+                    dictionary.laughter_word,
+                    dictionary.bracketed_word,
+                ]
+            ),
+        )
+        query = (
+            session.query(
+                Pronunciation.id,
+                Word.id,
+                Word.word,
+                Pronunciation.pronunciation,
+                Pronunciation.generated_by_rule,
+                in_vocabulary,
+            )
+            .join(Pronunciation.word)
+            .filter(Word.dictionary_id == dictionary.id)
+            .order_by(Pronunciation.id)
+        )
+        excluded_words = {"<s>", "</s>", self.silence_word}
+        mapping = {}
+        rows = []
+        cutoff_word_id = -3
+        for pron_id, word_id, word, pronunciation, generated, in_vocab in query:
+            mapping[(word, pronunciation)] = len(rows)
+            rows.append(
+                (pron_id, word_id, bool(in_vocab), bool(generated), word in excluded_words)
+            )
+            if word == dictionary.cutoff_word:
+                cutoff_word_id = word_id
+        for key, word_id in [(("<s>", ""), -1), (("</s>", ""), -2)]:
+            if key not in mapping:
+                mapping[key] = len(rows)
+                rows.append((-1, word_id, False, False, True))
+        cutoff_model = len(rows)
+        mapping[(dictionary.cutoff_word, "cutoff_model")] = cutoff_model
+        rows.append((-1, cutoff_word_id, True, False, False))
+        rows.append((-1, -4, False, False, False))
+        pron_ids, word_ids, in_vocab, generated, excluded = (np.array(x) for x in zip(*rows))
+        size = len(rows)
+        return {
+            "mapping": mapping,
+            "size": size,
+            "ids": pron_ids,
+            "word_groups": np.unique(word_ids, return_inverse=True)[1],
+            "in_vocabulary": in_vocab,
+            "generated": generated,
+            "excluded_words": excluded,
+            "cutoff_model": cutoff_model,
+            "counts": np.zeros((5, size), dtype=np.int64),
+            "bigrams": scipy.sparse.csr_matrix((size, size), dtype=np.int64),
+        }
+
     def compute_pronunciation_probabilities(self):
         """
         Multiprocessing function that computes pronunciation probabilities from alignments
 
         See Also
         --------
-        :class:`~montreal_forced_aligner.alignment.multiprocessing.GeneratePronunciationsFunction`
+        :class:`~montreal_forced_aligner.alignment.multiprocessing.PronunciationCountFunction`
             Multiprocessing helper function for each job
         :meth:`.CorpusAligner.generate_pronunciations_arguments`
             Job method for generating arguments for the helper function
@@ -425,29 +642,11 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
         """
 
         begin = time.time()
-        with self.session() as session:
-            dictionary_counters = {
-                dict_id: PronunciationProbabilityCounter()
-                for dict_id, in session.query(Dictionary.id).filter(Dictionary.name != "default")
-            }
         logger.info("Generating pronunciations...")
-        arguments = self.generate_pronunciations_arguments()
-        for result in run_kaldi_function(
-            GeneratePronunciationsFunction, arguments, total_count=self.num_current_utterances
-        ):
-            try:
-                dict_id, utterance_counter = result
-                dictionary_counters[dict_id].add_counts(utterance_counter)
-            except Exception:
-                import sys
-                import traceback
-
-                exc_type, exc_value, exc_traceback = sys.exc_info()
-                print("\n".join(traceback.format_exception(exc_type, exc_value, exc_traceback)))
-                raise
         initial_key = ("<s>", "")
         final_key = ("</s>", "")
         lambda_2 = 2
+        lambda_3 = 2
         silence_prob_sum = 0
         initial_silence_prob_sum = 0
         final_silence_correction_sum = 0
@@ -457,128 +656,142 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
             "w",
             encoding="utf8",
         ) as log_file, self.session() as session:
+            dictionaries = {
+                d.id: d for d in session.query(Dictionary).filter(Dictionary.name != "default")
+            }
+            indices = {}
+            arguments = self.generate_pronunciations_arguments()
+            for result in run_kaldi_function(
+                PronunciationCountFunction, arguments, total_count=self.num_current_utterances
+            ):
+                if isinstance(result, int):
+                    continue
+                (
+                    dict_id,
+                    pronunciations,
+                    counts,
+                    bigram_rows,
+                    bigram_columns,
+                    bigram_counts,
+                ) = result
+                if dict_id not in indices:
+                    indices[dict_id] = self._pronunciation_count_index(
+                        session, dictionaries[dict_id]
+                    )
+                index = indices[dict_id]
+                unknown = index["size"] - 1
+                global_indices = np.array(
+                    [
+                        index["mapping"].get(
+                            (w, re.sub(r"_[BSEI]\b", "", p))
+                            if self.position_dependent_phones
+                            else (w, p),
+                            unknown,
+                        )
+                        for w, p in pronunciations
+                    ],
+                    dtype=np.int64,
+                )
+                for i in range(counts.shape[0]):
+                    index["counts"][i] += np.bincount(
+                        global_indices, weights=counts[i], minlength=index["size"]
+                    ).astype(np.int64)
+                index["bigrams"] += scipy.sparse.csr_matrix(
+                    (
+                        bigram_counts,
+                        (global_indices[bigram_rows], global_indices[bigram_columns]),
+                    ),
+                    shape=(index["size"], index["size"]),
+                )
+
             session.query(Pronunciation).update({"count": 0})
             session.commit()
-            dictionaries = session.query(Dictionary)
             dictionary_mappings = []
-            for d in dictionaries:
-                d_id = d.id
-                if d_id not in dictionary_counters:
+            for d_id, d in dictionaries.items():
+                if d_id not in indices:
                     continue
-                counter = dictionary_counters[d_id]
+                index = indices[d_id]
                 log_file.write(f"For {d.name}:\n")
-                words = (
-                    session.query(Word.word)
-                    .filter(Word.dictionary_id == d_id)
-                    .filter(
-                        sqlalchemy.or_(
-                            sqlalchemy.and_(
-                                Word.word_type.in_(WordType.speech_types()), Word.count > 0
-                            ),
-                            Word.word.in_(
-                                [d.cutoff_word, d.oov_word, d.laughter_word, d.bracketed_word]
-                            ),
-                        )
-                    )
+                (
+                    pronunciation_counts,
+                    silence_following_counts,
+                    non_silence_following_counts,
+                    silence_before_counts,
+                    non_silence_before_counts,
+                ) = index["counts"]
+                included = index["in_vocabulary"] & (
+                    ~index["generated"] | (pronunciation_counts > 0)
                 )
-                pronunciations = (
-                    session.query(
-                        Word.word,
-                        Pronunciation.pronunciation,
-                        Pronunciation.id,
-                        Pronunciation.generated_by_rule,
-                    )
-                    .join(Pronunciation.word)
-                    .filter(Word.dictionary_id == d_id)
-                    .filter(
-                        sqlalchemy.or_(
-                            sqlalchemy.and_(
-                                Word.word_type.in_(WordType.speech_types()), Word.count > 0
-                            ),
-                            Word.word.in_(
-                                [d.cutoff_word, d.oov_word, d.laughter_word, d.bracketed_word]
-                            ),
-                        )
-                    )
+                excluded_words = index["excluded_words"]
+                modeled = included & ~excluded_words
+
+                pronunciation_counts = pronunciation_counts + modeled  # Add one smoothing
+                max_counts = np.zeros(index["word_groups"].max() + 1, dtype=np.int64)
+                np.maximum.at(
+                    max_counts, index["word_groups"][modeled], pronunciation_counts[modeled]
                 )
-                pron_mapping = {}
-                pronunciations = [
-                    (w, p, p_id)
-                    for w, p, p_id, generated in pronunciations
-                    if not generated or p in counter.word_pronunciation_counts[w]
-                ]
-                pronunciations.append((d.cutoff_word, "cutoff_model", None))
-                for w, p, p_id in pronunciations:
-                    pron_mapping[(w, p)] = {"id": p_id}
-                    if w in {initial_key[0], final_key[0], self.silence_word}:
-                        continue
-                    counter.word_pronunciation_counts[w][p] += 1  # Add one smoothing
-                for (w,) in words:
-                    if w in {initial_key[0], final_key[0], self.silence_word}:
-                        continue
-                    if w not in counter.word_pronunciation_counts:
-                        continue
-                    pron_counts = counter.word_pronunciation_counts[w]
-                    max_value = max(pron_counts.values())
-                    for p, c in pron_counts.items():
-                        if self.position_dependent_phones:
-                            p = re.sub(r"_[BSEI]\b", "", p)
-                        if (w, p) in pron_mapping:
-                            pron_mapping[(w, p)]["count"] = c
-                            pron_mapping[(w, p)]["probability"] = format_probability(c / max_value)
-
-                silence_count = sum(counter.silence_before_counts.values())
-                non_silence_count = sum(counter.non_silence_before_counts.values())
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    probabilities = pronunciation_counts / max_counts[index["word_groups"]]
+
+                silence_count = int(silence_before_counts.sum())
+                non_silence_count = int(non_silence_before_counts.sum())
                 log_file.write(f"Total silence count was {silence_count}\n")
                 log_file.write(f"Total non silence count was {non_silence_count}\n")
                 silence_probability = format_probability(
                     silence_count / (silence_count + non_silence_count)
                 )
                 silence_prob_sum += silence_probability
-                silence_probabilities = {}
-                for w, p, _ in pronunciations:
-                    count = counter.silence_following_counts[(w, p)]
-                    total_count = (
-                        counter.silence_following_counts[(w, p)]
-                        + counter.non_silence_following_counts[(w, p)]
-                    )
-                    pron_mapping[(w, p)]["silence_following_count"] = count
-                    pron_mapping[(w, p)][
-                        "non_silence_following_count"
-                    ] = counter.non_silence_following_counts[(w, p)]
-                    w_p_silence_count = count + (silence_probability * lambda_2)
-                    prob = format_probability(w_p_silence_count / (total_count + lambda_2))
-                    silence_probabilities[(w, p)] = prob
-                    if w not in {initial_key[0], final_key[0], self.silence_word}:
-                        pron_mapping[(w, p)]["silence_after_probability"] = prob
-                lambda_3 = 2
-                bar_count_silence_wp = collections.defaultdict(float)
-                bar_count_non_silence_wp = collections.defaultdict(float)
-                for (w_p1, w_p2), counts in counter.ngram_counts.items():
-                    if w_p1 not in silence_probabilities:
-                        silence_prob = 0.01
-                    else:
-                        silence_prob = silence_probabilities[w_p1]
-                    total_count = counts["silence"] + counts["non_silence"]
-                    bar_count_silence_wp[w_p2] += total_count * silence_prob
-                    bar_count_non_silence_wp[w_p2] += total_count * (1 - silence_prob)
-                for w, p, _ in pronunciations:
-                    if w in {initial_key[0], final_key[0], self.silence_word}:
-                        continue
-                    silence_count = counter.silence_before_counts[(w, p)]
-                    non_silence_count = counter.non_silence_before_counts[(w, p)]
-                    pron_mapping[(w, p)]["silence_before_correction"] = format_correction(
-                        (silence_count + lambda_3) / (bar_count_silence_wp[(w, p)] + lambda_3)
-                    )
+                silence_after_probabilities = format_probabilities(
+                    (silence_following_counts + (silence_probability * lambda_2))
+                    / (silence_following_counts + non_silence_following_counts + lambda_2)
+                )
+                preceding_silence_probabilities = np.where(
+                    included, silence_after_probabilities, 0.01
+                )
+                bigram_totals = index["bigrams"].T
+                bar_count_silence_wp = bigram_totals @ preceding_silence_probabilities
+                bar_count_non_silence_wp = bigram_totals @ (1 - preceding_silence_probabilities)
+                silence_before_corrections = format_corrections(
+                    (silence_before_counts + lambda_3) / (bar_count_silence_wp + lambda_3)
+                )
+                non_silence_before_corrections = format_corrections(
+                    (non_silence_before_counts + lambda_3) / (bar_count_non_silence_wp + lambda_3)
+                )
 
-                    pron_mapping[(w, p)]["non_silence_before_correction"] = format_correction(
-                        (non_silence_count + lambda_3)
-                        / (bar_count_non_silence_wp[(w, p)] + lambda_3)
-                    )
-                cutoff_model = pron_mapping.pop((d.cutoff_word, "cutoff_model"))
-                bulk_update(session, Pronunciation, list(pron_mapping.values()))
+                columns = {
+                    "count": pronunciation_counts,
+                    "probability": format_probabilities(probabilities),
+                    "silence_following_count": silence_following_counts,
+                    "non_silence_following_count": non_silence_following_counts,
+                    "silence_after_probability": silence_after_probabilities,
+                    "silence_before_correction": silence_before_corrections,
+                    "non_silence_before_correction": non_silence_before_corrections,
+                }
+                update_mask = modeled & (index["ids"] >= 0)
+                bulk_update_columns(
+                    session,
+                    Pronunciation,
+                    {
+                        "id": index["ids"][update_mask],
+                        **{k: v[update_mask] for k, v in columns.items()},
+                    },
+                )
+                update_mask = included & excluded_words & (index["ids"] >= 0)
+                bulk_update_columns(
+                    session,
+                    Pronunciation,
+                    {
+                        "id": index["ids"][update_mask],
+                        "silence_following_count": silence_following_counts[update_mask],
+                        "non_silence_following_count": non_silence_following_counts[update_mask],
+                    },
+                )
                 session.flush()
-                cutoff_not_model = pron_mapping[(d.cutoff_word, "spn")]
+                cutoff_model = {k: v[index["cutoff_model"]].item() for k, v in columns.items()}
+                cutoff_not_model = {
+                    k: v[index["mapping"][(d.cutoff_word, "spn")]].item()
+                    for k, v in columns.items()
+                }
                 cutoff_query = (
                     session.query(Pronunciation.id, Pronunciation.pronunciation)
                     .join(Pronunciation.word)
@@ -597,35 +810,26 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
                     bulk_update(session, Pronunciation, cutoff_mappings)
                     session.flush()
 
-                initial_silence_count = counter.silence_before_counts[initial_key] + (
+                initial_index = index["mapping"][initial_key]
+                final_index = index["mapping"][final_key]
+                initial_silence_count = silence_before_counts[initial_index] + (
                     silence_probability * lambda_2
                 )
-                initial_non_silence_count = counter.non_silence_before_counts[initial_key] + (
+                initial_non_silence_count = non_silence_before_counts[initial_index] + (
                     (1 - silence_probability) * lambda_2
                 )
                 initial_silence_probability = format_probability(
                     initial_silence_count / (initial_silence_count + initial_non_silence_count)
                 )
-
-                final_silence_correction = format_correction(
-                    (counter.silence_before_counts[final_key] + lambda_3)
-                    / (bar_count_silence_wp[final_key] + lambda_3)
-                )
-
-                final_non_silence_correction = format_correction(
-                    (counter.non_silence_before_counts[final_key] + lambda_3)
-                    / (bar_count_non_silence_wp[final_key] + lambda_3)
-                )
                 initial_silence_prob_sum += initial_silence_probability
-                final_silence_correction_sum += final_silence_correction
-                final_non_silence_correction_sum += final_non_silence_correction
+                final_silence_correction_sum += float(silence_before_corrections[final_index])
+                final_non_silence_correction_sum += float(
+                    non_silence_before_corrections[final_index]
+                )
                 dictionary_mappings.append(
                     {
                         "id": d_id,
                         "silence_probability": silence_probability,
-                        # "initial_silence_probability": initial_silence_probability,
-                        # "final_silence_correction": final_silence_correction,
-                        # "final_non_silence_correction": final_non_silence_correction,
                     }
                 )
 
@@ -786,6 +990,7 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
             f"Calculating pronunciation probabilities took {time.time() - begin:.3f} seconds"
         )
 
+    @profile_stage()
     def collect_alignments(self) -> None:
         """
         Process alignment archives to extract word or phone alignments
@@ -1311,6 +1516,7 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
         logger.info(f"Finished exporting TextGrids to {self.export_output_directory}!")
         logger.debug(f"Exported TextGrids in a total of {time.time() - begin:.3f} seconds")
 
+    @profile_stage()
     def export_files(
         self,
         output_directory: typing.Union[Path, str],
@@ -1448,12 +1654,6 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
             update_mappings = []
             indices = []
             to_comp = []
-            score_func = functools.partial(
-                align_phones,
-                silence_phone=self.optional_silence_phone,
-                custom_mapping=mapping,
-                debug=config.DEBUG,
-            )
             unaligned_utts = []
             utterances: typing.List[Utterance] = session.query(Utterance).options(
                 joinedload(Utterance.file, innerjoin=True),
@@ -1502,25 +1702,29 @@ class CorpusAligner(AcousticCorpusPronunciationMixin, AlignMixin, FileExporterMi
                     continue
                 indices.append(u)
                 to_comp.append((reference_phones, comparison_phones))
-            with ThreadPool(config.NUM_JOBS) as pool:
-                gen = pool.starmap(score_func, to_comp)
-                for i, (score, phone_error_rate, errors) in enumerate(gen):
-                    if score is None:
-                        continue
-                    u = indices[i]
-                    phone_confusions.update(errors)
-                    reference_phone_count = reference_phone_counts[u.id]
-                    update_mappings.append(
-                        {
-                            "id": u.id,
-                            "alignment_score": score,
-                            "phone_error_rate": phone_error_rate,
-                        }
-                    )
-                    score_count += 1
-                    score_sum += score
-                    phone_edit_sum += int(phone_error_rate * reference_phone_count)
-                    phone_length_sum += reference_phone_count
+            scores = batch_align_phones(
+                to_comp,
+                silence_phone=self.optional_silence_phone,
+                custom_mapping=mapping,
+                debug=config.DEBUG,
+            )
+            for i, (score, phone_error_rate, errors) in enumerate(scores):
+                if score is None:
+                    continue
+                u = indices[i]
+                phone_confusions.update(errors)
+                reference_phone_count = reference_phone_counts[u.id]
+                update_mappings.append(
+                    {
+                        "id": u.id,
+                        "alignment_score": score,
+                        "phone_error_rate": phone_error_rate,
+                    }
+                )
+                score_count += 1
+                score_sum += score
+                phone_edit_sum += int(phone_error_rate * reference_phone_count)
+                phone_length_sum += reference_phone_count
             bulk_update(session, Utterance, update_mappings)
             self.alignment_evaluation_done = True
             session.query(Corpus).update({Corpus.alignment_evaluation_done: True})
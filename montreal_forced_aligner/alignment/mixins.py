@@ -10,6 +10,8 @@ from abc import abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING, List
 
+import numpy as np
+
 from montreal_forced_aligner import config
 from montreal_forced_aligner.alignment.multiprocessing import (
     AlignArguments,
@@ -19,9 +21,18 @@ from montreal_forced_aligner.alignment.multiprocessing import (
     PhoneConfidenceArguments,
     PhoneConfidenceFunction,
 )
-from montreal_forced_aligner.db import CorpusWorkflow, Job, PhoneInterval, Utterance, bulk_update
+from montreal_forced_aligner.db import (
+    CorpusWorkflow,
+    Dictionary,
+    Job,
+    PhoneInterval,
+    Utterance,
+    bulk_update,
+    bulk_update_columns,
+)
 from montreal_forced_aligner.dictionary.mixins import DictionaryMixin
 from montreal_forced_aligner.exceptions import NoAlignmentsError
+from montreal_forced_aligner.journal import JobJournal
 from montreal_forced_aligner.utils import run_kaldi_function
 
 if TYPE_CHECKING:
@@ -49,6 +60,9 @@ class AlignMixin(DictionaryMixin):
         Size of the beam to use in decoding, defaults to 10
     retry_beam : int
         Size of the beam to use in decoding if it fails with the initial beam width, defaults to 40
+    cache_training_graphs : bool
+        Flag for compiling training graphs once per unique transcript and reusing them across
+        utterances, defaults to True
 
 
     See Also
@@ -60,10 +74,15 @@ class AlignMixin(DictionaryMixin):
     ----------
     jobs: list[:class:`~montreal_forced_aligner.corpus.multiprocessing.Job`]
         Jobs to process
+    alignment_seconds_per_utterance: float
+        Wall time per utterance of the most recent alignment pass that was not for training,
+        None if there has not been one
     """
 
     logger: logging.Logger
     jobs: List[Job]
+    #: Number of phone intervals to accumulate before updating phone goodness in the database
+    phone_confidence_batch_size: int = 100000
 
     def __init__(
         self,
@@ -76,6 +95,7 @@ class AlignMixin(DictionaryMixin):
         fine_tune: bool = False,
         phone_confidence: bool = False,
         use_phone_model: bool = False,
+        cache_training_graphs: bool = True,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -88,16 +108,53 @@ class AlignMixin(DictionaryMixin):
         self.fine_tune = fine_tune
         self.phone_confidence = phone_confidence
         self.use_phone_model = use_phone_model
+        self.cache_training_graphs = cache_training_graphs
         if self.retry_beam <= self.beam:
             self.retry_beam = self.beam * 4
         self.unaligned_files = set()
         self.final_alignment = False
+        self.alignment_seconds_per_utterance = None
+        self._journals = {}
 
     @property
     def tree_path(self) -> Path:
         """Path to tree file"""
         return self.working_directory.joinpath("tree")
 
+    @property
+    def journal(self) -> JobJournal:
+        """Journal of the steps and jobs completed in the current working directory"""
+        path = self.working_directory.joinpath(JobJournal.file_name)
+        if path not in self._journals:
+            self._journals[path] = JobJournal(path)
+        return self._journals[path]
+
+    def reset_journal(self) -> None:
+        """Delete the journal of the current working directory so no previous steps are skipped"""
+        self._journals.pop(self.working_directory.joinpath(JobJournal.file_name), None)
+        JobJournal.delete(self.working_directory)
+
+    def journal_inputs(self) -> MetaDict:
+        """
+        Inputs of alignment steps recorded in the :attr:`.journal`, so that steps completed
+        before a restart are run again if the model, tree, lexicon FSTs or alignment options
+        have changed
+
+        Returns
+        -------
+        dict[str, Any]
+            Input files and alignment options
+        """
+        with self.session() as session:
+            lexicon_fst_paths = [d.lexicon_fst_path for d in session.query(Dictionary)]
+        return {
+            "model": self.model_path,
+            "alignment_model": self.alignment_model_path,
+            "tree": self.tree_path,
+            "lexicon_fsts": lexicon_fst_paths,
+            **self.align_options,
+        }
+
     @property
     @abstractmethod
     def data_directory(self) -> str:
@@ -129,6 +186,7 @@ class AlignMixin(DictionaryMixin):
                     self.working_directory.joinpath("tree"),
                     self.alignment_model_path,
                     getattr(self, "use_g2p", False),
+                    self.cache_training_graphs,
                 )
             )
         return args
@@ -238,7 +296,11 @@ class AlignMixin(DictionaryMixin):
         os.makedirs(log_directory, exist_ok=True)
         logger.info("Compiling training graphs...")
         arguments = self.compile_train_graphs_arguments()
-        for _ in run_kaldi_function(CompileTrainGraphsFunction, arguments):
+        for _ in run_kaldi_function(
+            CompileTrainGraphsFunction,
+            arguments,
+            journal=self.journal.step("compile_train_graphs", self.journal_inputs()),
+        ):
             pass
         logger.debug(f"Compiling training graphs took {time.time() - begin:.3f} seconds")
 
@@ -251,19 +313,53 @@ class AlignMixin(DictionaryMixin):
 
         with self.session() as session:
             arguments = self.phone_confidence_arguments()
-            interval_update_mappings = []
-            for result in run_kaldi_function(
+            interval_ids = []
+            goodness = []
+            batch_count = 0
+            for ids, scores in run_kaldi_function(
                 PhoneConfidenceFunction, arguments, total_count=self.num_current_utterances
             ):
-                interval_update_mappings.extend(result)
-            bulk_update(session, PhoneInterval, interval_update_mappings)
-            session.commit()
+                interval_ids.append(ids)
+                goodness.append(scores)
+                batch_count += len(ids)
+                if batch_count >= self.phone_confidence_batch_size:
+                    bulk_update_columns(
+                        session,
+                        PhoneInterval,
+                        {
+                            "id": np.concatenate(interval_ids),
+                            "phone_goodness": np.concatenate(goodness),
+                        },
+                    )
+                    session.commit()
+                    interval_ids = []
+                    goodness = []
+                    batch_count = 0
+            if batch_count:
+                bulk_update_columns(
+                    session,
+                    PhoneInterval,
+                    {
+                        "id": np.concatenate(interval_ids),
+                        "phone_goodness": np.concatenate(goodness),
+                    },
+                )
+                session.commit()
         logger.debug(f"Calculating phone confidences took {time.time() - begin:.3f} seconds")
 
     def align_utterances(self, training=False) -> None:
         """
         Multiprocessing function that aligns based on the current model.
 
+        When training, finished jobs are recorded in the :attr:`.journal` and skipped after a
+        restart, otherwise the step is only skipped once its log-likelihoods are in the database.
+
+        Parameters
+        ----------
+        training: bool
+            Flag for whether alignments are for training, in which case utterance
+            log-likelihoods are not saved to the database
+
         See Also
         --------
         :class:`~montreal_forced_aligner.alignment.multiprocessing.AlignFunction`
@@ -276,6 +372,14 @@ class AlignMixin(DictionaryMixin):
             Reference Kaldi script
         """
         begin = time.time()
+        iteration = getattr(self, "iteration", None)
+        step_name = "align" if iteration is None else f"align.{iteration}"
+        if getattr(self, "uses_speaker_adaptation", False):
+            step_name += ".fmllr"
+        journal_step = self.journal.step(step_name, self.journal_inputs())
+        if not training and journal_step.is_complete():
+            logger.info("Alignments were generated before a restart, skipping.")
+            return
         logger.info("Generating alignments...")
         self.working_log_directory.mkdir(parents=True, exist_ok=True)
         log_like_sum = 0
@@ -283,8 +387,12 @@ class AlignMixin(DictionaryMixin):
         update_mappings = []
         num_errors = 0
         num_successful = 0
+        arguments = self.align_arguments()
         for utterance, log_likelihood in run_kaldi_function(
-            AlignFunction, self.align_arguments(), total_count=self.num_current_utterances
+            AlignFunction,
+            arguments,
+            total_count=self.num_current_utterances,
+            journal=journal_step if training else None,
         ):
             if log_likelihood:
                 num_successful += 1
@@ -323,10 +431,17 @@ class AlignMixin(DictionaryMixin):
                 workflow.time_stamp = datetime.datetime.now()
                 workflow.score = log_like_sum / log_like_count
                 session.commit()
+            journal_step.complete(
+                outputs=[x for args in arguments for x in AlignFunction.job_outputs(args)]
+            )
         logger.debug(
             f"Aligned {num_successful}, errors on {num_errors}, total {num_successful + num_errors}"
         )
         logger.debug(f"Alignment round took {time.time() - begin:.3f} seconds")
+        if not training:
+            self.alignment_seconds_per_utterance = (time.time() - begin) / max(
+                num_successful + num_errors, 1
+            )
 
     @property
     @abstractmethod
@@ -5,13 +5,13 @@ Alignment multiprocessing functions
 from __future__ import annotations
 
 import collections
+import itertools
 import json
 import logging
 import math
 import multiprocessing as mp
 import os
 import shutil
-import statistics
 import sys
 import time
 import traceback
@@ -21,13 +21,22 @@ from queue import Empty
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pywrapfst
+import scipy.sparse
 import sqlalchemy
 from _kalpy import feat as kalpy_feat
 from _kalpy import transform as kalpy_transform
-from _kalpy.gmm import gmm_compute_likes
+from _kalpy.fstext import VectorFst, VectorFstWriter
+from _kalpy.gmm import AccumAmDiagGmm, gmm_compute_likes
 from _kalpy.hmm import TransitionModel
-from _kalpy.matrix import FloatMatrix, FloatSubMatrix
-from _kalpy.util import RandomAccessBaseDoubleMatrixReader, RandomAccessBaseFloatMatrixReader
+from _kalpy.matrix import DoubleMatrix, DoubleVector, FloatMatrix, FloatSubMatrix
+from _kalpy.util import (
+    Input,
+    Int32VectorWriter,
+    Output,
+    RandomAccessBaseDoubleMatrixReader,
+    RandomAccessBaseFloatMatrixReader,
+)
 from kalpy.data import Segment
 from kalpy.decoder.data import FstArchive
 from kalpy.decoder.training_graphs import TrainingGraphCompiler
@@ -38,8 +47,8 @@ from kalpy.gmm.align import GmmAligner
 from kalpy.gmm.data import AlignmentArchive, TranscriptionArchive
 from kalpy.gmm.train import GmmStatsAccumulator
 from kalpy.gmm.utils import read_gmm_model
-from kalpy.utils import generate_read_specifier, read_kaldi_object
-from sqlalchemy.orm import joinedload, selectinload, subqueryload
+from kalpy.utils import generate_read_specifier, generate_write_specifier, read_kaldi_object
+from sqlalchemy.orm import joinedload, subqueryload
 
 from montreal_forced_aligner.abc import KaldiFunction
 from montreal_forced_aligner.data import (
@@ -53,6 +62,7 @@ from montreal_forced_aligner.data import (
 )
 from montreal_forced_aligner.db import (
     CorpusWorkflow,
+    Dictionary,
     File,
     Job,
     Phone,
@@ -84,24 +94,37 @@ else:
 
 __all__ = [
     "AlignmentExtractionFunction",
+    "AlignmentStatisticsArguments",
+    "AlignmentStatisticsFunction",
     "ExportTextGridProcessWorker",
     "AlignmentExtractionArguments",
     "ExportTextGridArguments",
     "AlignFunction",
     "AlignArguments",
-    "AnalyzeAlignmentsFunction",
     "AnalyzeAlignmentsArguments",
     "AnalyzeTranscriptsFunction",
+    "alignment_quality_statement",
     "AccStatsFunction",
     "AccStatsArguments",
+    "AlignAccStatsFunction",
+    "AlignAccStatsArguments",
+    "SumAccsFunction",
+    "SumAccsArguments",
+    "read_gmm_accs",
+    "write_gmm_accs",
+    "CachedTrainingGraphCompiler",
     "CompileTrainGraphsFunction",
     "CompileTrainGraphsArguments",
     "GeneratePronunciationsArguments",
     "GeneratePronunciationsFunction",
+    "PronunciationCountAccumulator",
+    "PronunciationCountFunction",
     "FineTuneArguments",
     "FineTuneFunction",
     "PhoneConfidenceArguments",
     "PhoneConfidenceFunction",
+    "phone_pdf_weight_matrix",
+    "phone_goodness_scores",
 ]
 
 logger = logging.getLogger("mfa")
@@ -133,6 +156,32 @@ class GeneratePronunciationsArguments(MfaArguments):
     for_g2p: bool
 
 
+@dataclass
+class AlignmentStatisticsArguments(MfaArguments):
+    """
+    Arguments for :class:`~montreal_forced_aligner.alignment.multiprocessing.AlignmentStatisticsFunction`
+
+    Parameters
+    ----------
+    job_name: int
+        Integer ID of the job
+    session: :class:`sqlalchemy.orm.scoped_session` or str
+        SqlAlchemy scoped session or string for database connections
+    log_path: :class:`~pathlib.Path`
+        Path to save logging information during the run
+    transition_model: :class:`_kalpy.hmm.TransitionModel`
+        Transition model
+    phone_symbol_table_path: :class:`~pathlib.Path`
+        Path to phone symbol table
+    frame_shift: float
+        Frame shift in seconds
+    """
+
+    transition_model: TransitionModel
+    phone_symbol_table_path: Path
+    frame_shift: float
+
+
 @dataclass
 class AlignmentExtractionArguments(MfaArguments):
     """
@@ -230,6 +279,8 @@ class CompileTrainGraphsArguments(MfaArguments):
         Path to model file
     use_g2p: bool
         Flag for whether acoustic model uses g2p
+    cache_graphs: bool
+        Flag for reusing compiled graphs across utterances with identical transcripts
     """
 
     working_directory: Path
@@ -237,6 +288,7 @@ class CompileTrainGraphsArguments(MfaArguments):
     tree_path: Path
     model_path: Path
     use_g2p: bool
+    cache_graphs: bool
 
 
 @dataclass
@@ -272,7 +324,7 @@ class AlignArguments(MfaArguments):
 @dataclass
 class AnalyzeAlignmentsArguments(MfaArguments):
     """
-    Arguments for :class:`~montreal_forced_aligner.alignment.multiprocessing.AnalyzeAlignmentsFunction`
+    Arguments for :class:`~montreal_forced_aligner.alignment.multiprocessing.AnalyzeTranscriptsFunction`
 
     Parameters
     ----------
@@ -376,10 +428,280 @@ class AccStatsArguments(MfaArguments):
         Path to working directory
     model_path: :class:`~pathlib.Path`
         Path to model file
+    accumulator_directory: :class:`~pathlib.Path`, optional
+        Directory to write accumulators to, if None, accumulators are returned to the main process
     """
 
     working_directory: Path
     model_path: Path
+    accumulator_directory: typing.Optional[Path]
+
+
+@dataclass
+class AlignAccStatsArguments(MfaArguments):
+    """
+    Arguments for :class:`~montreal_forced_aligner.alignment.multiprocessing.AlignAccStatsFunction`
+
+    Parameters
+    ----------
+    job_name: int
+        Integer ID of the job
+    session: :class:`sqlalchemy.orm.scoped_session` or str
+        SqlAlchemy scoped session or string for database connections
+    log_path: :class:`~pathlib.Path`
+        Path to save logging information during the run
+    working_directory: :class:`~pathlib.Path`
+        Path to working directory
+    model_path: :class:`~pathlib.Path`
+        Path to model file
+    align_options: dict[str, Any]
+        Alignment options
+    accumulator_directory: :class:`~pathlib.Path`, optional
+        Directory to write accumulators to, if None, accumulators are returned to the main process
+    write_alignments: bool
+        Flag for whether to write alignment archives for later steps to reuse
+    """
+
+    working_directory: Path
+    model_path: Path
+    align_options: MetaDict
+    accumulator_directory: typing.Optional[Path]
+    write_alignments: bool
+
+
+@dataclass
+class SumAccsArguments(MfaArguments):
+    """
+    Arguments for :class:`~montreal_forced_aligner.alignment.multiprocessing.SumAccsFunction`
+
+    Parameters
+    ----------
+    job_name: int
+        Integer ID of the job
+    session: :class:`sqlalchemy.orm.scoped_session` or str
+        SqlAlchemy scoped session or string for database connections
+    log_path: :class:`~pathlib.Path`
+        Path to save logging information during the run
+    acc_paths: list[:class:`~pathlib.Path`]
+        Paths of accumulator files to sum
+    output_path: :class:`~pathlib.Path`
+        Path to write the summed accumulators to
+    """
+
+    acc_paths: typing.List[Path]
+    output_path: Path
+
+
+def write_gmm_accs(path: Path, transition_accs: DoubleVector, gmm_accs: AccumAmDiagGmm) -> None:
+    """
+    Write transition and GMM accumulators in the binary format of :kaldi_src:`gmm-acc-stats-ali`
+
+    Parameters
+    ----------
+    path: :class:`~pathlib.Path`
+        Path to write to
+    transition_accs: :class:`_kalpy.matrix.DoubleVector`
+        Transition accumulators
+    gmm_accs: :class:`_kalpy.gmm.AccumAmDiagGmm`
+        GMM accumulators
+    """
+    ko = Output(str(path), True)
+    transition_accs.Write(ko.Stream(), True)
+    gmm_accs.Write(ko.Stream(), True)
+    ko.Close()
+
+
+def read_gmm_accs(paths: typing.List[Path]) -> typing.Tuple[DoubleVector, AccumAmDiagGmm]:
+    """
+    Read and sum accumulator files, equivalent to :kaldi_src:`gmm-sum-accs`
+
+    Parameters
+    ----------
+    paths: list[:class:`~pathlib.Path`]
+        Accumulator files to sum
+
+    Returns
+    -------
+    :class:`_kalpy.matrix.DoubleVector`
+        Summed transition accumulators
+    :class:`_kalpy.gmm.AccumAmDiagGmm`
+        Summed GMM accumulators
+    """
+    transition_accs = DoubleVector()
+    gmm_accs = AccumAmDiagGmm()
+    for path in paths:
+        ki = Input()
+        ki.Open(str(path), True)
+        transition_accs.Read(ki.Stream(), True, True)
+        gmm_accs.Read(ki.Stream(), True, True)
+        ki.Close()
+    return transition_accs, gmm_accs
+
+
+class CachedTrainingGraphCompiler(TrainingGraphCompiler):
+    """
+    Training graph compiler that reuses compiled graphs for repeated transcripts
+
+    Utterances in read speech corpora frequently share the exact same transcript, so rather than
+    composing the lexicon with every transcript from scratch, each unique transcript is compiled
+    once and its graph is written out for every utterance that uses it.  Graphs are only kept in
+    memory while there are utterances left that will use them, so memory usage is bounded by
+    ``max_cache_size`` rather than the number of utterances.
+
+    Notes
+    -----
+    Caching happens at the level of full transcripts rather than per-word HCLG fragments, as
+    triphone context and the lexicon's optional silence states span word boundaries, so
+    concatenated per-word fragments would not be equivalent to the graphs compiled by Kaldi.
+
+    Parameters
+    ----------
+    max_cache_size: int
+        Maximum number of compiled graphs to keep in memory, defaults to 10000
+    **kwargs
+        Parameters for :class:`kalpy.decoder.training_graphs.TrainingGraphCompiler`
+
+    Attributes
+    ----------
+    cache_hits: int
+        Number of utterances whose graphs were reused from the cache
+    cache_misses: int
+        Number of graphs that had to be compiled
+    """
+
+    def __init__(self, *args, max_cache_size: int = 10000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_cache_size = max_cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._fst_cache: typing.Dict[str, VectorFst] = {}
+
+    def compile_fst(
+        self,
+        transcript: str,
+        interjection_words: typing.List[str] = None,
+        cutoff_pattern: str = None,
+    ) -> typing.Optional[VectorFst]:
+        """
+        Compile a transcript to a training graph, reusing previously compiled graphs
+
+        Parameters
+        ----------
+        transcript: str
+            Orthographic transcript to compile
+        interjection_words: list[str], optional
+            List of words to add as interjections to the transcript
+        cutoff_pattern: str, optional
+            Cutoff symbol to use for inserting cutoffs before words
+
+        Returns
+        -------
+        :class:`_kalpy.fstext.VectorFst`
+            Training graph of transcript
+        """
+        if interjection_words or cutoff_pattern is not None:
+            return super().compile_fst(transcript, interjection_words, cutoff_pattern)
+        if transcript in self._fst_cache:
+            self.cache_hits += 1
+            return self._fst_cache[transcript]
+        self.cache_misses += 1
+        fst = super().compile_fst(transcript)
+        if len(self._fst_cache) < self.max_cache_size:
+            self._fst_cache[transcript] = fst
+        return fst
+
+    def _compile_batch(
+        self,
+        transcripts: typing.List[str],
+        interjection_words: typing.Optional[typing.Dict[str, float]],
+        cutoff_pattern: typing.Optional[str],
+    ) -> typing.Dict[str, VectorFst]:
+        """Compile unique transcripts in a single Kaldi batch"""
+        if interjection_words:
+            fsts = self.compiler.CompileGraphs(
+                [
+                    self.generate_utterance_graph(t, interjection_words, cutoff_pattern)
+                    for t in transcripts
+                ]
+            )
+        else:
+            fsts = self.compiler.CompileGraphsFromText(
+                [[self.to_int(x) for x in t.split()] for t in transcripts]
+            )
+        assert len(fsts) == len(transcripts)
+        self.cache_misses += len(transcripts)
+        return dict(zip(transcripts, fsts))
+
+    def export_graphs(
+        self,
+        file_name: os.PathLike,
+        transcripts: typing.Iterable[typing.Tuple[str, str]],
+        write_scp: bool = False,
+        callback: typing.Callable = None,
+        interjection_words: typing.Dict[str, float] = None,
+        cutoff_pattern: str = None,
+    ) -> None:
+        """
+        Export training graphs to a kaldi archive file, compiling each unique transcript once
+
+        Parameters
+        ----------
+        file_name: :class:`~pathlib.Path` or str
+            Archive file path to export to
+        transcripts: iterable[tuple[str, str]]
+            Utterance IDs and transcripts, in the order to be written
+        write_scp: bool
+            Flag for whether an SCP file should be generated as well
+        callback: callable, optional
+            Callback function for progress updates
+        interjection_words: dict[str, float], optional
+            Interjection words and their costs to add to the transcripts
+        cutoff_pattern: str, optional
+            Cutoff symbol to use for inserting cutoffs before words
+        """
+        graph_logger = logging.getLogger("kalpy.graphs")
+        transcripts = [(str(key), transcript) for key, transcript in transcripts]
+        remaining_uses = collections.Counter(t for _, t in transcripts)
+        writer = VectorFstWriter(generate_write_specifier(file_name, write_scp))
+        num_done = 0
+        num_error = 0
+        for batch_start in range(0, len(transcripts), self.batch_size):
+            batch = transcripts[batch_start : batch_start + self.batch_size]
+            to_compile = list(dict.fromkeys(t for _, t in batch if t not in self._fst_cache))
+            compiled = {}
+            if to_compile:
+                compiled = self._compile_batch(to_compile, interjection_words, cutoff_pattern)
+            batch_done = 0
+            for key, transcript in batch:
+                if transcript in self._fst_cache:
+                    fst = self._fst_cache[transcript]
+                    self.cache_hits += 1
+                else:
+                    fst = compiled[transcript]
+                remaining_uses[transcript] -= 1
+                if remaining_uses[transcript] == 0:
+                    self._fst_cache.pop(transcript, None)
+                elif (
+                    transcript not in self._fst_cache
+                    and len(self._fst_cache) < self.max_cache_size
+                ):
+                    self._fst_cache[transcript] = fst
+                if fst.Start() == pywrapfst.NO_STATE_ID:
+                    graph_logger.warning(f"Skipping {key}, empty FST for {transcript}")
+                    num_error += 1
+                    continue
+                writer.Write(key, fst)
+                batch_done += 1
+            del compiled
+            num_done += batch_done
+            if callback:
+                callback(batch_done)
+        writer.Close()
+        self._fst_cache = {}
+        graph_logger.info(
+            f"Done {num_done} utterances, errors on {num_error}, "
+            f"reused {self.cache_hits} graphs and compiled {self.cache_misses}."
+        )
 
 
 class CompileTrainGraphsFunction(KaldiFunction):
@@ -401,12 +723,18 @@ class CompileTrainGraphsFunction(KaldiFunction):
         Arguments for the function
     """
 
+    @classmethod
+    def job_outputs(cls, args: CompileTrainGraphsArguments) -> typing.List[Path]:
+        """Training graph archives of the job for each dictionary"""
+        return sorted(args.working_directory.glob(f"fsts.*.{args.job_name}.ark"))
+
     def __init__(self, args: CompileTrainGraphsArguments):
         super().__init__(args)
         self.tree_path = args.tree_path
         self.lexicon_compilers = args.lexicon_compilers
         self.model_path = args.model_path
         self.use_g2p = args.use_g2p
+        self.cache_graphs = args.cache_graphs
 
     def _run(self):
         """Run the function"""
@@ -454,7 +782,10 @@ class CompileTrainGraphsFunction(KaldiFunction):
                     if interjection_words and d.oov_word not in interjection_costs:
                         interjection_costs[d.oov_word] = min(interjection_costs.values())
                         # interjection_costs[d.cutoff_word] = min(interjection_costs.values())
-                compiler = TrainingGraphCompiler(
+                compiler_class = (
+                    CachedTrainingGraphCompiler if self.cache_graphs else TrainingGraphCompiler
+                )
+                compiler = compiler_class(
                     self.model_path,
                     self.tree_path,
                     lexicon,
@@ -506,10 +837,20 @@ class AccStatsFunction(KaldiFunction):
         Arguments for the function
     """
 
+    releases_gil = True
+
+    @classmethod
+    def job_outputs(cls, args: AccStatsArguments) -> typing.Optional[typing.List[Path]]:
+        """Accumulator files of the job, if they are written to disk"""
+        if args.accumulator_directory is None:
+            return None
+        return sorted(args.accumulator_directory.glob(f"{args.job_name}.*.acc"))
+
     def __init__(self, args: AccStatsArguments):
         super().__init__(args)
         self.working_directory = args.working_directory
         self.model_path = args.model_path
+        self.accumulator_directory = args.accumulator_directory
 
     def _run(self) -> None:
         """Run the function"""
@@ -544,7 +885,201 @@ class AccStatsFunction(KaldiFunction):
                 accumulator.accumulate_stats(
                     feature_archive, alignment_archive, callback=self.callback
                 )
-                self.callback((accumulator.transition_accs, accumulator.gmm_accs))
+                if self.accumulator_directory is None:
+                    self.callback((accumulator.transition_accs, accumulator.gmm_accs))
+                    continue
+                acc_path = self.accumulator_directory.joinpath(f"{self.job_name}.{dict_id}.acc")
+                write_gmm_accs(acc_path, accumulator.transition_accs, accumulator.gmm_accs)
+                self.callback(acc_path)
+
+
+class AlignAccStatsFunction(KaldiFunction):
+    """
+    Multiprocessing function that aligns utterances and accumulates stats for GMM training
+    from the alignments in the same pass over the features
+
+    Alignment uses a copy of the model with boosted silence, while stats are accumulated
+    for the unmodified model, matching running
+    :class:`~montreal_forced_aligner.alignment.multiprocessing.AlignFunction` followed by
+    :class:`~montreal_forced_aligner.alignment.multiprocessing.AccStatsFunction`.
+
+    See Also
+    --------
+    :meth:`.AcousticModelTrainingMixin.accumulate_gmm_stats`
+        Main function that calls this function in parallel
+    :meth:`.AcousticModelTrainingMixin.align_acc_stats_arguments`
+        Job method for generating arguments for this function
+    :kaldi_src:`gmm-align-compiled`
+        Relevant Kaldi binary
+    :kaldi_src:`gmm-acc-stats-ali`
+        Relevant Kaldi binary
+
+    Parameters
+    ----------
+    args: :class:`~montreal_forced_aligner.alignment.multiprocessing.AlignAccStatsArguments`
+        Arguments for the function
+    """
+
+    releases_gil = True
+    progress_interval = 100
+
+    @classmethod
+    def job_outputs(cls, args: AlignAccStatsArguments) -> typing.Optional[typing.List[Path]]:
+        """Accumulator files and alignment archives of the job, if they are written to disk"""
+        if args.accumulator_directory is None:
+            return None
+        outputs = sorted(args.accumulator_directory.glob(f"{args.job_name}.*.acc"))
+        if args.write_alignments:
+            outputs.extend(sorted(args.working_directory.glob(f"ali.*.{args.job_name}.ark")))
+        return outputs
+
+    def __init__(self, args: AlignAccStatsArguments):
+        super().__init__(args)
+        self.working_directory = args.working_directory
+        self.model_path = args.model_path
+        self.align_options = args.align_options
+        self.accumulator_directory = args.accumulator_directory
+        self.write_alignments = args.write_alignments
+
+    def _run(self) -> None:
+        """Run the function"""
+        with self.session() as session, thread_logger(
+            "kalpy.train", self.log_path, job_name=self.job_name
+        ) as train_logger:
+            train_logger.debug(f"Align options: {self.align_options}")
+            job: Job = (
+                session.query(Job)
+                .options(joinedload(Job.corpus, innerjoin=True), subqueryload(Job.dictionaries))
+                .filter(Job.id == self.job_name)
+                .first()
+            )
+            align_options = dict(self.align_options)
+            boost_silence = align_options.pop("boost_silence", 1.0)
+            silence_phones = [
+                x
+                for x, in session.query(Phone.mapping_id).filter(
+                    Phone.phone_type == PhoneType.silence, Phone.phone != "<eps>"
+                )
+            ]
+            aligner = GmmAligner(self.model_path, **align_options)
+            aligner.boost_silence(boost_silence, silence_phones)
+            for d in job.training_dictionaries:
+                train_logger.debug(
+                    f"Aligning and accumulating stats for dictionary {d.name} ({d.id})"
+                )
+                train_logger.debug(f"Model: {self.model_path}")
+                dict_id = d.id
+                accumulator = GmmStatsAccumulator(self.model_path)
+                fst_path = job.construct_path(self.working_directory, "fsts", "ark", dict_id)
+                feature_archive = job.construct_feature_archive(self.working_directory, dict_id)
+                train_logger.debug(f"Training graph archive: {fst_path}")
+                train_logger.debug("Feature Archive information:")
+                train_logger.debug(f"CMVN: {feature_archive.cmvn_read_specifier}")
+                train_logger.debug(f"Deltas: {feature_archive.use_deltas}")
+                train_logger.debug(f"Splices: {feature_archive.use_splices}")
+                train_logger.debug(f"LDA: {feature_archive.lda_mat_file_name}")
+                train_logger.debug(f"fMLLR: {feature_archive.transform_read_specifier}")
+                training_graph_archive = FstArchive(fst_path)
+                ali_path = job.construct_path(self.working_directory, "ali", "ark", dict_id)
+                ali_path.unlink(missing_ok=True)
+                writer = None
+                if self.write_alignments:
+                    train_logger.debug(f"Alignment path: {ali_path}")
+                    writer = Int32VectorWriter(generate_write_specifier(ali_path))
+                num_done = 0
+                num_error = 0
+                tot_like = 0.0
+                tot_t = 0
+                try:
+                    for utterance_id, feats in feature_archive:
+                        if feats.NumRows() == 0:
+                            train_logger.warning(
+                                f"Skipping {utterance_id} due to zero-length features"
+                            )
+                            continue
+                        try:
+                            training_graph = training_graph_archive[utterance_id]
+                        except KeyError:
+                            train_logger.warning(
+                                f"Skipping {utterance_id} due to missing training graph"
+                            )
+                            continue
+                        try:
+                            alignment = aligner.align_utterance(
+                                training_graph, feats, utterance_id
+                            )
+                        except Exception as e:
+                            train_logger.warning(f"Error on {utterance_id}: {e}")
+                            alignment = None
+                        if alignment is None:
+                            num_error += 1
+                            continue
+                        if writer is not None:
+                            writer.Write(str(utterance_id), alignment.alignment)
+                        tot_like += accumulator.gmm_accs.acc_stats(
+                            accumulator.acoustic_model,
+                            accumulator.transition_model,
+                            alignment.alignment,
+                            feats,
+                        )
+                        accumulator.transition_model.acc_stats(
+                            alignment.alignment, accumulator.transition_accs
+                        )
+                        tot_t += len(alignment.alignment)
+                        num_done += 1
+                        if num_done % self.progress_interval == 0:
+                            self.callback(self.progress_interval)
+                finally:
+                    if writer is not None:
+                        writer.Close()
+                if num_done % self.progress_interval:
+                    self.callback(num_done % self.progress_interval)
+                train_logger.info(f"Done {num_done}, errors on {num_error}")
+                if tot_t:
+                    train_logger.info(
+                        f"Overall avg like per frame (Gaussian only) = {tot_like / tot_t} "
+                        f"over {tot_t} frames."
+                    )
+                if self.accumulator_directory is None:
+                    self.callback((accumulator.transition_accs, accumulator.gmm_accs))
+                    continue
+                acc_path = self.accumulator_directory.joinpath(f"{self.job_name}.{dict_id}.acc")
+                write_gmm_accs(acc_path, accumulator.transition_accs, accumulator.gmm_accs)
+                self.callback(acc_path)
+
+
+class SumAccsFunction(KaldiFunction):
+    """
+    Multiprocessing function for summing GMM accumulators written by
+    :class:`~montreal_forced_aligner.alignment.multiprocessing.AccStatsFunction`
+
+    See Also
+    --------
+    :meth:`.AcousticModelTrainingMixin.tree_reduce_accs`
+        Main function that calls this function in parallel
+    :kaldi_src:`gmm-sum-accs`
+        Relevant Kaldi binary
+
+    Parameters
+    ----------
+    args: :class:`~montreal_forced_aligner.alignment.multiprocessing.SumAccsArguments`
+        Arguments for the function
+    """
+
+    def __init__(self, args: SumAccsArguments):
+        super().__init__(args)
+        self.acc_paths = args.acc_paths
+        self.output_path = args.output_path
+
+    def _run(self) -> None:
+        """Run the function"""
+        with thread_logger("kalpy.train", self.log_path, job_name=self.job_name) as train_logger:
+            transition_accs, gmm_accs = read_gmm_accs(self.acc_paths)
+            train_logger.debug(f"Summed {len(self.acc_paths)} accumulators")
+            write_gmm_accs(self.output_path, transition_accs, gmm_accs)
+            for path in self.acc_paths:
+                path.unlink()
+            self.callback(self.output_path)
 
 
 class AlignFunction(KaldiFunction):
@@ -568,6 +1103,25 @@ class AlignFunction(KaldiFunction):
         Arguments for the function
     """
 
+    releases_gil = True
+
+    @classmethod
+    def job_outputs(cls, args: AlignArguments) -> typing.List[Path]:
+        """
+        Alignment, word and likelihood archives of the job for each dictionary, along with the
+        first pass archives they link to
+
+        The archives are recorded under their own names, so that replacing a link to a first
+        pass archive, like when speaker-adapted alignment rewrites it, invalidates the step
+        """
+        outputs = []
+        for identifier in ["ali", "words", "likelihoods"]:
+            for path in sorted(args.working_directory.glob(f"{identifier}.*.{args.job_name}.ark")):
+                outputs.append(path)
+                if path.is_symlink():
+                    outputs.append(path.resolve())
+        return outputs
+
     def __init__(self, args: AlignArguments):
         super().__init__(args)
         self.working_directory = args.working_directory
@@ -672,87 +1226,46 @@ class AlignFunction(KaldiFunction):
                         )
 
 
-class AnalyzeAlignmentsFunction(KaldiFunction):
+def alignment_quality_statement(workflow_id: int) -> sqlalchemy.Select:
     """
-    Multiprocessing function for analyzing alignments.
+    Construct a grouped statement for per-utterance alignment quality measures
 
-    See Also
-    --------
-    :meth:`.CorpusAligner.analyze_alignments`
-        Main function that calls this function in parallel
-    :meth:`.CorpusAligner.calculate_speech_post_arguments`
-        Job method for generating arguments for this function
-    :kaldi_src:`lattice-to-post`
-        Relevant Kaldi binary
-    :kaldi_src:`weight-silence-post`
-        Relevant Kaldi binary
+    For each aligned utterance, the speech log-likelihood is the mean phone goodness
+    of its non-silence phone intervals and the duration deviation is the largest absolute
+    z-score of those intervals' durations against the phone duration statistics in
+    :class:`~montreal_forced_aligner.db.Phone`
 
     Parameters
     ----------
-    args: :class:`~montreal_forced_aligner.alignment.multiprocessing.CalculateSpeechPostArguments`
-        Arguments for the function
-    """
-
-    def __init__(self, args: AnalyzeAlignmentsArguments):
-        super().__init__(args)
-        self.model_path = args.model_path
-        self.align_options = args.align_options
+    workflow_id: int
+        Workflow of the phone intervals to analyze
 
-    def _run(self):
-        """Run the function"""
-
-        with self.session() as session:
-            job: Job = (
-                session.query(Job)
-                .options(joinedload(Job.corpus, innerjoin=True), subqueryload(Job.dictionaries))
-                .filter(Job.id == self.job_name)
-                .first()
-            )
-            workflow = (
-                session.query(CorpusWorkflow)
-                .filter(CorpusWorkflow.current == True)  # noqa
-                .first()
-            )
-            phones = {
-                k: (m, sd)
-                for k, m, sd in session.query(
-                    Phone.id, Phone.mean_duration, Phone.sd_duration
-                ).filter(
-                    Phone.phone_type == PhoneType.non_silence,
-                    Phone.sd_duration != None,  # noqa
-                    Phone.sd_duration != 0,
-                )
-            }
-            query = session.query(Utterance).filter(
-                Utterance.job_id == job.id, Utterance.alignment_log_likelihood != None  # noqa
-            )
-            for utterance in query:
-                phone_intervals = (
-                    session.query(PhoneInterval)
-                    .join(PhoneInterval.phone)
-                    .filter(
-                        PhoneInterval.utterance_id == utterance.id,
-                        PhoneInterval.workflow_id == workflow.id,
-                        Phone.id.in_(list(phones.keys())),
-                    )
-                    .all()
-                )
-                if not phone_intervals:
-                    continue
-                interval_count = len(phone_intervals)
-                log_like_sum = 0
-                duration_zscore_max = 0
-                for pi in phone_intervals:
-                    log_like_sum += pi.phone_goodness
-                    m, sd = phones[pi.phone_id]
-                    duration_zscore = abs((pi.duration - m) / sd)
-                    if duration_zscore > duration_zscore_max:
-                        duration_zscore_max = duration_zscore
-                utterance_speech_log_likelihood = log_like_sum / interval_count
-                utterance_duration_deviation = duration_zscore_max
-                self.callback(
-                    (utterance.id, utterance_speech_log_likelihood, utterance_duration_deviation)
+    Returns
+    -------
+    :class:`sqlalchemy.Select`
+        Statement selecting utterance id, speech log-likelihood and duration deviation
+    """
+    return (
+        sqlalchemy.select(
+            PhoneInterval.utterance_id.label("utterance_id"),
+            sqlalchemy.func.avg(PhoneInterval.phone_goodness).label("speech_log_likelihood"),
+            sqlalchemy.func.max(
+                sqlalchemy.func.abs(
+                    (PhoneInterval.duration - Phone.mean_duration) / Phone.sd_duration
                 )
+            ).label("duration_deviation"),
+        )
+        .join(Phone, PhoneInterval.phone_id == Phone.id)
+        .join(Utterance, PhoneInterval.utterance_id == Utterance.id)
+        .where(
+            PhoneInterval.workflow_id == workflow_id,
+            Phone.phone_type == PhoneType.non_silence,
+            Phone.sd_duration != None,  # noqa
+            Phone.sd_duration != 0,
+            Utterance.alignment_log_likelihood != None,  # noqa
+        )
+        .group_by(PhoneInterval.utterance_id)
+    )
 
 
 class AnalyzeTranscriptsFunction(KaldiFunction):
@@ -830,6 +1343,10 @@ class FineTuneFunction(KaldiFunction):
     """
     Multiprocessing function for fine tuning alignment.
 
+    Features are computed at a 1 ms frame shift once per utterance, and the window around each
+    phone boundary is sliced from them.  Training graphs for phone group pairs are compiled once
+    per job and reused for every boundary with the same pair.
+
     Parameters
     ----------
     args: :class:`~montreal_forced_aligner.alignment.multiprocessing.FineTuneArguments`
@@ -848,9 +1365,77 @@ class FineTuneFunction(KaldiFunction):
         self.frame_shift_seconds = args.original_frame_shift
 
         self.new_frame_shift_seconds = 0.001
-        self.feature_padding_factor = 3
         self.padding = round(self.frame_shift_seconds, 3)
         self.splice_frames = 3
+        self.pair_graphs = {}
+
+    def pair_graph(self, compiler: TrainingGraphCompiler, text: str) -> VectorFst:
+        """
+        Get the training graph for a phone group pair, compiling it on first use
+
+        Parameters
+        ----------
+        compiler: :class:`kalpy.decoder.training_graphs.TrainingGraphCompiler`
+            Compiler for phone group transcripts
+        text: str
+            Phone group pair
+
+        Returns
+        -------
+        :class:`_kalpy.fstext.VectorFst`
+            Training graph
+        """
+        if text not in self.pair_graphs:
+            self.pair_graphs[text] = compiler.compile_fst(text)
+        return self.pair_graphs[text]
+
+    def utterance_features(
+        self,
+        segment: Segment,
+        cmvn: typing.Optional[DoubleMatrix] = None,
+        transform: typing.Optional[FloatMatrix] = None,
+        lda_mat: typing.Optional[FloatMatrix] = None,
+        use_deltas: bool = True,
+        use_splices: bool = False,
+    ) -> FloatMatrix:
+        """
+        Compute transformed features for a full utterance at the fine tuning frame shift
+
+        Parameters
+        ----------
+        segment: :class:`kalpy.data.Segment`
+            Utterance segment, its audio is shared between MFCC and pitch computation
+        cmvn: :class:`_kalpy.matrix.DoubleMatrix`, optional
+            Speaker CMVN statistics
+        transform: :class:`_kalpy.matrix.FloatMatrix`, optional
+            Speaker fMLLR transform
+        lda_mat: :class:`_kalpy.matrix.FloatMatrix`, optional
+            LDA transform
+        use_deltas: bool
+            Flag for adding delta features
+        use_splices: bool
+            Flag for splicing frames
+
+        Returns
+        -------
+        :class:`_kalpy.matrix.FloatMatrix`
+            Feature matrix
+        """
+        feats = self.mfcc_computer.compute_mfccs_for_export(segment, compress=False)
+        if cmvn is not None:
+            kalpy_transform.ApplyCmvn(cmvn, False, feats)
+        if self.pitch_computer is not None:
+            pitch = self.pitch_computer.compute_pitch_for_export(segment, compress=False)
+            feats = kalpy_feat.paste_feats([feats, pitch], 0)
+        if use_deltas:
+            feats = kalpy_feat.compute_deltas(kalpy_feat.DeltaFeaturesOptions(), feats)
+        elif use_splices:
+            feats = kalpy_feat.splice_frames(feats, self.splice_frames, self.splice_frames)
+            if lda_mat is not None:
+                feats = kalpy_transform.apply_transform(feats, lda_mat)
+        if transform is not None:
+            feats = kalpy_transform.apply_transform(feats, transform)
+        return feats
 
     def _run(self):
         """Run the function"""
@@ -893,16 +1478,42 @@ class FineTuneFunction(KaldiFunction):
                 self.tree_path,
                 self.lexicon_compiler,
             )
+            use_splices = False
+            use_deltas = True
+            lda_mat = None
+            if workflow.lda_mat_path.exists():
+                use_splices = True
+                use_deltas = False
+                lda_mat = read_kaldi_object(FloatMatrix, workflow.lda_mat_path)
+            boost_silence = self.align_options.pop("boost_silence", 1.0)
+            end_padding = round(self.frame_shift_seconds * 1.5, 3)
+            prev_padding = round(self.frame_shift_seconds * 1.5, 3)
             for d_id in job.dictionary_ids:
-                utterance_query = (
-                    session.query(Utterance, SoundFile.sound_file_path)
+                interval_query = (
+                    session.query(
+                        Utterance.id,
+                        Utterance.speaker_id,
+                        Utterance.begin,
+                        Utterance.end,
+                        Utterance.channel,
+                        SoundFile.sound_file_path,
+                        PhoneInterval.id,
+                        PhoneInterval.begin,
+                        PhoneInterval.end,
+                        Phone.kaldi_label,
+                    )
+                    .join(PhoneInterval.utterance)
+                    .join(PhoneInterval.phone)
                     .join(Utterance.file)
                     .join(Utterance.speaker)
                     .join(File.sound_file)
-                    .filter(Utterance.job_id == self.job_name, Speaker.dictionary_id == d_id)
-                    .order_by(Utterance.kaldi_id)
+                    .filter(
+                        Utterance.job_id == self.job_name,
+                        Speaker.dictionary_id == d_id,
+                        PhoneInterval.workflow_id == workflow.id,
+                    )
+                    .order_by(Utterance.kaldi_id, PhoneInterval.begin)
                 )
-                boost_silence = self.align_options.pop("boost_silence", 1.0)
                 aligner = GmmAligner(
                     self.model_path,
                     disambiguation_symbols=disambiguation_symbols,
@@ -910,14 +1521,6 @@ class FineTuneFunction(KaldiFunction):
                 )
                 if boost_silence != 1.0:
                     aligner.boost_silence(boost_silence, silence_phones)
-                delta_options = kalpy_feat.DeltaFeaturesOptions()
-                use_splices = False
-                use_deltas = True
-                lda_mat = None
-                if workflow.lda_mat_path.exists():
-                    use_splices = True
-                    use_deltas = False
-                    lda_mat = read_kaldi_object(FloatMatrix, workflow.lda_mat_path)
 
                 cmvn_reader = None
                 cmvn_path = cmvn_paths[d_id]
@@ -933,87 +1536,56 @@ class FineTuneFunction(KaldiFunction):
                 current_speaker = None
                 current_transform = None
                 current_cmvn = None
-                for utterance, sf_path in utterance_query:
-                    interval_query = (
-                        session.query(PhoneInterval, Phone.kaldi_label)
-                        .join(PhoneInterval.phone)
-                        .filter(
-                            PhoneInterval.utterance_id == utterance.id,
-                            PhoneInterval.workflow_id == workflow.id,
-                        )
-                        .order_by(PhoneInterval.begin)
-                    )
-                    prev_label = None
-                    if utterance.speaker_id != current_speaker:
-                        current_speaker = utterance.speaker_id
+                for utterance_key, intervals in itertools.groupby(
+                    interval_query, key=lambda x: x[:6]
+                ):
+                    _, speaker_id, utterance_begin, utterance_end, channel, sf_path = utterance_key
+                    if speaker_id != current_speaker:
+                        current_speaker = speaker_id
                         if cmvn_reader is not None and cmvn_reader.HasKey(str(current_speaker)):
                             current_cmvn = cmvn_reader.Value(str(current_speaker))
                         if transform_reader is not None and transform_reader.HasKey(
                             str(current_speaker)
                         ):
                             current_transform = transform_reader.Value(str(current_speaker))
+                    feats = None
+                    prev_label = None
                     interval_mapping = []
-                    for interval, phone in interval_query:
+                    for *_, interval_id, interval_begin, interval_end, phone in intervals:
                         if prev_label is None:
                             prev_label = phone
                             interval_mapping.append(
-                                {"id": interval.id, "begin": interval.begin, "end": interval.end}
+                                {"id": interval_id, "begin": interval_begin, "end": interval_end}
                             )
                             continue
-                        end_padding = round(self.frame_shift_seconds * 1.5, 3)
-                        prev_padding = round(self.frame_shift_seconds * 1.5, 3)
-                        segment_begin = max(round(interval.begin - prev_padding, 4), 0)
-                        feature_segment_begin = max(
-                            round(
-                                interval.begin - (prev_padding * self.feature_padding_factor), 4
-                            ),
-                            0,
-                        )
-                        segment_end = round(min(interval.begin + end_padding, interval.end), 3)
-                        feature_segment_end = min(
-                            round(interval.begin + (end_padding * self.feature_padding_factor), 4),
-                            utterance.end,
+                        if feats is None:
+                            feats = self.utterance_features(
+                                Segment(sf_path, utterance_begin, utterance_end, channel),
+                                current_cmvn,
+                                current_transform,
+                                lda_mat,
+                                use_deltas=use_deltas,
+                                use_splices=use_splices,
+                            )
+                        segment_begin = max(
+                            round(interval_begin - prev_padding, 4), utterance_begin
                         )
-                        begin_offset = round(segment_begin - feature_segment_begin, 4)
-                        end_offset = round(segment_end - feature_segment_begin, 4)
-                        segment = Segment(
-                            sf_path, feature_segment_begin, feature_segment_end, utterance.channel
+                        segment_end = round(min(interval_begin + end_padding, interval_end), 3)
+                        start_frame = int(round((segment_begin - utterance_begin) * 1000))
+                        end_frame = min(
+                            int(round((segment_end - utterance_begin) * 1000)), feats.NumRows()
                         )
                         text = f"{self.phone_to_group_mapping[prev_label]} {self.phone_to_group_mapping[phone]}"
-
-                        train_graph = compiler.compile_fst(text)
-
-                        feats = self.mfcc_computer.compute_mfccs_for_export(
-                            segment, compress=False
-                        )
-                        if current_cmvn is not None:
-                            kalpy_transform.ApplyCmvn(current_cmvn, False, feats)
-
-                        if self.pitch_computer is not None:
-                            pitch = self.pitch_computer.compute_pitch_for_export(
-                                segment, compress=False
+                        train_graph = self.pair_graph(compiler, text)
+                        window = FloatMatrix(
+                            FloatSubMatrix(
+                                feats, start_frame, end_frame - start_frame, 0, feats.NumCols()
                             )
-                            feats = kalpy_feat.paste_feats([feats, pitch], 0)
-                        if use_deltas:
-                            feats = kalpy_feat.compute_deltas(delta_options, feats)
-                        elif use_splices:
-                            feats = kalpy_feat.splice_frames(
-                                feats, self.splice_frames, self.splice_frames
-                            )
-                            if lda_mat is not None:
-                                feats = kalpy_transform.apply_transform(feats, lda_mat)
-                        if current_transform is not None:
-                            feats = kalpy_transform.apply_transform(feats, current_transform)
-                        start_samp = int(round(begin_offset * 1000))
-                        end_samp = int(round(end_offset * 1000))
-                        sub_matrix = FloatSubMatrix(
-                            feats, start_samp, end_samp - start_samp, 0, feats.NumCols()
                         )
-                        feats = FloatMatrix(sub_matrix)
-                        alignment = aligner.align_utterance(train_graph, feats)
+                        alignment = aligner.align_utterance(train_graph, window)
                         if alignment is None:
                             aligner.acoustic_scale = 0.1
-                            alignment = aligner.align_utterance(train_graph, feats)
+                            alignment = aligner.align_utterance(train_graph, window)
                             aligner.acoustic_scale = 1.0
                         ctm_intervals = alignment.generate_ctm(
                             aligner.transition_model,
@@ -1022,12 +1594,9 @@ class FineTuneFunction(KaldiFunction):
                         )
                         interval_mapping.append(
                             {
-                                "id": interval.id,
-                                "begin": round(
-                                    ctm_intervals[1].begin + feature_segment_begin + begin_offset,
-                                    4,
-                                ),
-                                "end": interval.end,
+                                "id": interval_id,
+                                "begin": round(ctm_intervals[1].begin + segment_begin, 4),
+                                "end": interval_end,
                                 "label": phone_mapping[ctm_intervals[1].label],
                             }
                         )
@@ -1052,6 +1621,93 @@ class FineTuneFunction(KaldiFunction):
                     self.callback((interval_mapping, deletions))
 
 
+def phone_pdf_weight_matrix(
+    phone_pdf_counts_path: Path,
+) -> typing.Tuple[typing.List[str], scipy.sparse.csr_matrix]:
+    """
+    Construct a sparse matrix mapping pdf likelihoods to phone likelihoods
+
+    Each phone's column holds the relative frequency of each pdf in alignments of that phone,
+    with positional variants of the phone merged
+
+    Parameters
+    ----------
+    phone_pdf_counts_path: :class:`~pathlib.Path`
+        Path to JSON file with pdf counts per phone
+
+    Returns
+    -------
+    list[str]
+        Phones in column order
+    :class:`scipy.sparse.csr_matrix`
+        Weight matrix with a row per pdf and a column per phone
+    """
+    with mfa_open(phone_pdf_counts_path, "r") as f:
+        data = json.load(f)
+    phone_pdf_mapping = collections.defaultdict(collections.Counter)
+    for phone, pdf_counts in data.items():
+        phone = split_phone_position(phone)[0]
+        for pdf, count in pdf_counts.items():
+            phone_pdf_mapping[phone][int(pdf)] += count
+    phones = sorted(phone_pdf_mapping.keys())
+    pdfs = []
+    columns = []
+    weights = []
+    for i, phone in enumerate(phones):
+        pdf_counts = phone_pdf_mapping[phone]
+        phone_total = sum(pdf_counts.values())
+        for pdf, count in pdf_counts.items():
+            pdfs.append(pdf)
+            columns.append(i)
+            weights.append(count / phone_total)
+    num_pdfs = max(pdfs) + 1 if pdfs else 0
+    weight_matrix = scipy.sparse.csr_matrix(
+        (weights, (pdfs, columns)), shape=(num_pdfs, len(phones))
+    )
+    return phones, weight_matrix
+
+
+def phone_goodness_scores(
+    phone_likes: np.ndarray,
+    frame_begins: np.ndarray,
+    frame_ends: np.ndarray,
+    interval_phones: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute the goodness of pronunciation for phone intervals of an utterance
+
+    The score for each frame is the difference between the likelihood of the best scoring
+    phone and the likelihood of the aligned phone, and an interval's goodness is the mean
+    over its frames
+
+    Parameters
+    ----------
+    phone_likes: :class:`numpy.ndarray`
+        Phone likelihoods with a row per frame and a column per phone
+    frame_begins: :class:`numpy.ndarray`
+        First frame of each interval
+    frame_ends: :class:`numpy.ndarray`
+        Frame after the last frame of each interval
+    interval_phones: :class:`numpy.ndarray`
+        Column index of the aligned phone of each interval
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Goodness per interval, NaN for intervals without frames
+    """
+    num_frames = phone_likes.shape[0]
+    margins = phone_likes.max(axis=1, keepdims=True) - phone_likes
+    cumulative = np.zeros((num_frames + 1, phone_likes.shape[1]))
+    np.cumsum(margins, axis=0, out=cumulative[1:])
+    frame_begins = np.minimum(frame_begins, num_frames)
+    frame_ends = np.minimum(frame_ends, num_frames)
+    counts = frame_ends - frame_begins
+    sums = cumulative[frame_ends, interval_phones] - cumulative[frame_begins, interval_phones]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
 class PhoneConfidenceFunction(KaldiFunction):
     """
     Multiprocessing function to calculate phone confidence metrics
@@ -1077,76 +1733,73 @@ class PhoneConfidenceFunction(KaldiFunction):
 
     def _run(self):
         """Run the function"""
-
-        with mfa_open(self.phone_pdf_counts_path, "r") as f:
-            data = json.load(f)
-        phone_pdf_mapping = collections.defaultdict(collections.Counter)
-        for phone, pdf_counts in data.items():
-            phone = split_phone_position(phone)[0]
-            for pdf, count in pdf_counts.items():
-                phone_pdf_mapping[phone][int(pdf)] += count
-        phones = {p: i for i, p in enumerate(sorted(phone_pdf_mapping.keys()))}
-        reversed_phones = {k: v for v, k in phones.items()}
-
-        for phone, pdf_counts in phone_pdf_mapping.items():
-            phone_total = sum(pdf_counts.values())
-            for pdf, count in pdf_counts.items():
-                phone_pdf_mapping[phone][int(pdf)] = count / phone_total
+        phones, pdf_weights = phone_pdf_weight_matrix(self.phone_pdf_counts_path)
+        phone_indices = {p: i for i, p in enumerate(phones)}
+        num_pdfs = pdf_weights.shape[0]
         _, acoustic_model = read_gmm_model(self.model_path)
         with self.session() as session:
             job: typing.Optional[Job] = session.get(
                 Job, self.job_name, options=[joinedload(Job.dictionaries), joinedload(Job.corpus)]
             )
-            utterances = (
-                session.query(Utterance)
-                .filter(Utterance.job_id == self.job_name)
-                .options(
-                    selectinload(Utterance.phone_intervals).joinedload(
-                        PhoneInterval.phone, innerjoin=True
+            workflow: CorpusWorkflow = (
+                session.query(CorpusWorkflow)
+                .filter(CorpusWorkflow.current == True)  # noqa
+                .first()
+            )
+            for dict_id in job.dictionary_ids:
+                interval_query = (
+                    session.query(
+                        PhoneInterval.utterance_id,
+                        PhoneInterval.id,
+                        PhoneInterval.begin,
+                        PhoneInterval.end,
+                        Utterance.begin,
+                        Phone.phone,
+                    )
+                    .join(PhoneInterval.utterance)
+                    .join(PhoneInterval.phone)
+                    .join(Utterance.speaker)
+                    .filter(
+                        Utterance.job_id == self.job_name,
+                        Speaker.dictionary_id == dict_id,
+                        PhoneInterval.workflow_id == workflow.id,
+                        Phone.phone_type != PhoneType.silence,
                     )
+                    .order_by(PhoneInterval.utterance_id)
                 )
-            )
-            utterances = {u.id: (u.begin, u.phone_intervals) for u in utterances}
+                rows = [x for x in interval_query if x[5] in phone_indices]
+                if not rows:
+                    continue
+                utterance_ids = np.array([x[0] for x in rows])
+                interval_ids = np.array([x[1] for x in rows])
+                utterance_begins = np.array([x[4] for x in rows])
+                frame_begins = (
+                    ((np.array([x[2] for x in rows]) - utterance_begins) * 1000) / 10
+                ).astype(np.int64)
+                frame_ends = (
+                    ((np.array([x[3] for x in rows]) - utterance_begins) * 1000) / 10
+                ).astype(np.int64)
+                frame_ends[frame_begins == frame_ends] += 1
+                interval_phones = np.array([phone_indices[x[5]] for x in rows])
+                del rows
 
-            for dict_id in job.dictionary_ids:
                 feature_archive = job.construct_feature_archive(self.working_directory, dict_id)
-                interval_mappings = []
-
                 for utterance_id, feats in feature_archive:
                     utterance_id = int(utterance_id.split("-")[-1])
+                    lower = np.searchsorted(utterance_ids, utterance_id, side="left")
+                    upper = np.searchsorted(utterance_ids, utterance_id, side="right")
+                    if lower == upper:
+                        continue
                     likelihoods = gmm_compute_likes(acoustic_model, feats).numpy()
-                    phone_likes = np.zeros((likelihoods.shape[0], len(phones)))
-                    for i, p in reversed_phones.items():
-                        like = likelihoods[:, [x for x in phone_pdf_mapping[p].keys()]]
-                        weight = np.array([x for x in phone_pdf_mapping[p].values()])
-                        phone_likes[:, i] = np.dot(like, weight)
-                    top_phone_inds = np.argmax(phone_likes, axis=1)
-                    utt_begin, intervals = utterances[utterance_id]
-                    for pi in intervals:
-                        if pi.phone.phone == "sil":
-                            continue
-                        frame_begin = int(((pi.begin - utt_begin) * 1000) / 10)
-                        frame_end = int(((pi.end - utt_begin) * 1000) / 10)
-                        if frame_begin == frame_end:
-                            frame_end += 1
-                        frame_end = min(frame_end, top_phone_inds.shape[0])
-                        alternate_labels = collections.Counter()
-                        scores = []
-
-                        for i in range(frame_begin, frame_end):
-                            top_phone_ind = top_phone_inds[i]
-                            alternate_label = reversed_phones[top_phone_ind]
-                            alternate_label = split_phone_position(alternate_label)[0]
-                            alternate_labels[alternate_label] += 1
-                            if alternate_label == pi.phone.phone:
-                                scores.append(0)
-                            else:
-                                actual_score = phone_likes[i, phones[pi.phone.phone]]
-                                scores.append(phone_likes[i, top_phone_ind] - actual_score)
-                        average_score = statistics.mean(scores)
-                        interval_mappings.append({"id": pi.id, "phone_goodness": float(average_score)})
-                    self.callback(interval_mappings)
-                    interval_mappings = []
+                    phone_likes = np.asarray(likelihoods[:, :num_pdfs] @ pdf_weights)
+                    goodness = phone_goodness_scores(
+                        phone_likes,
+                        frame_begins[lower:upper],
+                        frame_ends[lower:upper],
+                        interval_phones[lower:upper],
+                    )
+                    valid = ~np.isnan(goodness)
+                    self.callback((interval_ids[lower:upper][valid], goodness[valid]))
 
 
 class GeneratePronunciationsFunction(KaldiFunction):
@@ -1211,8 +1864,23 @@ class GeneratePronunciationsFunction(KaldiFunction):
                         counter.ngram_counts[w_p, next_w_p]["non_silence"] += 1
         return counter
 
-    def _run(self) -> None:
-        """Run the function"""
+    def _word_pronunciations(
+        self,
+    ) -> typing.Generator[
+        typing.Tuple[Dictionary, int, typing.List[typing.Tuple[str, str]]], None, None
+    ]:
+        """
+        Generate the word pronunciations of each aligned utterance in the job
+
+        Yields
+        ------
+        :class:`~montreal_forced_aligner.db.Dictionary`
+            Pronunciation dictionary of the utterance
+        int
+            Utterance ID
+        list[tuple[str, str]]
+            Word and pronunciation of each word interval
+        """
         with self.session() as session:
             job = (
                 session.query(Job)
@@ -1255,21 +1923,312 @@ class GeneratePronunciationsFunction(KaldiFunction):
                             if pronunciation != d.oov_phone:
                                 pronunciation = "cutoff_model"
                         word_pronunciations.append((label, pronunciation))
-                    if self.for_g2p:
-                        phones = []
-                        for i, x in enumerate(word_pronunciations):
-                            if i > 0 and (
-                                x[0].startswith(d.clitic_marker)
-                                or word_pronunciations[i - 1][0].endswith(d.clitic_marker)
-                            ):
-                                phones.pop(-1)
-                            else:
-                                phones.append(WORD_BEGIN_SYMBOL)
-                            phones.extend(x[1].split())
-                            phones.append(WORD_END_SYMBOL)
-                        self.callback((d.id, utterance, " ".join(phones)))
+                    yield d, utterance, word_pronunciations
+
+    def _run(self) -> None:
+        """Run the function"""
+        for d, utterance, word_pronunciations in self._word_pronunciations():
+            if self.for_g2p:
+                phones = []
+                for i, x in enumerate(word_pronunciations):
+                    if i > 0 and (
+                        x[0].startswith(d.clitic_marker)
+                        or word_pronunciations[i - 1][0].endswith(d.clitic_marker)
+                    ):
+                        phones.pop(-1)
                     else:
-                        self.callback((d.id, self._process_pronunciations(word_pronunciations)))
+                        phones.append(WORD_BEGIN_SYMBOL)
+                    phones.extend(x[1].split())
+                    phones.append(WORD_END_SYMBOL)
+                self.callback((d.id, utterance, " ".join(phones)))
+            else:
+                self.callback((d.id, self._process_pronunciations(word_pronunciations)))
+
+
+class PronunciationCountAccumulator:
+    """
+    Array-based accumulator for the counts used in pronunciation probability modeling
+
+    Word pronunciations are assigned indices as they are first seen, and the index sequences of
+    utterances are buffered and counted with vectorized operations in batches.  Index 0 is the
+    utterance initial ``("<s>", "")`` and index 1 is the utterance final ``("</s>", "")``.
+
+    Parameters
+    ----------
+    silence_words: set[str]
+        Words that are counted as silence
+    batch_size: int
+        Number of buffered words to count at once, defaults to 1000000
+
+    Attributes
+    ----------
+    pronunciations: list[tuple[str, str]]
+        Word pronunciations in index order
+    counts: :class:`numpy.ndarray`
+        Pronunciation, silence following, non-silence following, silence before and non-silence
+        before counts, with a row per count type and a column per pronunciation index
+    """
+
+    def __init__(self, silence_words: typing.Set[str], batch_size: int = 1000000):
+        self.silence_words = silence_words
+        self.batch_size = batch_size
+        self.pronunciations = [("<s>", ""), ("</s>", "")]
+        self.pronunciation_indices = {x: i for i, x in enumerate(self.pronunciations)}
+        self.counts = np.zeros((5, 0), dtype=np.int64)
+        self.bigram_keys = np.zeros(0, dtype=np.int64)
+        self.bigram_counts = np.zeros(0, dtype=np.int64)
+        self._sequence = []
+        self._silence = []
+
+    def add(self, word_pronunciations: typing.List[typing.Tuple[str, str]]) -> None:
+        """
+        Add an utterance's word pronunciations
+
+        Parameters
+        ----------
+        word_pronunciations: list[tuple[str, str]]
+            Word and pronunciation of each word interval
+        """
+        self._sequence.append(0)
+        self._silence.append(False)
+        for w_p in word_pronunciations:
+            index = self.pronunciation_indices.get(w_p, None)
+            if index is None:
+                index = len(self.pronunciations)
+                self.pronunciation_indices[w_p] = index
+                self.pronunciations.append(w_p)
+            self._sequence.append(index)
+            self._silence.append(w_p[0] in self.silence_words)
+        self._sequence.append(1)
+        self._silence.append(False)
+        if len(self._sequence) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Count the buffered utterances"""
+        if not self._sequence:
+            return
+        sequence = np.array(self._sequence, dtype=np.int64)
+        silence = np.array(self._silence, dtype=bool)
+        self._sequence = []
+        self._silence = []
+        num_pronunciations = len(self.pronunciations)
+        counts = np.zeros((5, num_pronunciations), dtype=np.int64)
+        counts[:, : self.counts.shape[1]] = self.counts
+
+        has_previous = sequence[1:] != 0
+        current = sequence[1:][has_previous]
+        previous_silence = silence[:-1][has_previous]
+        counts[3] += np.bincount(current[previous_silence], minlength=num_pronunciations)
+        counts[4] += np.bincount(current[~previous_silence], minlength=num_pronunciations)
+
+        counts[0] += np.bincount(sequence[~silence], minlength=num_pronunciations)
+        following = np.flatnonzero(~silence & (sequence != 1))
+        next_silence = silence[following + 1]
+        counts[1] += np.bincount(sequence[following[next_silence]], minlength=num_pronunciations)
+        counts[2] += np.bincount(sequence[following[~next_silence]], minlength=num_pronunciations)
+        self.counts = counts
+
+        targets = sequence[np.where(next_silence, following + 2, following + 1)]
+        keys = np.concatenate([self.bigram_keys, (sequence[following] << 32) | targets])
+        bigram_counts = np.concatenate(
+            [self.bigram_counts, np.ones(following.shape[0], dtype=np.int64)]
+        )
+        self.bigram_keys, inverse = np.unique(keys, return_inverse=True)
+        self.bigram_counts = np.bincount(inverse, weights=bigram_counts).astype(np.int64)
+
+    def finalize(
+        self,
+    ) -> typing.Tuple[
+        typing.List[typing.Tuple[str, str]], np.ndarray, np.ndarray, np.ndarray, np.ndarray
+    ]:
+        """
+        Count any buffered utterances and return the accumulated counts
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            Word pronunciations in index order
+        :class:`numpy.ndarray`
+            Count matrix
+        :class:`numpy.ndarray`
+            First pronunciation index of each bigram
+        :class:`numpy.ndarray`
+            Second pronunciation index of each bigram, skipping over silence
+        :class:`numpy.ndarray`
+            Count of each bigram
+        """
+        self.flush()
+        return (
+            self.pronunciations,
+            self.counts,
+            self.bigram_keys >> 32,
+            self.bigram_keys & 0xFFFFFFFF,
+            self.bigram_counts,
+        )
+
+
+class PronunciationCountFunction(GeneratePronunciationsFunction):
+    """
+    Multiprocessing function for counting pronunciations and their silence contexts with arrays
+
+    Returns a single result per dictionary in the job, the dictionary ID followed by the output
+    of :meth:`~montreal_forced_aligner.alignment.multiprocessing.PronunciationCountAccumulator.finalize`,
+    along with integer progress updates
+
+    See Also
+    --------
+    :meth:`.CorpusAligner.compute_pronunciation_probabilities`
+        Main function that calls this function in parallel
+    :meth:`.CorpusAligner.generate_pronunciations_arguments`
+        Job method for generating arguments for this function
+
+    Parameters
+    ----------
+    args: :class:`~montreal_forced_aligner.alignment.multiprocessing.GeneratePronunciationsArguments`
+        Arguments for the function
+    """
+
+    progress_interval = 100
+
+    def _run(self) -> None:
+        """Run the function"""
+        dictionary_id = None
+        accumulator = None
+        num_done = 0
+        for d, _, word_pronunciations in self._word_pronunciations():
+            if d.id != dictionary_id:
+                if accumulator is not None:
+                    self.callback((dictionary_id, *accumulator.finalize()))
+                dictionary_id = d.id
+                accumulator = PronunciationCountAccumulator(self.silence_words)
+            accumulator.add(word_pronunciations)
+            num_done += 1
+            if num_done >= self.progress_interval:
+                self.callback(num_done)
+                num_done = 0
+        if accumulator is not None:
+            self.callback((dictionary_id, *accumulator.finalize()))
+        if num_done:
+            self.callback(num_done)
+
+
+class AlignmentStatisticsFunction(KaldiFunction):
+    """
+    Multiprocessing function for collecting phone durations and speech log-likelihoods directly
+    from alignment archives, without extracting word and phone intervals into the database
+
+    Durations and phone IDs of the non-silence phones of each utterance are saved to a
+    temporary ``.npz`` file in the workflow directory along with the utterance's speech
+    log-likelihood, so that duration deviations can be calculated once phone duration statistics
+    over all jobs are known.  Returns integer progress updates followed by the path of the
+    ``.npz`` file and the count, duration sum and squared duration sum of each phone ID.
+
+    See Also
+    --------
+    :meth:`.CorpusAligner.analyze_alignment_archives`
+        Main function that calls this function in parallel
+    :meth:`.CorpusAligner.alignment_statistics_arguments`
+        Job method for generating arguments for this function
+
+    Parameters
+    ----------
+    args: :class:`~montreal_forced_aligner.alignment.multiprocessing.AlignmentStatisticsArguments`
+        Arguments for the function
+    """
+
+    progress_interval = 100
+
+    def __init__(self, args: AlignmentStatisticsArguments):
+        super().__init__(args)
+        self.transition_model = args.transition_model
+        self.phone_symbol_table_path = args.phone_symbol_table_path
+        self.frame_shift = args.frame_shift
+
+    def _run(self) -> None:
+        """Run the function"""
+        phone_table = pywrapfst.SymbolTable.read_text(self.phone_symbol_table_path)
+        with self.session() as session:
+            job: Job = (
+                session.query(Job)
+                .options(subqueryload(Job.dictionaries))
+                .filter(Job.id == self.job_name)
+                .first()
+            )
+            workflow: CorpusWorkflow = (
+                session.query(CorpusWorkflow)
+                .filter(CorpusWorkflow.current == True)  # noqa
+                .first()
+            )
+            phones = {
+                label: p_id
+                for p_id, label in session.query(Phone.id, Phone.kaldi_label).filter(
+                    Phone.phone_type == PhoneType.non_silence
+                )
+            }
+            working_directory = workflow.working_directory
+            archive_paths = [
+                (
+                    job.construct_path(working_directory, "ali", "ark", dict_id),
+                    job.construct_path(working_directory, "likelihoods", "ark", dict_id),
+                )
+                for dict_id in job.dictionary_ids
+            ]
+        utterance_ids = []
+        interval_counts = []
+        speech_log_likelihoods = []
+        phone_ids = []
+        durations = []
+        num_done = 0
+        for ali_path, likes_path in archive_paths:
+            if not ali_path.exists():
+                continue
+            alignment_archive = AlignmentArchive(ali_path, likelihood_file_name=likes_path)
+            for alignment in alignment_archive:
+                intervals = alignment.generate_ctm(
+                    self.transition_model, phone_table, self.frame_shift
+                )
+                count = 0
+                log_likelihood_sum = 0.0
+                for interval in intervals:
+                    p_id = phones.get(interval.label, None)
+                    if p_id is None:
+                        continue
+                    phone_ids.append(p_id)
+                    durations.append(interval.end - interval.begin)
+                    if interval.confidence:
+                        log_likelihood_sum += interval.confidence
+                    count += 1
+                utterance_ids.append(int(alignment.utterance_id.split("-")[-1]))
+                interval_counts.append(count)
+                speech_log_likelihoods.append(log_likelihood_sum / count if count else np.nan)
+                num_done += 1
+                if num_done >= self.progress_interval:
+                    self.callback(num_done)
+                    num_done = 0
+            alignment_archive.close()
+        if num_done:
+            self.callback(num_done)
+        phone_ids = np.array(phone_ids, dtype=np.int64)
+        durations = np.array(durations, dtype=np.float64)
+        statistics_path = working_directory.joinpath(f"alignment_statistics.{self.job_name}.npz")
+        np.savez(
+            statistics_path,
+            utterance_ids=np.array(utterance_ids, dtype=np.int64),
+            interval_counts=np.array(interval_counts, dtype=np.int64),
+            speech_log_likelihoods=np.array(speech_log_likelihoods, dtype=np.float64),
+            phone_ids=phone_ids,
+            durations=durations,
+        )
+        num_phones = max(phones.values()) + 1 if phones else 0
+        self.callback(
+            (
+                statistics_path,
+                np.bincount(phone_ids, minlength=num_phones),
+                np.bincount(phone_ids, weights=durations, minlength=num_phones),
+                np.bincount(phone_ids, weights=durations**2, minlength=num_phones),
+            )
+        )
 
 
 class AlignmentExtractionFunction(KaldiFunction):
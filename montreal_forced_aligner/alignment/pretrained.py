@@ -40,6 +40,7 @@ from montreal_forced_aligner.online.alignment import (
     align_utterance_online,
     update_utterance_intervals,
 )
+from montreal_forced_aligner.profiling import profile_stage
 from montreal_forced_aligner.transcription.transcriber import TranscriberMixin
 from montreal_forced_aligner.utils import log_kaldi_errors, run_kaldi_function
 
@@ -189,6 +190,7 @@ class PretrainedAligner(TranscriberMixin, TopLevelMfaWorker):
             )
             session.commit()
 
+    @profile_stage()
     def setup(self) -> None:
         """Setup for alignment"""
         self.ignore_empty_utterances = True
@@ -351,6 +353,7 @@ class PretrainedAligner(TranscriberMixin, TopLevelMfaWorker):
             bulk_update(session, Utterance, update_mappings)
             session.commit()
 
+    @profile_stage()
     def align(self, workflow_name=None) -> None:
         """Run the aligner"""
         self.initialize_database()
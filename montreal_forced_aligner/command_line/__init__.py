@@ -4,26 +4,30 @@ Command line functionality
 
 """
 
-from montreal_forced_aligner.command_line.adapt import adapt_model_cli
-from montreal_forced_aligner.command_line.align import align_corpus_cli
-from montreal_forced_aligner.command_line.anchor import anchor_cli
-from montreal_forced_aligner.command_line.configure import configure_cli
-from montreal_forced_aligner.command_line.create_segments import create_segments_cli
-from montreal_forced_aligner.command_line.diarize_speakers import diarize_speakers_cli
-from montreal_forced_aligner.command_line.g2p import g2p_cli
-from montreal_forced_aligner.command_line.history import history_cli
-from montreal_forced_aligner.command_line.mfa import mfa_cli
-from montreal_forced_aligner.command_line.model import model_cli
-from montreal_forced_aligner.command_line.train_acoustic_model import train_acoustic_model_cli
-from montreal_forced_aligner.command_line.train_dictionary import train_dictionary_cli
-from montreal_forced_aligner.command_line.train_g2p import train_g2p_cli
-from montreal_forced_aligner.command_line.train_ivector_extractor import train_ivector_cli
-from montreal_forced_aligner.command_line.train_lm import train_lm_cli
-from montreal_forced_aligner.command_line.transcribe import transcribe_corpus_cli
-from montreal_forced_aligner.command_line.validate import (
-    validate_corpus_cli,
-    validate_dictionary_cli,
-)
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from montreal_forced_aligner.command_line.adapt import adapt_model_cli
+    from montreal_forced_aligner.command_line.align import align_corpus_cli
+    from montreal_forced_aligner.command_line.anchor import anchor_cli
+    from montreal_forced_aligner.command_line.configure import configure_cli
+    from montreal_forced_aligner.command_line.create_segments import create_segments_cli
+    from montreal_forced_aligner.command_line.diarize_speakers import diarize_speakers_cli
+    from montreal_forced_aligner.command_line.g2p import g2p_cli
+    from montreal_forced_aligner.command_line.history import history_cli
+    from montreal_forced_aligner.command_line.mfa import mfa_cli
+    from montreal_forced_aligner.command_line.model import model_cli
+    from montreal_forced_aligner.command_line.train_acoustic_model import train_acoustic_model_cli
+    from montreal_forced_aligner.command_line.train_dictionary import train_dictionary_cli
+    from montreal_forced_aligner.command_line.train_g2p import train_g2p_cli
+    from montreal_forced_aligner.command_line.train_ivector_extractor import train_ivector_cli
+    from montreal_forced_aligner.command_line.train_lm import train_lm_cli
+    from montreal_forced_aligner.command_line.transcribe import transcribe_corpus_cli
+    from montreal_forced_aligner.command_line.validate import (
+        validate_corpus_cli,
+        validate_dictionary_cli,
+    )
 
 __all__ = [
     "adapt",
@@ -63,3 +67,34 @@ __all__ = [
     "validate_dictionary_cli",
     "validate_corpus_cli",
 ]
+
+_cli_modules = {
+    "adapt_model_cli": "adapt",
+    "align_corpus_cli": "align",
+    "anchor_cli": "anchor",
+    "configure_cli": "configure",
+    "create_segments_cli": "create_segments",
+    "diarize_speakers_cli": "diarize_speakers",
+    "g2p_cli": "g2p",
+    "history_cli": "history",
+    "mfa_cli": "mfa",
+    "model_cli": "model",
+    "train_acoustic_model_cli": "train_acoustic_model",
+    "train_dictionary_cli": "train_dictionary",
+    "train_g2p_cli": "train_g2p",
+    "train_ivector_cli": "train_ivector_extractor",
+    "train_lm_cli": "train_lm",
+    "transcribe_corpus_cli": "transcribe",
+    "validate_corpus_cli": "validate",
+    "validate_dictionary_cli": "validate",
+}
+
+
+def __getattr__(name: str):
+    """Import command modules on first access so that running one command does not import all of them"""
+    if name in _cli_modules:
+        module = importlib.import_module(f"{__name__}.{_cli_modules[name]}")
+        return getattr(module, name)
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
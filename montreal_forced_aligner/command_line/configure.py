@@ -105,6 +105,28 @@ __all__ = ["configure_cli"]
     f"Currently defaults to {config.USE_POSTGRES}.",
     default=None,
 )
+@click.option(
+    "--enable_auto_execution/--disable_auto_execution",
+    "auto_execution",
+    help="If auto_execution is enabled, MFA will pick threads or processes for each multiprocessing "
+    "function and limit concurrent jobs based on available cores and memory. "
+    f"Currently defaults to {config.AUTO_EXECUTION}.",
+    default=None,
+)
+@click.option(
+    "--enable_pipeline_report/--disable_pipeline_report",
+    "pipeline_report",
+    help="Turn on/off recording of per-stage timing, memory and throughput reports. "
+    f"Currently defaults to {config.PIPELINE_REPORT}.",
+    default=None,
+)
+@click.option(
+    "--enable_prometheus_report/--disable_prometheus_report",
+    "prometheus_report",
+    help="Turn on/off saving pipeline reports in the Prometheus text format. "
+    f"Currently defaults to {config.PROMETHEUS_REPORT}.",
+    default=None,
+)
 @click.option(
     "--blas_num_threads",
     help="Number of threads to use for BLAS libraries, 1 is recommended "
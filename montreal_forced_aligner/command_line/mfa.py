@@ -2,52 +2,25 @@
 from __future__ import annotations
 
 import atexit
+import importlib
 import logging
 import sys
 import time
+import typing
 import warnings
 from datetime import datetime
 
 import rich_click as click
 
 from montreal_forced_aligner import config
-from montreal_forced_aligner.command_line.adapt import adapt_model_cli
-from montreal_forced_aligner.command_line.align import align_corpus_cli
-from montreal_forced_aligner.command_line.align_one import align_one_cli
-from montreal_forced_aligner.command_line.anchor import anchor_cli
-from montreal_forced_aligner.command_line.configure import configure_cli
-from montreal_forced_aligner.command_line.create_segments import (
-    create_segments_cli,
-    create_segments_vad_cli,
-)
-from montreal_forced_aligner.command_line.diarize_speakers import diarize_speakers_cli
-from montreal_forced_aligner.command_line.g2p import g2p_cli
-from montreal_forced_aligner.command_line.history import history_cli
-from montreal_forced_aligner.command_line.model import model_cli
-from montreal_forced_aligner.command_line.server import server_cli
-from montreal_forced_aligner.command_line.tokenize import tokenize_cli
-from montreal_forced_aligner.command_line.train_acoustic_model import train_acoustic_model_cli
-from montreal_forced_aligner.command_line.train_dictionary import train_dictionary_cli
-from montreal_forced_aligner.command_line.train_g2p import train_g2p_cli
-from montreal_forced_aligner.command_line.train_ivector_extractor import train_ivector_cli
-from montreal_forced_aligner.command_line.train_lm import train_lm_cli
-from montreal_forced_aligner.command_line.train_tokenizer import train_tokenizer_cli
-from montreal_forced_aligner.command_line.transcribe import (
-    transcribe_corpus_cli,
-    transcribe_speechbrain_cli,
-    transcribe_whisper_cli,
-)
-from montreal_forced_aligner.command_line.validate import (
-    validate_corpus_cli,
-    validate_dictionary_cli,
-)
-from montreal_forced_aligner.utils import check_third_party
 
 BEGIN = time.time()
 BEGIN_DATE = datetime.now()
 
 
-__all__ = ["ExitHooks", "mfa_cli"]
+__all__ = ["ExitHooks", "LazyGroup", "mfa_cli"]
+
+LIGHTWEIGHT_COMMANDS = {"configure", "version", "history"}
 
 
 class ExitHooks(object):
@@ -110,17 +83,70 @@ class ExitHooks(object):
             raise self.exception
 
 
+class LazyGroup(click.RichGroup):
+    """
+    Command group that imports subcommand modules only when their command is invoked
+
+    Parameters
+    ----------
+    lazy_subcommands: dict[str, str]
+        Mapping of command names to import paths of the form ``module:attribute``
+    """
+
+    def __init__(self, *args, lazy_subcommands: typing.Dict[str, str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> typing.List[str]:
+        """List both eagerly added and lazily loaded commands"""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands.keys()))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> typing.Optional[click.Command]:
+        """Get a command, importing its module if it has not been loaded yet"""
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
 @click.group(
     name="mfa",
+    cls=LazyGroup,
     help="Montreal Forced Aligner is a command line utility for aligning speech and text.",
+    lazy_subcommands={
+        "adapt": "montreal_forced_aligner.command_line.adapt:adapt_model_cli",
+        "align": "montreal_forced_aligner.command_line.align:align_corpus_cli",
+        "align_one": "montreal_forced_aligner.command_line.align_one:align_one_cli",
+        "anchor": "montreal_forced_aligner.command_line.anchor:anchor_cli",
+        "configure": "montreal_forced_aligner.command_line.configure:configure_cli",
+        "diarize": "montreal_forced_aligner.command_line.diarize_speakers:diarize_speakers_cli",
+        "g2p": "montreal_forced_aligner.command_line.g2p:g2p_cli",
+        "history": "montreal_forced_aligner.command_line.history:history_cli",
+        "model": "montreal_forced_aligner.command_line.model:model_cli",
+        "models": "montreal_forced_aligner.command_line.model:model_cli",
+        "segment": "montreal_forced_aligner.command_line.create_segments:create_segments_cli",
+        "segment_vad": "montreal_forced_aligner.command_line.create_segments:create_segments_vad_cli",
+        "server": "montreal_forced_aligner.command_line.server:server_cli",
+        "tokenize": "montreal_forced_aligner.command_line.tokenize:tokenize_cli",
+        "train": "montreal_forced_aligner.command_line.train_acoustic_model:train_acoustic_model_cli",
+        "train_dictionary": "montreal_forced_aligner.command_line.train_dictionary:train_dictionary_cli",
+        "train_g2p": "montreal_forced_aligner.command_line.train_g2p:train_g2p_cli",
+        "train_ivector": "montreal_forced_aligner.command_line.train_ivector_extractor:train_ivector_cli",
+        "train_lm": "montreal_forced_aligner.command_line.train_lm:train_lm_cli",
+        "train_tokenizer": "montreal_forced_aligner.command_line.train_tokenizer:train_tokenizer_cli",
+        "transcribe": "montreal_forced_aligner.command_line.transcribe:transcribe_corpus_cli",
+        "transcribe_speechbrain": "montreal_forced_aligner.command_line.transcribe:transcribe_speechbrain_cli",
+        "transcribe_whisper": "montreal_forced_aligner.command_line.transcribe:transcribe_whisper_cli",
+        "validate": "montreal_forced_aligner.command_line.validate:validate_corpus_cli",
+        "validate_dictionary": "montreal_forced_aligner.command_line.validate:validate_dictionary_cli",
+    },
 )
 @click.pass_context
 def mfa_cli(ctx: click.Context) -> None:
     """
     Main function for the MFA command line interface
     """
-    from montreal_forced_aligner.command_line.utils import check_server, start_server, stop_server
-
     config.load_configuration()
     auto_server = False
     run_check = True
@@ -152,16 +178,25 @@ def mfa_cli(ctx: click.Context) -> None:
         run_check = False
         auto_server = False
     if auto_server:
+        from montreal_forced_aligner.command_line.utils import start_server
+
         start_server()
     elif run_check:
+        from montreal_forced_aligner.command_line.utils import check_server
+
         check_server()
     warnings.simplefilter("ignore")
-    check_third_party()
+    if ctx.invoked_subcommand not in LIGHTWEIGHT_COMMANDS:
+        from montreal_forced_aligner.utils import check_third_party
+
+        check_third_party()
     if ctx.invoked_subcommand != "anchor":
         hooks = ExitHooks()
         hooks.hook()
         atexit.register(hooks.history_save_handler)
         if auto_server:
+            from montreal_forced_aligner.command_line.utils import stop_server
+
             atexit.register(stop_server)
 
 
@@ -177,31 +212,6 @@ def version_cli():
     click.echo(version)
 
 
-mfa_cli.add_command(adapt_model_cli)
-mfa_cli.add_command(align_corpus_cli)
-mfa_cli.add_command(align_one_cli)
-mfa_cli.add_command(anchor_cli)
-mfa_cli.add_command(diarize_speakers_cli)
-mfa_cli.add_command(create_segments_cli)
-mfa_cli.add_command(create_segments_vad_cli)
-mfa_cli.add_command(configure_cli)
-mfa_cli.add_command(history_cli)
-mfa_cli.add_command(g2p_cli)
-mfa_cli.add_command(model_cli, name="model")
-mfa_cli.add_command(model_cli, name="models")
-mfa_cli.add_command(server_cli)
-mfa_cli.add_command(tokenize_cli)
-mfa_cli.add_command(train_acoustic_model_cli)
-mfa_cli.add_command(train_dictionary_cli)
-mfa_cli.add_command(train_g2p_cli)
-mfa_cli.add_command(train_ivector_cli)
-mfa_cli.add_command(train_lm_cli)
-mfa_cli.add_command(train_tokenizer_cli)
-mfa_cli.add_command(transcribe_corpus_cli)
-mfa_cli.add_command(transcribe_speechbrain_cli)
-mfa_cli.add_command(transcribe_whisper_cli)
-mfa_cli.add_command(validate_corpus_cli)
-mfa_cli.add_command(validate_dictionary_cli)
 mfa_cli.add_command(version_cli)
 
 if __name__ == "__main__":
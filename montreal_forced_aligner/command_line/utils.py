@@ -110,6 +110,14 @@ def common_options(f: typing.Callable) -> typing.Callable:
             help="Use threading library rather than multiprocessing library. Multiprocessing is recommended will allow for faster executions.",
             default=None,
         ),
+        click.option(
+            "--auto_execution/--no_auto_execution",
+            "auto_execution",
+            help="Pick threads or processes for each multiprocessing function and limit how many "
+            "jobs run at once based on available cores and memory, "
+            f"default is {config.AUTO_EXECUTION}",
+            default=None,
+        ),
         click.option(
             "--debug/--no_debug",
             "-d/-nd",
@@ -123,6 +131,21 @@ def common_options(f: typing.Callable) -> typing.Callable:
             help=f"Use postgres instead of sqlite for extra functionality, default is {config.USE_POSTGRES}",
             default=None,
         ),
+        click.option(
+            "--pipeline_report/--no_pipeline_report",
+            "pipeline_report",
+            help="Record wall time, CPU time, peak memory and throughput of each stage and "
+            "save them to pipeline_report.json in the temporary directory, "
+            f"default is {config.PIPELINE_REPORT}",
+            default=None,
+        ),
+        click.option(
+            "--prometheus_report/--no_prometheus_report",
+            "prometheus_report",
+            help="Also save the pipeline report as Prometheus text-format metrics "
+            f"to pipeline_report.prom, default is {config.PROMETHEUS_REPORT}",
+            default=None,
+        ),
         click.option(
             "--single_speaker",
             "single_speaker",
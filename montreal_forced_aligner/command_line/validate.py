@@ -100,6 +100,20 @@ __all__ = ["validate_corpus_cli", "validate_dictionary_cli"]
     help="Use per-speaker language models to test accuracy of transcriptions.",
     default=False,
 )
+@click.option(
+    "--validation_sample_size",
+    help="Number of randomly sampled utterances to test transcriptions on, "
+    "default is to test every utterance.",
+    type=int,
+    default=0,
+)
+@click.option(
+    "--validation_time_budget",
+    help="Approximate number of seconds to spend testing transcriptions, "
+    "used to choose how many utterances to sample.",
+    type=float,
+    default=0.0,
+)
 @common_options
 @click.help_option("-h", "--help")
 @click.pass_context
@@ -155,6 +155,9 @@ GITHUB_TOKEN = None
 HF_TOKEN = None
 BLAS_NUM_THREADS = 1
 BYTES_LIMIT = 100e6
+PIPELINE_REPORT = False
+PROMETHEUS_REPORT = False
+AUTO_EXECUTION = True
 CURRENT_PROFILE_NAME = os.getenv(MFA_PROFILE_VARIABLE, "global")
 
 
@@ -189,6 +192,9 @@ class MfaProfile:
     temporary_directory: pathlib.Path = get_temporary_directory()
     github_token: typing.Optional[str] = None
     hf_token: typing.Optional[str] = None
+    pipeline_report: bool = False
+    prometheus_report: bool = False
+    auto_execution: bool = True
 
     def __getitem__(self, item):
         """Get key from profile"""
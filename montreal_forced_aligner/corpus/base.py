@@ -1179,6 +1179,71 @@ class CorpusMixin(MfaWorker, DatabaseMixin, metaclass=ABCMeta):
         """Corpus name"""
         return os.path.basename(self.corpus_directory)
 
+    @staticmethod
+    def stratified_subset_query(
+        candidates: sqlalchemy.orm.Query, num_utterances: int
+    ) -> sqlalchemy.Select:
+        """
+        Construct a query that deterministically samples utterances for a training subset,
+        balanced across speakers and preferring shorter utterances
+
+        Candidates are limited to the shortest ``10 * num_utterances`` utterances, and then taken
+        five at a time from each speaker, cycling through speakers in a fixed pseudo-random order.
+        Speakers with at least five candidates are used first, since speaker transforms can't be
+        estimated well from fewer utterances.
+
+        Parameters
+        ----------
+        candidates: :class:`~sqlalchemy.orm.Query`
+            Query of utterance ids, speaker ids and durations to sample from
+        num_utterances: int
+            Number of utterances to sample
+
+        Returns
+        -------
+        :class:`~sqlalchemy.Select`
+            Query for sampled utterance ids
+        """
+        block_size = 5
+
+        def sort_key(column):
+            # Multiplicative hash so that ordering is pseudo-random but reproducible
+            return (
+                sqlalchemy.cast(column, sqlalchemy.BigInteger)
+                * sqlalchemy.literal(2654435761, sqlalchemy.BigInteger)
+            ) % sqlalchemy.literal(4294967296, sqlalchemy.BigInteger)
+
+        pool = candidates.add_columns(
+            sqlalchemy.func.row_number()
+            .over(order_by=(Utterance.duration, Utterance.id))
+            .label("duration_rank")
+        ).subquery()
+        speaker_utterances = (
+            sqlalchemy.select(
+                pool.c.id,
+                pool.c.speaker_id,
+                sqlalchemy.func.row_number()
+                .over(partition_by=pool.c.speaker_id, order_by=(sort_key(pool.c.id), pool.c.id))
+                .label("speaker_rank"),
+                sqlalchemy.func.count()
+                .over(partition_by=pool.c.speaker_id)
+                .label("speaker_count"),
+            )
+            .where(pool.c.duration_rank <= num_utterances * 10)
+            .subquery()
+        )
+        return (
+            sqlalchemy.select(speaker_utterances.c.id)
+            .order_by(
+                sqlalchemy.case((speaker_utterances.c.speaker_count >= block_size, 0), else_=1),
+                (speaker_utterances.c.speaker_rank - 1) // block_size,
+                sort_key(speaker_utterances.c.speaker_id),
+                speaker_utterances.c.speaker_id,
+                speaker_utterances.c.speaker_rank,
+            )
+            .limit(num_utterances)
+        )
+
     def create_subset(self, subset: int) -> None:
         """
         Create a subset of utterances to use for training
@@ -1240,249 +1305,74 @@ class CorpusMixin(MfaWorker, DatabaseMixin, metaclass=ABCMeta):
                 dictionary_query = dictionary_query.filter(Dictionary.name != "nonnative")
             dictionary_lookup = {k: v for k, v in dictionary_query}
             num_dictionaries = len(dictionary_lookup)
-            if num_dictionaries > 1:
-                subsets_per_dictionary = {}
-                utts_per_dictionary = {}
-                subsetted = 0
-                for dict_name, dict_id in dictionary_lookup.items():
-                    base_query = (
-                        session.query(Utterance)
+            if subset >= self.num_utterances:
+                session.query(Utterance).update({Utterance.in_subset: True})
+            elif num_dictionaries > 1:
+                utts_per_dictionary = {
+                    k: v
+                    for k, v in add_filters(
+                        session.query(Speaker.dictionary_id, sqlalchemy.func.count(Utterance.id))
                         .join(Utterance.speaker)
-                        .filter(Speaker.dictionary_id == dict_id)  # noqa
+                        .filter(Speaker.dictionary_id.in_(list(dictionary_lookup.values())))
+                    ).group_by(Speaker.dictionary_id)
+                }
+                # Split the subset evenly across dictionaries, giving the shares that smaller
+                # dictionaries can't fill to the larger ones
+                subsets_per_dictionary = {}
+                remaining_subset = subset
+                for i, dict_id in enumerate(
+                    sorted(dictionary_lookup.values(), key=lambda x: utts_per_dictionary.get(x, 0))
+                ):
+                    subsets_per_dictionary[dict_id] = min(
+                        utts_per_dictionary.get(dict_id, 0),
+                        int(remaining_subset / (num_dictionaries - i)),
                     )
-                    base_query = add_filters(base_query)
-                    num_utts = base_query.count()
-                    utts_per_dictionary[dict_name] = num_utts
-                    if num_utts < int(subset / num_dictionaries):
-                        subsets_per_dictionary[dict_name] = num_utts
-                        subsetted += 1
-                remaining_subset = subset - sum(subsets_per_dictionary.values())
-                remaining_dicts = num_dictionaries - subsetted
-                remaining_subset_per_dictionary = int(remaining_subset / remaining_dicts)
-                for dict_name, num_utts in sorted(utts_per_dictionary.items(), key=lambda x: x[1]):
-                    dict_id = dictionary_lookup[dict_name]
-                    if dict_name in subsets_per_dictionary:
-                        subset_per_dictionary = subsets_per_dictionary[dict_name]
-                    else:
-                        subset_per_dictionary = remaining_subset_per_dictionary
-                        remaining_dicts -= 1
-                        if remaining_dicts > 0:
-                            if num_utts < subset_per_dictionary:
-                                remaining_subset -= num_utts
-                            else:
-                                remaining_subset -= subset_per_dictionary
-                            remaining_subset_per_dictionary = int(
-                                remaining_subset / remaining_dicts
-                            )
+                    remaining_subset -= subsets_per_dictionary[dict_id]
+                for dict_name, dict_id in dictionary_lookup.items():
+                    num_utts = utts_per_dictionary.get(dict_id, 0)
+                    subset_per_dictionary = subsets_per_dictionary[dict_id]
                     logger.debug(f"For {dict_name}, total number of utterances is {num_utts}")
-                    larger_subset_num = int(subset_per_dictionary * 10)
-                    speaker_ids = None
-                    average_duration = (
-                        add_filters(
-                            session.query(sqlalchemy.func.avg(Utterance.duration))
+                    if num_utts > subset_per_dictionary:
+                        candidates = add_filters(
+                            session.query(Utterance.id, Utterance.speaker_id, Utterance.duration)
                             .join(Utterance.speaker)
                             .filter(Speaker.dictionary_id == dict_id)
                         )
-                    ).first()[0]
-                    for utt_count_cutoff in [30, 15, 5]:
-                        sq = (
-                            add_filters(
-                                session.query(
-                                    Speaker.id.label("speaker_id"),
-                                    sqlalchemy.func.count(Utterance.id).label("utt_count"),
-                                )
-                                .join(Utterance.speaker)
-                                .filter(Speaker.dictionary_id == dict_id)
-                            )
-                            .filter(Utterance.duration <= average_duration)
-                            .group_by(Speaker.id.label("speaker_id"))
-                            .subquery()
-                        )
-                        total_speaker_utterances = (
-                            session.query(sqlalchemy.func.sum(sq.c.utt_count)).filter(
-                                sq.c.utt_count >= utt_count_cutoff
-                            )
-                        ).first()[0]
-                        if total_speaker_utterances >= subset_per_dictionary:
-                            speaker_ids = [
-                                x
-                                for x, in session.query(sq.c.speaker_id).filter(
-                                    sq.c.utt_count >= utt_count_cutoff
-                                )
-                            ]
-                            break
-                    if num_utts > larger_subset_num:
-                        larger_subset_query = (
-                            session.query(Utterance.id)
-                            .join(Utterance.speaker)
-                            .filter(Speaker.dictionary_id == dict_id)  # noqa
-                        )
-                        larger_subset_query = add_filters(larger_subset_query)
-                        if speaker_ids:
-                            larger_subset_query = larger_subset_query.filter(
-                                Speaker.id.in_(speaker_ids)
-                            )
-                        larger_subset_query = larger_subset_query.order_by(
-                            Utterance.duration
-                        ).limit(larger_subset_num)
-                        sq = larger_subset_query.subquery()
-                        subset_utts = (
-                            sqlalchemy.select(sq.c.id)
-                            .order_by(sqlalchemy.func.random())
-                            .limit(subset_per_dictionary)
-                            .scalar_subquery()
-                        )
-                        query = (
-                            sqlalchemy.update(Utterance)
-                            .execution_options(synchronize_session="fetch")
-                            .values(in_subset=True)
-                            .where(Utterance.id.in_(subset_utts))
-                        )
-                        session.execute(query)
-
-                        # Remove speakers with less than 5 utterances from subset,
-                        # can't estimate speaker transforms well for low utterance counts
-                        sq = (
-                            session.query(
-                                Utterance.speaker_id.label("speaker_id"),
-                                sqlalchemy.func.count(Utterance.id).label("utt_count"),
-                            )
-                            .filter(Utterance.in_subset == True)  # noqa
-                            .group_by(Utterance.speaker_id.label("speaker_id"))
-                            .subquery()
-                        )
-                        speaker_ids = [
-                            x for x, in session.query(sq.c.speaker_id).filter(sq.c.utt_count < 5)
-                        ]
-                        session.query(Utterance).filter(
-                            Utterance.speaker_id.in_(speaker_ids)
-                        ).update({Utterance.in_subset: False})
-                        session.commit()
-                        logger.debug(f"For {dict_name}, subset is {subset_per_dictionary}")
-                    elif num_utts > subset_per_dictionary:
-                        larger_subset_query = (
-                            session.query(Utterance.id)
-                            .join(Utterance.speaker)
-                            .filter(Speaker.dictionary_id == dict_id)  # noqa
-                        )
-                        larger_subset_query = add_filters(larger_subset_query)
-                        if speaker_ids:
-                            larger_subset_query = larger_subset_query.filter(
-                                Speaker.id.in_(speaker_ids)
-                            )
-                        sq = larger_subset_query.subquery()
-                        subset_utts = (
-                            sqlalchemy.select(sq.c.id)
-                            .order_by(sqlalchemy.func.random())
-                            .limit(subset_per_dictionary)
-                            .scalar_subquery()
-                        )
-                        query = (
-                            sqlalchemy.update(Utterance)
-                            .execution_options(synchronize_session="fetch")
-                            .values(in_subset=True)
-                            .where(Utterance.id.in_(subset_utts))
-                        )
-                        session.execute(query)
-                        session.commit()
-
-                        logger.debug(f"For {dict_name}, subset is {subset_per_dictionary}")
+                        subset_utts = self.stratified_subset_query(
+                            candidates, subset_per_dictionary
+                        ).scalar_subquery()
                     else:
-                        larger_subset_query = (
-                            session.query(Utterance.id)
+                        subset_utts = (
+                            sqlalchemy.select(Utterance.id)
                             .join(Utterance.speaker)
-                            .filter(Speaker.dictionary_id == dict_id)
-                            .filter(Utterance.ignored == False)  # noqa
-                            .filter(
+                            .where(Speaker.dictionary_id == dict_id)
+                            .where(Utterance.ignored == False)  # noqa
+                            .where(
                                 sqlalchemy.or_(
                                     Utterance.duration_deviation == None,  # noqa
                                     Utterance.duration_deviation < 10,
                                 )
-                            )  # noqa
-                        )
-                        sq = larger_subset_query.subquery()
-                        subset_utts = sqlalchemy.select(sq.c.id).scalar_subquery()
-                        query = (
-                            sqlalchemy.update(Utterance)
-                            .execution_options(synchronize_session="fetch")
-                            .values(in_subset=True)
-                            .where(Utterance.id.in_(subset_utts))
-                        )
-                        session.execute(query)
-                        session.commit()
-
-                    # Reassign any utterances from speakers below utterance count threshold
-                    sq = (
-                        session.query(
-                            Utterance.speaker_id.label("speaker_id"),
-                            sqlalchemy.func.count(Utterance.id).label("utt_count"),
-                        )
-                        .join(Utterance.speaker)
-                        .filter(Speaker.dictionary_id == dict_id)
-                        .filter(Utterance.in_subset == True)  # noqa
-                        .group_by(Utterance.speaker_id.label("speaker_id"))
-                        .subquery()
-                    )
-                    total_speaker_utterances = session.query(
-                        sqlalchemy.func.sum(sq.c.utt_count)
-                    ).first()[0]
-                    remaining = subset_per_dictionary - total_speaker_utterances
-                    if remaining > 0:
-                        speaker_ids = [x for x, in session.query(sq.c.speaker_id)]
-
-                        larger_subset_query = (
-                            session.query(Utterance.id)
-                            .join(Utterance.speaker)
-                            .filter(Speaker.dictionary_id == dict_id)  # noqa
-                        )
-                        larger_subset_query = add_filters(larger_subset_query)
-                        if speaker_ids:
-                            larger_subset_query = larger_subset_query.filter(
-                                Speaker.id.in_(speaker_ids)
                             )
-                        larger_subset_query = larger_subset_query.order_by(
-                            Utterance.duration
-                        ).limit(remaining * 10)
-                        sq = larger_subset_query.subquery()
-                        subset_utts = (
-                            sqlalchemy.select(sq.c.id)
-                            .order_by(sqlalchemy.func.random())
-                            .limit(remaining)
                             .scalar_subquery()
                         )
-                        query = (
-                            sqlalchemy.update(Utterance)
-                            .execution_options(synchronize_session="fetch")
-                            .values(in_subset=True)
-                            .where(Utterance.id.in_(subset_utts))
-                        )
-                        session.execute(query)
-
-            else:
-                larger_subset_num = subset * 10
-                if subset < self.num_utterances:
-                    # Get all shorter utterances that are not one word long
-                    larger_subset_query = (
-                        add_filters(session.query(Utterance.id))
-                        .order_by(Utterance.duration)
-                        .limit(larger_subset_num)
-                    )
-                    sq = larger_subset_query.subquery()
-                    subset_utts = (
-                        sqlalchemy.select(sq.c.id)
-                        .order_by(sqlalchemy.func.random())
-                        .limit(subset)
-                        .scalar_subquery()
-                    )
-                    query = (
+                    session.execute(
                         sqlalchemy.update(Utterance)
-                        .execution_options(synchronize_session="fetch")
+                        .execution_options(synchronize_session=False)
                         .values(in_subset=True)
                         .where(Utterance.id.in_(subset_utts))
                     )
-                    session.execute(query)
-                else:
-                    session.query(Utterance).update({Utterance.in_subset: True})
+                    logger.debug(f"For {dict_name}, subset is {subset_per_dictionary}")
+            else:
+                candidates = add_filters(
+                    session.query(Utterance.id, Utterance.speaker_id, Utterance.duration)
+                )
+                subset_utts = self.stratified_subset_query(candidates, subset).scalar_subquery()
+                session.execute(
+                    sqlalchemy.update(Utterance)
+                    .execution_options(synchronize_session=False)
+                    .values(in_subset=True)
+                    .where(Utterance.id.in_(subset_utts))
+                )
 
             session.commit()
             subset_directory = self.corpus_output_directory.joinpath(f"subset_{subset}")
@@ -1490,26 +1380,37 @@ class CorpusMixin(MfaWorker, DatabaseMixin, metaclass=ABCMeta):
             os.makedirs(log_dir, exist_ok=True)
 
             logger.debug(f"Setting subset flags took {time.time() - begin} seconds")
-            with self.session() as session:
-                jobs = (
-                    session.query(Job)
-                    .options(
-                        joinedload(Job.corpus, innerjoin=True), subqueryload(Job.dictionaries)
-                    )
-                    .filter(Job.utterances.any(Utterance.in_subset == True))  # noqa
+            self.export_subset_files(subset_directory, subset)
+
+    def export_subset_files(self, subset_directory: Path, subset: int) -> None:
+        """
+        Set the current jobs to those with utterances in the subset and export their Kaldi files
+
+        Parameters
+        ----------
+        subset_directory: :class:`~pathlib.Path`
+            Directory to export files to
+        subset: int
+            Number of utterances in the subset
+        """
+        with self.session() as session:
+            self._jobs = (
+                session.query(Job)
+                .options(joinedload(Job.corpus, innerjoin=True), subqueryload(Job.dictionaries))
+                .filter(Job.utterances.any(Utterance.in_subset == True))  # noqa
+                .all()
+            )
+            arguments = [
+                ExportKaldiFilesArguments(
+                    j.id,
+                    getattr(self, "session" if config.USE_THREADING else "db_string", ""),
+                    None,
+                    subset_directory,
                 )
-                self._jobs = jobs.all()
-                arguments = [
-                    ExportKaldiFilesArguments(
-                        j.id,
-                        getattr(self, "session" if config.USE_THREADING else "db_string", ""),
-                        None,
-                        subset_directory,
-                    )
-                    for j in self._jobs
-                ]
-            for _ in run_kaldi_function(ExportKaldiFilesFunction, arguments, total_count=subset):
-                pass
+                for j in self._jobs
+            ]
+        for _ in run_kaldi_function(ExportKaldiFilesFunction, arguments, total_count=subset):
+            pass
 
     @property
     def num_files(self) -> int:
@@ -1553,6 +1454,7 @@ class CorpusMixin(MfaWorker, DatabaseMixin, metaclass=ABCMeta):
         self._jobs = []
         with self.session() as session:
             c = session.query(Corpus).first()
+            c.validation_sample = False
             if subset is None or subset >= self.num_utterances or subset <= 0:
                 c.current_subset = 0
             else:
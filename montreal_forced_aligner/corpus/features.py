@@ -184,6 +184,8 @@ class MfccFunction(KaldiFunction):
         Arguments for the function
     """
 
+    releases_gil = True
+
     def __init__(self, args: MfccArguments):
         super().__init__(args)
         self.data_directory = args.data_directory
@@ -450,6 +452,8 @@ class CalcFmllrFunction(KaldiFunction):
         Arguments for the function
     """
 
+    releases_gil = True
+
     def __init__(self, args: CalcFmllrArguments):
         super().__init__(args)
         self.working_directory = args.working_directory
@@ -980,6 +984,8 @@ class ExtractIvectorsFunction(KaldiFunction):
         Arguments for the function
     """
 
+    releases_gil = True
+
     def __init__(self, args: ExtractIvectorsArguments):
         super().__init__(args)
         self.ivector_options = args.ivector_options
@@ -17,11 +17,9 @@ from _kalpy.ivector import (
     PldaUnsupervisedAdaptor,
     PldaUnsupervisedAdaptorConfig,
     ivector_normalize_length,
-    ivector_subtract_mean,
 )
 from _kalpy.matrix import DoubleMatrix, DoubleVector, FloatVector
 from _kalpy.util import BaseFloatVectorWriter, SequentialBaseFloatVectorReader
-from kalpy.data import KaldiMapping
 from kalpy.ivector.data import IvectorArchive
 from kalpy.utils import (
     generate_read_specifier,
@@ -40,16 +38,81 @@ from montreal_forced_aligner.corpus.features import (
     IvectorConfigMixin,
 )
 from montreal_forced_aligner.data import WorkflowType
-from montreal_forced_aligner.db import Corpus, Speaker, Utterance, bulk_update
+from montreal_forced_aligner.db import Corpus, Speaker, Utterance, bulk_update, bulk_update_columns
 from montreal_forced_aligner.exceptions import IvectorTrainingError
 from montreal_forced_aligner.helper import mfa_open
 from montreal_forced_aligner.utils import run_kaldi_function
 
-__all__ = ["IvectorCorpusMixin"]
+__all__ = ["IvectorCorpusMixin", "load_ivector_matrix", "normalize_ivector_lengths"]
 
 logger = logging.getLogger("mfa")
 
 
+def load_ivector_matrix(
+    scp_path: Path, dimension: int
+) -> typing.Tuple[typing.List[str], typing.List[str], np.ndarray]:
+    """
+    Load all ivectors in an scp file into a single matrix
+
+    Parameters
+    ----------
+    scp_path: :class:`~pathlib.Path`
+        Script file of ivectors
+    dimension: int
+        Dimension of the ivectors
+
+    Returns
+    -------
+    list[str]
+        Keys of the ivectors
+    list[str]
+        Archive locations of the ivectors
+    :class:`numpy.ndarray`
+        Matrix of ivectors with one row per key
+    """
+    keys = []
+    locations = []
+    with mfa_open(scp_path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            key, location = line.split(maxsplit=1)
+            keys.append(key)
+            locations.append(location)
+    ivectors = np.empty((len(keys), dimension), dtype=np.float32)
+    if not keys:
+        return keys, locations, ivectors
+    reader = SequentialBaseFloatVectorReader(generate_read_specifier(scp_path))
+    i = 0
+    while not reader.Done():
+        ivectors[i, :] = reader.Value().numpy()
+        i += 1
+        reader.Next()
+    reader.Close()
+    return keys, locations, ivectors
+
+
+def normalize_ivector_lengths(ivectors: np.ndarray) -> np.ndarray:
+    """
+    Scale each row of an ivector matrix to have a length of the square root of its dimension,
+    as in Kaldi's :kaldi_src:`ivectorbin/ivector-normalize-length`
+
+    Parameters
+    ----------
+    ivectors: :class:`numpy.ndarray`
+        Matrix of ivectors
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Length-normalized ivectors
+    """
+    norms = np.linalg.norm(ivectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return ivectors * (math.sqrt(ivectors.shape[1]) / norms)
+
+
 class IvectorCorpusMixin(AcousticCorpusMixin, IvectorConfigMixin):
     """
     Abstract corpus mixin for corpora that extract ivectors
@@ -146,49 +209,45 @@ class IvectorCorpusMixin(AcousticCorpusMixin, IvectorConfigMixin):
             self.working_directory, "current_speaker_ivectors.ark"
         )
         self._write_spk2utt()
-        spk2utt_path = os.path.join(self.corpus_output_directory, "spk2utt.scp")
 
         log_path = self.working_log_directory.joinpath("speaker_ivectors.log")
         num_utts_path = self.working_directory.joinpath("current_num_utts.ark")
+        utterance_scp_path = self.working_directory.joinpath("speaker_utterance_ivectors.scp")
         logger.info("Computing speaker ivectors...")
         if self.stopped.is_set():
             logger.debug("Speaker ivector computation stopped early.")
             return
-        with self.session() as session, tqdm(
-            total=self.num_utterances, disable=config.QUIET
-        ) as pbar, mfa_open(num_utts_path, "w") as num_utts_archive, kalpy_logger(
+        with self.session() as session, mfa_open(utterance_scp_path, "w") as f:
+            query = (
+                session.query(Utterance.speaker_id, Utterance.ivector_ark)
+                .filter(Utterance.ivector_ark != None)  # noqa
+                .order_by(Utterance.speaker_id, Utterance.id)
+            )
+            speaker_ids = []
+            for i, (speaker_id, ivector_ark) in enumerate(query):
+                speaker_ids.append(speaker_id)
+                f.write(f"{i} {ivector_ark}\n")
+        speaker_ids = np.array(speaker_ids, dtype=np.int64)
+        _, _, ivectors = load_ivector_matrix(utterance_scp_path, config.IVECTOR_DIMENSION)
+        ivectors = normalize_ivector_lengths(ivectors.astype(np.float64))
+        speakers, starts, counts = np.unique(speaker_ids, return_index=True, return_counts=True)
+        if len(speakers):
+            speaker_means = np.add.reduceat(ivectors, starts, axis=0) / counts[:, np.newaxis]
+        else:
+            speaker_means = np.empty((0, config.IVECTOR_DIMENSION))
+        with mfa_open(num_utts_path, "w") as num_utts_archive, kalpy_logger(
             "kalpy.ivector", log_path
         ):
             speaker_mean_archive = BaseFloatVectorWriter(
                 generate_write_specifier(speaker_ivector_ark_path)
             )
-            spk2utt = KaldiMapping(list_mapping=True)
-            spk2utt.load(spk2utt_path)
-            query = (
-                session.query(Speaker.id, Utterance.ivector_ark)
-                .join(Utterance.speaker)
-                .order_by(Speaker.id)
-            )
-            current_speaker = None
-            utt_count = 0
-            speaker_mean = FloatVector(config.IVECTOR_DIMENSION)
-            for speaker_id, ivector_path in query:
-                if current_speaker is None:
-                    current_speaker = speaker_id
-                if speaker_id != current_speaker:
-                    speaker_mean.Scale(1.0 / utt_count)
-
-                    speaker_mean_archive.Write(str(speaker_id), speaker_mean)
-                    num_utts_archive.write(f"{speaker_id} {utt_count}\n")
-                    speaker_mean = FloatVector(config.IVECTOR_DIMENSION)
-                    utt_count = 0
-                    current_speaker = speaker_id
-                    pbar.update(1)
-                ivector = read_kaldi_object(FloatVector, ivector_path)
-                # ivector-normalize-length
-                ivector_normalize_length(ivector)
-                utt_count += 1
-                speaker_mean.AddVec(1.0, ivector)
+            for speaker_id, utt_count, speaker_mean in zip(
+                speakers.tolist(), counts.tolist(), speaker_means.astype(np.float32)
+            ):
+                kaldi_ivector = FloatVector()
+                kaldi_ivector.from_numpy(speaker_mean)
+                speaker_mean_archive.Write(str(speaker_id), kaldi_ivector)
+                num_utts_archive.write(f"{speaker_id} {utt_count}\n")
             speaker_mean_archive.Close()
 
         self.collect_speaker_ivectors()
@@ -357,34 +416,31 @@ class IvectorCorpusMixin(AcousticCorpusMixin, IvectorConfigMixin):
     def collect_utterance_ivectors(self) -> None:
         """Collect trained per-utterance ivectors"""
         logger.info("Collecting ivectors...")
-        with self.session() as session, tqdm(
-            total=self.num_utterances, disable=config.QUIET
-        ) as pbar:
-            update_mapping = {}
-
-            ivector_sum = FloatVector(config.IVECTOR_DIMENSION)
-            ivectors = {}
-            count = 0
-            for j in self.jobs:
-                ivector_scp_path = j.construct_path(self.split_directory, "ivectors", "scp")
-                with mfa_open(ivector_scp_path) as f:
-                    for line in f:
-                        line = line.strip()
-                        utt_id, ivector_ark_path = line.split(maxsplit=1)
-                        utt_id = int(utt_id.split("-")[-1])
-                        ivector = read_kaldi_object(FloatVector, ivector_ark_path)
-                        ivectors[utt_id] = ivector
-                        update_mapping[utt_id] = {"id": utt_id, "ivector_ark": ivector_ark_path}
-                        ivector_normalize_length(ivector)
-                        count += 1
-                        ivector_sum.AddVec(1.0, ivector)
-            for utt_id, ivector in ivectors.items():
-                ivector.AddVec(-1.0 / count, ivector_sum)
-
-                ivector_normalize_length(ivector)
-                update_mapping[utt_id]["ivector"] = ivector.numpy()
-                pbar.update(1)
-            bulk_update(session, Utterance, list(update_mapping.values()))
+        utterance_ids = []
+        ivector_arks = []
+        job_ivectors = []
+        for j in self.jobs:
+            ivector_scp_path = j.construct_path(self.split_directory, "ivectors", "scp")
+            keys, locations, ivectors = load_ivector_matrix(
+                ivector_scp_path, config.IVECTOR_DIMENSION
+            )
+            utterance_ids.extend(int(x.split("-")[-1]) for x in keys)
+            ivector_arks.extend(locations)
+            job_ivectors.append(ivectors)
+        ivectors = np.concatenate(job_ivectors).astype(np.float64)
+        ivectors = normalize_ivector_lengths(ivectors)
+        if len(ivectors):
+            ivectors = normalize_ivector_lengths(ivectors - ivectors.mean(axis=0))
+        with self.session() as session:
+            bulk_update_columns(
+                session,
+                Utterance,
+                {
+                    "id": np.array(utterance_ids, dtype=np.int64),
+                    "ivector_ark": ivector_arks,
+                    "ivector": ivectors.astype(np.float32),
+                },
+            )
             session.flush()
             n_lists = int(math.sqrt(self.num_utterances))
             n_probe = int(math.sqrt(n_lists))
@@ -416,29 +472,34 @@ class IvectorCorpusMixin(AcousticCorpusMixin, IvectorConfigMixin):
             ivector_archive = IvectorArchive(
                 speaker_ivector_ark_path, num_utterances_file_name=num_utts_path
             )
-            ivectors = []
             speaker_ids = []
             num_utts = []
+            ivectors = []
             for speaker_id, ivector, utts in ivector_archive:
                 speaker_ids.append(speaker_id)
                 num_utts.append(utts)
-                ivector_normalize_length(ivector)
-                ivectors.append(DoubleVector(ivector))
-            ivector_subtract_mean(ivectors)
-            update_mapping = []
-            for i in range(len(speaker_ids)):
-                ivector = ivectors[i]
-                ivector_normalize_length(ivector)
-
-                update_mapping.append(
-                    {
-                        "id": speaker_ids[i],
-                        "ivector": ivector.numpy(),
-                        "plda_vector": self.plda.transform_ivector(ivector, num_utts[i]).numpy(),
-                    }
-                )
+                ivectors.append(ivector.numpy())
+            ivectors = np.array(ivectors, dtype=np.float64).reshape(-1, config.IVECTOR_DIMENSION)
+            ivectors = normalize_ivector_lengths(ivectors)
+            if len(ivectors):
+                ivectors = normalize_ivector_lengths(ivectors - ivectors.mean(axis=0))
+            plda_vectors = []
+            for ivector, utts in zip(ivectors, num_utts):
+                kaldi_ivector = DoubleVector()
+                kaldi_ivector.from_numpy(ivector)
+                plda_vectors.append(self.plda.transform_ivector(kaldi_ivector, utts).numpy())
                 pbar.update(1)
-            bulk_update(session, Speaker, update_mapping)
+            bulk_update_columns(
+                session,
+                Speaker,
+                {
+                    "id": np.array(speaker_ids, dtype=np.int64),
+                    "ivector": ivectors.astype(np.float32),
+                    "plda_vector": np.array(plda_vectors, dtype=np.float32).reshape(
+                        len(speaker_ids), -1
+                    ),
+                },
+            )
             session.flush()
             session.execute(
                 sqlalchemy.text(
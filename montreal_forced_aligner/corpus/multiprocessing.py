@@ -4,6 +4,7 @@ Corpus loading worker
 """
 from __future__ import annotations
 
+import collections
 import os
 import threading
 import typing
@@ -255,12 +256,20 @@ class ExportKaldiFilesArguments(MfaArguments):
 class NormalizeTextFunction(KaldiFunction):
     """
     Multiprocessing function for normalizing text.
+
+    Each unique text in a job is tokenized once and the result is returned for every
+    utterance with that text.  spaCy pipelines are run in batches with components
+    that do not affect tokenization disabled.
+
     Parameters
     ----------
     args: :class:`~montreal_forced_aligner.corpus.multiprocessing.NormalizeTextArguments`
         Arguments for the function
     """
 
+    spacy_batch_size = 256
+    unused_spacy_components = ("parser", "ner", "senter")
+
     def __init__(self, args: NormalizeTextArguments):
         super().__init__(args)
         self.tokenizers = args.tokenizers
@@ -268,6 +277,48 @@ class NormalizeTextFunction(KaldiFunction):
         self.ignore_case = args.ignore_case
         self.use_cutoff_model = args.use_cutoff_model
 
+    def _tokenize_texts(
+        self, tokenizer, texts: typing.List[str]
+    ) -> typing.Generator[typing.Tuple[str, str]]:
+        """
+        Tokenize unique texts, batching them through spaCy's pipe when available
+
+        Parameters
+        ----------
+        tokenizer: callable
+            Tokenizer from :func:`~montreal_forced_aligner.tokenization.spacy.generate_language_tokenizer`
+            or None to keep texts as is
+        texts: list[str]
+            Texts to tokenize
+
+        Yields
+        ------
+        str
+            Normalized text
+        str
+            Normalized text for generating pronunciations
+        """
+        if tokenizer is None:
+            for text in texts:
+                yield text, text
+            return
+        if hasattr(tokenizer, "pipe"):
+            disable = [x for x in self.unused_spacy_components if x in tokenizer.pipe_names]
+            tokenized_texts = tokenizer.pipe(
+                texts, batch_size=self.spacy_batch_size, disable=disable
+            )
+        else:
+            tokenized_texts = (tokenizer(text) for text in texts)
+        for tokenized in tokenized_texts:
+            if isinstance(tokenized, tuple):
+                yield tokenized[:2]
+                continue
+            if not isinstance(tokenized, str):
+                tokenized = " ".join([x.text for x in tokenized])
+            if self.ignore_case:
+                tokenized = tokenized.lower()
+            yield tokenized, tokenized.lower()
+
     def _run(self):
         """Run the function"""
 
@@ -299,8 +350,11 @@ class NormalizeTextFunction(KaldiFunction):
                         .filter(Utterance.job_id == self.job_name)
                         .filter(Speaker.dictionary_id == d.id)
                     )
+                    text_mapping = collections.defaultdict(list)
                     for u_id, u_text in utterances:
-                        if simple_tokenization:
+                        text_mapping[u_text].append(u_id)
+                    if simple_tokenization:
+                        for u_text, u_ids in text_mapping.items():
                             normalized_text, normalized_character_text, oovs = tokenizer(u_text)
                             if self.use_cutoff_model:
                                 new_text = []
@@ -314,39 +368,36 @@ class NormalizeTextFunction(KaldiFunction):
                                             w = f"{d.cutoff_word[:-1]}-{next_w}{d.cutoff_word[-1]}"
                                     new_text.append(w)
                                 normalized_text = " ".join(new_text)
-                            self.callback(
-                                (
-                                    {
-                                        "id": u_id,
-                                        "oovs": " ".join(sorted(oovs)),
-                                        "normalized_text": normalized_text,
-                                        "normalized_character_text": normalized_character_text,
-                                    },
-                                    d.id,
+                            oovs = " ".join(sorted(oovs))
+                            for u_id in u_ids:
+                                self.callback(
+                                    (
+                                        {
+                                            "id": u_id,
+                                            "oovs": oovs,
+                                            "normalized_text": normalized_text,
+                                            "normalized_character_text": normalized_character_text,
+                                        },
+                                        d.id,
+                                    )
                                 )
-                            )
-                        else:
-                            tokenized = tokenizer(u_text)
-                            if isinstance(tokenized, tuple):
-                                normalized_text, pronunciation_form = tokenized
-                            else:
-                                if not isinstance(tokenized, str):
-                                    tokenized = " ".join([x.text for x in tokenized])
-                                if self.ignore_case:
-                                    tokenized = tokenized.lower()
-                                normalized_text, pronunciation_form = tokenized, tokenized.lower()
-                            oovs = set()
-                            self.callback(
-                                (
-                                    {
-                                        "id": u_id,
-                                        "oovs": " ".join(sorted(oovs)),
-                                        "normalized_text": normalized_text,
-                                        "normalized_character_text": pronunciation_form,
-                                    },
-                                    d.id,
+                    else:
+                        texts = list(text_mapping.keys())
+                        for u_text, (normalized_text, pronunciation_form) in zip(
+                            texts, self._tokenize_texts(tokenizer, texts)
+                        ):
+                            for u_id in text_mapping[u_text]:
+                                self.callback(
+                                    (
+                                        {
+                                            "id": u_id,
+                                            "oovs": "",
+                                            "normalized_text": normalized_text,
+                                            "normalized_character_text": pronunciation_form,
+                                        },
+                                        d.id,
+                                    )
                                 )
-                            )
             else:
                 tokenizer = self.tokenizers
                 if isinstance(tokenizer, Language):
@@ -362,29 +413,24 @@ class NormalizeTextFunction(KaldiFunction):
                     .filter(Utterance.text != "")
                     .filter(Utterance.job_id == self.job_name)
                 )
+                text_mapping = collections.defaultdict(list)
                 for u_id, u_text in utterances:
-                    if tokenizer is None:
-                        normalized_text, pronunciation_form = u_text, u_text
-                    else:
-                        tokenized = tokenizer(u_text)
-                        if isinstance(tokenized, tuple):
-                            normalized_text, pronunciation_form = tokenized[:2]
-                        else:
-                            if not isinstance(tokenized, str):
-                                tokenized = " ".join([x.text for x in tokenized])
-                            if self.ignore_case:
-                                tokenized = tokenized.lower()
-                            normalized_text, pronunciation_form = tokenized, tokenized.lower()
-                    self.callback(
-                        (
-                            {
-                                "id": u_id,
-                                "normalized_text": normalized_text,
-                                "normalized_character_text": pronunciation_form,
-                            },
-                            None,
+                    text_mapping[u_text].append(u_id)
+                texts = list(text_mapping.keys())
+                for u_text, (normalized_text, pronunciation_form) in zip(
+                    texts, self._tokenize_texts(tokenizer, texts)
+                ):
+                    for u_id in text_mapping[u_text]:
+                        self.callback(
+                            (
+                                {
+                                    "id": u_id,
+                                    "normalized_text": normalized_text,
+                                    "normalized_character_text": pronunciation_form,
+                                },
+                                None,
+                            )
                         )
-                    )
 
 
 class ExportKaldiFilesFunction(KaldiFunction):
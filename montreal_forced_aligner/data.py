@@ -15,6 +15,7 @@ import typing
 from pathlib import Path
 
 import dataclassy
+import numpy
 import pynini
 import pywrapfst
 from praatio.utilities.constants import Interval, TextgridFormats
@@ -1583,13 +1584,66 @@ class NgramHistoryState:
 class ArpaNgramModel:
     """
     Wrapper class for ngram models, taken largely from :kaldi_utils`:`lang/internal/arpa2fst_constrained.py`
+
+    N-grams are stored per order as arrays of word indices, log10 probabilities and log10 backoff
+    weights in the order they appear in the ARPA file.  Lookups for constructing FSTs use binary
+    searches over the n-grams of each order, packed into byte strings that sort like their word
+    indices, so no per n-gram Python objects are created.  The dictionary based history states
+    are only created when :attr:`~montreal_forced_aligner.data.ArpaNgramModel.orders` is
+    accessed.
+
+    Parameters
+    ----------
+    vocabulary: list[str], optional
+        Words of the model, indexed by the n-gram arrays
+    ngrams: dict[int, tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`]], optional
+        Word indices, log10 probabilities and log10 backoff weights (NaN if absent) per order
     """
 
-    def __init__(self):
-        self.orders = {0: collections.defaultdict(NgramHistoryState)}
+    def __init__(
+        self,
+        vocabulary: typing.Optional[typing.List[str]] = None,
+        ngrams: typing.Optional[
+            typing.Dict[int, typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]
+        ] = None,
+    ):
+        self.vocabulary = vocabulary if vocabulary is not None else []
+        self.ngrams = ngrams if ngrams is not None else {}
+        self._orders = None
+        self._word_mapping = None
+        self._sorted_ngrams = {}
+
+    @property
+    def orders(self) -> typing.Dict[int, typing.Dict[typing.Tuple[str, ...], NgramHistoryState]]:
+        """History states for each order, mapping histories to word probabilities and backoffs"""
+        if self._orders is None:
+            log10 = math.log(10.0)
+            self._orders = {0: collections.defaultdict(NgramHistoryState)}
+            for order in sorted(self.ngrams):
+                word_ids, log_probs, log_backoffs = self.ngrams[order]
+                self._orders[order] = collections.defaultdict(NgramHistoryState)
+                history_states = self._orders[order - 1]
+                ngram_states = self._orders[order]
+                has_backoff = ~numpy.isnan(log_backoffs)
+                for ngram, prob, backoff_prob, backoff in zip(
+                    word_ids.tolist(),
+                    numpy.exp(log_probs * log10).tolist(),
+                    numpy.exp(log_backoffs * log10).tolist(),
+                    has_backoff.tolist(),
+                ):
+                    ngram = tuple(self.vocabulary[x] for x in ngram)
+                    history_states[ngram[:-1]].word_to_prob[ngram[-1]] = prob
+                    if backoff:
+                        ngram_states[ngram].backoff_prob = backoff_prob
+        return self._orders
+
+    @property
+    def num_ngrams(self) -> typing.Dict[int, int]:
+        """Number of n-grams per order"""
+        return {k: v[1].shape[0] for k, v in self.ngrams.items()}
 
     @classmethod
-    def read(cls, input: typing.Union[io.StringIO, str]):
+    def read(cls, input: typing.Union[io.StringIO, str, Path]) -> ArpaNgramModel:
         """
         Read an ngram model from a stream
 
@@ -1603,42 +1657,223 @@ class ArpaNgramModel:
         :class:`~montreal_forced_aligner.data.ArpaNgramModel`
             Constructed model
         """
-        cleanup = False
-        if isinstance(input, str):
-            cleanup = True
-            input = open(input, "r", encoding="utf8")
-        log10 = math.log(10.0)
+        if not isinstance(input, (str, Path)):
+            return cls(*cls._parse(input))
+        with open(input, "r", encoding="utf8") as f:
+            return cls(*cls._parse(f))
+
+    @staticmethod
+    def _parse(
+        input: typing.Iterable[str],
+    ) -> typing.Tuple[
+        typing.List[str],
+        typing.Dict[int, typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]],
+    ]:
+        """
+        Parse ARPA lines into a vocabulary and per-order n-gram arrays
+
+        Parameters
+        ----------
+        input: Iterable[str]
+            Lines of an ARPA file
+
+        Returns
+        -------
+        list[str]
+            Vocabulary
+        dict[int, tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`]]
+            Word indices, log10 probabilities and log10 backoff weights per order
+        """
+        vocabulary = []
+        word_mapping = {}
+        ngrams = {}
         current_order = -1
-        model = ArpaNgramModel()
+        word_ids, log_probs, log_backoffs = [], [], []
+
+        def finalize_order():
+            if current_order < 1:
+                return
+            ngrams[current_order] = (
+                numpy.array(word_ids, dtype=numpy.int32).reshape(-1, current_order),
+                numpy.array(log_probs, dtype=numpy.float64),
+                numpy.array(log_backoffs, dtype=numpy.float64),
+            )
+
+        nan = float("nan")
         for line in input:
-            line = line.strip()
-            if not line:
+            col = line.split()
+            if not col:
                 continue
-            m = re.match(r"\\(?P<order>[0-9]*)-grams:$", line)
-            if m:
-                current_order = int(m.group("order"))
-                model.orders[current_order] = collections.defaultdict(NgramHistoryState)
+            if col[0].startswith("\\"):
+                m = re.match(r"\\(?P<order>[0-9]*)-grams:$", line.strip())
+                if m:
+                    finalize_order()
+                    current_order = int(m.group("order"))
+                    word_ids, log_probs, log_backoffs = [], [], []
                 continue
             if current_order < 1:
                 continue
-            if line.startswith("\\"):
-                continue
-            col = line.split()
-            prob = math.exp(float(col[0]) * log10)
-            hist = tuple(col[1:current_order])
-            word = col[current_order]  # a string
-            backoff_prob = (
-                math.exp(float(col[current_order + 1]) * log10)
-                if len(col) == current_order + 2
-                else None
+            log_probs.append(float(col[0]))
+            for word in col[1 : current_order + 1]:
+                word_id = word_mapping.get(word, None)
+                if word_id is None:
+                    word_id = word_mapping[word] = len(vocabulary)
+                    vocabulary.append(word)
+                word_ids.append(word_id)
+            log_backoffs.append(
+                float(col[current_order + 1]) if len(col) == current_order + 2 else nan
+            )
+        finalize_order()
+        return vocabulary, ngrams
+
+    @staticmethod
+    def _pack(word_ids: numpy.ndarray) -> numpy.ndarray:
+        """Pack rows of word indices into fixed width byte strings that sort like the rows"""
+        word_ids = numpy.ascontiguousarray(word_ids, dtype=">u4")
+        if word_ids.shape[1] == 0:
+            return numpy.zeros(word_ids.shape[0], dtype="S1")
+        return word_ids.view(f"S{4 * word_ids.shape[1]}").ravel()
+
+    def _word_ids(self, words: typing.Sequence[str]) -> typing.Optional[typing.List[int]]:
+        """Look up word indices, None if any word is out of vocabulary"""
+        if self._word_mapping is None:
+            self._word_mapping = {w: i for i, w in enumerate(self.vocabulary)}
+        word_ids = [self._word_mapping.get(w, None) for w in words]
+        if None in word_ids:
+            return None
+        return word_ids
+
+    def _sorted_order(self, order: int) -> typing.Tuple[numpy.ndarray, ...]:
+        """
+        Get the n-grams of an order sorted by their word indices
+
+        Parameters
+        ----------
+        order: int
+            Order of the n-grams
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Packed n-grams
+        :class:`numpy.ndarray`
+            Packed histories of the n-grams
+        :class:`numpy.ndarray`
+            Word indices
+        :class:`numpy.ndarray`
+            Probabilities
+        :class:`numpy.ndarray`
+            Backoff probabilities, NaN if absent
+        :class:`numpy.ndarray`
+            Positions of the n-grams in the ARPA file
+        """
+        if order not in self._sorted_ngrams:
+            log10 = math.log(10.0)
+            word_ids, log_probs, log_backoffs = self.ngrams[order]
+            keys = self._pack(word_ids)
+            sort_order = numpy.argsort(keys, kind="stable")
+            word_ids = numpy.asarray(word_ids)[sort_order]
+            self._sorted_ngrams[order] = (
+                keys[sort_order],
+                self._pack(word_ids[:, :-1]),
+                word_ids,
+                numpy.exp(numpy.asarray(log_probs)[sort_order] * log10),
+                numpy.exp(numpy.asarray(log_backoffs)[sort_order] * log10),
+                sort_order,
             )
+        return self._sorted_ngrams[order]
+
+    def _find_ngram(self, ngram: typing.Tuple[str, ...]) -> int:
+        """Get the index of an n-gram in the sorted n-grams of its order, -1 if not present"""
+        order = len(ngram)
+        word_ids = self._word_ids(ngram)
+        if order not in self.ngrams or word_ids is None:
+            return -1
+        keys = self._sorted_order(order)[0]
+        key = self._pack(numpy.array([word_ids]))
+        index = int(numpy.searchsorted(keys, key)[0])
+        if index < keys.shape[0] and keys[index] == key[0]:
+            return index
+        return -1
+
+    def _history_state(
+        self, hist: typing.Tuple[str, ...]
+    ) -> typing.Tuple[typing.List[str], typing.List[float], float]:
+        """
+        Get the words following a history along with their probabilities, and the backoff
+        probability of the history
 
-            model.orders[current_order - 1][hist].word_to_prob[word] = prob
-            if backoff_prob is not None:
-                model.orders[current_order][hist + (word,)].backoff_prob = backoff_prob
-        if cleanup:
-            input.close()
-        return model
+        Words are in the order of their n-grams in the ARPA file
+
+        Parameters
+        ----------
+        hist: tuple[str, ...]
+            History to look up
+
+        Returns
+        -------
+        list[str]
+            Words following the history
+        list[float]
+            Probabilities of the words
+        float
+            Backoff probability of the history, 1.0 if absent
+        """
+        words, probs = [], []
+        order = len(hist) + 1
+        word_ids = self._word_ids(hist)
+        if order in self.ngrams and word_ids is not None:
+            _, prefixes, ngram_word_ids, ngram_probs, _, positions = self._sorted_order(order)
+            key = self._pack(numpy.array([word_ids]))
+            begin = int(numpy.searchsorted(prefixes, key, side="left")[0])
+            end = int(numpy.searchsorted(prefixes, key, side="right")[0])
+            indices = begin + numpy.argsort(positions[begin:end])
+            words = [self.vocabulary[x] for x in ngram_word_ids[indices, -1].tolist()]
+            probs = ngram_probs[indices].tolist()
+        return words, probs, self._get_backoff_prob(hist)
+
+    def _get_backoff_prob(self, hist: typing.Tuple[str, ...]) -> float:
+        """Get the backoff probability of a history, 1.0 if it has no backoff weight"""
+        index = self._find_ngram(hist)
+        if index < 0:
+            return 1.0
+        backoff_prob = self._sorted_order(len(hist))[4][index]
+        if numpy.isnan(backoff_prob):
+            return 1.0
+        return float(backoff_prob)
+
+    def _histories(self, order: int) -> typing.List[typing.Tuple[str, ...]]:
+        """
+        Get the histories of an order, which are the n-grams with backoff weights and the
+        histories of n-grams of the next order
+
+        Histories are in the order they are first reached in the ARPA file, so that FST states
+        are numbered the same as with the dictionary based history states
+
+        Parameters
+        ----------
+        order: int
+            Order of the histories
+
+        Returns
+        -------
+        list[tuple[str, ...]]
+            Histories in ARPA file order
+        """
+        if order == 0:
+            return [()]
+        packed = []
+        if order in self.ngrams:
+            word_ids, _, log_backoffs = self.ngrams[order]
+            packed.append(self._pack(numpy.asarray(word_ids)[~numpy.isnan(log_backoffs)]))
+        if order + 1 in self.ngrams:
+            packed.append(self._pack(numpy.asarray(self.ngrams[order + 1][0])[:, :-1]))
+        if not packed:
+            return []
+        packed, first_positions = numpy.unique(numpy.concatenate(packed), return_index=True)
+        packed = packed[numpy.argsort(first_positions)]
+        word_ids = packed.view(">u4").reshape(-1, order)
+        return [tuple(self.vocabulary[x] for x in row) for row in word_ids.tolist()]
 
     def history_to_fst_state_mapping(
         self, min_order: int = None, max_order: int = None
@@ -1680,7 +1915,7 @@ class ArpaNgramModel:
         # didn't naturally have such bigram states, we'll create them so that we
         # can enforce the bigram constraints supplied in 'bigrams_file' by the
         # user.
-        for word in self.orders[0][()].word_to_prob:
+        for word in (self.vocabulary[x] for x in self.ngrams[1][0][:, 0].tolist()):
             if word != "<s>" and word != "</s>":
                 hist = (word,)
                 hist_to_state[hist] = len(state_to_hist)
@@ -1690,12 +1925,12 @@ class ArpaNgramModel:
         # we don't have a unigram state in the output FST, only bigram states; and
         # we don't iterate over bigram histories because we covered them all above;
         # that's why we start 'n' from 2 below instead of from 0.
-        for order, history_states in self.orders.items():
+        for order in range(len(self.ngrams) + 1):
             if min_order is not None and order < min_order:
                 continue
             if max_order is not None and order > max_order:
                 continue
-            for hist in history_states.keys():
+            for hist in self._histories(order):
                 # note: hist is a tuple of strings.
                 assert hist not in hist_to_state
                 hist_to_state[hist] = len(state_to_hist)
@@ -1721,19 +1956,13 @@ class ArpaNgramModel:
         float
             Probability
         """
-        assert len(hist) < len(self.orders)
+        assert len(hist) <= len(self.ngrams)
+        index = self._find_ngram(hist + (word,))
+        if index >= 0:
+            return float(self._sorted_order(len(hist) + 1)[3][index])
         if len(hist) == 0:
-            word_to_prob = self.orders[0][()].word_to_prob
-            return word_to_prob[word]
-        else:
-            if hist in self.orders[len(hist)]:
-                hist_state = self.orders[len(hist)][hist]
-                if word in hist_state.word_to_prob:
-                    return hist_state.word_to_prob[word]
-                else:
-                    return hist_state.backoff_prob * self._get_prob(hist[1:], word)
-            else:
-                return self._get_prob(hist[1:], word)
+            raise KeyError(word)
+        return self._get_backoff_prob(hist) * self._get_prob(hist[1:], word)
 
     def _get_state_for_hist(self, hist_to_state, hist) -> int:
         """
@@ -1791,7 +2020,7 @@ class ArpaNgramModel:
         (hist_to_state, state_to_hist) = self.history_to_fst_state_mapping(min_order=2)
 
         # The following 3 things are just for diagnostics.
-        normalization_stats = [[0, 0.0] for _ in range(len(self.orders))]
+        normalization_stats = [[0, 0.0] for _ in range(len(self.ngrams) + 1)]
         num_ngrams_allowed = 0
         num_ngrams_disallowed = 0
 
@@ -1822,8 +2051,7 @@ class ArpaNgramModel:
                         k = symbols.find(word)
                         fst.add_arc(state, pywrapfst.Arc(k, k, cost, next_state))
             else:  # it's a higher-order than bigram state.
-                assert hist in self.orders[hist_len]
-                hist_state = self.orders[hist_len][hist]
+                words, probs, backoff_prob = self._history_state(hist)
                 most_recent_word = hist[-1]
 
                 normalization_stats[hist_len][0] += 1
@@ -1831,7 +2059,7 @@ class ArpaNgramModel:
                     self._get_prob(hist, word) for word in bigram_map[most_recent_word]
                 )
 
-                for word, prob in hist_state.word_to_prob.items():
+                for word, prob in zip(words, probs):
                     cost = -math.log(prob)
                     if word in bigram_map[most_recent_word]:
                         num_ngrams_allowed += 1
@@ -1845,16 +2073,12 @@ class ArpaNgramModel:
                         k = symbols.find(word)
                         fst.add_arc(state, pywrapfst.Arc(k, k, cost, next_state))
 
-                assert hist in self.orders[hist_len]
-                backoff_prob = self.orders[hist_len][hist].backoff_prob
                 assert backoff_prob != 0.0
                 cost = -math.log(backoff_prob)
                 backoff_hist = hist[1:]
                 backoff_state = self._get_state_for_hist(hist_to_state, backoff_hist)
 
-                this_disambig_symbol = (
-                    disambig_symbol if len(hist_state.word_to_prob) != 0 else "<eps>"
-                )
+                this_disambig_symbol = disambig_symbol if len(words) != 0 else "<eps>"
                 k = symbols.find(this_disambig_symbol)
                 eps = symbols.find("<eps>")
                 fst.add_arc(state, pywrapfst.Arc(k, eps, cost, backoff_state))
@@ -1890,7 +2114,7 @@ class ArpaNgramModel:
         (hist_to_state, state_to_hist) = self.history_to_fst_state_mapping(min_order=2)
 
         # The following 3 things are just for diagnostics.
-        normalization_stats = [[0, 0.0] for _ in range(len(self.orders))]
+        normalization_stats = [[0, 0.0] for _ in range(len(self.ngrams) + 1)]
         num_ngrams_allowed = 0
         num_ngrams_disallowed = 0
 
@@ -1920,8 +2144,7 @@ class ArpaNgramModel:
                         next_state = self._get_state_for_hist(hist_to_state, (context_word, word))
                         output.write(f"{state} {next_state} {word} {word} {cost:.3f}\n")
             else:  # it's a higher-order than bigram state.
-                assert hist in self.orders[hist_len]
-                hist_state = self.orders[hist_len][hist]
+                words, probs, backoff_prob = self._history_state(hist)
                 most_recent_word = hist[-1]
 
                 normalization_stats[hist_len][0] += 1
@@ -1929,7 +2152,7 @@ class ArpaNgramModel:
                     self._get_prob(hist, word) for word in bigram_map[most_recent_word]
                 )
 
-                for word, prob in hist_state.word_to_prob.items():
+                for word, prob in zip(words, probs):
                     cost = -math.log(prob)
                     if word in bigram_map[most_recent_word]:
                         num_ngrams_allowed += 1
@@ -1942,16 +2165,12 @@ class ArpaNgramModel:
                         next_state = self._get_state_for_hist(hist_to_state, (hist) + (word,))
                         output.write(f"{state} {next_state} {word} {word} {cost:.3f}\n")
 
-                assert hist in self.orders[hist_len]
-                backoff_prob = self.orders[hist_len][hist].backoff_prob
                 assert backoff_prob != 0.0
                 cost = -math.log(backoff_prob)
                 backoff_hist = hist[1:]
                 backoff_state = self._get_state_for_hist(hist_to_state, backoff_hist)
 
-                this_disambig_symbol = (
-                    disambig_symbol if len(hist_state.word_to_prob) != 0 else "<eps>"
-                )
+                this_disambig_symbol = disambig_symbol if len(words) != 0 else "<eps>"
                 output.write(f"{state} {backoff_state} {this_disambig_symbol} <eps> {cost:.3f}")
         output.close()
 
@@ -1,6 +1,9 @@
 """Database classes"""
 from __future__ import annotations
 
+import csv
+import io
+import itertools
 import logging
 import os
 import re
@@ -66,6 +69,8 @@ __all__ = [
     "Grapheme",
     "MfaSqlBase",
     "bulk_update",
+    "bulk_insert_columns",
+    "bulk_update_columns",
     "get_next_primary_key",
     "full_load_utterance",
 ]
@@ -177,6 +182,176 @@ def bulk_update(
     MfaSqlBase.metadata.remove(temp_table)
 
 
+def bulk_insert_columns(
+    session: sqlalchemy.orm.Session,
+    table: MfaSqlBase,
+    columns: typing.Dict[str, typing.Any],
+) -> int:
+    """
+    Perform a bulk insert of rows specified as columns of values.  Columns can either be
+    sequences (i.e., :class:`numpy.ndarray`) with a value per row, or a single value to use for
+    every row.  On PostgreSQL, rows are streamed in through ``COPY``, so string columns cannot
+    contain nulls.
+
+    Parameters
+    ----------
+    session: :class:`sqlalchemy.orm.Session`
+        SqlAlchemy session to use
+    table: :class:`~montreal_forced_aligner.db.MfaSqlBase`
+        Table to insert into
+    columns: dict[str, Any]
+        Mapping of column names to either sequences of values or constant values
+
+    Returns
+    -------
+    int
+        Number of rows inserted
+    """
+    num_rows = None
+    for v in columns.values():
+        if isinstance(v, (np.ndarray, list, tuple)):
+            if num_rows is None:
+                num_rows = len(v)
+            elif len(v) != num_rows:
+                raise ValueError("All columns must have the same number of rows")
+    if not num_rows:
+        return 0
+    columns = {k: v for k, v in columns.items() if v is not None}
+    column_names = list(columns.keys())
+    values = []
+    for v in columns.values():
+        if isinstance(v, np.ndarray):
+            values.append(v.tolist())
+        elif isinstance(v, (list, tuple)):
+            values.append(v)
+        else:
+            values.append(itertools.repeat(v, num_rows))
+    if config.USE_POSTGRES:
+        sql_column_names = ", ".join(f'"{x}"' for x in column_names)
+        string_columns = ", ".join(
+            f'"{x}"' for x in column_names if isinstance(table.__table__.c[x].type, String)
+        )
+        options = "FORMAT csv"
+        if string_columns:
+            options += f", FORCE_NOT_NULL ({string_columns})"
+        buf = io.StringIO()
+        csv.writer(buf).writerows(zip(*values))
+        buf.seek(0)
+        cursor = session.connection().connection.cursor()
+        cursor.copy_expert(
+            f"COPY {table.__tablename__} ({sql_column_names}) FROM STDIN WITH ({options})", buf
+        )
+        cursor.close()
+    else:
+        session.execute(
+            sqlalchemy.insert(table.__table__),
+            [dict(zip(column_names, row)) for row in zip(*values)],
+        )
+    return num_rows
+
+
+def bulk_update_columns(
+    session: sqlalchemy.orm.Session,
+    table: MfaSqlBase,
+    columns: typing.Dict[str, typing.Any],
+    id_field: str = "id",
+) -> int:
+    """
+    Perform a bulk update of rows specified as columns of values.  Columns are sequences
+    with a value per row, and two-dimensional :class:`numpy.ndarray` columns are used as vector
+    columns with one row per database row.  On PostgreSQL, rows are streamed into a temporary
+    table through ``COPY`` and the table is updated from it in a single statement.
+
+    Parameters
+    ----------
+    session: :class:`sqlalchemy.orm.Session`
+        SqlAlchemy session to use
+    table: :class:`~montreal_forced_aligner.db.MfaSqlBase`
+        Table to update
+    columns: dict[str, Any]
+        Mapping of column names to sequences of values, including the primary key column
+    id_field: str
+        Primary key field, defaults to "id"
+
+    Returns
+    -------
+    int
+        Number of rows updated
+    """
+    num_rows = len(columns[id_field])
+    for v in columns.values():
+        if len(v) != num_rows:
+            raise ValueError("All columns must have the same number of rows")
+    if not num_rows:
+        return 0
+    column_names = list(columns.keys())
+    if not config.USE_POSTGRES:
+        values = [
+            v.tolist() if isinstance(v, np.ndarray) and v.ndim == 1 else v
+            for v in columns.values()
+        ]
+        bulk_update(
+            session,
+            table,
+            [dict(zip(column_names, row)) for row in zip(*values)],
+            id_field=id_field,
+        )
+        return num_rows
+    values = []
+    for v in columns.values():
+        if isinstance(v, np.ndarray) and v.ndim == 2:
+            values.append(["[" + ",".join(map(str, row)) + "]" for row in v.tolist()])
+        elif isinstance(v, np.ndarray):
+            values.append(v.tolist())
+        else:
+            values.append(v)
+    update_columns = [getattr(table, x)._copy() for x in column_names if x != id_field]
+    sql_column_names = [f'"{x}"' for x in column_names if x != id_field]
+    session.execute(sqlalchemy.text(f"ALTER TABLE {table.__tablename__} DISABLE TRIGGER all"))
+    session.commit()
+    with session.begin_nested():
+        temp_table = sqlalchemy.Table(
+            f"temp_{table.__tablename__}",
+            MfaSqlBase.metadata,
+            sqlalchemy.Column(id_field, sqlalchemy.Integer, primary_key=True),
+            *update_columns,
+            prefixes=["TEMPORARY"],
+            extend_existing=True,
+        )
+        create_statement = str(
+            sqlalchemy.schema.CreateTable(temp_table).compile(session.get_bind())
+        )
+        session.execute(sqlalchemy.text(create_statement))
+        buf = io.StringIO()
+        csv.writer(buf).writerows(zip(*values))
+        buf.seek(0)
+        cursor = session.connection().connection.cursor()
+        all_column_names = ", ".join(f'"{x}"' for x in column_names)
+        cursor.copy_expert(
+            f"COPY temp_{table.__tablename__} ({all_column_names}) FROM STDIN WITH (FORMAT csv)",
+            buf,
+        )
+        cursor.close()
+        set_statements = ",\n".join(f" {c} = b.{c}" for c in sql_column_names)
+        session.execute(
+            sqlalchemy.text(
+                f"""
+        UPDATE {table.__tablename__}
+        SET
+            {set_statements}
+        FROM temp_{table.__tablename__} AS b
+        WHERE {table.__tablename__}.{id_field}=b.{id_field};
+        """
+            )
+        )
+        session.execute(sqlalchemy.text(f"DROP TABLE temp_{table.__tablename__}"))
+    session.execute(sqlalchemy.text(f"ALTER TABLE {table.__tablename__} ENABLE TRIGGER all"))
+    session.commit()
+    session.execute(sqlalchemy.text("DISCARD TEMP"))
+    MfaSqlBase.metadata.remove(temp_table)
+    return num_rows
+
+
 Dictionary2Job = sqlalchemy.Table(
     "dictionary_job",
     MfaSqlBase.metadata,
@@ -229,6 +404,8 @@ class Corpus(MfaSqlBase):
         Flag for whether alignment evaluation has successfully completed
     has_reference_alignments: bool
         Flag for whether reference alignments have been imported
+    validation_sample: bool
+        Flag for whether the current subset is a sample for testing transcriptions
     """
 
     __tablename__ = "corpus"
@@ -253,6 +430,7 @@ class Corpus(MfaSqlBase):
     num_jobs = Column(Integer, default=0)
 
     current_subset = Column(Integer, default=0)
+    validation_sample = Column(Boolean, default=False)
     data_directory = Column(PathType, nullable=False)
 
     jobs = relationship("Job", back_populates="corpus")
@@ -265,6 +443,8 @@ class Corpus(MfaSqlBase):
     def current_subset_directory(self):
         if not self.current_subset:
             return self.split_directory
+        if self.validation_sample:
+            return self.data_directory.joinpath(f"validation_sample_{self.current_subset}")
         return self.data_directory.joinpath(f"subset_{self.current_subset}")
 
     @property
@@ -1419,6 +1599,8 @@ class Utterance(MfaSqlBase):
         Word error rate for transcription evaluation
     character_error_rate: float
         Character error rate for transcription evaluation
+    lm_perplexity: float
+        Perplexity of the utterance under a language model trained on the corpus
     file_id: int
         Foreign key to :class:`~montreal_forced_aligner.db.File`
     speaker_id: int
@@ -1464,6 +1646,7 @@ class Utterance(MfaSqlBase):
     alignment_score = Column(Float)
     word_error_rate = Column(Float)
     character_error_rate = Column(Float)
+    lm_perplexity = Column(Float)
     ivector = Column(Vector(config.IVECTOR_DIMENSION), nullable=True)
     plda_vector = Column(Vector(config.PLDA_DIMENSION), nullable=True)
     xvector = Column(Vector(config.XVECTOR_DIMENSION), nullable=True)
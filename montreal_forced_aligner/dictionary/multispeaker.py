@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import abc
 import collections
+import hashlib
 import logging
 import os
 import re
+import shutil
 import typing
 import unicodedata
 from pathlib import Path
@@ -86,6 +88,9 @@ class MultispeakerDictionaryMixin(TemporaryDictionaryMixin, metaclass=abc.ABCMet
         Mapping of dictionary names to ids
     """
 
+    lexicon_cache_version = 2
+    lexicon_cache_size = 20
+
     def __init__(
         self,
         dictionary_path: typing.Union[str, Path] = None,
@@ -1639,12 +1644,86 @@ class MultispeakerDictionaryMixin(TemporaryDictionaryMixin, metaclass=abc.ABCMet
             for d in dictionaries:
                 self.lexicon_compilers[d.id] = d.lexicon_compiler
 
+    def lexicon_cache_key(
+        self,
+        lexicon_compiler: LexiconCompiler,
+        pronunciations: typing.List[typing.Tuple],
+        disambiguation: bool,
+    ) -> str:
+        """
+        Get the digest identifying a compiled lexicon in the lexicon cache
+
+        Parameters
+        ----------
+        lexicon_compiler: :class:`~kalpy.fstext.lexicon.LexiconCompiler`
+            Lexicon compiler with the silence and probability parameters of the lexicon
+        pronunciations: list[tuple]
+            Words, pronunciations and probabilities to compile
+        disambiguation: bool
+            Flag for whether the lexicon uses disambiguation symbols
+
+        Returns
+        -------
+        str
+            SHA-256 digest of the lexicon contents and parameters
+        """
+        digest = hashlib.sha256()
+        parameters = [
+            getattr(lexicon_compiler, x, None)
+            for x in (
+                "silence_probability",
+                "initial_silence_probability",
+                "final_silence_correction",
+                "final_non_silence_correction",
+                "silence_word",
+                "oov_word",
+                "silence_phone",
+                "oov_phone",
+                "position_dependent_phones",
+                "ignore_case",
+            )
+        ]
+        digest.update(
+            f"v{self.lexicon_cache_version}:{disambiguation}:{parameters}\n".encode("utf8")
+        )
+        for table in (lexicon_compiler.phone_table, lexicon_compiler.word_table):
+            digest.update("\n".join(f"{k}\t{v}" for k, v in table).encode("utf8"))
+            digest.update(b"\n\n")
+        for row in pronunciations:
+            digest.update(f"{row}\n".encode("utf8"))
+        return digest.hexdigest()
+
     def build_lexicon_compiler(
         self,
         dictionary_id: int,
         acoustic_model: AcousticModel = None,
         disambiguation: bool = False,
     ):
+        """
+        Build the lexicon FSTs for a dictionary and write them to the dictionary's temporary
+        directory
+
+        Compiled FSTs, word symbol tables and disambiguation symbols are saved in a
+        "lexicon_cache" directory in :data:`~montreal_forced_aligner.config.TEMPORARY_DIRECTORY`,
+        keyed by
+        :meth:`~montreal_forced_aligner.dictionary.multispeaker.MultispeakerDictionaryMixin.lexicon_cache_key`,
+        so unchanged lexicons are copied from the cache rather than recompiled.  Only the
+        :attr:`lexicon_cache_size` most recently used lexicons are kept.
+
+        Parameters
+        ----------
+        dictionary_id: int
+            Database ID of the dictionary
+        acoustic_model: :class:`~montreal_forced_aligner.models.AcousticModel`, optional
+            Acoustic model to take the lexicon compiler parameters and phone table from
+        disambiguation: bool
+            Flag for using disambiguation symbols
+
+        Returns
+        -------
+        :class:`~kalpy.fstext.lexicon.LexiconCompiler`
+            Lexicon compiler with the compiled FSTs loaded
+        """
         with self.session() as session:
             d = session.get(Dictionary, dictionary_id)
             if acoustic_model is None:
@@ -1701,6 +1780,50 @@ class MultispeakerDictionaryMixin(TemporaryDictionaryMixin, metaclass=abc.ABCMet
                     .order_by(Word.mapping_id)
                 )
             lexicon_compiler.word_table = d.word_table
+            pronunciations = []
+            for row in query:
+                phones = row[2].split()
+                if self.position_dependent_phones:
+                    if any(not lexicon_compiler.phone_table.member(x + "_S") for x in phones):
+                        continue
+                else:
+                    if any(not lexicon_compiler.phone_table.member(x) for x in phones):
+                        continue
+                pronunciations.append(tuple(row))
+            if not pronunciations:
+                raise DictionaryError("Lexicon compiler did not have any pronunciations.")
+            if disambiguation:
+                fst_path, align_fst_path = (
+                    d.lexicon_disambig_fst_path,
+                    d.align_lexicon_disambig_path,
+                )
+            else:
+                fst_path, align_fst_path = d.lexicon_fst_path, d.align_lexicon_path
+            cache_directory = config.TEMPORARY_DIRECTORY.joinpath(
+                "lexicon_cache",
+                self.lexicon_cache_key(lexicon_compiler, pronunciations, disambiguation),
+            )
+            if cache_directory.exists():
+                logger.debug(f"Loading compiled lexicon for {d.name} from {cache_directory}")
+                shutil.copyfile(cache_directory.joinpath("L.fst"), fst_path)
+                shutil.copyfile(cache_directory.joinpath("align_lexicon.fst"), align_fst_path)
+                lexicon_compiler.load_l_from_file(fst_path)
+                lexicon_compiler.load_l_align_from_file(align_fst_path)
+                lexicon_compiler.word_table = pywrapfst.SymbolTable.read_text(
+                    cache_directory.joinpath("words.txt")
+                )
+                with mfa_open(cache_directory.joinpath("disambiguation.yaml"), "r") as f:
+                    disambiguation_data = yaml.load(f, Loader=yaml.Loader)
+                lexicon_compiler.max_disambiguation_symbol = disambiguation_data[
+                    "max_disambiguation_symbol"
+                ]
+                lexicon_compiler.silence_disambiguation_symbol = disambiguation_data[
+                    "silence_disambiguation_symbol"
+                ]
+                for x in range(lexicon_compiler.max_disambiguation_symbol + 3):
+                    lexicon_compiler.phone_table.add_symbol(f"#{x}")
+                os.utime(cache_directory)
+                return lexicon_compiler
             for (
                 mapping_id,
                 word,
@@ -1709,14 +1832,7 @@ class MultispeakerDictionaryMixin(TemporaryDictionaryMixin, metaclass=abc.ABCMet
                 silence_after_probability,
                 silence_before_correction,
                 non_silence_before_correction,
-            ) in query:
-                phones = pronunciation.split()
-                if self.position_dependent_phones:
-                    if any(not lexicon_compiler.phone_table.member(x + "_S") for x in phones):
-                        continue
-                else:
-                    if any(not lexicon_compiler.phone_table.member(x) for x in phones):
-                        continue
+            ) in pronunciations:
                 if not lexicon_compiler.word_table.member(word):
                     lexicon_compiler.word_table.add_symbol(word, mapping_id)
                 lexicon_compiler.pronunciations.append(
@@ -1730,20 +1846,57 @@ class MultispeakerDictionaryMixin(TemporaryDictionaryMixin, metaclass=abc.ABCMet
                         None,
                     )
                 )
-            if not lexicon_compiler.pronunciations:
-                raise DictionaryError("Lexicon compiler did not have any pronunciations.")
             lexicon_compiler.compute_disambiguation_symbols()
 
             lexicon_compiler.create_fsts()
-            if disambiguation:
-                lexicon_compiler.align_fst.write(d.align_lexicon_disambig_path)
-                lexicon_compiler.fst.write(d.lexicon_disambig_fst_path)
-            else:
-                lexicon_compiler.align_fst.write(d.align_lexicon_path)
-                lexicon_compiler.fst.write(d.lexicon_fst_path)
+            lexicon_compiler.align_fst.write(align_fst_path)
+            lexicon_compiler.fst.write(fst_path)
             lexicon_compiler.clear()
+            temporary_directory = cache_directory.with_name(
+                f"{cache_directory.name}.{os.getpid()}.tmp"
+            )
+            temporary_directory.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(fst_path, temporary_directory.joinpath("L.fst"))
+            shutil.copyfile(align_fst_path, temporary_directory.joinpath("align_lexicon.fst"))
+            lexicon_compiler.word_table.write_text(temporary_directory.joinpath("words.txt"))
+            with mfa_open(temporary_directory.joinpath("disambiguation.yaml"), "w") as f:
+                yaml.dump(
+                    {
+                        "max_disambiguation_symbol": lexicon_compiler.max_disambiguation_symbol,
+                        "silence_disambiguation_symbol": (
+                            lexicon_compiler.silence_disambiguation_symbol
+                        ),
+                    },
+                    f,
+                    Dumper=yaml.Dumper,
+                )
+            try:
+                temporary_directory.rename(cache_directory)
+            except OSError:  # Saved by another process in the meantime
+                shutil.rmtree(temporary_directory, ignore_errors=True)
+            self.prune_lexicon_cache(cache_directory.parent)
         return lexicon_compiler
 
+    def prune_lexicon_cache(self, cache_directory: Path) -> None:
+        """
+        Delete all but the :attr:`lexicon_cache_size` most recently used compiled lexicons
+
+        Parameters
+        ----------
+        cache_directory: :class:`~pathlib.Path`
+            Lexicon cache directory
+        """
+        entries = []
+        for path in cache_directory.iterdir():
+            if path.suffix == ".tmp":
+                continue
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:  # Pruned by another process in the meantime
+                continue
+        for _, path in sorted(entries, reverse=True)[self.lexicon_cache_size :]:
+            shutil.rmtree(path, ignore_errors=True)
+
     def write_training_information(self) -> None:
         """Write phone information needed for training"""
         self._write_topo()
@@ -0,0 +1,423 @@
+"""
+Stage execution
+===============
+
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+import typing
+
+from montreal_forced_aligner import config
+from montreal_forced_aligner.profiling import PROFILER
+
+if typing.TYPE_CHECKING:
+    from montreal_forced_aligner.abc import KaldiFunction
+    from montreal_forced_aligner.data import MfaArguments
+
+__all__ = [
+    "StageTask",
+    "StageExecutor",
+    "ExecutionPlan",
+    "JobGovernor",
+    "GOVERNOR",
+    "available_cores",
+    "available_memory",
+]
+
+logger = logging.getLogger("mfa")
+
+
+class StageTask:
+    """
+    Single step of a pipeline stage along with the steps it depends on
+
+    Parameters
+    ----------
+    name: str
+        Name of the task
+    function: Callable
+        Function to call, with the results of the tasks in ``inputs`` as positional arguments
+    inputs: list[str]
+        Names of tasks whose results are passed to the function
+    dependencies: list[str]
+        Names of tasks that must finish before this task starts, but whose results are not used
+    """
+
+    def __init__(
+        self,
+        name: str,
+        function: typing.Callable,
+        inputs: typing.Sequence[str] = (),
+        dependencies: typing.Sequence[str] = (),
+    ):
+        self.name = name
+        self.function = function
+        self.inputs = list(inputs)
+        self.dependencies = list(dict.fromkeys([*inputs, *dependencies]))
+        self.result = None
+        self.begin = None
+        self.end = None
+
+    @property
+    def duration(self) -> float:
+        """Wall time of the task in seconds"""
+        if self.begin is None or self.end is None:
+            return 0.0
+        return self.end - self.begin
+
+    def __repr__(self) -> str:
+        return f"<StageTask {self.name} depends on {self.dependencies}>"
+
+
+class StageExecutor:
+    """
+    Run the steps of a pipeline stage as a graph of tasks, starting each task as soon as
+    every task it depends on has finished
+
+    Independent tasks run concurrently in threads, and the work they do in Kaldi functions
+    is still spread over the job processes.  After :meth:`~StageExecutor.run`, the difference
+    between running the tasks one after another and the elapsed time is available as
+    :attr:`~StageExecutor.time_saved`.
+
+    Parameters
+    ----------
+    name: str
+        Name of the stage, used for logging
+    max_workers: int, optional
+        Maximum number of tasks to run at once, defaults to the number of tasks
+    """
+
+    def __init__(self, name: str, max_workers: typing.Optional[int] = None):
+        self.name = name
+        self.max_workers = max_workers
+        self.tasks: typing.Dict[str, StageTask] = {}
+        self.wall_time = 0.0
+
+    def add_task(
+        self,
+        name: str,
+        function: typing.Callable,
+        inputs: typing.Sequence[str] = (),
+        dependencies: typing.Sequence[str] = (),
+    ) -> StageTask:
+        """
+        Add a task to the stage
+
+        Parameters
+        ----------
+        name: str
+            Name of the task
+        function: Callable
+            Function to call, with the results of the tasks in ``inputs`` as positional arguments
+        inputs: list[str]
+            Names of previously added tasks whose results are passed to the function
+        dependencies: list[str]
+            Names of previously added tasks that must finish before this task starts
+
+        Returns
+        -------
+        :class:`~montreal_forced_aligner.executor.StageTask`
+            Task that was added
+
+        Raises
+        ------
+        ValueError
+            If a task with the same name exists or a dependency has not been added yet
+        """
+        if name in self.tasks:
+            raise ValueError(f"A task named {name} was already added to {self.name}")
+        task = StageTask(name, function, inputs, dependencies)
+        for d in task.dependencies:
+            if d not in self.tasks:
+                raise ValueError(f"Task {name} depends on {d}, which has not been added")
+        self.tasks[name] = task
+        return task
+
+    @property
+    def serial_time(self) -> float:
+        """Total wall time of all tasks, as if they had been run one after another"""
+        return sum(t.duration for t in self.tasks.values())
+
+    @property
+    def time_saved(self) -> float:
+        """Wall time saved by running independent tasks concurrently"""
+        return max(self.serial_time - self.wall_time, 0.0)
+
+    def _run_task(self, task: StageTask, parent: typing.Optional[str] = None) -> typing.Any:
+        """Run a single task with the results of its inputs, profiled under a parent stage"""
+        task.begin = time.perf_counter()
+        try:
+            with PROFILER.stage(task.name, "stage_task", parent=parent):
+                return task.function(*(self.tasks[x].result for x in task.inputs))
+        finally:
+            task.end = time.perf_counter()
+
+    def run(self) -> typing.Dict[str, typing.Any]:
+        """
+        Run all tasks, waiting for running tasks to finish if any of them fails
+
+        A task that is ready while no other task is running is run on the calling thread,
+        so stages without independent tasks run exactly as they would without the executor
+
+        Returns
+        -------
+        dict[str, Any]
+            Results of each task, keyed by task name
+        """
+        begin = time.perf_counter()
+        pending = dict(self.tasks)
+        done = set()
+        running = {}
+        error = None
+        max_workers = self.max_workers or max(len(self.tasks), 1)
+        parent = PROFILER.current_stage
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while pending or running:
+                if error is None:
+                    ready = [t for t in pending.values() if all(d in done for d in t.dependencies)]
+                    for task in ready:
+                        del pending[task.name]
+                    if len(ready) == 1 and not running:
+                        task = ready[0]
+                        task.result = self._run_task(task, parent)
+                        done.add(task.name)
+                        continue
+                    for task in ready:
+                        running[pool.submit(self._run_task, task, parent)] = task
+                if not running:
+                    break
+                finished, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in finished:
+                    task = running.pop(future)
+                    try:
+                        task.result = future.result()
+                    except BaseException as e:
+                        if error is None:
+                            error = e
+                        continue
+                    done.add(task.name)
+        self.wall_time = time.perf_counter() - begin
+        if error is not None:
+            raise error
+        logger.debug(
+            f"{self.name} took {self.wall_time:.3f} seconds, "
+            f"saving {self.time_saved:.3f} seconds over running "
+            f"{', '.join(self.tasks.keys())} serially"
+        )
+        return {name: task.result for name, task in self.tasks.items()}
+
+
+def available_cores() -> int:
+    """
+    Get the number of cores the current process is allowed to run on
+
+    Returns
+    -------
+    int
+        Number of usable cores
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def available_memory() -> typing.Optional[float]:
+    """
+    Get the memory that can be allocated without swapping
+
+    Returns
+    -------
+    float or None
+        Available memory in MB, None if it cannot be determined on the current platform
+    """
+    try:
+        with open("/proc/meminfo", "r", encoding="utf8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+class ExecutionPlan:
+    """
+    How the jobs of a single call of :func:`~montreal_forced_aligner.utils.run_kaldi_function`
+    are run
+
+    Parameters
+    ----------
+    function_name: str
+        Name of the :class:`~montreal_forced_aligner.abc.KaldiFunction`
+    use_threading: bool
+        Flag for running jobs in threads rather than processes
+    max_workers: int
+        Maximum number of jobs to run at once
+    reason: str
+        Explanation of the plan for logging
+    """
+
+    def __init__(
+        self, function_name: str, use_threading: bool, max_workers: int, reason: str = ""
+    ):
+        self.function_name = function_name
+        self.use_threading = use_threading
+        self.max_workers = max_workers
+        self.reason = reason
+
+    def __repr__(self) -> str:
+        mode = "threads" if self.use_threading else "processes"
+        return f"<ExecutionPlan {self.function_name}: {self.max_workers} {mode} ({self.reason})>"
+
+
+class JobGovernor:
+    """
+    Picks whether the jobs of a :class:`~montreal_forced_aligner.abc.KaldiFunction` run in
+    threads or processes and how many of them run at once
+
+    Functions declare whether their work releases the GIL through
+    :attr:`~montreal_forced_aligner.abc.KaldiFunction.releases_gil` and how much memory a job
+    needs through :meth:`~montreal_forced_aligner.abc.KaldiFunction.estimate_job_memory`.  The
+    first call of a function calibrates these declarations: a threaded call whose jobs kept less
+    than half of their cores busy is treated as GIL-bound and later calls use processes, and the
+    memory growth of process jobs replaces the declared estimate.
+
+    Plans only differ from the global configuration when
+    :data:`~montreal_forced_aligner.config.AUTO_EXECUTION` is enabled.  Threads are only picked
+    when :data:`~montreal_forced_aligner.config.USE_THREADING` is disabled, since job arguments
+    then carry a database connection string that works from either threads or processes.
+    """
+
+    #: Fraction of the available memory that concurrent jobs may use
+    memory_fraction = 0.8
+    #: Minimum ratio of CPU time to wall time per running thread for a function to not be GIL-bound
+    thread_efficiency_threshold = 0.5
+
+    def __init__(self):
+        self.gil_bound: typing.Dict[str, bool] = {}
+        self.job_memory: typing.Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Forget calibrations from previous runs"""
+        with self._lock:
+            self.gil_bound = {}
+            self.job_memory = {}
+
+    def estimate_job_memory(
+        self, function: typing.Type[KaldiFunction], arguments: typing.List[MfaArguments]
+    ) -> typing.Optional[float]:
+        """
+        Estimate the memory a single job of a function needs
+
+        Parameters
+        ----------
+        function: type[:class:`~montreal_forced_aligner.abc.KaldiFunction`]
+            Function to run
+        arguments: list[:class:`~montreal_forced_aligner.data.MfaArguments`]
+            Arguments for each job
+
+        Returns
+        -------
+        float or None
+            Memory per job in MB, None if neither measured nor declared
+        """
+        if function.__name__ in self.job_memory:
+            return self.job_memory[function.__name__]
+        estimates = [function.estimate_job_memory(args) for args in arguments]
+        estimates = [x for x in estimates if x is not None]
+        if not estimates:
+            return None
+        return max(estimates)
+
+    def plan(
+        self, function: typing.Type[KaldiFunction], arguments: typing.List[MfaArguments]
+    ) -> ExecutionPlan:
+        """
+        Plan the execution of a function's jobs
+
+        Parameters
+        ----------
+        function: type[:class:`~montreal_forced_aligner.abc.KaldiFunction`]
+            Function to run
+        arguments: list[:class:`~montreal_forced_aligner.data.MfaArguments`]
+            Arguments for each job
+
+        Returns
+        -------
+        :class:`~montreal_forced_aligner.executor.ExecutionPlan`
+            Execution plan for the jobs
+        """
+        name = function.__name__
+        num_jobs = max(len(arguments), 1)
+        if not config.AUTO_EXECUTION:
+            return ExecutionPlan(name, config.USE_THREADING, num_jobs, "configured")
+        reasons = []
+        use_threading = config.USE_THREADING
+        if not use_threading and function.releases_gil:
+            if self.gil_bound.get(name, False):
+                reasons.append("GIL-bound in calibration")
+            else:
+                use_threading = True
+                reasons.append("releases the GIL")
+        max_workers = min(num_jobs, available_cores())
+        job_memory = self.estimate_job_memory(function, arguments)
+        free_memory = available_memory()
+        if job_memory and free_memory is not None:
+            memory_cap = max(int(free_memory * self.memory_fraction / job_memory), 1)
+            if memory_cap < max_workers:
+                max_workers = memory_cap
+                reasons.append(
+                    f"{free_memory:.0f} MB available for jobs using {job_memory:.0f} MB each"
+                )
+        return ExecutionPlan(name, use_threading, max_workers, ", ".join(reasons))
+
+    def observe(
+        self,
+        plan: ExecutionPlan,
+        wall_time: float,
+        jobs: typing.List[typing.Tuple[float, typing.Optional[float]]],
+    ) -> None:
+        """
+        Calibrate later plans of a function from the resource usage of a finished call
+
+        Parameters
+        ----------
+        plan: :class:`~montreal_forced_aligner.executor.ExecutionPlan`
+            Plan that the jobs ran under
+        wall_time: float
+            Elapsed time for all jobs
+        jobs: list[tuple[float, float or None]]
+            CPU time and memory growth in MB of each job, memory is None when it could not be
+            measured
+        """
+        if not jobs or wall_time <= 0:
+            return
+        name = plan.function_name
+        with self._lock:
+            concurrency = min(plan.max_workers, len(jobs))
+            if plan.use_threading and concurrency > 1 and name not in self.gil_bound:
+                efficiency = sum(x[0] for x in jobs) / (wall_time * concurrency)
+                self.gil_bound[name] = efficiency < self.thread_efficiency_threshold
+                if self.gil_bound[name]:
+                    logger.debug(
+                        f"{name} kept {efficiency:.0%} of {concurrency} threads busy, "
+                        f"running later calls in processes"
+                    )
+            memory = [x[1] for x in jobs if x[1] is not None]
+            if memory:
+                self.job_memory[name] = max(max(memory), 1.0)
+
+
+GOVERNOR = JobGovernor()
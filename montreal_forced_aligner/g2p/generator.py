@@ -12,7 +12,6 @@ import statistics
 import time
 import typing
 import unicodedata
-from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
 
@@ -32,7 +31,7 @@ from montreal_forced_aligner.data import MfaArguments, TextgridFormats, WordType
 from montreal_forced_aligner.db import File, Utterance, Word, bulk_update
 from montreal_forced_aligner.exceptions import PyniniGenerationError
 from montreal_forced_aligner.g2p.mixins import G2PTopLevelMixin
-from montreal_forced_aligner.helper import comma_join, mfa_open, score_g2p
+from montreal_forced_aligner.helper import batch_score_g2p, comma_join, mfa_open
 from montreal_forced_aligner.models import G2PModel
 from montreal_forced_aligner.textgrid import construct_output_path
 from montreal_forced_aligner.utils import run_kaldi_function
@@ -813,24 +812,22 @@ class PyniniValidator(PyniniGenerator, TopLevelMfaWorker):
             f"Generated an average of {hyp_pron_count / len(hypothesis_values)} variants "
             f"The gold set had an average of {gold_pron_count / len(hypothesis_values)} variants."
         )
-        with ThreadPool(config.NUM_JOBS) as pool:
-            gen = pool.starmap(score_g2p, to_comp)
-            for i, (edits, length) in enumerate(gen):
-                word = indices[i]
-                gold_pronunciations = gold_values[word]
-                hyp = hypothesis_values[word]
-                output.append(
-                    {
-                        "Word": word,
-                        "Gold pronunciations": ", ".join(gold_pronunciations),
-                        "Hypothesis pronunciations": ", ".join(hyp),
-                        "Accuracy": 1,
-                        "Error rate": edits / length,
-                        "Length": length,
-                    }
-                )
-                total_edits += edits
-                total_length += length
+        for i, (edits, length) in enumerate(batch_score_g2p(to_comp)):
+            word = indices[i]
+            gold_pronunciations = gold_values[word]
+            hyp = hypothesis_values[word]
+            output.append(
+                {
+                    "Word": word,
+                    "Gold pronunciations": ", ".join(gold_pronunciations),
+                    "Hypothesis pronunciations": ", ".join(hyp),
+                    "Accuracy": 1,
+                    "Error rate": edits / length,
+                    "Length": length,
+                }
+            )
+            total_edits += edits
+            total_length += length
         with mfa_open(self.evaluation_csv_path, "w") as f:
             writer = csv.DictWriter(
                 f,
@@ -6,7 +6,6 @@ Helper functions
 from __future__ import annotations
 
 import collections
-import functools
 import itertools
 import json
 import logging
@@ -19,7 +18,6 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 import dataclassy
 import numpy
 import yaml
-from Bio import pairwise2
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.theme import Theme
@@ -46,13 +44,22 @@ __all__ = [
     "overlap_scoring",
     "make_re_character_set_safe",
     "align_phones",
+    "batch_align_phones",
+    "batch_edit_distance",
+    "batch_global_alignment",
+    "batch_score_g2p",
+    "batch_score_wer",
+    "global_alignment",
+    "Alignment",
     "split_phone_position",
     "align_pronunciations",
     "configure_logger",
     "mfa_open",
     "load_configuration",
     "format_correction",
+    "format_corrections",
     "format_probability",
+    "format_probabilities",
     "load_evaluation_mapping",
 ]
 
@@ -397,6 +404,8 @@ def edit_distance(x: List[str], y: List[str]) -> int:
     --------
     `https://gist.github.com/kylebgorman/8034009 <https://gist.github.com/kylebgorman/8034009>`_
          For a more expressive version of this function
+    :func:`~montreal_forced_aligner.helper.batch_edit_distance`
+        For computing edit distances of many pairs at once
 
     Parameters
     ----------
@@ -410,21 +419,67 @@ def edit_distance(x: List[str], y: List[str]) -> int:
     int
         Edit distance
     """
-    idim = len(x) + 1
-    jdim = len(y) + 1
-    table = numpy.zeros((idim, jdim), dtype=numpy.uint8)
-    table[1:, 0] = 1
-    table[0, 1:] = 1
-    for i in range(1, idim):
-        for j in range(1, jdim):
-            if x[i - 1] == y[j - 1]:
-                table[i][j] = table[i - 1][j - 1]
-            else:
-                c1 = table[i - 1][j]
-                c2 = table[i][j - 1]
-                c3 = table[i - 1][j - 1]
-                table[i][j] = min(c1, c2, c3) + 1
-    return int(table[-1][-1])
+    return int(batch_edit_distance([(x, y)])[0])
+
+
+def batch_edit_distance(
+    pairs: List[Tuple[List[str], List[str]]], batch_size: int = 1024
+) -> numpy.ndarray:
+    """
+    Compute edit distances for many pairs of label sequences
+
+    Labels are mapped to integers and pairs of similar length are processed together, so each
+    row of the dynamic programming tables is computed for a whole batch of pairs with numpy
+    operations.  Insertions within a row are resolved with a running minimum, so there are no
+    per-cell Python operations.
+
+    Parameters
+    ----------
+    pairs: list[tuple[list[str], list[str]]]
+        Pairs of sequences to compare
+    batch_size: int
+        Number of pairs to process together
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Edit distance for each pair
+    """
+    distances = numpy.zeros(len(pairs), dtype=numpy.int64)
+    symbols = {}
+    encoded = [
+        (
+            [symbols.setdefault(t, len(symbols)) for t in x],
+            [symbols.setdefault(t, len(symbols)) for t in y],
+        )
+        for x, y in pairs
+    ]
+    order = sorted(range(len(pairs)), key=lambda k: (len(encoded[k][0]), len(encoded[k][1])))
+    for start in range(0, len(order), batch_size):
+        indices = order[start : start + batch_size]
+        x_lengths = numpy.array([len(encoded[k][0]) for k in indices])
+        y_lengths = numpy.array([len(encoded[k][1]) for k in indices])
+        max_x = x_lengths.max()
+        max_y = y_lengths.max()
+        x = numpy.full((len(indices), max_x), -1, dtype=numpy.int64)
+        y = numpy.full((len(indices), max_y), -2, dtype=numpy.int64)
+        for i, k in enumerate(indices):
+            x[i, : x_lengths[i]] = encoded[k][0]
+            y[i, : y_lengths[i]] = encoded[k][1]
+        offsets = numpy.arange(max_y + 1, dtype=numpy.int64)
+        row = numpy.tile(offsets, (len(indices), 1))
+        batch_distances = y_lengths.copy()
+        for i in range(1, max_x + 1):
+            current = numpy.empty_like(row)
+            current[:, 0] = i
+            numpy.minimum(
+                row[:, :-1] + (x[:, i - 1, None] != y), row[:, 1:] + 1, out=current[:, 1:]
+            )
+            row = numpy.minimum.accumulate(current - offsets, axis=1) + offsets
+            finished = numpy.nonzero(x_lengths == i)[0]
+            batch_distances[finished] = row[finished, y_lengths[finished]]
+        distances[indices] = batch_distances
+    return distances
 
 
 def score_g2p(gold: List[str], hypo: List[str]) -> Tuple[int, int]:
@@ -445,20 +500,45 @@ def score_g2p(gold: List[str], hypo: List[str]) -> Tuple[int, int]:
     int
         Length of the gold labels
     """
-    for h in hypo:
-        if h in gold:
-            return 0, len(h)
-    edits = 100000
-    best_length = 100000
-    for g, h in itertools.product(gold, hypo):
-        e = edit_distance(g.split(), h.split())
-        if e < edits:
-            edits = e
-            best_length = len(g)
-        if not edits:
-            best_length = len(g)
-            break
-    return edits, best_length
+    return batch_score_g2p([(gold, hypo)])[0]
+
+
+def batch_score_g2p(pairs: List[Tuple[List[str], List[str]]]) -> List[Tuple[int, int]]:
+    """
+    Computes sufficient statistics for LER calculation for many words at once
+
+    See Also
+    --------
+    :func:`~montreal_forced_aligner.helper.score_g2p`
+        For scoring a single word
+
+    Parameters
+    ----------
+    pairs: list[tuple[list[str], list[str]]]
+        Gold pronunciations and hypothesized pronunciations for each word
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Edit distance and length of the best matching gold pronunciation for each word
+    """
+    scores = [None] * len(pairs)
+    to_comp = []
+    candidates = []
+    for i, (gold, hypo) in enumerate(pairs):
+        for h in hypo:
+            if h in gold:
+                scores[i] = (0, len(h))
+                break
+        else:
+            for g, h in itertools.product(gold, hypo):
+                candidates.append((i, len(g)))
+                to_comp.append((g.split(), h.split()))
+            scores[i] = (100000, 100000)
+    for (i, length), edits in zip(candidates, batch_edit_distance(to_comp)):
+        if edits < scores[i][0]:
+            scores[i] = (int(edits), length)
+    return scores
 
 
 def score_wer(gold: List[str], hypo: List[str]) -> Tuple[int, int, int, int]:
@@ -483,11 +563,36 @@ def score_wer(gold: List[str], hypo: List[str]) -> Tuple[int, int, int, int]:
     int
         Length of the gold characters
     """
-    word_edits = edit_distance(gold, hypo)
-    character_gold = list("".join(gold))
-    character_hypo = list("".join(hypo))
-    character_edits = edit_distance(character_gold, character_hypo)
-    return word_edits, len(gold), character_edits, len(character_gold)
+    return batch_score_wer([(gold, hypo)])[0]
+
+
+def batch_score_wer(pairs: List[Tuple[List[str], List[str]]]) -> List[Tuple[int, int, int, int]]:
+    """
+    Computes word error rate and character error rate for many transcriptions at once
+
+    See Also
+    --------
+    :func:`~montreal_forced_aligner.helper.score_wer`
+        For scoring a single transcription
+
+    Parameters
+    ----------
+    pairs: list[tuple[list[str], list[str]]]
+        Reference words and hypothesized words for each transcription
+
+    Returns
+    -------
+    list[tuple[int, int, int, int]]
+        Word edit distance, length of the gold words, character edit distance and length of the
+        gold characters for each transcription
+    """
+    character_pairs = [(list("".join(gold)), list("".join(hypo))) for gold, hypo in pairs]
+    word_edits = batch_edit_distance(pairs)
+    character_edits = batch_edit_distance(character_pairs)
+    return [
+        (int(word_edits[i]), len(gold), int(character_edits[i]), len(character_pairs[i][0]))
+        for i, (gold, _) in enumerate(pairs)
+    ]
 
 
 def compare_labels(
@@ -577,6 +682,370 @@ class EnhancedJSONEncoder(json.JSONEncoder):
         return dataclassy.asdict(o)
 
 
+Alignment = collections.namedtuple("Alignment", ["seqA", "seqB", "score", "start", "end"])
+
+
+def _rint(value):
+    """Truncate scores to the precision used for finding equally scoring paths"""
+    return numpy.trunc(value * 1000 + 0.5)
+
+
+def _fill_alignment_matrices(
+    scores: numpy.ndarray, gap_penalty: float
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Fill score and traceback matrices for a batch of padded score matrices
+
+    Cells along each anti-diagonal only depend on the previous two anti-diagonals, so each
+    anti-diagonal is computed for all pairs in the batch at once.  Matrices are stored indexed by
+    anti-diagonal and row so that the cells of an anti-diagonal and their neighbors are contiguous
+    slices.  Each cell only depends on cells above and to the left of it, so padding does not
+    affect the cells of shorter pairs.
+
+    Parameters
+    ----------
+    scores: :class:`numpy.ndarray`
+        Pairwise scores of shape (batch, rows, columns)
+    gap_penalty: float
+        Penalty for each gapped element
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Score matrices of shape (rows + columns + 1, rows + 1, batch), where the score of cell
+        (row, column) is at index (row + column, row)
+    :class:`numpy.ndarray`
+        Traceback matrices with the same shape and indexing as the score matrices
+    """
+    batch_size, num_rows, num_columns = scores.shape
+    shape = (num_rows + num_columns + 1, num_rows + 1, batch_size)
+    score_matrix = numpy.zeros(shape)
+    row_scores = numpy.zeros(shape)
+    column_scores = numpy.zeros(shape)
+    trace_matrix = numpy.zeros(shape, dtype=numpy.int8)
+    skewed_scores = numpy.zeros(shape)
+    rows, columns = numpy.meshgrid(
+        numpy.arange(1, num_rows + 1), numpy.arange(1, num_columns + 1), indexing="ij"
+    )
+    skewed_scores[rows + columns, rows] = scores.transpose(1, 2, 0)
+    row_range = numpy.arange(num_rows + 1)
+    column_range = numpy.arange(num_columns + 1)
+    score_matrix[row_range, row_range] = (gap_penalty * row_range)[:, None]
+    score_matrix[column_range, 0] = (gap_penalty * column_range)[:, None]
+    row_scores[row_range, row_range] = (gap_penalty * (row_range + 1))[:, None]
+    column_scores[column_range[1:], 0] = (gap_penalty * (column_range[1:] + 1))[:, None]
+    for diagonal in range(2, num_rows + num_columns + 1):
+        begin = max(1, diagonal - num_columns)
+        end = min(num_rows, diagonal - 1) + 1
+        no_gap = (
+            score_matrix[diagonal - 2, begin - 1 : end - 1] + skewed_scores[diagonal, begin:end]
+        )
+        row_open = score_matrix[diagonal - 1, begin:end] + gap_penalty
+        row_extend = row_scores[diagonal - 1, begin:end] + gap_penalty
+        column_open = score_matrix[diagonal - 1, begin - 1 : end - 1] + gap_penalty
+        column_extend = column_scores[diagonal - 1, begin - 1 : end - 1] + gap_penalty
+        row_score = numpy.maximum(row_open, row_extend, out=row_scores[diagonal, begin:end])
+        column_score = numpy.maximum(
+            column_open, column_extend, out=column_scores[diagonal, begin:end]
+        )
+        best_score = numpy.maximum(
+            numpy.maximum(no_gap, column_score),
+            row_score,
+            out=score_matrix[diagonal, begin:end],
+        )
+
+        row_open = _rint(row_open)
+        row_extend = _rint(row_extend)
+        column_open = _rint(column_open)
+        column_extend = _rint(column_extend)
+        row_score = numpy.maximum(row_open, row_extend)
+        column_score = numpy.maximum(column_open, column_extend)
+        best_score = _rint(best_score)
+        row_trace = 1 * (row_open == row_score) + 8 * (row_extend == row_score)
+        column_trace = 4 * (column_open == column_score) + 16 * (column_extend == column_score)
+        trace_matrix[diagonal, begin:end] = (
+            2 * (_rint(no_gap) == best_score)
+            + row_trace * (row_score == best_score)
+            + column_trace * (column_score == best_score)
+        )
+    return score_matrix, trace_matrix
+
+
+def _find_gap_open(
+    seq_a: List[Any],
+    seq_b: List[Any],
+    ali_a: List[Any],
+    ali_b: List[Any],
+    row: int,
+    column: int,
+    column_gap: bool,
+    score_matrix: numpy.ndarray,
+    trace_matrix: numpy.ndarray,
+    in_process: List[Tuple[int, int, int, bool, int]],
+    gap_penalty: float,
+    direction: str,
+    gap_char: str,
+) -> Tuple[int, int, bool]:
+    """Walk back along an extended gap, queueing each position where it could have been opened"""
+    dead_end = False
+    target_score = _rint(score_matrix[row + column, row])
+    for n in range(column if direction == "column" else row):
+        if direction == "column":
+            column -= 1
+            ali_a.append(gap_char)
+            ali_b.append(seq_b[column])
+        else:
+            row -= 1
+            ali_a.append(seq_a[row])
+            ali_b.append(gap_char)
+        actual_score = score_matrix[row + column, row] + gap_penalty * (n + 1)
+        trace = int(trace_matrix[row + column, row])
+        if _rint(actual_score) == target_score and n > 0:
+            if not trace:
+                break
+            in_process.append((len(ali_a), row, column, column_gap, trace))
+        if not trace:
+            dead_end = True
+    return row, column, dead_end
+
+
+def _trace_back_alignment(
+    seq_a: List[Any],
+    seq_b: List[Any],
+    score_matrix: numpy.ndarray,
+    trace_matrix: numpy.ndarray,
+    gap_penalty: float,
+    gap_char: str,
+) -> Optional[Alignment]:
+    """
+    Recover the first optimal global alignment from filled matrices
+
+    Follows the same order of preference between equally scoring paths as
+    :func:`Bio.pairwise2.align.globalcs`, so alignments are identical to the ones it returns with
+    ``one_alignment_only=True``.  Paths waiting to be explored always extend a prefix of the
+    current path, so they are stored as the length of that prefix rather than as copies.
+    Returns None if no alignment could be recovered.
+    """
+    row, column = len(seq_a), len(seq_b)
+    ali_a, ali_b = [], []
+    in_process = [(0, row, column, False, int(trace_matrix[row + column, row]))]
+    while in_process:
+        dead_end = False
+        length, row, column, column_gap, trace = in_process.pop()
+        del ali_a[length:]
+        del ali_b[length:]
+        while (row > 0 or column > 0) and not dead_end:
+            cache = (len(ali_a), row, column, column_gap)
+            if not trace:
+                if column and column_gap:
+                    dead_end = True
+                else:
+                    ali_a.extend(seq_a[row - 1 :: -1] if row else [])
+                    ali_b.extend(seq_b[column - 1 :: -1] if column else [])
+                    ali_a.extend([gap_char] * (len(ali_b) - len(ali_a)))
+                    ali_b.extend([gap_char] * (len(ali_a) - len(ali_b)))
+                break
+            elif trace % 2 == 1:
+                trace -= 1
+                if column_gap:
+                    dead_end = True
+                else:
+                    column -= 1
+                    ali_a.append(gap_char)
+                    ali_b.append(seq_b[column])
+            elif trace % 4 == 2:
+                trace -= 2
+                row -= 1
+                column -= 1
+                ali_a.append(seq_a[row])
+                ali_b.append(seq_b[column])
+                column_gap = False
+            elif trace % 8 == 4:
+                trace -= 4
+                row -= 1
+                ali_a.append(seq_a[row])
+                ali_b.append(gap_char)
+                column_gap = True
+            elif trace in (8, 24):
+                trace -= 8
+                if column_gap:
+                    dead_end = True
+                else:
+                    row, column, dead_end = _find_gap_open(
+                        seq_a,
+                        seq_b,
+                        ali_a,
+                        ali_b,
+                        row,
+                        column,
+                        column_gap,
+                        score_matrix,
+                        trace_matrix,
+                        in_process,
+                        gap_penalty,
+                        "column",
+                        gap_char,
+                    )
+            elif trace == 16:
+                trace -= 16
+                column_gap = True
+                row, column, dead_end = _find_gap_open(
+                    seq_a,
+                    seq_b,
+                    ali_a,
+                    ali_b,
+                    row,
+                    column,
+                    column_gap,
+                    score_matrix,
+                    trace_matrix,
+                    in_process,
+                    gap_penalty,
+                    "row",
+                    gap_char,
+                )
+            if trace:
+                in_process.append(cache + (trace,))
+            trace = int(trace_matrix[row + column, row])
+        if not dead_end:
+            return Alignment(
+                ali_a[::-1],
+                ali_b[::-1],
+                float(score_matrix[len(seq_a) + len(seq_b), len(seq_a)]),
+                0,
+                len(ali_a),
+            )
+    return None
+
+
+def batch_global_alignment(
+    pairs: List[Tuple[List[Any], List[Any]]],
+    score_matrices: List[numpy.ndarray],
+    gap_penalty: float,
+    gap_char: str = "-",
+    max_cells: int = 500000,
+) -> List[Optional[Alignment]]:
+    """
+    Globally align many pairs of sequences with linear gap penalties
+
+    Pairs are sorted by size and padded into batches, and the dynamic programming matrices of a
+    batch are filled one anti-diagonal at a time with numpy.  The returned alignments are the same
+    as those of :func:`Bio.pairwise2.align.globalcs` with equal gap open and extend penalties and
+    ``one_alignment_only=True``, which is used as a fallback for the rare pairs where the
+    traceback does not find an alignment.
+
+    Parameters
+    ----------
+    pairs: list[tuple[list, list]]
+        Pairs of sequences to align
+    score_matrices: list[:class:`numpy.ndarray`]
+        Score for aligning each element of the first sequence with each element of the second
+        sequence for every pair
+    gap_penalty: float
+        Score for each gapped element, should be negative
+    gap_char: str
+        Symbol to use for gaps in the alignments
+    max_cells: int
+        Maximum number of matrix cells to fill per batch
+
+    Returns
+    -------
+    list[Optional[tuple]]
+        :class:`~montreal_forced_aligner.helper.Alignment` for each pair, or None if either
+        sequence is empty
+    """
+    alignments = [None] * len(pairs)
+    order = sorted(
+        (k for k, (a, b) in enumerate(pairs) if len(a) and len(b)),
+        key=lambda k: (len(pairs[k][0]), len(pairs[k][1])),
+    )
+    start = 0
+    while start < len(order):
+        end = start + 1
+        num_rows = len(pairs[order[start]][0])
+        num_columns = len(pairs[order[start]][1])
+        while end < len(order):
+            rows = max(num_rows, len(pairs[order[end]][0]))
+            columns = max(num_columns, len(pairs[order[end]][1]))
+            if (end - start + 1) * (rows + 1) * (columns + 1) > max_cells:
+                break
+            num_rows, num_columns = rows, columns
+            end += 1
+        indices = order[start:end]
+        scores = numpy.zeros((len(indices), num_rows, num_columns))
+        for i, k in enumerate(indices):
+            scores[i, : len(pairs[k][0]), : len(pairs[k][1])] = score_matrices[k]
+        score_matrix, trace_matrix = _fill_alignment_matrices(scores, gap_penalty)
+        for i, k in enumerate(indices):
+            seq_a, seq_b = pairs[k]
+            alignment = _trace_back_alignment(
+                seq_a, seq_b, score_matrix[:, :, i], trace_matrix[:, :, i], gap_penalty, gap_char
+            )
+            if alignment is None:
+                from Bio import pairwise2
+
+                matrix = score_matrices[k]
+                alignment = pairwise2.align.globalcs(
+                    list(range(len(seq_a))),
+                    list(range(len(seq_a), len(seq_a) + len(seq_b))),
+                    lambda x, y: matrix[x, y - len(seq_a)],
+                    gap_penalty,
+                    gap_penalty,
+                    gap_char=[gap_char],
+                    one_alignment_only=True,
+                )[0]
+                alignment = Alignment(
+                    [gap_char if x == gap_char else seq_a[x] for x in alignment.seqA],
+                    [gap_char if x == gap_char else seq_b[x - len(seq_a)] for x in alignment.seqB],
+                    alignment.score,
+                    alignment.start,
+                    alignment.end,
+                )
+            alignments[k] = alignment
+        start = end
+    return alignments
+
+
+def global_alignment(
+    seq_a: List[Any],
+    seq_b: List[Any],
+    score_function: typing.Callable[[Any, Any], float],
+    gap_penalty: float,
+    gap_char: str = "-",
+) -> List[Alignment]:
+    """
+    Globally align two sequences with a scoring function over their elements
+
+    See Also
+    --------
+    :func:`~montreal_forced_aligner.helper.batch_global_alignment`
+        For aligning many pairs at once
+
+    Parameters
+    ----------
+    seq_a: list
+        First sequence
+    seq_b: list
+        Second sequence
+    score_function: callable
+        Function returning the score for aligning an element of the first sequence with an
+        element of the second
+    gap_penalty: float
+        Score for each gapped element, should be negative
+    gap_char: str
+        Symbol to use for gaps in the alignment
+
+    Returns
+    -------
+    list[tuple]
+        List containing the best :class:`~montreal_forced_aligner.helper.Alignment`, or an empty
+        list if either sequence is empty
+    """
+    scores = numpy.array([[score_function(a, b) for b in seq_b] for a in seq_a], dtype=float)
+    alignment = batch_global_alignment([(seq_a, seq_b)], [scores], gap_penalty, gap_char)[0]
+    return [alignment] if alignment is not None else []
+
+
 def align_pronunciations(
     ref_text: typing.List[str],
     pronunciations: typing.List[str],
@@ -594,14 +1063,8 @@ def align_pronunciations(
             return 0
         return -2
 
-    alignments = pairwise2.align.globalcs(
-        ref_text,
-        pronunciations,
-        score_function,
-        -1 if word_pronunciations else -5,
-        -1 if word_pronunciations else -5,
-        gap_char=["-"],
-        one_alignment_only=True,
+    alignments = global_alignment(
+        ref_text, pronunciations, score_function, -1 if word_pronunciations else -5
     )
     transformed_pronunciations = []
     for a in alignments:
@@ -680,6 +1143,11 @@ def align_phones(
     Align phones based on how much they overlap and their phone label, with the ability to specify a custom mapping for
     different phone labels to be scored as if they're the same phone
 
+    See Also
+    --------
+    :func:`~montreal_forced_aligner.helper.batch_align_phones`
+        For aligning the phones of many utterances at once
+
     Parameters
     ----------
     ref: list[:class:`~montreal_forced_aligner.data.CtmInterval`]
@@ -704,69 +1172,136 @@ def align_phones(
     dict[tuple[str, str], int]
         Dictionary of error pairs with their counts
     """
+    return batch_align_phones(
+        [(ref, test)],
+        silence_phone,
+        ignored_phones=ignored_phones,
+        custom_mapping=custom_mapping,
+        debug=debug,
+    )[0]
+
+
+def _phone_score_matrices(
+    pairs: List[Tuple[List[CtmInterval], List[CtmInterval]]],
+    silence_phone: str,
+    custom_mapping: Optional[Dict[str, str]] = None,
+) -> List[numpy.ndarray]:
+    """Compute :func:`~montreal_forced_aligner.helper.overlap_scoring` between all phones of each pair"""
+    ref_labels = {}
+    test_labels = {}
+    for ref, test in pairs:
+        for x in ref:
+            ref_labels.setdefault(x.label, len(ref_labels))
+        for x in test:
+            test_labels.setdefault(x.label, len(test_labels))
+    label_scores = numpy.array(
+        [
+            [compare_labels(r, t, silence_phone, mapping=custom_mapping) for t in test_labels]
+            for r in ref_labels
+        ],
+        dtype=float,
+    ).reshape(len(ref_labels), len(test_labels))
+    score_matrices = []
+    for ref, test in pairs:
+        ref_times = numpy.array([(x.begin, x.end) for x in ref], dtype=float).reshape(-1, 2)
+        test_times = numpy.array([(x.begin, x.end) for x in test], dtype=float).reshape(-1, 2)
+        label_diff = label_scores[
+            numpy.array([ref_labels[x.label] for x in ref], dtype=int)[:, None],
+            numpy.array([test_labels[x.label] for x in test], dtype=int)[None, :],
+        ]
+        begin_diff = numpy.abs(ref_times[:, None, 0] - test_times[None, :, 0])
+        end_diff = numpy.abs(ref_times[:, None, 1] - test_times[None, :, 1])
+        score_matrices.append(-((begin_diff + end_diff) + label_diff))
+    return score_matrices
+
+
+def batch_align_phones(
+    pairs: List[Tuple[List[CtmInterval], List[CtmInterval]]],
+    silence_phone: str,
+    ignored_phones: typing.Set[str] = None,
+    custom_mapping: Optional[Dict[str, str]] = None,
+    debug: bool = False,
+) -> List[Tuple[float, float, Dict[Tuple[str, str], int]]]:
+    """
+    Align phones of many utterances at once, see :func:`~montreal_forced_aligner.helper.align_phones`
 
+    Parameters
+    ----------
+    pairs: list[tuple[list[:class:`~montreal_forced_aligner.data.CtmInterval`], list[:class:`~montreal_forced_aligner.data.CtmInterval`]]]
+        Reference CTM intervals and CTM intervals to compare to them for each utterance
+    silence_phone: str
+        Silence phone (these are ignored in the final calculation)
+    ignored_phones: set[str], optional
+        Phones that should be ignored in score calculations (silence phone is automatically added)
+    custom_mapping: dict[str, str], optional
+        Mapping of phones to treat as matches even if they have different symbols
+    debug: bool, optional
+        Flag for logging extra information about alignments
+
+    Returns
+    -------
+    list[tuple[float, float, dict[tuple[str, str], int]]]
+        Overlap score, phone error rate and error pair counts for each utterance
+    """
     if ignored_phones is None:
         ignored_phones = set()
     if not isinstance(ignored_phones, set):
         ignored_phones = set(ignored_phones)
-    if custom_mapping is None:
-        score_func = functools.partial(overlap_scoring, silence_phone=silence_phone)
-    else:
-        score_func = functools.partial(
-            overlap_scoring, silence_phone=silence_phone, mapping=custom_mapping
-        )
-
-    alignments = pairwise2.align.globalcs(
-        ref, test, score_func, -2, -2, gap_char=["-"], one_alignment_only=True
+    ignored_phones.add(silence_phone)
+    pairs = list(pairs)
+    alignments = batch_global_alignment(
+        pairs, _phone_score_matrices(pairs, silence_phone, custom_mapping), -2
     )
     if custom_mapping is not None:
-        ref, test = fix_many_to_one_alignments(alignments, custom_mapping)
-        alignments = pairwise2.align.globalcs(
-            ref, test, score_func, -2, -2, gap_char=["-"], one_alignment_only=True
+        for i, alignment in enumerate(alignments):
+            if alignment is not None:
+                pairs[i] = fix_many_to_one_alignments([alignment], custom_mapping)
+        alignments = batch_global_alignment(
+            pairs, _phone_score_matrices(pairs, silence_phone, custom_mapping), -2
         )
-    overlap_count = 0
-    overlap_sum = 0
-    num_insertions = 0
-    num_deletions = 0
-    num_substitutions = 0
-    errors = collections.Counter()
-    ignored_phones.add(silence_phone)
-    for a in alignments:
-        for i, sa in enumerate(a.seqA):
-            sb = a.seqB[i]
-            if sa == "-":
-                if sb.label not in ignored_phones:
-                    errors[(sa, sb.label)] += 1
-                    num_insertions += 1
-                else:
-                    continue
-            elif sb == "-":
-                if sa.label not in ignored_phones:
-                    errors[(sa.label, sb)] += 1
-                    num_deletions += 1
+    results = []
+    for (ref, test), alignment in zip(pairs, alignments):
+        overlap_count = 0
+        overlap_sum = 0
+        num_insertions = 0
+        num_deletions = 0
+        num_substitutions = 0
+        errors = collections.Counter()
+        if alignment is not None:
+            for sa, sb in zip(alignment.seqA, alignment.seqB):
+                if sa == "-":
+                    if sb.label not in ignored_phones:
+                        errors[(sa, sb.label)] += 1
+                        num_insertions += 1
+                elif sb == "-":
+                    if sa.label not in ignored_phones:
+                        errors[(sa.label, sb)] += 1
+                        num_deletions += 1
                 else:
-                    continue
-            else:
-                if sa.label in ignored_phones:
-                    continue
-                overlap_sum += (abs(sa.begin - sb.begin) + abs(sa.end - sb.end)) / 2
-                overlap_count += 1
-                if compare_labels(sa.label, sb.label, silence_phone, mapping=custom_mapping) > 0:
-                    num_substitutions += 1
-                    errors[(sa.label, sb.label)] += 1
-    if overlap_count:
-        score = overlap_sum / overlap_count
-    else:
-        score = None
-    phone_error_rate = (num_insertions + num_deletions + (2 * num_substitutions)) / len(ref)
-    if debug:
-        import logging
+                    if sa.label in ignored_phones:
+                        continue
+                    overlap_sum += (abs(sa.begin - sb.begin) + abs(sa.end - sb.end)) / 2
+                    overlap_count += 1
+                    if (
+                        compare_labels(sa.label, sb.label, silence_phone, mapping=custom_mapping)
+                        > 0
+                    ):
+                        num_substitutions += 1
+                        errors[(sa.label, sb.label)] += 1
+        if overlap_count:
+            score = overlap_sum / overlap_count
+        else:
+            score = None
+        phone_error_rate = (num_insertions + num_deletions + (2 * num_substitutions)) / len(ref)
+        if debug and alignment is not None:
+            from Bio import pairwise2
 
-        logger = logging.getLogger("mfa")
-        logger.debug(
-            f"{pairwise2.format_alignment(*alignments[0])}\nScore: {score}\nPER: {phone_error_rate}\nErrors: {errors}"
-        )
-    return score, phone_error_rate, errors
+            logger = logging.getLogger("mfa")
+            logger.debug(
+                f"{pairwise2.format_alignment(*alignment)}\nScore: {score}\nPER: {phone_error_rate}\nErrors: {errors}"
+            )
+        results.append((score, phone_error_rate, errors))
+    return results
 
 
 def fix_unk_words(
@@ -796,7 +1331,6 @@ def fix_unk_words(
     float
         Aligned duration of found words
     """
-
     from kalpy.gmm.data import WordCtmInterval
 
     def score_func(ref, test):
@@ -817,9 +1351,7 @@ def fix_unk_words(
             return 0
         return -2
 
-    alignments = pairwise2.align.globalcs(
-        ref, test, score_func, -2, -2, gap_char=["-"], one_alignment_only=True
-    )
+    alignments = global_alignment(ref, test, score_func, -2)
     output_ctm = []
     for a in alignments:
         for i, sa in enumerate(a.seqA):
@@ -868,7 +1400,6 @@ def align_words(
     float
         Aligned duration of found words
     """
-
     from montreal_forced_aligner.data import CtmInterval
 
     if ignored_words is None:
@@ -889,9 +1420,7 @@ def align_words(
             return -10
         return -2
 
-    alignments = pairwise2.align.globalcs(
-        ref, test, score_func, -2, -2, gap_char=["-"], one_alignment_only=True
-    )
+    alignments = global_alignment(ref, test, score_func, -2)
     num_insertions = 0
     num_deletions = 0
     num_substitutions = 0
@@ -922,7 +1451,7 @@ def align_words(
                     aligned_duration += sb.end - sb.begin
     word_error_rate = (num_insertions + num_deletions + (2 * num_substitutions)) / len(ref)
     if debug:
-        import logging
+        from Bio import pairwise2
 
         logger = logging.getLogger("mfa")
         logger.debug(
@@ -942,3 +1471,16 @@ def format_correction(correction_value: float, positive_only=True) -> float:
     if correction_value <= 0 and positive_only:
         correction_value = 0.01
     return correction_value
+
+
+def format_probabilities(probability_values: numpy.ndarray) -> numpy.ndarray:
+    """Format an array of probabilities to have two decimal places and be between 0.01 and 0.99"""
+    return numpy.clip(numpy.round(probability_values, 2), 0.01, 0.99)
+
+
+def format_corrections(correction_values: numpy.ndarray, positive_only=True) -> numpy.ndarray:
+    """Format an array of probability correction values to have two decimal places and be greater than 0.01"""
+    correction_values = numpy.round(correction_values, 2)
+    if positive_only:
+        correction_values = numpy.where(correction_values <= 0, 0.01, correction_values)
+    return correction_values
@@ -82,6 +82,8 @@ class GmmGselectFunction(KaldiFunction):
         Arguments for the function
     """
 
+    releases_gil = True
+
     def __init__(self, args: GmmGselectArguments):
         super().__init__(args)
         self.working_directory = args.working_directory
@@ -301,6 +303,8 @@ class AccIvectorStatsFunction(KaldiFunction):
         Arguments for the function
     """
 
+    releases_gil = True
+
     def __init__(self, args: AccIvectorStatsArguments):
         super().__init__(args)
         self.working_directory = args.working_directory
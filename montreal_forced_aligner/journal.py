@@ -0,0 +1,356 @@
+"""
+Job journal
+===========
+
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import typing
+from pathlib import Path
+
+__all__ = ["file_checksum", "input_fingerprint", "JobJournal", "JournalStep"]
+
+logger = logging.getLogger("mfa")
+
+_checksum_cache: typing.Dict[typing.Tuple[str, int, int], str] = {}
+
+
+def file_checksum(path: typing.Union[Path, str]) -> str:
+    """
+    Compute a checksum of a file's contents
+
+    Parameters
+    ----------
+    path: :class:`~pathlib.Path`
+        Path to file
+
+    Returns
+    -------
+    str
+        BLAKE2 hex digest of the file
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def input_fingerprint(inputs: typing.Dict[str, typing.Any]) -> str:
+    """
+    Compute a fingerprint of the inputs of a step, covering the contents of input files and the
+    values of configuration options
+
+    Checksums of files are reused while their size and modification time are unchanged.
+
+    Parameters
+    ----------
+    inputs: dict[str, Any]
+        Input files, lists of input files and JSON serializable configuration values
+
+    Returns
+    -------
+    str
+        BLAKE2 hex digest of the inputs
+    """
+
+    def fingerprint_value(value):
+        if isinstance(value, (list, tuple)):
+            return [fingerprint_value(x) for x in value]
+        if not isinstance(value, Path):
+            return value
+        if not value.exists():
+            return None
+        stat = value.stat()
+        key = (str(value), stat.st_size, stat.st_mtime_ns)
+        if key not in _checksum_cache:
+            _checksum_cache[key] = file_checksum(value)
+        return _checksum_cache[key]
+
+    data = {k: fingerprint_value(v) for k, v in inputs.items()}
+    return hashlib.blake2b(
+        json.dumps(data, sort_keys=True, default=str).encode("utf8"), digest_size=16
+    ).hexdigest()
+
+
+class JobJournal:
+    """
+    Durable record of the workflow steps and multiprocessing jobs that finished in a working
+    directory, along with the size and checksum of every file they wrote
+
+    Entries are appended as JSON lines and synced to disk as soon as a step or job finishes, so
+    a run that was killed partway through, like from running out of memory or preemption, can
+    skip completed work when it is restarted.  A step or job counts as complete only if all of
+    its files still exist and match their checksums, the fingerprint of its inputs is unchanged,
+    and only the first time it is reached in the current process, so steps that are legitimately
+    run again in the same run are never skipped.
+
+    Parameters
+    ----------
+    path: :class:`~pathlib.Path`
+        Path to the journal file
+    """
+
+    file_name = "journal.jsonl"
+
+    def __init__(self, path: typing.Union[Path, str]):
+        self.path = Path(path)
+        self.entries: typing.Dict[typing.Tuple[str, typing.Optional[str]], typing.Dict] = {}
+        self._reached: typing.Set[str] = set()
+        self._lock = threading.Lock()
+        self.load()
+
+    @classmethod
+    def delete(cls, directory: typing.Union[Path, str]) -> None:
+        """
+        Delete the journal of a working directory, so that no steps of a previous run are skipped
+
+        Parameters
+        ----------
+        directory: :class:`~pathlib.Path`
+            Working directory
+        """
+        Path(directory).joinpath(cls.file_name).unlink(missing_ok=True)
+
+    @staticmethod
+    def _key(step: str, job_name=None) -> typing.Tuple[str, typing.Optional[str]]:
+        return step, None if job_name is None else str(job_name)
+
+    def load(self) -> None:
+        """Load entries from the journal file, ignoring a final line cut off by a crash"""
+        self.entries = {}
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.entries[self._key(entry["step"], entry["job"])] = entry
+
+    def record(
+        self,
+        step: str,
+        job_name=None,
+        outputs: typing.Iterable[typing.Union[Path, str]] = (),
+        fingerprint: typing.Optional[str] = None,
+    ) -> None:
+        """
+        Record a step or a job of a step as complete
+
+        Parameters
+        ----------
+        step: str
+            Name of the step
+        job_name: int, optional
+            Job of the step, None to record the whole step
+        outputs: list[:class:`~pathlib.Path`]
+            Files written by the step or job
+        fingerprint: str, optional
+            Fingerprint of the step's inputs
+        """
+        key = self._key(step, job_name)
+        entry = {
+            "step": key[0],
+            "job": key[1],
+            "time": time.time(),
+            "fingerprint": fingerprint,
+            "outputs": {
+                str(p): {"size": os.path.getsize(p), "checksum": file_checksum(p)} for p in outputs
+            },
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.entries[key] = entry
+
+    def reach(self, step: str) -> bool:
+        """
+        Mark a step as reached in the current process
+
+        Parameters
+        ----------
+        step: str
+            Name of the step
+
+        Returns
+        -------
+        bool
+            True if the step was reached for the first time, so that its entries from a
+            previous run may be used
+        """
+        with self._lock:
+            if step in self._reached:
+                return False
+            self._reached.add(step)
+            return True
+
+    def is_complete(
+        self, step: str, job_name=None, fingerprint: typing.Optional[str] = None
+    ) -> bool:
+        """
+        Check whether a step or job finished with the same inputs and its files are intact
+
+        Parameters
+        ----------
+        step: str
+            Name of the step
+        job_name: int, optional
+            Job of the step, None to check the whole step
+        fingerprint: str, optional
+            Fingerprint of the step's current inputs
+
+        Returns
+        -------
+        bool
+            True if the entry exists, was recorded with the same fingerprint and every file
+            matches its recorded size and checksum
+        """
+        entry = self.entries.get(self._key(step, job_name), None)
+        if entry is None or entry.get("fingerprint", None) != fingerprint:
+            return False
+        for path, info in entry["outputs"].items():
+            if not os.path.exists(path) or os.path.getsize(path) != info["size"]:
+                return False
+            if file_checksum(path) != info["checksum"]:
+                return False
+        return True
+
+    def outputs(self, step: str, job_name=None) -> typing.List[Path]:
+        """
+        Get the files recorded for a step or job
+
+        Parameters
+        ----------
+        step: str
+            Name of the step
+        job_name: int, optional
+            Job of the step, None for the whole step
+
+        Returns
+        -------
+        list[:class:`~pathlib.Path`]
+            Recorded files, empty if there is no entry
+        """
+        entry = self.entries.get(self._key(step, job_name), None)
+        if entry is None:
+            return []
+        return [Path(x) for x in entry["outputs"].keys()]
+
+    def step(
+        self, name: str, inputs: typing.Optional[typing.Dict[str, typing.Any]] = None
+    ) -> JournalStep:
+        """
+        Get a view of the journal for a single step
+
+        Parameters
+        ----------
+        name: str
+            Name of the step
+        inputs: dict[str, Any], optional
+            Input files and configuration values of the step, see
+            :func:`~montreal_forced_aligner.journal.input_fingerprint`
+
+        Returns
+        -------
+        :class:`~montreal_forced_aligner.journal.JournalStep`
+            Journal step
+        """
+        return JournalStep(self, name, input_fingerprint(inputs) if inputs else None)
+
+
+class JournalStep:
+    """
+    Entries of a :class:`~montreal_forced_aligner.journal.JobJournal` for a single step
+
+    Creating the step marks it as reached, so completed entries from a previous run can only be
+    used by the first instance for a step name in the current process.  Entries are only used
+    if they were recorded with the same input fingerprint.  Jobs found to be complete are
+    collected in :attr:`~JournalStep.skipped_jobs`, so that callers can pick up their recorded
+    files instead of results.
+
+    Parameters
+    ----------
+    journal: :class:`~montreal_forced_aligner.journal.JobJournal`
+        Journal to record to
+    name: str
+        Name of the step
+    fingerprint: str, optional
+        Fingerprint of the step's inputs
+    """
+
+    def __init__(self, journal: JobJournal, name: str, fingerprint: typing.Optional[str] = None):
+        self.journal = journal
+        self.name = name
+        self.fingerprint = fingerprint
+        self.resumable = journal.reach(name)
+        self.skipped_jobs = []
+
+    def is_complete(self, job_name=None) -> bool:
+        """
+        Check whether the step or one of its jobs finished in a previous run
+
+        Parameters
+        ----------
+        job_name: int, optional
+            Job to check, None to check the whole step
+
+        Returns
+        -------
+        bool
+            True if the step or job can be skipped
+        """
+        if not self.resumable:
+            return False
+        complete = self.journal.is_complete(self.name, job_name, self.fingerprint)
+        if complete:
+            if job_name is None:
+                logger.debug(f"Skipping {self.name}, completed in a previous run")
+            else:
+                self.skipped_jobs.append(job_name)
+                logger.debug(
+                    f"Skipping job {job_name} of {self.name}, completed in a previous run"
+                )
+        return complete
+
+    def outputs(self, job_name=None) -> typing.List[Path]:
+        """
+        Get the files recorded for the step or one of its jobs
+
+        Parameters
+        ----------
+        job_name: int, optional
+            Job of the step, None for the whole step
+
+        Returns
+        -------
+        list[:class:`~pathlib.Path`]
+            Recorded files
+        """
+        return self.journal.outputs(self.name, job_name)
+
+    def complete(
+        self, job_name=None, outputs: typing.Iterable[typing.Union[Path, str]] = ()
+    ) -> None:
+        """
+        Record the step or one of its jobs as complete
+
+        Parameters
+        ----------
+        job_name: int, optional
+            Job of the step, None to record the whole step
+        outputs: list[:class:`~pathlib.Path`]
+            Files written by the step or job
+        """
+        self.journal.record(self.name, job_name, outputs, self.fingerprint)
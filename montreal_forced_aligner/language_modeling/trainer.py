@@ -17,7 +17,7 @@ from montreal_forced_aligner import config
 from montreal_forced_aligner.abc import DatabaseMixin, MfaWorker, TopLevelMfaWorker, TrainerMixin
 from montreal_forced_aligner.corpus.text_corpus import TextCorpusMixin
 from montreal_forced_aligner.data import WordType, WorkflowType
-from montreal_forced_aligner.db import Dictionary, Utterance, Word
+from montreal_forced_aligner.db import Dictionary, Utterance, Word, bulk_update
 from montreal_forced_aligner.dictionary.mixins import DictionaryMixin
 from montreal_forced_aligner.dictionary.multispeaker import MultispeakerDictionaryMixin
 from montreal_forced_aligner.helper import mfa_open
@@ -38,11 +38,54 @@ __all__ = [
     "LmDictionaryCorpusTrainerMixin",
     "MfaLmCorpusTrainer",
     "MfaLmDictionaryCorpusTrainer",
+    "parse_perplexity_output",
 ]
 
 logger = logging.getLogger("mfa")
 
 
+def parse_perplexity_output(
+    lines: typing.Iterable[str],
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Parse the summaries printed by :ngram_src:`ngramperplexity`
+
+    Parameters
+    ----------
+    lines: Iterable[str]
+        Lines of ngramperplexity output
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Number of sentences, words and OOVs, log probability and perplexity of each summary,
+        with per-utterance summaries in verbose mode followed by the corpus summary
+    """
+    summaries = []
+    current = None
+    for line in lines:
+        m = re.search(
+            r"(?P<sentences>\d+) sentences, (?P<words>\d+) words, (?P<oovs>\d+) OOVs", line
+        )
+        if m:
+            current = {
+                "num_sentences": int(m.group("sentences")),
+                "num_words": int(m.group("words")),
+                "num_oovs": int(m.group("oovs")),
+            }
+            continue
+        m = re.search(
+            r"logprob\(base 10\)= *(?P<log_prob>[-\d.e+inf]+); *perplexity = (?P<perplexity>[\d.e+inf]+)",
+            line,
+        )
+        if m and current is not None:
+            current["log_prob"] = float(m.group("log_prob"))
+            current["perplexity"] = float(m.group("perplexity"))
+            summaries.append(current)
+            current = None
+    return summaries
+
+
 class LmTrainerMixin(DictionaryMixin, TrainerMixin, MfaWorker):
     """
     Abstract mixin class for training language models
@@ -221,6 +264,8 @@ class LmCorpusTrainerMixin(LmTrainerMixin, TextCorpusMixin):
         Smoothing method for the ngram model, defaults to "kneser_ney"
     count_threshold:int
         Minimum count needed to not be treated as an OOV item, defaults to 1
+    per_utterance_perplexity: bool
+        Flag for saving the perplexity of each utterance under the large model to the database
 
     See Also
     --------
@@ -232,8 +277,9 @@ class LmCorpusTrainerMixin(LmTrainerMixin, TextCorpusMixin):
         For top-level parameters
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, per_utterance_perplexity: bool = False, **kwargs):
         super().__init__(**kwargs)
+        self.per_utterance_perplexity = per_utterance_perplexity
         self.large_perplexity = None
         self.medium_perplexity = None
         self.small_perplexity = None
@@ -298,120 +344,170 @@ class LmCorpusTrainerMixin(LmTrainerMixin, TextCorpusMixin):
             meta["version"] = self.model_version
         return meta
 
-    def evaluate(self) -> None:
+    def compile_evaluation_far(self, log_file: typing.TextIO) -> typing.List[int]:
         """
-        Run an evaluation over the training data to generate perplexity score
-        """
-        log_path = self.working_log_directory.joinpath("evaluate.log")
+        Compile the normalized text of all utterances into a FAR file for perplexity evaluation,
+        with words that are not speech words replaced by the OOV word
 
-        small_mod_path = self.mod_path.with_stem(self.mod_path.stem + "_small")
-        med_mod_path = self.mod_path.with_stem(self.mod_path.stem + "_med")
-        with self.session() as session, mfa_open(log_path, "w") as log_file:
+        Parameters
+        ----------
+        log_file: TextIO
+            Log file for farcompilestrings
+
+        Returns
+        -------
+        list[int]
+            Utterance ids in the order of the FAR
+        """
+        utterance_ids = []
+        with self.session() as session, open(self.far_path, "wb") as f:
             word_query = session.query(Word.word).filter(
                 Word.word_type.in_(WordType.speech_types())
             )
             included_words = set(x[0] for x in word_query)
-            utterance_query = session.query(Utterance.normalized_text, Utterance.text)
+            utterance_query = session.query(
+                Utterance.id, Utterance.normalized_text, Utterance.text
+            ).order_by(Utterance.id)
+
+            farcompile_proc = subprocess.Popen(
+                [
+                    thirdparty_binary("farcompilestrings"),
+                    "--fst_type=compact",
+                    "--token_type=symbol",
+                    "--generate_keys=16",
+                    f"--symbols={self.sym_path}",
+                    "--keep_symbols",
+                ],
+                stderr=log_file,
+                stdin=subprocess.PIPE,
+                stdout=f,
+                env=os.environ,
+            )
+            batch = []
+            for utterance_id, normalized_text, text in utterance_query.yield_per(10000):
+                if not normalized_text:
+                    normalized_text = text
+                batch.append(
+                    " ".join(
+                        x if x in included_words else self.oov_word
+                        for x in normalized_text.split()
+                    )
+                )
+                utterance_ids.append(utterance_id)
+                if len(batch) >= 10000:
+                    farcompile_proc.stdin.write(("\n".join(batch) + "\n").encode("utf8"))
+                    batch = []
+            if batch:
+                farcompile_proc.stdin.write(("\n".join(batch) + "\n").encode("utf8"))
+            farcompile_proc.stdin.close()
+            farcompile_proc.wait()
+        return utterance_ids
+
+    def evaluate(
+        self, model_paths: typing.Optional[typing.Dict[str, Path]] = None
+    ) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """
+        Run an evaluation over the training data to generate perplexity scores
+
+        The evaluation FAR is compiled once and every model is scored by its own
+        :ngram_src:`ngramperplexity` process, all running at the same time.
 
-            with open(self.far_path, "wb") as f:
-                farcompile_proc = subprocess.Popen(
+        Parameters
+        ----------
+        model_paths: dict[str, :class:`~pathlib.Path`], optional
+            Names and paths of models to evaluate, defaults to the large, medium and small models
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Number of sentences, words and OOVs, log probability and perplexity per model
+        """
+        log_path = self.working_log_directory.joinpath("evaluate.log")
+        if model_paths is None:
+            model_paths = {
+                "large": self.mod_path,
+                "medium": self.mod_path.with_stem(self.mod_path.stem + "_med"),
+                "small": self.mod_path.with_stem(self.mod_path.stem + "_small"),
+            }
+        results = {}
+        with mfa_open(log_path, "w") as log_file:
+            utterance_ids = self.compile_evaluation_far(log_file)
+            procs = {}
+            for name, model_path in model_paths.items():
+                verbose = self.per_utterance_perplexity and name == "large"
+                output_path = self.working_directory.joinpath(f"perplexity_{name}.txt")
+                output_file = mfa_open(output_path, "w")
+                proc = subprocess.Popen(
                     [
-                        thirdparty_binary("farcompilestrings"),
-                        "--fst_type=compact",
-                        "--token_type=symbol",
-                        "--generate_keys=16",
-                        f"--symbols={self.sym_path}",
-                        "--keep_symbols",
+                        thirdparty_binary("ngramperplexity"),
+                        f"--OOV_symbol={self.oov_word}",
+                        f"--v={1 if verbose else 0}",
+                        model_path,
+                        self.far_path,
                     ],
+                    stdout=output_file,
                     stderr=log_file,
-                    stdin=subprocess.PIPE,
-                    stdout=f,
+                    encoding="utf8",
                     env=os.environ,
                 )
-                for normalized_text, text in utterance_query:
-                    if not normalized_text:
-                        normalized_text = text
-                    text = " ".join(
-                        x if x in included_words else self.oov_word
-                        for x in normalized_text.split()
-                    )
-                    farcompile_proc.stdin.write(f"{text}\n".encode("utf8"))
-                    farcompile_proc.stdin.flush()
-                farcompile_proc.stdin.close()
-                farcompile_proc.wait()
-            perplexity_proc = subprocess.Popen(
-                [
-                    thirdparty_binary("ngramperplexity"),
-                    f"--OOV_symbol={self.oov_word}",
-                    self.mod_path,
-                    self.far_path,
-                ],
-                stdout=subprocess.PIPE,
-                stderr=log_file,
-                encoding="utf8",
+                procs[name] = (proc, output_file, output_path)
+            for name, (proc, output_file, output_path) in procs.items():
+                proc.wait()
+                output_file.close()
+                with mfa_open(output_path, "r") as f:
+                    summaries = parse_perplexity_output(f)
+                if not summaries:
+                    results[name] = {
+                        "num_sentences": None,
+                        "num_words": None,
+                        "num_oovs": None,
+                        "log_prob": None,
+                        "perplexity": None,
+                    }
+                    continue
+                results[name] = summaries[-1]
+                if self.per_utterance_perplexity and name == "large":
+                    self.save_utterance_perplexities(utterance_ids, summaries[:-1])
+        for name, result in results.items():
+            logger.info(
+                f"{result['num_sentences']} sentences, {result['num_words']} words, "
+                f"{result['num_oovs']} OOVs"
             )
-            stdout, stderr = perplexity_proc.communicate()
-            num_sentences = None
-            num_words = None
-            num_oovs = None
-            perplexity = None
-            for line in stdout.splitlines():
-                m = re.search(r"\d+ sentences", line)
-                if m:
-                    num_sentences = m.group(0)
-                m = re.search(r"\d+ words", line)
-                if m:
-                    num_words = m.group(0)
-                m = re.search(r"\d+ OOVs", line)
-                if m:
-                    num_oovs = m.group(0)
-                m = re.search(r"perplexity = (?P<perplexity>[\d.]+)", line)
-                if m:
-                    perplexity = float(m.group("perplexity"))
-            self.large_perplexity = perplexity
-            logger.info(f"{num_sentences}, {num_words}, {num_oovs}")
-            logger.info(f"Perplexity of large model: {perplexity}")
-
-            perplexity_proc = subprocess.Popen(
-                [
-                    thirdparty_binary("ngramperplexity"),
-                    f"--OOV_symbol={self.oov_word}",
-                    med_mod_path,
-                    self.far_path,
-                ],
-                stdout=subprocess.PIPE,
-                stderr=log_file,
-                encoding="utf8",
+            logger.info(f"Perplexity of {name} model: {result['perplexity']}")
+        self.large_perplexity = results.get("large", {}).get("perplexity", None)
+        self.medium_perplexity = results.get("medium", {}).get("perplexity", None)
+        self.small_perplexity = results.get("small", {}).get("perplexity", None)
+        return results
+
+    def save_utterance_perplexities(
+        self, utterance_ids: typing.List[int], summaries: typing.List[typing.Dict[str, typing.Any]]
+    ) -> None:
+        """
+        Save per-utterance perplexities of the large model to the database
+
+        Parameters
+        ----------
+        utterance_ids: list[int]
+            Utterance ids in the order of the evaluation FAR
+        summaries: list[dict[str, Any]]
+            Per-utterance results from :func:`~montreal_forced_aligner.language_modeling.trainer.parse_perplexity_output`
+        """
+        if len(summaries) != len(utterance_ids):
+            logger.warning(
+                f"Found perplexities for {len(summaries)} utterances but expected "
+                f"{len(utterance_ids)}, skipping saving per-utterance perplexities."
             )
-            stdout, stderr = perplexity_proc.communicate()
-
-            perplexity = None
-            for line in stdout.splitlines():
-                m = re.search(r"perplexity = (?P<perplexity>[\d.]+)", line)
-                if m:
-                    perplexity = float(m.group("perplexity"))
-            self.medium_perplexity = perplexity
-            logger.info(f"Perplexity of medium model: {perplexity}")
-            perplexity_proc = subprocess.Popen(
+            return
+        with self.session() as session:
+            bulk_update(
+                session,
+                Utterance,
                 [
-                    thirdparty_binary("ngramperplexity"),
-                    f"--OOV_symbol={self.oov_word}",
-                    small_mod_path,
-                    self.far_path,
+                    {"id": u, "lm_perplexity": s["perplexity"]}
+                    for u, s in zip(utterance_ids, summaries)
                 ],
-                stdout=subprocess.PIPE,
-                stderr=log_file,
-                encoding="utf8",
             )
-            stdout, stderr = perplexity_proc.communicate()
-
-            perplexity = None
-            for line in stdout.splitlines():
-                m = re.search(r"perplexity = (?P<perplexity>[\d.]+)", line)
-                if m:
-                    perplexity = float(m.group("perplexity"))
-            self.small_perplexity = perplexity
-            logger.info(f"Perplexity of small model: {perplexity}")
+            session.commit()
 
     def train_large_lm(self) -> None:
         """Train a large language model"""
@@ -0,0 +1,318 @@
+"""
+Pipeline profiling
+==================
+
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+import typing
+from contextlib import contextmanager
+from pathlib import Path
+
+from montreal_forced_aligner import config
+
+__all__ = ["StageRecord", "PipelineProfiler", "PROFILER", "profile_stage"]
+
+
+def _cpu_time() -> float:
+    """CPU time of the current process and its finished child processes"""
+    times = os.times()
+    return time.process_time() + times.children_user + times.children_system
+
+
+class StageRecord:
+    """
+    Timing and resource usage for a single run of a pipeline stage
+
+    Parameters
+    ----------
+    name: str
+        Name of the stage
+    category: str
+        Category of the stage, like "kaldi_function", "stage" or "training_iteration"
+    parent: str, optional
+        Name of the stage that was running when this stage started
+    """
+
+    def __init__(self, name: str, category: str, parent: typing.Optional[str] = None):
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.start_time = time.time()
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.peak_rss = None
+        self.peak_child_rss = None
+        self.num_items = 0
+        self.jobs: typing.Dict[str, typing.Dict[str, float]] = {}
+        self._begin = time.perf_counter()
+        self._cpu_begin = _cpu_time()
+
+    def finish(self) -> None:
+        """Record elapsed wall and CPU time and the current peak memory usage"""
+        from montreal_forced_aligner.utils import get_peak_memory_usage
+
+        self.wall_time = time.perf_counter() - self._begin
+        self.cpu_time = _cpu_time() - self._cpu_begin
+        self.peak_rss, self.peak_child_rss = get_peak_memory_usage()
+
+    def add_job(self, job_name, wall_time: float, cpu_time: float, num_items: int) -> None:
+        """
+        Record the resource usage of a single job of the stage
+
+        Parameters
+        ----------
+        job_name: int or str
+            Job identifier
+        wall_time: float
+            Wall time of the job in seconds
+        cpu_time: float
+            CPU time of the job in seconds
+        num_items: int
+            Number of items processed by the job
+        """
+        self.jobs[str(job_name)] = {
+            "wall_time": wall_time,
+            "cpu_time": cpu_time,
+            "num_items": num_items,
+        }
+        self.num_items += num_items
+
+    @property
+    def items_per_second(self) -> typing.Optional[float]:
+        """Throughput of the stage, or None if no items were counted"""
+        if not self.num_items or not self.wall_time:
+            return None
+        return self.num_items / self.wall_time
+
+    @property
+    def job_skew(self) -> typing.Optional[float]:
+        """Ratio of the slowest job's wall time to the mean job wall time"""
+        times = [x["wall_time"] for x in self.jobs.values()]
+        if len(times) < 2 or not sum(times):
+            return None
+        return max(times) / (sum(times) / len(times))
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """Export the record for the JSON report"""
+        return {
+            "name": self.name,
+            "category": self.category,
+            "parent": self.parent,
+            "start_time": self.start_time,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_rss_mb": self.peak_rss,
+            "peak_child_rss_mb": self.peak_child_rss,
+            "num_items": self.num_items,
+            "items_per_second": self.items_per_second,
+            "job_skew": self.job_skew,
+            "jobs": self.jobs,
+        }
+
+
+class PipelineProfiler:
+    """
+    Collects :class:`~montreal_forced_aligner.profiling.StageRecord` objects over a run of MFA
+    and exports them as a JSON report and Prometheus text-format metrics
+
+    Recording only happens when :data:`~montreal_forced_aligner.config.PIPELINE_REPORT` is enabled.
+    Stages being recorded are tracked per thread, so stages running concurrently in different
+    threads do not become each other's parents.
+    """
+
+    def __init__(self):
+        self.records: typing.List[StageRecord] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def _active(self) -> typing.List[StageRecord]:
+        """Stages being recorded in the current thread"""
+        if not hasattr(self._local, "active"):
+            self._local.active = []
+        return self._local.active
+
+    @property
+    def current_stage(self) -> typing.Optional[str]:
+        """Name of the innermost stage being recorded in the current thread"""
+        return self._active[-1].name if self._active else None
+
+    @property
+    def enabled(self) -> bool:
+        """Flag for whether stages should be recorded"""
+        return config.PIPELINE_REPORT
+
+    def reset(self) -> None:
+        """Remove all records from previous runs"""
+        with self._lock:
+            self.records = []
+            self._local = threading.local()
+
+    @contextmanager
+    def stage(
+        self, name: str, category: str = "stage", parent: typing.Optional[str] = None
+    ) -> typing.Generator[typing.Optional[StageRecord], None, None]:
+        """
+        Context manager for recording a stage, yields None if profiling is disabled
+
+        Parameters
+        ----------
+        name: str
+            Name of the stage
+        category: str
+            Category of the stage
+        parent: str, optional
+            Name of the parent stage, defaults to the innermost stage being recorded in the
+            current thread
+        """
+        if not self.enabled:
+            yield None
+            return
+        if parent is None:
+            parent = self.current_stage
+        record = StageRecord(name, category, parent)
+        active = self._active
+        active.append(record)
+        try:
+            yield record
+        finally:
+            record.finish()
+            active.remove(record)
+            with self._lock:
+                self.records.append(record)
+
+    def is_active(self, name: str) -> bool:
+        """Check whether a stage with a given name is currently being recorded"""
+        return any(x.name == name for x in self._active)
+
+    def summary(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """
+        Aggregate records with the same category and name
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Totals per stage, keyed by "category:name"
+        """
+        summary = {}
+        for r in self.records:
+            key = f"{r.category}:{r.name}"
+            if key not in summary:
+                summary[key] = {
+                    "name": r.name,
+                    "category": r.category,
+                    "count": 0,
+                    "wall_time": 0.0,
+                    "cpu_time": 0.0,
+                    "num_items": 0,
+                    "peak_rss_mb": None,
+                    "max_job_skew": None,
+                }
+            s = summary[key]
+            s["count"] += 1
+            s["wall_time"] += r.wall_time
+            s["cpu_time"] += r.cpu_time
+            s["num_items"] += r.num_items
+            if r.peak_rss is not None:
+                s["peak_rss_mb"] = max(s["peak_rss_mb"] or 0, r.peak_rss)
+            if r.job_skew is not None:
+                s["max_job_skew"] = max(s["max_job_skew"] or 0, r.job_skew)
+        for s in summary.values():
+            s["items_per_second"] = (
+                s["num_items"] / s["wall_time"] if s["num_items"] and s["wall_time"] else None
+            )
+        return summary
+
+    def export_json(self, path: Path, **metadata) -> None:
+        """
+        Export the report as JSON
+
+        Parameters
+        ----------
+        path: :class:`~pathlib.Path`
+            Path to save report
+        **metadata
+            Extra information about the run to include in the report
+        """
+        report = {
+            **metadata,
+            "stages": [r.to_dict() for r in self.records],
+            "summary": self.summary(),
+        }
+        with open(path, "w", encoding="utf8") as f:
+            json.dump(report, f, indent=2)
+
+    def export_prometheus(self, path: Path) -> None:
+        """
+        Export aggregated stage metrics in the Prometheus text exposition format
+
+        Parameters
+        ----------
+        path: :class:`~pathlib.Path`
+            Path to save metrics
+        """
+        metrics = [
+            ("mfa_stage_runs_total", "counter", "Number of times the stage was run", "count"),
+            ("mfa_stage_wall_seconds", "gauge", "Total wall time of the stage", "wall_time"),
+            ("mfa_stage_cpu_seconds", "gauge", "Total CPU time of the stage", "cpu_time"),
+            ("mfa_stage_items", "gauge", "Total items processed by the stage", "num_items"),
+            (
+                "mfa_stage_items_per_second",
+                "gauge",
+                "Throughput of the stage",
+                "items_per_second",
+            ),
+            ("mfa_stage_peak_rss_megabytes", "gauge", "Peak RSS after the stage", "peak_rss_mb"),
+            (
+                "mfa_stage_job_skew",
+                "gauge",
+                "Largest ratio of slowest job to mean job wall time",
+                "max_job_skew",
+            ),
+        ]
+        summary = self.summary()
+        lines = []
+        for metric, metric_type, description, key in metrics:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} {metric_type}")
+            for s in summary.values():
+                if s[key] is None:
+                    continue
+                name = s["name"].replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{metric}{{category="{s["category"]}",stage="{name}"}} {s[key]}')
+        with open(path, "w", encoding="utf8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+PROFILER = PipelineProfiler()
+
+
+def profile_stage(category: str = "stage") -> typing.Callable:
+    """
+    Decorator for recording calls to a worker method as pipeline stages
+
+    Nested calls to methods of the same name, such as through ``super()``, are recorded once
+
+    Parameters
+    ----------
+    category: str
+        Category of the stage
+    """
+
+    def decorator(func: typing.Callable) -> typing.Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled or PROFILER.is_active(func.__name__):
+                return func(*args, **kwargs)
+            with PROFILER.stage(func.__name__, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
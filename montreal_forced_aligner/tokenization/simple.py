@@ -10,6 +10,9 @@ from montreal_forced_aligner.helper import make_re_character_set_safe
 
 __all__ = ["SanitizeFunction", "SplitWordsFunction", "SimpleTokenizer"]
 
+INITIAL_QUOTE_REGEX = re.compile("^'")
+FINAL_QUOTE_REGEX = re.compile("'$")
+
 
 class SanitizeFunction:
     """
@@ -151,6 +154,16 @@ class SplitWordsFunction:
         self.compound_pattern = None
         self.clitic_pattern = None
         self.non_speech_regexes = non_speech_regexes
+        self.non_speech_words = list(non_speech_regexes.keys())
+        self.non_speech_regex = None
+        if non_speech_regexes:
+            patterns = []
+            for i, regex in enumerate(non_speech_regexes.values()):
+                pattern = regex.pattern
+                if regex.flags & re.IGNORECASE:
+                    pattern = f"(?i:{pattern})"
+                patterns.append(f"(?P<non_speech_{i}>{pattern})")
+            self.non_speech_regex = re.compile("|".join(patterns))
         self.initial_clitic_regex = initial_clitic_regex
         self.final_clitic_regex = final_clitic_regex
         self.has_initial = False
@@ -161,6 +174,28 @@ class SplitWordsFunction:
             self.has_final = True
         self.always_split_compounds = always_split_compounds
 
+    def match_non_speech(self, item: str) -> typing.Optional[str]:
+        """
+        Find the non-speech word for an item using a single combined regex, checking
+        non-speech patterns in order
+
+        Parameters
+        ----------
+        item: str
+            Word to check
+
+        Returns
+        -------
+        str, optional
+            Non-speech word for the first matching pattern, or None if none match
+        """
+        if self.non_speech_regex is None:
+            return None
+        m = self.non_speech_regex.match(item)
+        if m is None:
+            return None
+        return self.non_speech_words[int(m.lastgroup.rsplit("_", maxsplit=1)[1])]
+
     def to_str(self, normalized_text: str) -> str:
         """
         Convert normalized text to an integer ID
@@ -181,9 +216,9 @@ class SplitWordsFunction:
             return normalized_text
         if self.cutoff_regex is not None and self.cutoff_regex.match(normalized_text):
             return normalized_text
-        for word, regex in self.non_speech_regexes.items():
-            if regex.match(normalized_text):
-                return word
+        word = self.match_non_speech(normalized_text)
+        if word is not None:
+            return word
         return normalized_text
 
     def split_clitics(
@@ -213,8 +248,6 @@ class SplitWordsFunction:
             s = [item]
         if self.word_table is None:
             return [item]
-        clean_initial_quote_regex = re.compile("^'")
-        clean_final_quote_regex = re.compile("'$")
         for seg in s:
             if not seg:
                 continue
@@ -257,11 +290,11 @@ class SplitWordsFunction:
                     if self.word_table.member(seg):
                         break
                 final_clitics.reverse()
-            split.extend([clean_initial_quote_regex.sub("", x) for x in initial_clitics])
-            seg = clean_final_quote_regex.sub("", clean_initial_quote_regex.sub("", seg))
+            split.extend([INITIAL_QUOTE_REGEX.sub("", x) for x in initial_clitics])
+            seg = FINAL_QUOTE_REGEX.sub("", INITIAL_QUOTE_REGEX.sub("", seg))
             if seg:
                 split.append(seg)
-            split.extend([clean_final_quote_regex.sub("", x) for x in final_clitics])
+            split.extend([FINAL_QUOTE_REGEX.sub("", x) for x in final_clitics])
             if not benefit and self.word_table.member(seg):
                 benefit = True
         if not benefit:
@@ -272,10 +305,9 @@ class SplitWordsFunction:
         self,
         item: str,
     ) -> typing.Generator[str]:
-        for word, regex in self.non_speech_regexes.items():
-            if regex.match(item):
-                yield word
-                break
+        word = self.match_non_speech(item)
+        if word is not None:
+            yield word
         else:
             for c in item:
                 if self.grapheme_set is not None and c in self.grapheme_set:
@@ -305,9 +337,8 @@ class SplitWordsFunction:
             return [item]
         if self.cutoff_regex is not None and self.cutoff_regex.match(item):
             return [item]
-        for regex in self.non_speech_regexes.values():
-            if regex.match(item):
-                return [item]
+        if self.non_speech_regex is not None and self.non_speech_regex.match(item):
+            return [item]
         return self.split_clitics(item)
 
 
@@ -328,8 +359,11 @@ class SimpleTokenizer:
         clitic_set: typing.Iterable = None,
         grapheme_set: typing.Iterable = None,
         word_table: pywrapfst.SymbolTable = None,
+        word_cache_size: int = 100000,
     ):
         self.word_break_markers = word_break_markers
+        self.word_cache_size = word_cache_size
+        self.word_cache = {}
         self.word_table = word_table
         self.punctuation = punctuation
         self.clitic_markers = clitic_markers
@@ -475,24 +509,59 @@ class SimpleTokenizer:
             if final_clitics:
                 self.final_clitic_regex = re.compile(rf"(?<=\w)({'|'.join(final_clitics)})$")
 
+    def _split_word(
+        self, word: str
+    ) -> typing.Tuple[typing.Tuple[str, str, bool, typing.Tuple[str, ...]], ...]:
+        """
+        Split a sanitized word into subwords along with their normalized forms, OOV
+        status and graphemes, caching the result for words seen again
+
+        Parameters
+        ----------
+        word: str
+            Sanitized word
+
+        Returns
+        -------
+        tuple[tuple[str, str, bool, tuple[str, ...]], ...]
+            Subword, normalized form, whether the subword is OOV, and graphemes for each subword
+        """
+        try:
+            return self.word_cache[word]
+        except KeyError:
+            pass
+        split = tuple(
+            (
+                new_w,
+                self.split_function.to_str(new_w),
+                not self.word_table.member(new_w),
+                tuple(self.split_function.parse_graphemes(new_w)),
+            )
+            for new_w in self.split_function(word)
+        )
+        if self.word_cache_size > 0:
+            if len(self.word_cache) >= self.word_cache_size:
+                self.word_cache.clear()
+            self.word_cache[word] = split
+        return split
+
     def _dictionary_sanitize(self, text):
         words = self.sanitize_function(text)
         normalized_text = []
         normalized_character_text = []
         oovs = set()
         for w in words:
-            for new_w in self.split_function(w):
-                if not self.word_table.member(new_w):
+            for new_w, normalized_w, is_oov, graphemes in self._split_word(w):
+                if is_oov:
                     oovs.add(new_w)
-                normalized_text.append(self.split_function.to_str(new_w))
+                normalized_text.append(normalized_w)
                 if normalized_character_text:
                     if not self.clitic_marker or (
-                        not normalized_text[-1].endswith(self.clitic_marker)
+                        not normalized_w.endswith(self.clitic_marker)
                         and not new_w.startswith(self.clitic_marker)
                     ):
                         normalized_character_text.append("<space>")
-                for c in self.split_function.parse_graphemes(new_w):
-                    normalized_character_text.append(c)
+                normalized_character_text.extend(graphemes)
         normalized_text = " ".join(normalized_text)
         normalized_character_text = " ".join(normalized_character_text)
         return normalized_text, normalized_character_text, sorted(oovs)
@@ -8,7 +8,6 @@ import queue
 import threading
 import time
 import typing
-from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from queue import Queue
 
@@ -29,7 +28,7 @@ from montreal_forced_aligner.db import File, Utterance, bulk_update
 from montreal_forced_aligner.dictionary.mixins import DictionaryMixin
 from montreal_forced_aligner.exceptions import PyniniGenerationError
 from montreal_forced_aligner.g2p.generator import PhonetisaurusRewriter, Rewriter, RewriterWorker
-from montreal_forced_aligner.helper import edit_distance, mfa_open
+from montreal_forced_aligner.helper import batch_edit_distance, mfa_open
 from montreal_forced_aligner.models import TokenizerModel
 from montreal_forced_aligner.textgrid import construct_output_path
 from montreal_forced_aligner.utils import run_kaldi_function
@@ -524,25 +523,24 @@ class TokenizerValidator(CorpusTokenizer):
                 incorrect += 1
                 indices.append(word)
                 to_comp.append((gold, hyp))  # Multiple hypotheses to compare
-        with ThreadPool(config.NUM_JOBS) as pool:
-            gen = pool.starmap(edit_distance, to_comp)
-            for i, (edits) in enumerate(gen):
-                word = indices[i]
-                gold = gold_values[word]
-                length = len(gold)
-                hyp = hypothesis_values[word]
-                output.append(
-                    {
-                        "Word": word,
-                        "Gold tokenization": gold,
-                        "Hypothesis tokenization": hyp,
-                        "Accuracy": 1,
-                        "Error rate": edits / length,
-                        "Length": length,
-                    }
-                )
-                total_edits += edits
-                total_length += length
+        for i, edits in enumerate(batch_edit_distance(to_comp)):
+            edits = int(edits)
+            word = indices[i]
+            gold = gold_values[word]
+            length = len(gold)
+            hyp = hypothesis_values[word]
+            output.append(
+                {
+                    "Word": word,
+                    "Gold tokenization": gold,
+                    "Hypothesis tokenization": hyp,
+                    "Accuracy": 1,
+                    "Error rate": edits / length,
+                    "Length": length,
+                }
+            )
+            total_edits += edits
+            total_length += length
         with mfa_open(self.evaluation_csv_path, "w") as f:
             writer = csv.DictWriter(
                 f,
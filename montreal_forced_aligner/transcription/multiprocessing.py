@@ -529,6 +529,14 @@ class DecodeFunction(KaldiFunction):
         Arguments for the function
     """
 
+    releases_gil = True
+
+    @classmethod
+    def estimate_job_memory(cls, args: DecodeArguments) -> typing.Optional[float]:
+        """Decoding graphs and the model are read into memory whole, so use their size on disk"""
+        paths = [*args.hclg_paths.values(), args.model_path]
+        return sum(os.path.getsize(p) for p in paths if os.path.exists(p)) / (1024 * 1024)
+
     def __init__(self, args: DecodeArguments):
         super().__init__(args)
         self.working_directory = args.working_directory
@@ -17,7 +17,6 @@ import threading
 import time
 import typing
 import warnings
-from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from queue import Empty, Queue
 from typing import TYPE_CHECKING, Dict, List, Optional
@@ -55,10 +54,10 @@ from montreal_forced_aligner.db import (
 from montreal_forced_aligner.dictionary.mixins import DictionaryMixin
 from montreal_forced_aligner.exceptions import KaldiProcessingError, ModelError
 from montreal_forced_aligner.helper import (
+    batch_score_wer,
     load_configuration,
     mfa_open,
     parse_old_features,
-    score_wer,
 )
 from montreal_forced_aligner.language_modeling.multiprocessing import (
     TrainLmArguments,
@@ -67,6 +66,7 @@ from montreal_forced_aligner.language_modeling.multiprocessing import (
     TrainSpeakerLmFunction,
 )
 from montreal_forced_aligner.models import AcousticModel, LanguageModel
+from montreal_forced_aligner.profiling import profile_stage
 from montreal_forced_aligner.textgrid import construct_output_path
 from montreal_forced_aligner.transcription.models import FOUND_WHISPERX, load_model
 from montreal_forced_aligner.transcription.multiprocessing import (
@@ -274,21 +274,19 @@ class TranscriptionEvaluationMixin:
                         {"id": utt.id, "word_error_rate": 0.0, "character_error_rate": 0.0}
                     )
 
-            with ThreadPool(config.NUM_JOBS) as pool:
-                gen = pool.starmap(score_wer, to_comp)
-                for i, (word_edits, word_length, character_edits, character_length) in enumerate(
-                    gen
-                ):
-                    utt_id = indices[i]
-                    update_mappings.append(
-                        {
-                            "id": utt_id,
-                            "word_error_rate": word_edits / word_length,
-                            "character_error_rate": character_edits / character_length,
-                        }
-                    )
-                    total_word_edits += word_edits
-                    total_character_edits += character_edits
+            for i, (word_edits, word_length, character_edits, character_length) in enumerate(
+                batch_score_wer(to_comp)
+            ):
+                utt_id = indices[i]
+                update_mappings.append(
+                    {
+                        "id": utt_id,
+                        "word_error_rate": word_edits / word_length,
+                        "character_error_rate": character_edits / character_length,
+                    }
+                )
+                total_word_edits += word_edits
+                total_character_edits += character_edits
 
             bulk_update(session, Utterance, update_mappings)
             session.commit()
@@ -665,6 +663,7 @@ class TranscriberMixin(CorpusAligner, TranscriptionEvaluationMixin):
             hclg_path = self.working_directory.joinpath("HCLG_phone.fst")
             compiler.export_hclg(None, hclg_path)
 
+    @profile_stage()
     def transcribe(self, workflow_type: WorkflowType = WorkflowType.transcription):
         self.initialize_database()
         self.create_new_current_workflow(workflow_type)
@@ -1275,6 +1274,7 @@ class Transcriber(TranscriberMixin, TopLevelMfaWorker):
         self.initialized = True
         logger.debug(f"Setup for transcription in {time.time() - begin: .3f} seconds")
 
+    @profile_stage()
     def export_files(
         self,
         output_directory: Path,
@@ -1404,6 +1404,7 @@ class HuggingFaceTranscriber(
                 e.update_log_file()
             raise
 
+    @profile_stage()
     def export_files(
         self,
         output_directory: Path,
@@ -5,6 +5,7 @@ Utility functions
 """
 from __future__ import annotations
 
+import collections
 import datetime
 import logging
 import multiprocessing as mp
@@ -14,6 +15,7 @@ import queue
 import re
 import shutil
 import subprocess
+import sys
 import threading
 import time
 import typing
@@ -35,7 +37,10 @@ from montreal_forced_aligner.exceptions import (
     KaldiProcessingError,
     ThirdpartyError,
 )
+from montreal_forced_aligner.executor import GOVERNOR
 from montreal_forced_aligner.helper import mfa_open
+from montreal_forced_aligner.journal import JournalStep
+from montreal_forced_aligner.profiling import PROFILER, StageRecord
 from montreal_forced_aligner.textgrid import process_ctm_line
 
 __all__ = [
@@ -43,6 +48,7 @@ __all__ = [
     "thirdparty_binary",
     "log_kaldi_errors",
     "get_mfa_version",
+    "get_peak_memory_usage",
     "parse_logs",
     "inspect_database",
     "Counter",
@@ -267,6 +273,29 @@ def get_mfa_version() -> str:
     return __version__
 
 
+def get_peak_memory_usage() -> typing.Tuple[typing.Optional[float], typing.Optional[float]]:
+    """
+    Get the peak resident set size of the current process and of its largest finished child process
+
+    Returns
+    -------
+    float or None
+        Peak memory usage of the current process in MB, None on platforms without :mod:`resource`
+    float or None
+        Peak memory usage of the largest child process in MB, None on platforms without
+        :mod:`resource`
+    """
+    try:
+        import resource
+    except ImportError:
+        return None, None
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale,
+    )
+
+
 def check_third_party():
     """
     Checks whether third party software is available on the path
@@ -521,12 +550,24 @@ class KaldiProcessWorker(threading.Thread):
         self.return_q = return_q
         self.stopped = stopped
         self.finished = threading.Event()
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.num_items = 0
 
     def add_to_return_queue(self, result):
         if self.stopped.is_set():
             return
+        self.num_items += result if isinstance(result, int) else 1
         self.return_q.put(result)
 
+    def resource_usage(self) -> typing.Tuple[float, float, int]:
+        """Wall time, CPU time and number of items processed by the finished worker"""
+        return self.wall_time, self.cpu_time, self.num_items
+
+    def memory_growth(self) -> typing.Optional[float]:
+        """Memory used by the finished worker, which cannot be separated from other threads"""
+        return None
+
     def run(self) -> None:
         """
         Run through the arguments in the queue apply the function to them
@@ -535,6 +576,8 @@ class KaldiProcessWorker(threading.Thread):
         os.environ["OMP_NUM_THREADS"] = f"{config.BLAS_NUM_THREADS}"
         os.environ["OPENBLAS_NUM_THREADS"] = f"{config.BLAS_NUM_THREADS}"
         os.environ["MKL_NUM_THREADS"] = f"{config.BLAS_NUM_THREADS}"
+        begin = time.perf_counter()
+        cpu_begin = time.thread_time()
         try:
             self.function.run()
         except Exception as e:
@@ -543,6 +586,8 @@ class KaldiProcessWorker(threading.Thread):
                 e.job_name = self.job_name
             self.return_q.put(e)
         finally:
+            self.wall_time = time.perf_counter() - begin
+            self.cpu_time = time.thread_time() - cpu_begin
             self.finished.set()
 
 
@@ -576,12 +621,27 @@ class KaldiProcessWorkerMp(mp.Process):
         self.return_q = return_q
         self.stopped = stopped
         self.finished = mp.Event()
+        self.wall_time = mp.Value("d", 0.0, lock=False)
+        self.cpu_time = mp.Value("d", 0.0, lock=False)
+        self.num_items = mp.Value("q", 0, lock=False)
+        self.peak_memory_growth = mp.Value("d", -1.0, lock=False)
 
     def add_to_return_queue(self, result):
         if self.stopped.is_set():
             return
+        self.num_items.value += result if isinstance(result, int) else 1
         self.return_q.put(result)
 
+    def resource_usage(self) -> typing.Tuple[float, float, int]:
+        """Wall time, CPU time and number of items processed by the finished worker"""
+        return self.wall_time.value, self.cpu_time.value, self.num_items.value
+
+    def memory_growth(self) -> typing.Optional[float]:
+        """Growth in peak memory of the finished worker over the course of the job in MB"""
+        if self.peak_memory_growth.value < 0:
+            return None
+        return self.peak_memory_growth.value
+
     def run(self) -> None:
         """
         Run through the arguments in the queue apply the function to them
@@ -590,6 +650,9 @@ class KaldiProcessWorkerMp(mp.Process):
         os.environ["OMP_NUM_THREADS"] = f"{config.BLAS_NUM_THREADS}"
         os.environ["OPENBLAS_NUM_THREADS"] = f"{config.BLAS_NUM_THREADS}"
         os.environ["MKL_NUM_THREADS"] = f"{config.BLAS_NUM_THREADS}"
+        begin = time.perf_counter()
+        cpu_begin = time.process_time()
+        memory_begin = get_peak_memory_usage()[0]
         try:
             self.function.run()
         except Exception as e:
@@ -598,6 +661,11 @@ class KaldiProcessWorkerMp(mp.Process):
                 e.job_name = self.job_name
             self.return_q.put(e)
         finally:
+            self.wall_time.value = time.perf_counter() - begin
+            self.cpu_time.value = time.process_time() - cpu_begin
+            memory_end = get_peak_memory_usage()[0]
+            if memory_begin is not None and memory_end is not None:
+                self.peak_memory_growth.value = memory_end - memory_begin
             self.finished.set()
 
 
@@ -608,7 +676,8 @@ def thread_logger(
     kalpy_logging = logging.getLogger(log_name)
     file_handler = logging.FileHandler(log_path, encoding="utf8")
     file_handler.setLevel(logging.DEBUG)
-    if config.USE_THREADING:
+    in_worker_thread = job_name is not None and threading.current_thread().name == str(job_name)
+    if config.USE_THREADING or in_worker_thread:
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(thread)d - %(threadName)s - %(levelname)s - %(message)s"
         )
@@ -651,9 +720,38 @@ class IgnoreThreadsFilter(logging.Filter):
 
 
 def run_kaldi_function(
-    function, arguments, stopped: threading.Event = None, total_count: int = None
+    function,
+    arguments,
+    stopped: threading.Event = None,
+    total_count: int = None,
+    journal: typing.Optional[JournalStep] = None,
+):
+    with PROFILER.stage(function.__name__, "kaldi_function") as record:
+        yield from _run_kaldi_function(function, arguments, stopped, total_count, record, journal)
+
+
+def _run_kaldi_function(
+    function,
+    arguments,
+    stopped: threading.Event = None,
+    total_count: int = None,
+    record: typing.Optional[StageRecord] = None,
+    journal: typing.Optional[JournalStep] = None,
 ):
-    if config.USE_THREADING:
+    if journal is not None:
+        arguments = [x for x in arguments if not journal.is_complete(x.job_name)]
+        if not arguments:
+            return
+        job_arguments = {x.job_name: x for x in arguments}
+    plan = None
+    use_threading = config.USE_THREADING
+    if config.USE_MP:
+        arguments = list(arguments)
+        plan = GOVERNOR.plan(function, arguments)
+        use_threading = plan.use_threading
+        if plan.reason:
+            logger.debug(repr(plan))
+    if use_threading:
         Event = threading.Event
         Queue = queue.Queue
         Worker = KaldiProcessWorker
@@ -674,13 +772,32 @@ def run_kaldi_function(
         pbar = tqdm(total=total_count, maxinterval=0)
         progress_callback = pbar.update
     update_time = time.time()
+
+    def complete_job(job_name):
+        if journal is None or stopped.is_set():
+            return
+        outputs = function.job_outputs(job_arguments[job_name])
+        if outputs is not None:
+            journal.complete(job_name, outputs)
+
     if config.USE_MP:
         procs = []
-        for args in arguments:
-            f = function(args)
-            p = Worker(args.job_name, return_queue, f, stopped)
-            procs.append(p)
-            p.start()
+        running = []
+        pending = collections.deque(arguments)
+        begin = time.perf_counter()
+
+        def start_workers():
+            for proc in [x for x in running if x.finished.is_set()]:
+                running.remove(proc)
+                complete_job(proc.job_name)
+            while pending and len(running) < plan.max_workers and not stopped.is_set():
+                job_args = pending.popleft()
+                proc = Worker(job_args.job_name, return_queue, function(job_args), stopped)
+                procs.append(proc)
+                running.append(proc)
+                proc.start()
+
+        start_workers()
         try:
             while True:
                 try:
@@ -704,11 +821,11 @@ def run_kaldi_function(
                             update_time = time.time()
                     if isinstance(return_queue, queue.Queue):
                         return_queue.task_done()
+                    if pending:
+                        start_workers()
                 except queue.Empty:
-                    for proc in procs:
-                        if not proc.finished.is_set():
-                            break
-                    else:
+                    start_workers()
+                    if not running:
                         break
                     continue
                 except Exception as e:
@@ -726,10 +843,18 @@ def run_kaldi_function(
                     continue
 
         finally:
+            jobs = []
             for p in procs:
                 p.join()
+                wall_time, cpu_time, num_items = p.resource_usage()
+                if record is not None:
+                    record.add_job(p.job_name, wall_time, cpu_time, num_items)
+                jobs.append((cpu_time, p.memory_growth()))
                 del p.function
+            if not error_dict and not stopped.is_set():
+                GOVERNOR.observe(plan, time.perf_counter() - begin, jobs)
             del procs
+            del running
             del return_queue
             del stopped
             del arguments
@@ -790,6 +915,9 @@ def run_kaldi_function(
 
             finally:
                 p.join()
+                if record is not None:
+                    record.add_job(p.job_name, *p.resource_usage())
+            complete_job(args.job_name)
 
         if error_dict:
             for v in error_dict.values():
@@ -41,6 +41,38 @@ except (ImportError, OSError):
 logger = logging.getLogger("mfa")
 
 
+def get_initial_segmentation_array(
+    frames: np.ndarray, frame_shift: float
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute initial segmentation over voice activity as arrays of boundaries
+
+    Parameters
+    ----------
+    frames: :class:`numpy.ndarray`
+        Array of frames with VAD output
+    frame_shift: float
+        Frame shift of features in seconds
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Begin times of speech segments
+    :class:`numpy.ndarray`
+        End times of speech segments
+    """
+    speech = np.asarray(frames).astype(np.int32) > 0
+    padded = np.concatenate([[False], speech, [False]]).astype(np.int8)
+    changes = np.diff(padded)
+    begin_frames = np.flatnonzero(changes == 1)
+    end_frames = np.flatnonzero(changes == -1)
+    begins = begin_frames * frame_shift
+    ends = (end_frames - 1) * frame_shift
+    if end_frames.shape[0] and end_frames[-1] == speech.shape[0]:
+        ends[-1] = speech.shape[0] * frame_shift
+    return begins, ends
+
+
 def get_initial_segmentation(frames: np.ndarray, frame_shift: float) -> typing.List[CtmInterval]:
     """
     Compute initial segmentation over voice activity
@@ -57,26 +89,85 @@ def get_initial_segmentation(frames: np.ndarray, frame_shift: float) -> typing.L
     List[CtmInterval]
         Initial segmentation
     """
-    segments = []
-    cur_segment = None
-    silent_frames = 0
-    non_silent_frames = 0
-    for i in range(frames.shape[0]):
-        f = frames[i]
-        if int(f) > 0:
-            non_silent_frames += 1
-            if cur_segment is None:
-                cur_segment = CtmInterval(begin=i * frame_shift, end=0, label="speech")
-        else:
-            silent_frames += 1
-            if cur_segment is not None:
-                cur_segment.end = (i - 1) * frame_shift
-                segments.append(cur_segment)
-                cur_segment = None
-    if cur_segment is not None:
-        cur_segment.end = len(frames) * frame_shift
-        segments.append(cur_segment)
-    return segments
+    begins, ends = get_initial_segmentation_array(frames, frame_shift)
+    return [
+        CtmInterval(begin=b, end=e, label="speech") for b, e in zip(begins.tolist(), ends.tolist())
+    ]
+
+
+def merge_segments_array(
+    begins: np.ndarray,
+    ends: np.ndarray,
+    min_pause_duration: float,
+    max_segment_length: float,
+    min_segment_length: float,
+    snap_boundaries: bool = True,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge segments together, operating on arrays of boundaries
+
+    Parameters
+    ----------
+    begins: :class:`numpy.ndarray`
+        Begin times of initial segments
+    ends: :class:`numpy.ndarray`
+        End times of initial segments
+    min_pause_duration: float
+        Minimum amount of silence time to mark an utterance boundary
+    max_segment_length: float
+        Maximum length of segments before they're broken up
+    min_segment_length: float
+        Minimum length of segments returned
+    snap_boundaries: bool
+        Flag for moving boundaries of adjacent segments into the pause between them
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Begin times of merged segments
+    :class:`numpy.ndarray`
+        End times of merged segments
+    """
+    begins = np.asarray(begins, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    num_segments = begins.shape[0]
+    if num_segments == 0:
+        return begins, ends
+    snap_boundary_threshold = min_pause_duration / 2 if snap_boundaries else 0
+    gaps = begins[1:] - ends[:-1]
+    half_boundaries = np.zeros(num_segments, dtype=np.float64)
+    if snap_boundary_threshold:
+        half_boundaries[1:] = np.where(
+            gaps < snap_boundary_threshold, gaps / 2, snap_boundary_threshold / 2
+        )
+    # Begin of a merged segment if a segment starts a new one
+    snapped_begins = begins - half_boundaries
+
+    pause_breaks = np.concatenate([[0], np.flatnonzero(gaps > min_pause_duration) + 1])
+    group_ends = np.append(pause_breaks[1:], num_segments)
+    group_max_ends = np.maximum.reduceat(ends, pause_breaks)
+    too_long = group_max_ends - snapped_begins[pause_breaks] > max_segment_length
+    if np.any(too_long):
+        breaks = []
+        for group_begin, group_end, split in zip(
+            pause_breaks.tolist(), group_ends.tolist(), too_long.tolist()
+        ):
+            breaks.append(group_begin)
+            if not split:
+                continue
+            current_begin = snapped_begins[group_begin]
+            for i in range(group_begin + 1, group_end):
+                if ends[i] - current_begin > max_segment_length:
+                    breaks.append(i)
+                    current_begin = snapped_begins[i]
+        breaks = np.array(breaks, dtype=np.int64)
+    else:
+        breaks = pause_breaks
+    merged_begins = snapped_begins[breaks]
+    last_indices = np.append(breaks[1:], num_segments) - 1
+    merged_ends = ends[last_indices] + np.append(half_boundaries[breaks[1:]], 0.0)
+    keep = merged_ends - merged_begins > min_segment_length
+    return merged_begins[keep], merged_ends[keep]
 
 
 def merge_segments(
@@ -99,35 +190,161 @@ def merge_segments(
         Maximum length of segments before they're broken up
     min_segment_length: float
         Minimum length of segments returned
+    snap_boundaries: bool
+        Flag for moving boundaries of adjacent segments into the pause between them
 
     Returns
     -------
     List[CtmInterval]
         Merged segments
     """
-    merged_segments = []
-    snap_boundary_threshold = 0
-    if snap_boundaries:
-        snap_boundary_threshold = min_pause_duration / 2
-    for s in segments:
-        if (
-            not merged_segments
-            or s.begin > merged_segments[-1].end + min_pause_duration
-            or s.end - merged_segments[-1].begin > max_segment_length
-        ):
-            if merged_segments and snap_boundary_threshold:
-                boundary_gap = s.begin - merged_segments[-1].end
-                if boundary_gap < snap_boundary_threshold:
-                    half_boundary = boundary_gap / 2
-                else:
-                    half_boundary = snap_boundary_threshold / 2
-                merged_segments[-1].end += half_boundary
-                s.begin -= half_boundary
+    begins, ends = merge_segments_array(
+        np.array([s.begin for s in segments], dtype=np.float64),
+        np.array([s.end for s in segments], dtype=np.float64),
+        min_pause_duration,
+        max_segment_length,
+        min_segment_length,
+        snap_boundaries=snap_boundaries,
+    )
+    return [
+        CtmInterval(begin=b, end=e, label="speech") for b, e in zip(begins.tolist(), ends.tolist())
+    ]
+
+
+class StreamingSegmenter:
+    """
+    Incremental segmentation of VAD output that is processed in consecutive chunks
+
+    Feeding all frames of a recording through :meth:`~StreamingSegmenter.process_frames`
+    and then calling :meth:`~StreamingSegmenter.flush` gives the same segments as
+    :func:`merge_segments_array` over :func:`get_initial_segmentation_array`, but only
+    the current chunk and the segment under construction are kept in memory.
 
-            merged_segments.append(s)
+    Parameters
+    ----------
+    frame_shift: float
+        Frame shift of features in seconds
+    min_pause_duration: float
+        Minimum amount of silence time to mark an utterance boundary
+    max_segment_length: float
+        Maximum length of segments before they're broken up
+    min_segment_length: float
+        Minimum length of segments returned
+    snap_boundaries: bool
+        Flag for moving boundaries of adjacent segments into the pause between them
+    """
+
+    def __init__(
+        self,
+        frame_shift: float,
+        min_pause_duration: float,
+        max_segment_length: float,
+        min_segment_length: float,
+        snap_boundaries: bool = True,
+    ):
+        self.frame_shift = frame_shift
+        self.min_pause_duration = min_pause_duration
+        self.max_segment_length = max_segment_length
+        self.min_segment_length = min_segment_length
+        self.snap_boundary_threshold = min_pause_duration / 2 if snap_boundaries else 0
+        self.num_frames = 0
+        self._open_run_begin = None
+        self._current_begin = None
+        self._previous_end = None
+        self._begins = []
+        self._ends = []
+
+    def _emit(self, end: float) -> None:
+        if end - self._current_begin > self.min_segment_length:
+            self._begins.append(self._current_begin)
+            self._ends.append(end)
+
+    def _add_run(self, begin: float, end: float) -> None:
+        if self._current_begin is None:
+            self._current_begin = begin
         else:
-            merged_segments[-1].end = s.end
-    return [x for x in merged_segments if x.end - x.begin > min_segment_length]
+            gap = begin - self._previous_end
+            half_boundary = 0.0
+            if self.snap_boundary_threshold:
+                if gap < self.snap_boundary_threshold:
+                    half_boundary = gap / 2
+                else:
+                    half_boundary = self.snap_boundary_threshold / 2
+            if (
+                gap > self.min_pause_duration
+                or end - self._current_begin > self.max_segment_length
+            ):
+                self._emit(self._previous_end + half_boundary)
+                self._current_begin = begin - half_boundary
+        self._previous_end = end
+
+    def _finalized_segments(self) -> typing.Tuple[np.ndarray, np.ndarray]:
+        begins = np.array(self._begins, dtype=np.float64)
+        ends = np.array(self._ends, dtype=np.float64)
+        self._begins = []
+        self._ends = []
+        return begins, ends
+
+    def process_frames(self, frames: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Process the next chunk of VAD output
+
+        Parameters
+        ----------
+        frames: :class:`numpy.ndarray`
+            Array of frames with VAD output that directly follow the previous chunk
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Begin times of segments that were finalized by this chunk
+        :class:`numpy.ndarray`
+            End times of segments that were finalized by this chunk
+        """
+        speech = np.asarray(frames).astype(np.int32) > 0
+        num_frames = speech.shape[0]
+        if num_frames == 0:
+            return self._finalized_segments()
+        offset = self.num_frames
+        padded = np.concatenate([[self._open_run_begin is not None], speech, [False]]).astype(
+            np.int8
+        )
+        changes = np.diff(padded)
+        begin_frames = (np.flatnonzero(changes == 1) + offset).tolist()
+        end_frames = (np.flatnonzero(changes == -1) + offset).tolist()
+        if self._open_run_begin is not None:
+            begin_frames.insert(0, self._open_run_begin)
+        self._open_run_begin = None
+        if end_frames and end_frames[-1] == offset + num_frames:
+            self._open_run_begin = begin_frames.pop()
+            end_frames.pop()
+        for begin_frame, end_frame in zip(begin_frames, end_frames):
+            self._add_run(begin_frame * self.frame_shift, (end_frame - 1) * self.frame_shift)
+        self.num_frames += num_frames
+        return self._finalized_segments()
+
+    def flush(self) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Finalize any remaining segments at the end of the recording and reset state
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Begin times of remaining segments
+        :class:`numpy.ndarray`
+            End times of remaining segments
+        """
+        if self._open_run_begin is not None:
+            self._add_run(
+                self._open_run_begin * self.frame_shift, self.num_frames * self.frame_shift
+            )
+        if self._current_begin is not None:
+            self._emit(self._previous_end)
+        self.num_frames = 0
+        self._open_run_begin = None
+        self._current_begin = None
+        self._previous_end = None
+        return self._finalized_segments()
 
 
 class MfaVAD(VAD):
@@ -138,6 +355,7 @@ class MfaVAD(VAD):
         activation_threshold=0.5,
         deactivation_threshold=0.0,
         eps=1e-6,
+        offset=0.0,
     ):
         """Applies energy-based VAD within the detected speech segments.The neural
         network VAD often creates longer segments and tends to merge segments that
@@ -164,12 +382,16 @@ class MfaVAD(VAD):
             The segment is considered ended when the energy is <= deactivation_th.
         eps: float
             Small constant for numerical stability.
+        offset: float
+            Time in seconds of the first sample of ``audio_file`` when it is a loaded waveform
 
         Returns
         -------
         new_boundaries
             The new boundaries that are post-processed by the energy VAD.
         """
+        if not segments:
+            return []
         if isinstance(audio_file, (str, Path)):
             # Getting the total size of the input file
             sample_rate, audio_len = self._get_audio_info(audio_file)
@@ -178,8 +400,20 @@ class MfaVAD(VAD):
                 raise ValueError(
                     "The detected sample rate is different from that set in the hparam file"
                 )
+            # Read the span covering all segments once rather than once per segment
+            offset = segments[0].begin
+            span_begin = int(offset * sample_rate)
+            audio_file, _ = torchaudio.load(
+                audio_file,
+                frame_offset=span_begin,
+                num_frames=int(segments[-1].end * sample_rate) - span_begin,
+            )
         else:
             sample_rate = self.sample_rate
+        if isinstance(audio_file, np.ndarray):
+            audio_file = torch.tensor(audio_file)
+        if len(audio_file.shape) == 1:
+            audio_file = audio_file.unsqueeze(0)
 
         # Computing the chunk length of the energy window
         chunk_len = int(self.time_resolution * sample_rate)
@@ -187,18 +421,12 @@ class MfaVAD(VAD):
 
         # Processing speech segments
         for segment in segments:
-            begin_sample = int(segment.begin * sample_rate)
-            end_sample = int(segment.end * sample_rate)
+            begin_sample = int((segment.begin - offset) * sample_rate)
+            end_sample = int((segment.end - offset) * sample_rate)
             seg_len = end_sample - begin_sample
             if seg_len < chunk_len:
                 continue
-            if not isinstance(audio_file, torch.Tensor):
-                # Reading the speech segment
-                audio, _ = torchaudio.load(
-                    audio_file, frame_offset=begin_sample, num_frames=seg_len
-                )
-            else:
-                audio = audio_file[:, begin_sample : begin_sample + seg_len]
+            audio = audio_file[:, begin_sample : begin_sample + seg_len]
 
             # Create chunks
             segment_chunks = self.create_chunks(
@@ -323,6 +551,9 @@ class MfaVAD(VAD):
                 segments,
                 activation_threshold=energy_activation_threshold,
                 deactivation_threshold=energy_deactivation_threshold,
+                offset=segment.begin
+                if isinstance(segment, Segment) and segment.begin is not None
+                else 0.0,
             )
 
         # Merge short segments
@@ -1,10 +1,12 @@
 """Multiprocessing functionality for VAD"""
 from __future__ import annotations
 
+import math
 import typing
 from pathlib import Path
 from typing import TYPE_CHECKING, Union
 
+import numpy as np
 import pynini
 import pywrapfst
 from _kalpy.decoder import LatticeFasterDecoder, LatticeFasterDecoderConfig
@@ -24,10 +26,15 @@ from sqlalchemy.orm import joinedload, subqueryload
 
 from montreal_forced_aligner.abc import KaldiFunction
 from montreal_forced_aligner.data import MfaArguments
-from montreal_forced_aligner.db import File, Job, Speaker, Utterance
+from montreal_forced_aligner.db import File, Job, SoundFile, Speaker, Utterance
 from montreal_forced_aligner.exceptions import SegmenterError
 from montreal_forced_aligner.models import AcousticModel, G2PModel
-from montreal_forced_aligner.vad.models import MfaVAD, get_initial_segmentation, merge_segments
+from montreal_forced_aligner.vad.models import (
+    MfaVAD,
+    StreamingSegmenter,
+    get_initial_segmentation_array,
+    merge_segments_array,
+)
 
 if TYPE_CHECKING:
     SpeakerCharacterType = Union[str, int]
@@ -40,10 +47,13 @@ else:
 __all__ = [
     "SegmentTranscriptArguments",
     "SegmentVadArguments",
+    "SegmentVadStreamingArguments",
     "SegmentTranscriptFunction",
     "SegmentVadFunction",
+    "SegmentVadStreamingFunction",
     "segment_utterance_transcript",
     "segment_utterance_vad",
+    "segment_utterance_vad_streaming",
 ]
 
 
@@ -55,6 +65,16 @@ class SegmentVadArguments(MfaArguments):
     segmentation_options: MetaDict
 
 
+@dataclass
+class SegmentVadStreamingArguments(MfaArguments):
+    """Arguments for :class:`~montreal_forced_aligner.vad.multiprocessing.SegmentVadStreamingFunction`"""
+
+    mfcc_options: MetaDict
+    vad_options: MetaDict
+    segmentation_options: MetaDict
+    chunk_duration: float
+
+
 @dataclass
 class SegmentTranscriptArguments(MfaArguments):
     """Arguments for :class:`~montreal_forced_aligner.segmenter.SegmentTranscriptFunction`"""
@@ -341,23 +361,116 @@ def segment_utterance_vad(
         vad_options["energy_threshold"] = mfccs[:, 0].mean()
     vad_computer = VadComputer(**vad_options)
     vad = vad_computer.compute_vad(feats).numpy()
-    segments = get_initial_segmentation(vad, mfcc_computer.frame_shift)
-    segments = merge_segments(
-        segments,
+    begins, ends = get_initial_segmentation_array(vad, mfcc_computer.frame_shift)
+    begins, ends = merge_segments_array(
+        begins,
+        ends,
         segmentation_options["min_pause_duration"],
         segmentation_options["max_segment_length"],
         segmentation_options["min_segment_length"] if allow_empty else 0.02,
     )
-    new_segments = []
-    for s in segments:
-        seg = Segment(
-            segment.file_path,
-            s.begin + segment.begin,
-            s.end + segment.begin,
-            segment.channel,
+    begins += segment.begin
+    ends += segment.begin
+    return [
+        Segment(segment.file_path, b, e, segment.channel)
+        for b, e in zip(begins.tolist(), ends.tolist())
+    ]
+
+
+def segment_utterance_vad_streaming(
+    segment: Segment,
+    mfcc_options: MetaDict,
+    vad_options: MetaDict,
+    segmentation_options: MetaDict,
+    chunk_duration: float = 60.0,
+    allow_empty: bool = True,
+) -> typing.Generator[typing.Tuple[np.ndarray, np.ndarray]]:
+    """
+    Segment an utterance with energy-based VAD, reading its audio in overlapping chunks
+
+    Each chunk is extended by enough audio on either side to compute MFCC frames and
+    VAD context for all of its own frames, so frames are identical to computing them
+    over the full utterance.  The energy threshold uses the running mean of log energy
+    over the audio processed so far in place of the mean over the whole utterance.
+
+    Parameters
+    ----------
+    segment: :class:`~kalpy.data.Segment`
+        Segment to split
+    mfcc_options: dict[str, Any]
+        MFCC options for energy based VAD
+    vad_options: dict[str, Any]
+        Options for energy based VAD
+    segmentation_options: dict[str, Any]
+        Segmentation options
+    chunk_duration: float
+        Duration in seconds of audio to process at a time
+    allow_empty: bool
+        Flag for keeping segments shorter than the minimum segment length
+
+    Yields
+    ------
+    :class:`numpy.ndarray`
+        Begin times of segments finalized after each chunk
+    :class:`numpy.ndarray`
+        End times of segments finalized after each chunk
+    """
+    mfcc_options = dict(mfcc_options)
+    mfcc_options["use_energy"] = True
+    mfcc_options["raw_energy"] = False
+    mfcc_options["dither"] = 0.0
+    mfcc_options["energy_floor"] = 0.0
+    mfcc_computer = MfccComputer(**mfcc_options)
+    frame_shift = mfcc_computer.frame_shift
+    vad_options = dict(vad_options)
+    energy_threshold = vad_options.pop("energy_threshold", 5.0)
+    energy_mean_scale = vad_options.pop("energy_mean_scale", 0.5)
+    frames_context = vad_options.get("frames_context", 0)
+    chunk_frames = max(int(round(chunk_duration / frame_shift)), 1)
+    right_context = frames_context + math.ceil(mfcc_computer.frame_length / 1000 / frame_shift)
+    segmenter = StreamingSegmenter(
+        frame_shift,
+        segmentation_options["min_pause_duration"],
+        segmentation_options["max_segment_length"],
+        segmentation_options["min_segment_length"] if allow_empty else 0.02,
+    )
+    energy_sum = 0.0
+    energy_count = 0
+    chunk_start = 0
+    while segment.end is None or segment.begin + chunk_start * frame_shift < segment.end:
+        window_start = max(chunk_start - frames_context, 0)
+        window_end = segment.begin + (chunk_start + chunk_frames + right_context) * frame_shift
+        if segment.end is not None:
+            window_end = min(window_end, segment.end)
+        feats = mfcc_computer.compute_mfccs_for_export(
+            Segment(
+                segment.file_path,
+                segment.begin + window_start * frame_shift,
+                window_end,
+                segment.channel,
+            ),
+            compress=False,
+        )
+        core_offset = chunk_start - window_start
+        energy = feats.numpy()[core_offset : core_offset + chunk_frames, 0]
+        num_frames = energy.shape[0]
+        if num_frames == 0:
+            break
+        energy_sum += float(energy.sum())
+        energy_count += num_frames
+        vad_computer = VadComputer(
+            energy_threshold=energy_threshold + energy_mean_scale * energy_sum / energy_count,
+            energy_mean_scale=0.0,
+            **vad_options,
         )
-        new_segments.append(seg)
-    return new_segments
+        vad = vad_computer.compute_vad(feats).numpy()[core_offset : core_offset + num_frames]
+        begins, ends = segmenter.process_frames(vad)
+        yield begins + segment.begin, ends + segment.begin
+        if num_frames < chunk_frames:
+            break
+        chunk_start += chunk_frames
+    begins, ends = segmenter.flush()
+    yield begins + segment.begin, ends + segment.begin
 
 
 class SegmentVadFunction(KaldiFunction):
@@ -391,21 +504,77 @@ class SegmentVadFunction(KaldiFunction):
         while not reader.Done():
             utt_id = reader.Key()
             frames = reader.Value()
-            initial_segments = get_initial_segmentation(
+            begins, ends = get_initial_segmentation_array(
                 frames.numpy(), self.segmentation_options["frame_shift"]
             )
 
-            merged = merge_segments(
-                initial_segments,
+            begins, ends = merge_segments_array(
+                begins,
+                ends,
                 self.segmentation_options["min_pause_duration"],
                 self.segmentation_options["max_segment_length"],
                 self.segmentation_options["min_segment_length"],
             )
-            self.callback((int(utt_id.split("-")[-1]), merged))
+            self.callback((int(utt_id.split("-")[-1]), begins, ends))
             reader.Next()
         reader.Close()
 
 
+class SegmentVadStreamingFunction(KaldiFunction):
+    """
+    Multiprocessing function to generate segments from energy-based VAD computed over
+    audio chunks, so that memory use does not depend on the length of the recordings.
+
+    See Also
+    --------
+    :meth:`montreal_forced_aligner.vad.segmenter.VadSegmenter.segment_vad_streaming`
+        Main function that calls this function in parallel
+    :meth:`montreal_forced_aligner.vad.segmenter.VadSegmenter.segment_vad_streaming_arguments`
+        Job method for generating arguments for this function
+    :func:`~montreal_forced_aligner.vad.multiprocessing.segment_utterance_vad_streaming`
+        Chunked segmentation of a single utterance
+
+    Parameters
+    ----------
+    args: :class:`~montreal_forced_aligner.vad.multiprocessing.SegmentVadStreamingArguments`
+        Arguments for the function
+    """
+
+    def __init__(self, args: SegmentVadStreamingArguments):
+        super().__init__(args)
+        self.mfcc_options = args.mfcc_options
+        self.vad_options = args.vad_options
+        self.segmentation_options = args.segmentation_options
+        self.chunk_duration = args.chunk_duration
+
+    def _run(self):
+        """Run the function"""
+        with self.session() as session:
+            utterances = (
+                session.query(
+                    Utterance.id,
+                    SoundFile.sound_file_path,
+                    Utterance.begin,
+                    Utterance.end,
+                    Utterance.channel,
+                )
+                .join(Utterance.file)
+                .join(File.sound_file)
+                .filter(Utterance.job_id == self.job_name)
+                .order_by(Utterance.kaldi_id)
+                .all()
+            )
+        for utt_id, sound_file_path, begin, end, channel in utterances:
+            for begins, ends in segment_utterance_vad_streaming(
+                Segment(sound_file_path, begin, end, channel),
+                self.mfcc_options,
+                self.vad_options,
+                self.segmentation_options,
+                chunk_duration=self.chunk_duration,
+            ):
+                self.callback((utt_id, begins, ends))
+
+
 class SegmentTranscriptFunction(KaldiFunction):
     """
     Multiprocessing function to segment utterances with transcripts from VAD output.
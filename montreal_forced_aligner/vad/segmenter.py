@@ -7,11 +7,13 @@ from __future__ import annotations
 
 import collections
 import logging
+import math
 import os
 import typing
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 import sqlalchemy
 from kalpy.fstext.lexicon import Pronunciation as KalpyPronunciation
 from sqlalchemy.orm import joinedload, selectinload
@@ -28,6 +30,7 @@ from montreal_forced_aligner.db import (
     Pronunciation,
     Utterance,
     Word,
+    bulk_insert_columns,
     full_load_utterance,
 )
 from montreal_forced_aligner.exceptions import KaldiProcessingError
@@ -42,6 +45,8 @@ from montreal_forced_aligner.vad.multiprocessing import (
     SegmentTranscriptFunction,
     SegmentVadArguments,
     SegmentVadFunction,
+    SegmentVadStreamingArguments,
+    SegmentVadStreamingFunction,
     segment_utterance,
     segment_utterance_transcript,
 )
@@ -112,13 +117,18 @@ class VadSegmenter(
     len_th: float
         If the length of the segment is smaller than len_th, the segments
         will be merged.
+    chunk_duration: float
+        Duration in seconds of audio chunks to read at a time when segmenting, if 0,
+        VAD is computed over features for whole utterances, defaults to 0
     """
 
     def __init__(
         self,
+        chunk_duration: float = 0.0,
         **kwargs,
     ):
         super().__init__(**kwargs)
+        self.chunk_duration = chunk_duration
         self.transcriptions_required = False
 
     @classmethod
@@ -190,6 +200,127 @@ class VadSegmenter(
             for j in self.jobs
         ]
 
+    def segment_vad_streaming_arguments(self) -> List[SegmentVadStreamingArguments]:
+        """
+        Generate Job arguments for :class:`~montreal_forced_aligner.vad.multiprocessing.SegmentVadStreamingFunction`
+
+        Returns
+        -------
+        list[SegmentVadStreamingArguments]
+            Arguments for processing
+        """
+        return [
+            SegmentVadStreamingArguments(
+                j.id,
+                getattr(self, "session" if config.USE_THREADING else "db_string", ""),
+                self.working_log_directory.joinpath(f"segment_vad.{j.id}.log"),
+                self.mfcc_options,
+                self.vad_options,
+                self.segmentation_options,
+                self.chunk_duration,
+            )
+            for j in self.jobs
+        ]
+
+    def generate_features(self) -> None:
+        """
+        Generate features for the corpus, skipped when segmenting over chunks of audio
+        since features are computed for each chunk as it is read
+        """
+        if self.chunk_duration > 0:
+            return
+        super().generate_features()
+
+    def segment_vad_streaming(self) -> None:
+        """
+        Run segmentation based off of VAD computed over chunks of audio, inserting
+        segments as they are finalized so that memory use does not depend on the
+        length of recordings.
+
+        See Also
+        --------
+        :class:`~montreal_forced_aligner.vad.multiprocessing.SegmentVadStreamingFunction`
+            Multiprocessing helper function for each job
+        segment_vad_streaming_arguments
+            Job method for generating arguments for helper function
+        """
+        arguments = self.segment_vad_streaming_arguments()
+        old_utts = []
+        begins = []
+        ends = []
+        speaker_ids = []
+        file_ids = []
+        channels = []
+        num_buffered = 0
+
+        with self.session() as session:
+            utterances = session.query(
+                Utterance.id,
+                Utterance.channel,
+                Utterance.speaker_id,
+                Utterance.file_id,
+                Utterance.duration,
+            )
+            utterance_cache = {}
+            total_count = 0
+            for u_id, channel, speaker_id, file_id, duration in utterances:
+                utterance_cache[u_id] = (channel, speaker_id, file_id)
+                total_count += math.ceil(duration / self.chunk_duration) + 1
+            for utt, segment_begins, segment_ends in run_kaldi_function(
+                SegmentVadStreamingFunction, arguments, total_count=total_count
+            ):
+                old_utts.append(utt)
+                num_segments = segment_begins.shape[0]
+                if not num_segments:
+                    continue
+                channel, speaker_id, file_id = utterance_cache[utt]
+                begins.append(segment_begins)
+                ends.append(segment_ends)
+                speaker_ids.append(np.full(num_segments, speaker_id, dtype=np.int64))
+                file_ids.append(np.full(num_segments, file_id, dtype=np.int64))
+                channels.append(np.full(num_segments, channel, dtype=np.int64))
+                num_buffered += num_segments
+                if num_buffered < 1000:
+                    continue
+                # Original utterances are replaced in the same transaction as their segments
+                session.query(Utterance).filter(Utterance.id.in_(old_utts)).delete()
+                self._insert_segments(session, begins, ends, speaker_ids, file_ids, channels)
+                session.commit()
+                old_utts, begins, ends, speaker_ids, file_ids, channels = [], [], [], [], [], []
+                num_buffered = 0
+            if old_utts:
+                session.query(Utterance).filter(Utterance.id.in_(old_utts)).delete()
+            if begins:
+                self._insert_segments(session, begins, ends, speaker_ids, file_ids, channels)
+            session.commit()
+
+    @staticmethod
+    def _insert_segments(
+        session: sqlalchemy.orm.Session,
+        begins: List[np.ndarray],
+        ends: List[np.ndarray],
+        speaker_ids: List[np.ndarray],
+        file_ids: List[np.ndarray],
+        channels: List[np.ndarray],
+    ) -> None:
+        bulk_insert_columns(
+            session,
+            Utterance,
+            {
+                "begin": np.concatenate(begins),
+                "end": np.concatenate(ends),
+                "text": "speech",
+                "speaker_id": np.concatenate(speaker_ids),
+                "file_id": np.concatenate(file_ids),
+                "oovs": "",
+                "normalized_text": "",
+                "features": "",
+                "in_subset": False,
+                "ignored": False,
+                "channel": np.concatenate(channels),
+            },
+        )
+
     def segment_vad(self) -> None:
         """
         Run segmentation based off of VAD.
@@ -204,7 +335,11 @@ class VadSegmenter(
 
         arguments = self.segment_vad_arguments()
         old_utts = set()
-        new_utts = []
+        begins = []
+        ends = []
+        speaker_ids = []
+        file_ids = []
+        channels = []
 
         with self.session() as session:
             utterances = session.query(
@@ -213,31 +348,20 @@ class VadSegmenter(
             utterance_cache = {}
             for u_id, channel, speaker_id, file_id in utterances:
                 utterance_cache[u_id] = (channel, speaker_id, file_id)
-            for utt, segments in run_kaldi_function(
+            for utt, segment_begins, segment_ends in run_kaldi_function(
                 SegmentVadFunction, arguments, total_count=self.num_utterances
             ):
                 old_utts.add(utt)
                 channel, speaker_id, file_id = utterance_cache[utt]
-                for seg in segments:
-                    new_utts.append(
-                        {
-                            "begin": seg.begin,
-                            "end": seg.end,
-                            "text": "speech",
-                            "speaker_id": speaker_id,
-                            "file_id": file_id,
-                            "oovs": "",
-                            "normalized_text": "",
-                            "features": "",
-                            "in_subset": False,
-                            "ignored": False,
-                            "channel": channel,
-                        }
-                    )
+                num_segments = segment_begins.shape[0]
+                begins.append(segment_begins)
+                ends.append(segment_ends)
+                speaker_ids.append(np.full(num_segments, speaker_id, dtype=np.int64))
+                file_ids.append(np.full(num_segments, file_id, dtype=np.int64))
+                channels.append(np.full(num_segments, channel, dtype=np.int64))
             session.query(Utterance).filter(Utterance.id.in_(old_utts)).delete()
-            session.bulk_insert_mappings(
-                Utterance, new_utts, return_defaults=False, render_nulls=True
-            )
+            if begins:
+                self._insert_segments(session, begins, ends, speaker_ids, file_ids, channels)
             session.commit()
 
     def setup(self) -> None:
@@ -270,8 +394,11 @@ class VadSegmenter(
             logger.info("Segmentation already done, skipping.")
             return
         try:
-            self.compute_vad()
-            self.segment_vad()
+            if self.chunk_duration > 0:
+                self.segment_vad_streaming()
+            else:
+                self.compute_vad()
+                self.segment_vad()
             with self.session() as session:
                 session.query(CorpusWorkflow).filter(CorpusWorkflow.id == wf.id).update(
                     {"done": True}
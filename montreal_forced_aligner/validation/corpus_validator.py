@@ -4,14 +4,18 @@ Validating corpora
 """
 from __future__ import annotations
 
+import json
 import logging
+import math
 import os
+import shutil
 import time
 import typing
 from decimal import Decimal
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+import numpy as np
 import sqlalchemy
 
 from montreal_forced_aligner.acoustic_modeling.trainer import TrainableAligner
@@ -26,11 +30,91 @@ if TYPE_CHECKING:
     from montreal_forced_aligner.abc import MetaDict
 
 
-__all__ = ["TrainingValidator", "PretrainedValidator"]
+__all__ = [
+    "TrainingValidator",
+    "PretrainedValidator",
+    "wilson_interval",
+    "ratio_confidence_interval",
+]
 
 logger = logging.getLogger("mfa")
 
 
+def wilson_interval(successes: int, total: int, z: float = 1.96) -> typing.Tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion
+
+    Parameters
+    ----------
+    successes: int
+        Number of successes
+    total: int
+        Number of trials
+    z: float
+        Standard normal quantile of the interval, defaults to 1.96 for 95% confidence
+
+    Returns
+    -------
+    float
+        Lower bound
+    float
+        Upper bound
+    """
+    if total == 0:
+        return 0.0, 1.0
+    p = successes / total
+    denominator = 1 + z**2 / total
+    center = (p + z**2 / (2 * total)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / total + z**2 / (4 * total**2)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def ratio_confidence_interval(
+    errors: np.ndarray,
+    lengths: np.ndarray,
+    population_size: typing.Optional[int] = None,
+    z: float = 1.96,
+) -> typing.Tuple[float, float, float]:
+    """
+    Estimate an error rate pooled over sampled utterances, like word error rate, with a normal
+    approximation confidence interval from the linearized variance of the ratio estimator
+
+    Parameters
+    ----------
+    errors: :class:`numpy.ndarray`
+        Number of errors per sampled utterance
+    lengths: :class:`numpy.ndarray`
+        Number of reference units per sampled utterance
+    population_size: int, optional
+        Number of utterances the sample was drawn from, for the finite population correction
+    z: float
+        Standard normal quantile of the interval, defaults to 1.96 for 95% confidence
+
+    Returns
+    -------
+    float
+        Estimated error rate
+    float
+        Lower bound
+    float
+        Upper bound
+    """
+    errors = np.asarray(errors, dtype=np.float64)
+    lengths = np.asarray(lengths, dtype=np.float64)
+    n = errors.shape[0]
+    if n == 0 or lengths.sum() == 0:
+        return 0.0, 0.0, 0.0
+    rate = float(errors.sum() / lengths.sum())
+    if n < 2:
+        return rate, rate, rate
+    residuals = errors - rate * lengths
+    variance = (residuals**2).sum() / (n - 1) / n / lengths.mean() ** 2
+    if population_size:
+        variance *= max(0.0, 1 - n / population_size)
+    margin = z * math.sqrt(variance)
+    return rate, max(0.0, rate - margin), rate + margin
+
+
 class ValidationMixin:
     """
     Mixin class for performing validation on a corpus
@@ -45,6 +129,12 @@ class ValidationMixin:
         Flag for whether alignments should be compared to a phone-based system
     target_num_ngrams: int
         Target number of ngrams from speaker models to use
+    validation_sample_size: int
+        Number of randomly sampled utterances to test transcriptions on, defaults to 0 to test
+        every utterance
+    validation_time_budget: float
+        Approximate number of seconds to spend testing transcriptions, used to pick the sample
+        size from the speed of the preceding alignment, defaults to 0 for no budget
 
     See Also
     --------
@@ -60,6 +150,8 @@ class ValidationMixin:
         target_num_ngrams: int = 100,
         order: int = 3,
         method: str = "kneser_ney",
+        validation_sample_size: int = 0,
+        validation_time_budget: float = 0.0,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -68,36 +160,133 @@ class ValidationMixin:
         self.target_num_ngrams = target_num_ngrams
         self.order = order
         self.method = method
+        self.validation_sample_size = validation_sample_size
+        self.validation_time_budget = validation_time_budget
+        self.validation_statistics: typing.Dict[str, typing.Any] = {}
+
+    decoding_cost_ratio = 5.0
+    """Approximate ratio of per-speaker language model decoding time to alignment time"""
 
     @property
     def working_log_directory(self) -> str:
         """Working log directory"""
         return self.working_directory.joinpath("log")
 
-    def analyze_setup(self, output_directory: Path = None) -> None:
+    def collect_validation_statistics(self, output_directory: Path = None) -> None:
         """
-        Analyzes the setup process and outputs info to the console
+        Collect corpus statistics and per-utterance issues in a single pass over the database,
+        streaming OOV and missing feature reports to disk as utterances are read
 
         Parameters
         ----------
         output_directory: Path, optional
             Optional directory to save output files in
         """
+        if output_directory is None:
+            output_directory = self.output_directory
+        os.makedirs(output_directory, exist_ok=True)
         begin = time.time()
-
+        statistics = {
+            "num_oov_utterances": 0,
+            "num_oov_tokens": 0,
+            "num_missing_feature_utterances": 0,
+        }
         with self.session() as session:
-            sound_file_count = session.query(SoundFile).count()
-            text_file_count = session.query(TextFile).count()
-            total_duration = session.query(sqlalchemy.func.sum(Utterance.duration)).scalar()
+            sound_file_count, text_file_count, total_duration = session.query(
+                session.query(sqlalchemy.func.count(SoundFile.file_id)).scalar_subquery(),
+                session.query(sqlalchemy.func.count(TextFile.file_id)).scalar_subquery(),
+                session.query(sqlalchemy.func.sum(Utterance.duration)).scalar_subquery(),
+            ).one()
+            statistics["num_sound_files"] = sound_file_count
+            statistics["num_text_files"] = text_file_count
+            statistics["total_duration"] = float(total_duration or 0)
+            condition = sqlalchemy.and_(Utterance.oovs != None, Utterance.oovs != "")  # noqa
+            if not self.ignore_acoustics:
+                condition = sqlalchemy.or_(condition, Utterance.ignored == True)  # noqa
+            utterances = (
+                session.query(
+                    File.name,
+                    File.relative_path,
+                    Speaker.name,
+                    Utterance.begin,
+                    Utterance.end,
+                    Utterance.oovs,
+                    Utterance.ignored,
+                )
+                .join(Utterance.file)
+                .join(Utterance.speaker)
+                .filter(condition)
+                .order_by(Utterance.id)
+            )
+            with mfa_open(
+                output_directory.joinpath("utterance_oovs.txt"), "w"
+            ) as oov_file, mfa_open(
+                output_directory.joinpath("missing_features.csv"), "w"
+            ) as feature_file:
+                for (
+                    file_name,
+                    relative_path,
+                    speaker_name,
+                    begin,
+                    end,
+                    oovs,
+                    ignored,
+                ) in utterances.yield_per(10000):
+                    path = relative_path.joinpath(file_name)
+                    if oovs:
+                        statistics["num_oov_utterances"] += 1
+                        statistics["num_oov_tokens"] += len(oovs)
+                        oov_file.write(
+                            f"{path}, {speaker_name}: {begin}-{end}: {', '.join(oovs)}\n"
+                        )
+                        self.oovs_found.update(oovs)
+                    if ignored and not self.ignore_acoustics:
+                        statistics["num_missing_feature_utterances"] += 1
+                        feature_file.write(f"{path},{begin},{end}\n")
+        statistics["num_oov_types"] = len(self.oovs_found)
+        self.validation_statistics.update(statistics)
+        logger.debug(f"Collecting validation statistics took {time.time() - begin:.3f} seconds")
+
+    def export_validation_summary(self, output_directory: Path = None) -> None:
+        """
+        Save collected validation statistics and error rate estimates to "validation_summary.json"
 
-        total_duration = Decimal(str(total_duration)).quantize(Decimal("0.001"))
-        logger.debug(f"Duration calculation took {time.time() - begin:.3f} seconds")
+        Parameters
+        ----------
+        output_directory: Path, optional
+            Optional directory to save output files in
+        """
+        if output_directory is None:
+            output_directory = self.output_directory
+        os.makedirs(output_directory, exist_ok=True)
+        summary = {
+            "num_speakers": self.num_speakers,
+            "num_utterances": self.num_utterances,
+            "num_sound_file_errors": len(self.sound_file_errors),
+            "num_files_without_transcriptions": len(self.no_transcription_files),
+            "num_transcriptions_without_sound_files": len(self.transcriptions_without_wavs),
+            "num_textgrid_read_errors": len(self.textgrid_read_errors),
+            "num_text_decode_errors": len(self.decode_error_files),
+            **self.validation_statistics,
+        }
+        with mfa_open(output_directory.joinpath("validation_summary.json"), "w") as f:
+            json.dump(summary, f, indent=2)
 
-        begin = time.time()
-        ignored_count = len(self.no_transcription_files)
-        ignored_count += len(self.textgrid_read_errors)
-        ignored_count += len(self.decode_error_files)
-        logger.debug(f"Ignored count calculation took {time.time() - begin:.3f} seconds")
+    def analyze_setup(self, output_directory: Path = None) -> None:
+        """
+        Analyzes the setup process and outputs info to the console
+
+        Parameters
+        ----------
+        output_directory: Path, optional
+            Optional directory to save output files in
+        """
+        self.collect_validation_statistics(output_directory=output_directory)
+        sound_file_count = self.validation_statistics["num_sound_files"]
+        text_file_count = self.validation_statistics["num_text_files"]
+        total_duration = Decimal(str(self.validation_statistics["total_duration"])).quantize(
+            Decimal("0.001")
+        )
 
         logger.info("Corpus")
         logger.info(f"{sound_file_count} sound files")
@@ -114,18 +303,19 @@ class ValidationMixin:
         logger.info(f"{self.num_speakers} speakers")
         logger.info(f"{self.num_utterances} utterances")
         logger.info(f"{total_duration} seconds total duration")
-        self.analyze_wav_errors()
-        self.analyze_missing_features()
-        self.analyze_files_with_no_transcription()
-        self.analyze_transcriptions_with_no_wavs()
+        self.analyze_wav_errors(output_directory=output_directory)
+        self.analyze_missing_features(output_directory=output_directory)
+        self.analyze_files_with_no_transcription(output_directory=output_directory)
+        self.analyze_transcriptions_with_no_wavs(output_directory=output_directory)
 
         if len(self.decode_error_files):
-            self.analyze_unreadable_text_files()
+            self.analyze_unreadable_text_files(output_directory=output_directory)
         if len(self.textgrid_read_errors):
-            self.analyze_textgrid_read_errors()
+            self.analyze_textgrid_read_errors(output_directory=output_directory)
 
         logger.info("Dictionary")
         self.analyze_oovs(output_directory=output_directory)
+        self.export_validation_summary(output_directory)
 
     def analyze_oovs(self, output_directory: Path = None) -> None:
         """
@@ -143,33 +333,13 @@ class ValidationMixin:
         oov_path = os.path.join(output_directory, "oovs_found.txt")
         utterance_oov_path = os.path.join(output_directory, "utterance_oovs.txt")
 
-        total_instances = 0
-        with mfa_open(utterance_oov_path, "w") as f, self.session() as session:
-            utterances = (
-                session.query(
-                    File.name,
-                    File.relative_path,
-                    Speaker.name,
-                    Utterance.begin,
-                    Utterance.end,
-                    Utterance.oovs,
-                )
-                .join(Utterance.file)
-                .join(Utterance.speaker)
-                .filter(Utterance.oovs != None)  # noqa
-                .filter(Utterance.oovs != "")
-            )
-
-            for file_name, relative_path, speaker_name, begin, end, oovs in utterances:
-                total_instances += len(oovs)
-                f.write(
-                    f"{relative_path.joinpath(file_name)}, {speaker_name}: {begin}-{end}: {', '.join(oovs)}\n"
-                )
-                self.oovs_found.update(oovs)
+        if "num_oov_tokens" not in self.validation_statistics:
+            self.collect_validation_statistics(output_directory=output_directory)
+        total_instances = self.validation_statistics["num_oov_tokens"]
         if self.oovs_found:
             self.save_oovs_found(output_directory)
             logger.warning(f"{len(self.oovs_found)} OOV word types")
-            logger.warning(f"{total_instances}total OOV tokens")
+            logger.warning(f"{total_instances} total OOV tokens")
             logger.warning(
                 f"For a full list of the word types, please see: {oov_path}. "
                 f"For a by-utterance breakdown of missing words, see: {utterance_oov_path}"
@@ -226,24 +396,17 @@ class ValidationMixin:
         if output_directory is None:
             output_directory = self.output_directory
         os.makedirs(output_directory, exist_ok=True)
-        with self.session() as session:
-            utterances = (
-                session.query(File.name, File.relative_path, Utterance.begin, Utterance.end)
-                .join(Utterance.file)
-                .filter(Utterance.ignored == True)  # noqa
+        if "num_missing_feature_utterances" not in self.validation_statistics:
+            self.collect_validation_statistics(output_directory=output_directory)
+        num_missing = self.validation_statistics["num_missing_feature_utterances"]
+        if num_missing:
+            path = os.path.join(output_directory, "missing_features.csv")
+            logger.error(
+                f"There were {num_missing} utterances missing features. "
+                f"Please see {path} for a list."
             )
-            if utterances.count():
-                path = os.path.join(output_directory, "missing_features.csv")
-                with mfa_open(path, "w") as f:
-                    for file_name, relative_path, begin, end in utterances:
-                        f.write(f"{relative_path.joinpath(file_name)},{begin},{end}\n")
-
-                logger.error(
-                    f"There were {utterances.count()} utterances missing features. "
-                    f"Please see {path} for a list."
-                )
-            else:
-                logger.info("There were no utterances missing features.")
+        else:
+            logger.info("There were no utterances missing features.")
 
     def analyze_files_with_no_transcription(self, output_directory: Path = None) -> None:
         """
@@ -351,11 +514,166 @@ class ValidationMixin:
         else:
             logger.info("There were no issues reading text files.")
 
+    @property
+    def transcription_test_sample_size(self) -> int:
+        """
+        Number of utterances to test transcriptions on, based on
+        :attr:`~montreal_forced_aligner.validation.corpus_validator.ValidationMixin.validation_sample_size`
+        and :attr:`~montreal_forced_aligner.validation.corpus_validator.ValidationMixin.validation_time_budget`,
+        0 if every utterance should be tested
+        """
+        sample_size = self.validation_sample_size
+        if self.validation_time_budget > 0:
+            if self.alignment_seconds_per_utterance:
+                budget_size = max(
+                    1,
+                    int(
+                        self.validation_time_budget
+                        / (self.alignment_seconds_per_utterance * self.decoding_cost_ratio)
+                    ),
+                )
+                if not sample_size or budget_size < sample_size:
+                    sample_size = budget_size
+            else:
+                logger.warning(
+                    "Could not estimate decoding speed for the time budget, "
+                    "testing transcriptions without a time budget."
+                )
+        if sample_size >= self.num_utterances:
+            return 0
+        return sample_size
+
+    def create_validation_sample(self, sample_size: int) -> None:
+        """
+        Select a random sample of utterances with transcripts and features as the current subset
+        and export their Kaldi files
+
+        Parameters
+        ----------
+        sample_size: int
+            Number of utterances to sample
+        """
+        logger.info(f"Sampling {sample_size} utterances for testing transcriptions...")
+        with self.session() as session:
+            session.query(Utterance).filter(Utterance.in_subset == True).update(  # noqa
+                {Utterance.in_subset: False}
+            )
+            sample = (
+                sqlalchemy.select(Utterance.id)
+                .where(Utterance.ignored == False)  # noqa
+                .where(Utterance.normalized_text != None)  # noqa
+                .where(Utterance.normalized_text != "")
+                .order_by(sqlalchemy.func.random())
+                .limit(sample_size)
+                .scalar_subquery()
+            )
+            session.execute(
+                sqlalchemy.update(Utterance)
+                .execution_options(synchronize_session="fetch")
+                .values(in_subset=True)
+                .where(Utterance.id.in_(sample))
+            )
+            session.query(Corpus).update(
+                {Corpus.current_subset: sample_size, Corpus.validation_sample: True}
+            )
+            session.commit()
+        sample_directory = self.corpus_output_directory.joinpath(
+            f"validation_sample_{sample_size}"
+        )
+        shutil.rmtree(sample_directory, ignore_errors=True)
+        sample_directory.joinpath("log").mkdir(parents=True, exist_ok=True)
+        self.export_subset_files(sample_directory, sample_size)
+
+    def remove_validation_sample(self, sample_size: int) -> None:
+        """
+        Restore the full corpus as the current subset after testing transcriptions on a sample
+
+        Parameters
+        ----------
+        sample_size: int
+            Number of utterances that were sampled
+        """
+        with self.session() as session:
+            session.query(Corpus).update(
+                {Corpus.current_subset: 0, Corpus.validation_sample: False}
+            )
+            session.commit()
+        self._jobs = []
+        shutil.rmtree(
+            self.corpus_output_directory.joinpath(f"validation_sample_{sample_size}"),
+            ignore_errors=True,
+        )
+
+    def estimate_sample_error_rates(self) -> typing.Dict[str, typing.Any]:
+        """
+        Estimate corpus sentence, word and character error rates with 95% confidence intervals
+        from the utterances in the transcription test sample
+
+        Returns
+        -------
+        dict[str, Any]
+            Point estimates and confidence intervals of error rates
+        """
+        with self.session() as session:
+            population_size = (
+                session.query(sqlalchemy.func.count(Utterance.id))
+                .filter(Utterance.ignored == False)  # noqa
+                .filter(Utterance.normalized_text != None)  # noqa
+                .filter(Utterance.normalized_text != "")
+                .scalar()
+            )
+            rows = session.query(
+                Utterance.normalized_text,
+                Utterance.word_error_rate,
+                Utterance.character_error_rate,
+            )
+            rows = rows.filter(Utterance.in_subset == True)  # noqa
+            word_lengths = []
+            character_lengths = []
+            word_error_rates = []
+            character_error_rates = []
+            for normalized_text, word_error_rate, character_error_rate in rows:
+                words = normalized_text.split()
+                word_lengths.append(len(words))
+                character_lengths.append(len("".join(words)))
+                word_error_rates.append(1.0 if word_error_rate is None else word_error_rate)
+                character_error_rates.append(
+                    1.0 if character_error_rate is None else character_error_rate
+                )
+        word_lengths = np.array(word_lengths, dtype=np.float64)
+        character_lengths = np.array(character_lengths, dtype=np.float64)
+        word_error_rates = np.array(word_error_rates, dtype=np.float64)
+        character_error_rates = np.array(character_error_rates, dtype=np.float64)
+        num_incorrect = int(np.count_nonzero(word_error_rates > 0))
+        sample_size = word_lengths.shape[0]
+        ser_interval = wilson_interval(num_incorrect, sample_size)
+        wer, wer_lower, wer_upper = ratio_confidence_interval(
+            word_error_rates * word_lengths, word_lengths, population_size
+        )
+        cer, cer_lower, cer_upper = ratio_confidence_interval(
+            character_error_rates * character_lengths, character_lengths, population_size
+        )
+        return {
+            "sample_size": sample_size,
+            "population_size": population_size,
+            "sentence_error_rate": num_incorrect / sample_size if sample_size else 0.0,
+            "sentence_error_rate_interval": list(ser_interval),
+            "word_error_rate": wer,
+            "word_error_rate_interval": [wer_lower, wer_upper],
+            "character_error_rate": cer,
+            "character_error_rate_interval": [cer_lower, cer_upper],
+        }
+
     def test_utterance_transcriptions(self, output_directory: Path = None) -> None:
         """
         Tests utterance transcriptions with simple unigram models based on the utterance text and frequent
         words in the corpus
 
+        If :attr:`~montreal_forced_aligner.validation.corpus_validator.ValidationMixin.validation_sample_size`
+        or :attr:`~montreal_forced_aligner.validation.corpus_validator.ValidationMixin.validation_time_budget`
+        is set, only a random sample of utterances is decoded and corpus error rates are estimated
+        from it with confidence intervals
+
         Parameters
         ----------
         output_directory: Path, optional
@@ -370,7 +688,10 @@ class ValidationMixin:
         if output_directory is None:
             output_directory = self.output_directory
         os.makedirs(output_directory, exist_ok=True)
+        sample_size = self.transcription_test_sample_size
         try:
+            if sample_size:
+                self.create_validation_sample(sample_size)
             self.subset_lexicon(write_disambiguation=True)
             self.train_speaker_lms()
 
@@ -378,28 +699,47 @@ class ValidationMixin:
 
             logger.info("Test transcriptions")
             ser, wer, cer = self.compute_wer()
-            if ser < 0.3:
-                logger.info(f"{ser * 100:.2f}% sentence error rate")
-            elif ser < 0.8:
-                logger.warning(f"{ser * 100:.2f}% sentence error rate")
-            else:
-                logger.error(f"{ser * 100:.2f}% sentence error rate")
-
-            if wer < 0.25:
-                logger.info(f"{wer * 100:.2f}% word error rate")
-            elif wer < 0.75:
-                logger.warning(f"{wer * 100:.2f}% word error rate")
-            else:
-                logger.error(f"{wer * 100:.2f}% word error rate")
-
-            if cer < 0.25:
-                logger.info(f"{cer * 100:.2f}% character error rate")
-            elif cer < 0.75:
-                logger.warning(f"{cer * 100:.2f}% character error rate")
+            intervals = {}
+            if sample_size:
+                estimates = self.estimate_sample_error_rates()
+                self.validation_statistics["transcription_test"] = estimates
+                ser = estimates["sentence_error_rate"]
+                wer = estimates["word_error_rate"]
+                cer = estimates["character_error_rate"]
+                intervals = {
+                    "sentence": estimates["sentence_error_rate_interval"],
+                    "word": estimates["word_error_rate_interval"],
+                    "character": estimates["character_error_rate_interval"],
+                }
+                logger.info(
+                    f"Estimated from {estimates['sample_size']} of "
+                    f"{estimates['population_size']} utterances"
+                )
             else:
-                logger.error(f"{cer * 100:.2f}% character error rate")
+                self.validation_statistics["transcription_test"] = {
+                    "sample_size": self.num_utterances,
+                    "sentence_error_rate": ser,
+                    "word_error_rate": wer,
+                    "character_error_rate": cer,
+                }
+            for name, rate, thresholds in [
+                ("sentence", ser, (0.3, 0.8)),
+                ("word", wer, (0.25, 0.75)),
+                ("character", cer, (0.25, 0.75)),
+            ]:
+                message = f"{rate * 100:.2f}% {name} error rate"
+                if name in intervals:
+                    lower, upper = intervals[name]
+                    message += f" (95% CI {lower * 100:.2f}%-{upper * 100:.2f}%)"
+                if rate < thresholds[0]:
+                    logger.info(message)
+                elif rate < thresholds[1]:
+                    logger.warning(message)
+                else:
+                    logger.error(message)
 
             self.save_transcription_evaluation(output_directory)
+            self.export_validation_summary(output_directory)
             out_path = os.path.join(output_directory, "transcription_evaluation.csv")
             logger.info(f"See {out_path} for more details.")
 
@@ -408,6 +748,9 @@ class ValidationMixin:
                 log_kaldi_errors(e.error_logs)
                 e.update_log_file()
             raise
+        finally:
+            if sample_size:
+                self.remove_validation_sample(sample_size)
 
 
 class TrainingValidator(TrainableAligner, ValidationMixin):
@@ -5,6 +5,7 @@ import pytest
 import sqlalchemy.orm
 
 from montreal_forced_aligner.acoustic_modeling.trainer import TrainableAligner
+from montreal_forced_aligner.acoustic_modeling.triphone import TriphoneTrainer
 from montreal_forced_aligner.alignment import PretrainedAligner
 from montreal_forced_aligner.db import PhonologicalRule
 
@@ -212,3 +213,31 @@ def test_basic_sat(
     assert a.output_directory.joinpath("sat", "trans.1.1.ark").exists()
     a.cleanup()
     a.clean_working_directory()
+
+
+def test_alignments_reused():
+    trainer = TriphoneTrainer.__new__(TriphoneTrainer)
+    trainer.num_iterations = 35
+    trainer.num_leaves = 2000
+    trainer.realignment_iterations = []
+    trainer.compute_calculated_properties()
+    assert trainer.realignment_iterations == [10, 20, 30]
+    skipped = []
+    for iteration in range(1, trainer.num_iterations + 1):
+        trainer.iteration = iteration
+        if not trainer.alignments_reused:
+            skipped.append(iteration)
+    assert skipped == [9, 19, 29]
+
+    trainer.num_iterations = 6
+    trainer.realignment_iterations = [2, 3, 4, 6]
+    reused = {}
+    for iteration in range(1, trainer.num_iterations + 1):
+        trainer.iteration = iteration
+        reused[iteration] = trainer.alignments_reused
+    assert reused == {1: False, 2: False, 3: False, 4: True, 5: False, 6: True}
+
+
+def test_accumulator_reduction():
+    with pytest.raises(ValueError):
+        TriphoneTrainer(identifier="triphone", worker=None, accumulator_reduction="trees")
@@ -280,3 +280,82 @@ def test_transcript_verification(
                 assert utterance.word_error_rate > 0
 
         print(f"Successful: {successes} of {len(utterances)}")
+
+
+def test_cached_training_graphs(
+    english_dictionary,
+    english_acoustic_model,
+    basic_corpus_dir,
+    test_align_config,
+    db_setup,
+):
+    a = PretrainedAligner(
+        corpus_directory=basic_corpus_dir,
+        dictionary_path=english_dictionary,
+        acoustic_model_path=english_acoustic_model,
+        **test_align_config,
+    )
+    a.setup()
+    a.create_new_current_workflow(WorkflowType.alignment)
+    a.acoustic_model.export_model(a.working_directory)
+    a.cache_training_graphs = False
+    a.compile_train_graphs()
+    uncached = {}
+    for j in a.jobs:
+        for path in j.construct_path_dictionary(a.working_directory, "fsts", "ark").values():
+            if path.exists():
+                uncached[path] = path.read_bytes()
+                path.unlink()
+    assert uncached
+    a.cache_training_graphs = True
+    a.compile_train_graphs()
+    for path, data in uncached.items():
+        assert path.read_bytes() == data
+    a.cleanup()
+    a.clean_working_directory()
+
+
+def test_align_fine_tune(
+    english_dictionary,
+    english_acoustic_model,
+    basic_corpus_dir,
+    test_align_config,
+    db_setup,
+):
+    a = PretrainedAligner(
+        corpus_directory=basic_corpus_dir,
+        dictionary_path=english_dictionary,
+        acoustic_model_path=english_acoustic_model,
+        oov_count_threshold=1,
+        fine_tune=True,
+        **test_align_config,
+    )
+    a.align()
+    frame_shift = round(a.frame_shift / 1000, 3)
+    with a.session() as session:
+        workflow_id = a.current_workflow.id
+        utterances = session.query(Utterance).filter(
+            Utterance.alignment_log_likelihood != None  # noqa
+        )
+        num_checked = 0
+        for utterance in utterances:
+            phone_intervals = (
+                session.query(PhoneInterval.begin, PhoneInterval.end)
+                .filter(
+                    PhoneInterval.utterance_id == utterance.id,
+                    PhoneInterval.workflow_id == workflow_id,
+                )
+                .order_by(PhoneInterval.begin)
+                .all()
+            )
+            assert phone_intervals
+            assert phone_intervals[0][0] >= utterance.begin
+            assert phone_intervals[-1][1] <= utterance.end + frame_shift
+            for begin, end in phone_intervals:
+                assert begin < end
+            for (_, end), (next_begin, _) in zip(phone_intervals, phone_intervals[1:]):
+                assert end == next_begin
+            num_checked += 1
+        assert num_checked > 0
+    a.cleanup()
+    a.clean_working_directory()
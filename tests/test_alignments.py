@@ -0,0 +1,250 @@
+import collections
+import json
+import statistics
+
+import numpy as np
+import pytest
+
+from montreal_forced_aligner import config
+from montreal_forced_aligner.acoustic_modeling.trainer import TrainableAligner
+from montreal_forced_aligner.alignment import PretrainedAligner
+from montreal_forced_aligner.alignment.multiprocessing import (
+    GeneratePronunciationsFunction,
+    PronunciationCountAccumulator,
+    phone_goodness_scores,
+    phone_pdf_weight_matrix,
+)
+from montreal_forced_aligner.data import PhoneType, PronunciationProbabilityCounter
+from montreal_forced_aligner.db import Phone, PhoneInterval, Utterance
+from montreal_forced_aligner.helper import mfa_open
+
+
+def test_pronunciation_count_accumulator():
+    utterances = [
+        [("the", "dh ah"), ("<eps>", "sil"), ("cat", "k ae t")],
+        [("the", "dh iy"), ("cat", "k ae t"), ("<eps>", "sil")],
+        [("cat", "k ae t"), ("the", "dh ah"), ("cat", "k ae t")],
+    ]
+    function = GeneratePronunciationsFunction.__new__(GeneratePronunciationsFunction)
+    function.silence_words = {"<eps>"}
+    expected = PronunciationProbabilityCounter()
+    accumulator = PronunciationCountAccumulator({"<eps>"}, batch_size=8)
+    for word_pronunciations in utterances:
+        expected.add_counts(function._process_pronunciations(word_pronunciations))
+        accumulator.add(word_pronunciations)
+    pronunciations, counts, bigram_rows, bigram_columns, bigram_counts = accumulator.finalize()
+    for i, (w, p) in enumerate(pronunciations):
+        assert counts[:, i].tolist() == [
+            expected.word_pronunciation_counts[w][p],
+            expected.silence_following_counts[(w, p)],
+            expected.non_silence_following_counts[(w, p)],
+            expected.silence_before_counts[(w, p)],
+            expected.non_silence_before_counts[(w, p)],
+        ]
+    bigrams = {
+        (pronunciations[r], pronunciations[c]): n
+        for r, c, n in zip(bigram_rows, bigram_columns, bigram_counts)
+    }
+    assert bigrams == {
+        k: v["silence"] + v["non_silence"] for k, v in expected.ngram_counts.items()
+    }
+
+
+def test_phone_goodness_scores(tmp_path):
+    phone_pdf_counts = {
+        "a_B": {"0": 2, "1": 1},
+        "a_E": {"1": 1, "4": 2},
+        "b": {"2": 3, "0": 1},
+        "c_S": {"3": 4},
+        "sil": {"5": 5},
+    }
+    phone_pdf_counts_path = tmp_path.joinpath("phone_pdf.counts")
+    with open(phone_pdf_counts_path, "w", encoding="utf8") as f:
+        json.dump(phone_pdf_counts, f)
+    phones, weight_matrix = phone_pdf_weight_matrix(phone_pdf_counts_path)
+
+    phone_pdf_mapping = collections.defaultdict(collections.Counter)
+    for phone, pdf_counts in phone_pdf_counts.items():
+        for pdf, count in pdf_counts.items():
+            phone_pdf_mapping[phone.split("_")[0]][int(pdf)] += count
+    assert phones == sorted(phone_pdf_mapping.keys())
+    for phone, pdf_counts in phone_pdf_mapping.items():
+        phone_total = sum(pdf_counts.values())
+        for pdf, count in pdf_counts.items():
+            pdf_counts[pdf] = count / phone_total
+
+    likelihoods = np.random.default_rng(1234).normal(size=(20, 6))
+    phone_likes = np.asarray(likelihoods @ weight_matrix)
+    expected_likes = np.zeros((likelihoods.shape[0], len(phones)))
+    for i, phone in enumerate(phones):
+        like = likelihoods[:, list(phone_pdf_mapping[phone].keys())]
+        weight = np.array(list(phone_pdf_mapping[phone].values()))
+        expected_likes[:, i] = np.dot(like, weight)
+    assert np.allclose(phone_likes, expected_likes)
+
+    intervals = [("a", 0, 3), ("b", 3, 4), ("c", 4, 11), ("a", 11, 16), ("b", 16, 25)]
+    top_phone_inds = np.argmax(expected_likes, axis=1)
+    expected = []
+    for phone, frame_begin, frame_end in intervals:
+        scores = []
+        for i in range(frame_begin, min(frame_end, likelihoods.shape[0])):
+            if phones[top_phone_inds[i]] == phone:
+                scores.append(0)
+            else:
+                scores.append(
+                    expected_likes[i, top_phone_inds[i]] - expected_likes[i, phones.index(phone)]
+                )
+        expected.append(statistics.mean(scores))
+    goodness = phone_goodness_scores(
+        phone_likes,
+        np.array([x[1] for x in intervals]),
+        np.array([x[2] for x in intervals]),
+        np.array([phones.index(x[0]) for x in intervals]),
+    )
+    assert np.allclose(goodness, expected)
+
+
+def test_analyze_alignment_archives(
+    english_dictionary,
+    english_acoustic_model,
+    basic_corpus_dir,
+    test_align_config,
+    db_setup,
+):
+    a = PretrainedAligner(
+        corpus_directory=basic_corpus_dir,
+        dictionary_path=english_dictionary,
+        acoustic_model_path=english_acoustic_model,
+        oov_count_threshold=1,
+        **test_align_config,
+    )
+    a.align()
+    a.analyze_alignments()
+    with a.session() as session:
+        mean_durations = dict(
+            session.query(Phone.id, Phone.mean_duration).filter(
+                Phone.phone_type == PhoneType.non_silence, Phone.mean_duration != None  # noqa
+            )
+        )
+        duration_deviations = dict(
+            session.query(Utterance.id, Utterance.duration_deviation).filter(
+                Utterance.duration_deviation != None  # noqa
+            )
+        )
+        session.query(Phone).update({Phone.mean_duration: None, Phone.sd_duration: None})
+        session.query(Utterance).update({Utterance.duration_deviation: None})
+        session.commit()
+    assert mean_durations
+    assert duration_deviations
+
+    a.analyze_alignment_archives()
+    with a.session() as session:
+        assert dict(
+            session.query(Phone.id, Phone.mean_duration).filter(
+                Phone.phone_type == PhoneType.non_silence,
+                Phone.mean_duration != None,  # noqa
+            )
+        ) == pytest.approx(mean_durations, abs=1e-3)
+        assert dict(
+            session.query(Utterance.id, Utterance.duration_deviation).filter(
+                Utterance.duration_deviation != None  # noqa
+            )
+        ) == pytest.approx(duration_deviations, abs=1e-3)
+    a.cleanup()
+    a.clean_working_directory()
+
+
+def test_analyze_alignments_sqlite(
+    english_dictionary,
+    english_acoustic_model,
+    basic_corpus_dir,
+    test_align_config,
+    db_setup,
+):
+    use_postgres = config.USE_POSTGRES
+    config.USE_POSTGRES = False
+    try:
+        a = PretrainedAligner(
+            corpus_directory=basic_corpus_dir,
+            dictionary_path=english_dictionary,
+            acoustic_model_path=english_acoustic_model,
+            oov_count_threshold=1,
+            **test_align_config,
+        )
+        a.align()
+        assert a.db_string.startswith("sqlite")
+        a.analyze_alignments()
+        with a.session() as session:
+            phones = {
+                p_id: (mean_duration, sd_duration)
+                for p_id, mean_duration, sd_duration in session.query(
+                    Phone.id, Phone.mean_duration, Phone.sd_duration
+                ).filter(
+                    Phone.phone_type == PhoneType.non_silence,
+                    Phone.sd_duration != None,  # noqa
+                    Phone.sd_duration != 0,
+                )
+            }
+            assert phones
+            expected = {}
+            query = session.query(
+                PhoneInterval.utterance_id, PhoneInterval.phone_id, PhoneInterval.duration
+            ).filter(
+                PhoneInterval.workflow_id == a.current_workflow.id,
+                PhoneInterval.phone_id.in_(list(phones.keys())),
+            )
+            for u_id, p_id, duration in query:
+                mean_duration, sd_duration = phones[p_id]
+                z_score = abs((duration - mean_duration) / sd_duration)
+                expected[u_id] = max(expected.get(u_id, 0), z_score)
+            duration_deviations = dict(
+                session.query(Utterance.id, Utterance.duration_deviation).filter(
+                    Utterance.duration_deviation != None,  # noqa
+                    Utterance.speech_log_likelihood != None,  # noqa
+                )
+            )
+            assert duration_deviations == pytest.approx(expected)
+        assert a.working_directory.joinpath("alignment_analysis.csv").exists()
+        a.cleanup()
+        a.clean_working_directory()
+    finally:
+        config.USE_POSTGRES = use_postgres
+
+
+def test_quality_check_subset(basic_dict_path, basic_corpus_dir, mono_train_config_path, db_setup):
+    from kalpy.gmm.data import AlignmentArchive
+
+    a = TrainableAligner(
+        corpus_directory=basic_corpus_dir,
+        dictionary_path=basic_dict_path,
+        **TrainableAligner.parse_parameters(mono_train_config_path),
+    )
+    a.train()
+    a.current_subset = 3
+    a.subset_directory(a.current_subset)
+    with a.session() as session:
+        utterance = session.query(Utterance).filter(Utterance.in_subset == True).first()  # noqa
+        utterance.duration_deviation = 100
+        kaldi_id = utterance.kaldi_id
+        utterance_id = utterance.id
+        session.commit()
+
+    a.quality_check_subset()
+    with a.session() as session:
+        assert not session.get(Utterance, utterance_id).in_subset
+    for j in a.jobs:
+        for dict_id, ali_path in j.construct_path_dictionary(
+            a.working_directory, "ali", "ark"
+        ).items():
+            if not ali_path.exists():
+                continue
+            alignment_archive = AlignmentArchive(ali_path)
+            assert kaldi_id not in {x.utterance_id for x in alignment_archive}
+            del alignment_archive
+            feat_path = j.construct_path(
+                j.corpus.current_subset_directory, "feats", "scp", dictionary_id=dict_id
+            )
+            with mfa_open(feat_path, "r") as feat_file:
+                assert kaldi_id not in {line.split(maxsplit=1)[0] for line in feat_file}
+    a.cleanup()
+    a.clean_working_directory()
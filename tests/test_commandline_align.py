@@ -5,6 +5,7 @@ import click.testing
 import pytest
 from praatio import textgrid as tgio
 
+from montreal_forced_aligner import config
 from montreal_forced_aligner.command_line.mfa import mfa_cli
 
 
@@ -247,6 +248,62 @@ def test_align_single_speaker(
         assert os.path.exists(path)
 
 
+def test_align_pipeline_report(
+    basic_corpus_dir,
+    generated_dir,
+    english_dictionary,
+    temp_dir,
+    basic_align_config_path,
+    english_acoustic_model,
+    db_setup,
+):
+    output_directory = generated_dir.joinpath("basic_align_output")
+    command = [
+        "align",
+        basic_corpus_dir,
+        english_dictionary,
+        english_acoustic_model,
+        output_directory,
+        "--config_path",
+        basic_align_config_path,
+        "-q",
+        "--clean",
+        "--debug",
+        "--pipeline_report",
+        "--prometheus_report",
+        "-p",
+        "test",
+    ]
+    command = [str(x) for x in command]
+    try:
+        result = click.testing.CliRunner(mix_stderr=False).invoke(
+            mfa_cli, command, catch_exceptions=True
+        )
+    finally:
+        config.PIPELINE_REPORT = False
+        config.PROMETHEUS_REPORT = False
+    print(result.stdout)
+    print(result.stderr)
+    if result.exception:
+        print(result.exc_info)
+        raise result.exception
+    assert not result.return_value
+
+    report_path = temp_dir.joinpath(basic_corpus_dir.name, "pipeline_report.json")
+    assert report_path.exists()
+    assert report_path.with_suffix(".prom").exists()
+    with open(report_path, encoding="utf8") as f:
+        report = json.load(f)
+    stages = {(x["category"], x["name"]) for x in report["stages"]}
+    assert ("stage", "align") in stages
+    assert ("stage", "collect_alignments") in stages
+    assert ("stage", "export_files") in stages
+    assert ("kaldi_function", "AlignFunction") in stages
+    align_function = report["summary"]["kaldi_function:AlignFunction"]
+    assert align_function["num_items"] > 0
+    assert align_function["items_per_second"] > 0
+
+
 def test_align_duplicated(
     duplicated_name_corpus_dir,
     generated_dir,
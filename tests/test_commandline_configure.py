@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 
 import click.testing
 
@@ -56,3 +58,16 @@ def test_configure(
     config.VERBOSE = True
     config.USE_MP = False
     config.TEMPORARY_DIRECTORY = temp_dir
+
+
+def test_lazy_command_loading():
+    code = (
+        "import sys\n"
+        "from montreal_forced_aligner.command_line.mfa import mfa_cli\n"
+        "assert 'align' in mfa_cli.list_commands(None)\n"
+        "mfa_cli.get_command(None, 'configure')\n"
+        "heavy = ['montreal_forced_aligner.db', 'montreal_forced_aligner.command_line.align', 'librosa']\n"
+        "loaded = [m for m in heavy if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
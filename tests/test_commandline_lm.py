@@ -3,6 +3,7 @@ import os
 import click.testing
 
 from montreal_forced_aligner.command_line.mfa import mfa_cli
+from montreal_forced_aligner.models import LanguageModel
 
 
 def test_train_lm(
@@ -22,6 +23,7 @@ def test_train_lm(
         basic_train_lm_config_path,
         "-q",
         "--clean",
+        "--per_utterance_perplexity",
     ]
     command = [str(x) for x in command]
     result = click.testing.CliRunner(mix_stderr=False).invoke(
@@ -34,6 +36,9 @@ def test_train_lm(
         raise result.exception
     assert not result.return_value
     assert os.path.exists(output_model_path)
+    evaluation = LanguageModel(output_model_path).meta["evaluation_training"]
+    for name in ["large", "medium", "small"]:
+        assert evaluation[f"{name}_perplexity"] > 0
 
 
 def test_train_lm_text(
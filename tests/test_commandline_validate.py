@@ -1,3 +1,5 @@
+import json
+
 import click.testing
 
 from montreal_forced_aligner.command_line.mfa import mfa_cli
@@ -38,6 +40,51 @@ def test_validate_corpus(
     assert not result.return_value
 
 
+def test_validate_corpus_sample(
+    multilingual_ipa_tg_corpus_dir,
+    english_mfa_acoustic_model,
+    english_us_mfa_dictionary,
+    generated_dir,
+    temp_dir,
+    db_setup,
+):
+    output_directory = generated_dir.joinpath("validate_sample")
+    command = [
+        "validate",
+        multilingual_ipa_tg_corpus_dir,
+        english_us_mfa_dictionary,
+        "--acoustic_model_path",
+        english_mfa_acoustic_model,
+        "--output_directory",
+        output_directory,
+        "-q",
+        "-s",
+        "4",
+        "--clean",
+        "--no_use_mp",
+        "--test_transcriptions",
+        "--validation_sample_size",
+        "5",
+    ]
+    command = [str(x) for x in command]
+    result = click.testing.CliRunner(mix_stderr=False).invoke(
+        mfa_cli, command, catch_exceptions=True
+    )
+    print(result.stdout)
+    print(result.stderr)
+    if result.exception:
+        print(result.exc_info)
+        raise result.exception
+    assert not result.return_value
+    with open(output_directory.joinpath("validation_summary.json"), encoding="utf8") as f:
+        summary = json.load(f)
+    assert summary["num_sound_files"] > 0
+    estimates = summary["transcription_test"]
+    assert estimates["sample_size"] == 5
+    lower, upper = estimates["word_error_rate_interval"]
+    assert lower <= estimates["word_error_rate"] <= upper
+
+
 def test_validate_training_corpus(
     multilingual_ipa_tg_corpus_dir,
     english_dictionary,
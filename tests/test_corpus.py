@@ -11,7 +11,7 @@ from montreal_forced_aligner.corpus.classes import FileData, UtteranceData
 from montreal_forced_aligner.corpus.helper import get_wav_info
 from montreal_forced_aligner.corpus.text_corpus import DictionaryTextCorpus, TextCorpus
 from montreal_forced_aligner.data import TextFileType, WordType
-from montreal_forced_aligner.db import Word
+from montreal_forced_aligner.db import Utterance, Word
 
 
 def test_mp3(mp3_test_path):
@@ -350,6 +350,16 @@ def test_subset(multilingual_ipa_corpus_dir, generated_dir, db_setup):
     s = corpus.subset_directory(5)
     assert os.path.exists(sd)
     assert os.path.exists(s)
+    with corpus.session() as session:
+        subset_ids = {
+            x for x, in session.query(Utterance.id).filter(Utterance.in_subset == True)  # noqa
+        }
+    assert 0 < len(subset_ids) <= 5
+    corpus.create_subset(5)
+    with corpus.session() as session:
+        assert subset_ids == {
+            x for x, in session.query(Utterance.id).filter(Utterance.in_subset == True)  # noqa
+        }
     corpus.cleanup_connections()
 
 
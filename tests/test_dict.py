@@ -1,7 +1,7 @@
 import shutil
 
 from montreal_forced_aligner import config
-from montreal_forced_aligner.db import Pronunciation
+from montreal_forced_aligner.db import Dictionary, Pronunciation
 from montreal_forced_aligner.dictionary.multispeaker import MultispeakerDictionary
 
 
@@ -236,3 +236,38 @@ def test_vietnamese_tones(vietnamese_dict_path, generated_dir, db_setup):
     assert "o˨˩ˀ" in dictionary.kaldi_grouped_phones["o"]
     assert "o˦˩" in dictionary.kaldi_grouped_phones["o"]
     dictionary.cleanup_connections()
+
+
+def test_lexicon_cache(basic_dict_path, generated_dir, db_setup):
+    output_directory = generated_dir.joinpath("dictionary_tests", "lexicon_cache")
+    config.TEMPORARY_DIRECTORY = output_directory
+    shutil.rmtree(output_directory, ignore_errors=True)
+    dictionary = MultispeakerDictionary(dictionary_path=basic_dict_path)
+    dictionary.dictionary_setup()
+    dictionary.write_lexicon_information()
+    cache_directory = output_directory.joinpath("lexicon_cache")
+    assert len(list(cache_directory.iterdir())) == 1
+    dictionary_id = dictionary.dictionary_lookup["test_basic"]
+    with dictionary.session() as session:
+        d = session.get(Dictionary, dictionary_id)
+        lexicon_fst_path = d.lexicon_fst_path
+    compiled = lexicon_fst_path.read_bytes()
+    lexicon_fst_path.unlink()
+    lexicon_compiler = dictionary.build_lexicon_compiler(dictionary_id)
+    assert lexicon_fst_path.read_bytes() == compiled
+    assert lexicon_compiler.fst.num_states() > 0
+    assert len(list(cache_directory.iterdir())) == 1
+
+    uncached = dictionary.build_lexicon_compiler(dictionary_id, disambiguation=True)
+    assert len(list(cache_directory.iterdir())) == 2
+    cached = dictionary.build_lexicon_compiler(dictionary_id, disambiguation=True)
+    assert cached.max_disambiguation_symbol == uncached.max_disambiguation_symbol
+    assert cached.silence_disambiguation_symbol == uncached.silence_disambiguation_symbol
+    assert cached.silence_disambiguation_symbol != "<eps>"
+    assert cached.phone_table.member(f"#{cached.max_disambiguation_symbol + 2}")
+
+    dictionary.lexicon_cache_size = 2
+    dictionary.silence_probability = 0.3
+    dictionary.build_lexicon_compiler(dictionary_id)
+    assert len(list(cache_directory.iterdir())) == 2
+    dictionary.cleanup_connections()
@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from montreal_forced_aligner import config
+from montreal_forced_aligner.abc import KaldiFunction
+from montreal_forced_aligner.data import MfaArguments
+from montreal_forced_aligner.executor import (
+    GOVERNOR,
+    ExecutionPlan,
+    JobGovernor,
+    StageExecutor,
+    available_cores,
+)
+from montreal_forced_aligner.utils import run_kaldi_function
+
+
+def test_job_governor():
+    class ThreadedFunction(KaldiFunction):
+        releases_gil = True
+
+    class LargeFunction(KaldiFunction):
+        job_memory_mb = float("inf")
+
+    arguments = list(range(max(available_cores(), 2) + 1))
+    governor = JobGovernor()
+    current_config = config.AUTO_EXECUTION, config.USE_THREADING
+    config.AUTO_EXECUTION, config.USE_THREADING = True, False
+    try:
+        plan = governor.plan(ThreadedFunction, arguments)
+        assert plan.use_threading
+        assert plan.max_workers == min(len(arguments), available_cores())
+
+        governor.observe(plan, 10.0, [(0.1, None)] * len(arguments))
+        if plan.max_workers > 1:
+            assert not governor.plan(ThreadedFunction, arguments).use_threading
+
+        plan = governor.plan(LargeFunction, arguments)
+        assert not plan.use_threading
+        assert plan.max_workers == 1
+
+        governor.observe(plan, 1.0, [(1.0, 2.0)] * len(arguments))
+        assert governor.estimate_job_memory(LargeFunction, arguments) == 2.0
+
+        config.AUTO_EXECUTION = False
+        plan = governor.plan(LargeFunction, arguments)
+        assert not plan.use_threading
+        assert plan.max_workers == len(arguments)
+    finally:
+        config.AUTO_EXECUTION, config.USE_THREADING = current_config
+
+
+def test_stage_executor():
+    both_started = threading.Barrier(2, timeout=5)
+
+    def branch(value):
+        both_started.wait()
+        return value * 2
+
+    executor = StageExecutor("test")
+    executor.add_task("source", lambda: 3)
+    executor.add_task("left", branch, inputs=["source"])
+    executor.add_task("right", branch, inputs=["source"])
+    executor.add_task("join", lambda x, y: x + y, inputs=["left", "right"])
+    assert executor.run() == {"source": 3, "left": 6, "right": 6, "join": 12}
+    assert executor.time_saved >= 0
+
+    with pytest.raises(ValueError):
+        executor.add_task("missing", lambda: None, dependencies=["not_added"])
+
+    def fail():
+        raise RuntimeError("failed")
+
+    executor = StageExecutor("test_error")
+    executor.add_task("fail", fail)
+    executor.add_task("after", lambda: None, dependencies=["fail"])
+    with pytest.raises(RuntimeError):
+        executor.run()
+    assert executor.tasks["after"].begin is None
+
+
+def test_run_kaldi_function_pending_jobs(tmp_path):
+    lock = threading.Lock()
+    num_running = [0, 0]
+
+    class CountingFunction(KaldiFunction):
+        def _run(self):
+            with lock:
+                num_running[0] += 1
+                num_running[1] = max(num_running)
+            time.sleep(0.05)
+            with lock:
+                num_running[0] -= 1
+            self.callback(self.job_name)
+
+    arguments = [MfaArguments(i, None, tmp_path.joinpath(f"{i}.log")) for i in range(6)]
+    current_config = config.USE_MP, config.USE_THREADING, config.QUIET
+    config.USE_MP, config.QUIET = True, True
+    GOVERNOR.plan = lambda function, args: ExecutionPlan(function.__name__, True, 2)
+    try:
+        results = sorted(run_kaldi_function(CountingFunction, arguments))
+    finally:
+        del GOVERNOR.plan
+        config.USE_MP, config.USE_THREADING, config.QUIET = current_config
+    assert results == list(range(6))
+    assert num_running[1] <= 2
@@ -1,5 +1,11 @@
 from montreal_forced_aligner.data import CtmInterval
-from montreal_forced_aligner.helper import align_phones, load_evaluation_mapping
+from montreal_forced_aligner.helper import (
+    align_phones,
+    batch_align_phones,
+    batch_edit_distance,
+    edit_distance,
+    load_evaluation_mapping,
+)
 
 
 def test_align_phones(basic_corpus_dir, basic_dict_path, temp_dir, eval_mapping_path):
@@ -96,3 +102,32 @@ def test_align_phones(basic_corpus_dir, basic_dict_path, temp_dir, eval_mapping_
 
     assert score < 1
     assert phone_errors < 1
+
+
+def test_batch_edit_distance():
+    pairs = [
+        (["a", "b", "c"], ["a", "c"]),
+        (["a", "b"], []),
+        ([], ["a"]),
+        (list("kitten"), list("sitting")),
+        (["a"] * 300, ["b"] * 300),
+    ]
+    assert batch_edit_distance(pairs).tolist() == [1, 2, 1, 3, 300]
+    assert [edit_distance(x, y) for x, y in pairs] == [1, 2, 1, 3, 300]
+
+
+def test_batch_align_phones():
+    reference = [
+        CtmInterval(i * 0.1, (i + 1) * 0.1, x) for i, x in enumerate("HH AH L OW".split())
+    ]
+    comparisons = [
+        [CtmInterval(i * 0.1, (i + 1) * 0.1, x) for i, x in enumerate("HH AH L OW".split())],
+        [CtmInterval(i * 0.12, (i + 1) * 0.12, x) for i, x in enumerate("HH EH L OW W".split())],
+        [CtmInterval(0.0, 0.4, "sil")],
+    ]
+    results = batch_align_phones([(reference, c) for c in comparisons], silence_phone="sil")
+    for comparison, result in zip(comparisons, results):
+        assert result == align_phones(reference, comparison, silence_phone="sil")
+    assert results[0][0] == 0
+    assert results[0][1] == 0
+    assert results[1][2] == {("AH", "EH"): 1, ("-", "W"): 1}
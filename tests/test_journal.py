@@ -0,0 +1,69 @@
+from montreal_forced_aligner.journal import JobJournal
+
+
+def test_job_journal(tmp_path):
+    journal_path = tmp_path.joinpath("journal.jsonl")
+    output_path = tmp_path.joinpath("fsts.1.1.ark")
+    output_path.write_bytes(b"graphs")
+    journal = JobJournal(journal_path)
+    step = journal.step("compile_train_graphs")
+    assert not step.is_complete(1)
+    step.complete(1, [output_path])
+    with open(journal_path, "a", encoding="utf8") as f:
+        f.write('{"step": "compile_train_gr')
+
+    journal = JobJournal(journal_path)
+    step = journal.step("compile_train_graphs")
+    assert step.is_complete(1)
+    assert not step.is_complete(2)
+    assert step.skipped_jobs == [1]
+    assert step.outputs(1) == [output_path]
+    assert not journal.step("compile_train_graphs").is_complete(1)
+
+    output_path.write_bytes(b"grapsh")
+    journal = JobJournal(journal_path)
+    assert not journal.step("compile_train_graphs").is_complete(1)
+
+
+def test_job_journal_inputs(tmp_path):
+    journal_path = tmp_path.joinpath("journal.jsonl")
+    model_path = tmp_path.joinpath("final.mdl")
+    model_path.write_bytes(b"model")
+    output_path = tmp_path.joinpath("ali.1.ark")
+    output_path.write_bytes(b"alignments")
+    inputs = {"model": model_path, "beam": 10, "retry_beam": 40}
+    JobJournal(journal_path).step("align", inputs).complete(1, [output_path])
+    assert JobJournal(journal_path).step("align", inputs).is_complete(1)
+    assert not JobJournal(journal_path).step("align").is_complete(1)
+    assert not JobJournal(journal_path).step("align", {**inputs, "beam": 100}).is_complete(1)
+
+    model_path.write_bytes(b"updated model")
+    assert not JobJournal(journal_path).step("align", inputs).is_complete(1)
+
+    JobJournal.delete(tmp_path)
+    assert not journal_path.exists()
+    assert not JobJournal(journal_path).entries
+
+
+def test_job_journal_first_pass_links(tmp_path):
+    from montreal_forced_aligner.alignment.multiprocessing import AlignArguments, AlignFunction
+
+    journal_path = tmp_path.joinpath("journal.jsonl")
+    for identifier in ["ali", "words", "likelihoods"]:
+        first_pass_path = tmp_path.joinpath(f"{identifier}_first_pass.1.1.ark")
+        first_pass_path.write_bytes(b"first pass")
+        tmp_path.joinpath(f"{identifier}.1.1.ark").symlink_to(first_pass_path)
+    arguments = AlignArguments(
+        1, None, tmp_path.joinpath("align.1.log"), tmp_path, None, {}, False, False
+    )
+    outputs = AlignFunction.job_outputs(arguments)
+    assert tmp_path.joinpath("ali.1.1.ark") in outputs
+    assert tmp_path.joinpath("ali_first_pass.1.1.ark") in outputs
+    JobJournal(journal_path).step("align").complete(outputs=outputs)
+    assert JobJournal(journal_path).step("align").is_complete()
+
+    ali_path = tmp_path.joinpath("ali.1.1.ark")
+    ali_path.unlink()
+    ali_path.write_bytes(b"partial")
+    assert tmp_path.joinpath("ali_first_pass.1.1.ark").read_bytes() == b"first pass"
+    assert not JobJournal(journal_path).step("align").is_complete()
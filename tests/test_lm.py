@@ -0,0 +1,43 @@
+from montreal_forced_aligner.data import ArpaNgramModel
+
+
+def test_arpa_read(transcription_language_model_arpa):
+    with open(transcription_language_model_arpa, encoding="utf8") as f:
+        streamed = ArpaNgramModel.read(f)
+    parsed = ArpaNgramModel.read(transcription_language_model_arpa)
+    assert (
+        streamed.num_ngrams
+        == parsed.num_ngrams
+        == {
+            1: 1799,
+            2: 13154,
+            3: 20310,
+        }
+    )
+    assert parsed.vocabulary == streamed.vocabulary
+    for order, history_states in streamed.orders.items():
+        assert list(parsed.orders[order].keys()) == list(history_states.keys())
+    assert parsed._get_prob(("the",), "chapter") == streamed._get_prob(("the",), "chapter")
+
+
+def test_arpa_history_lookups(transcription_language_model_arpa):
+    with open(transcription_language_model_arpa, encoding="utf8") as f:
+        model = ArpaNgramModel.read(f)
+    hist_to_state, state_to_hist = model.history_to_fst_state_mapping(min_order=2)
+    expected_states = [("<s>",)]
+    expected_states.extend(
+        (w,) for w in model.orders[0][()].word_to_prob.keys() if w not in {"<s>", "</s>"}
+    )
+    for order in range(2, len(model.ngrams) + 1):
+        expected_states.extend(model.orders[order].keys())
+    assert state_to_hist == expected_states
+    assert all(hist_to_state[hist] == i for i, hist in enumerate(state_to_hist))
+    for order in range(1, len(model.ngrams) + 1):
+        history_states = model.orders[order]
+        assert model._histories(order) == list(history_states.keys())
+        for hist in list(history_states.keys())[:100]:
+            words, probs, backoff_prob = model._history_state(hist)
+            assert list(zip(words, probs)) == list(history_states[hist].word_to_prob.items())
+            assert backoff_prob == history_states[hist].backoff_prob
+            for word in list(model.orders[0][()].word_to_prob.keys())[:20]:
+                assert model._get_prob(hist, word) > 0
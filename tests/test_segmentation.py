@@ -1,6 +1,14 @@
+import numpy as np
 import pytest
 
 from montreal_forced_aligner.diarization.speaker_diarizer import FOUND_SPEECHBRAIN
+from montreal_forced_aligner.vad.models import (
+    StreamingSegmenter,
+    get_initial_segmentation,
+    get_initial_segmentation_array,
+    merge_segments,
+    merge_segments_array,
+)
 from montreal_forced_aligner.vad.segmenter import TranscriptionSegmenter
 
 
@@ -27,3 +35,53 @@ def test_segment_transcript(
     new_utterances = segmenter.segment_transcript(1)
     assert len(new_utterances) > 0
     segmenter.cleanup()
+
+
+def test_vad_segmentation_arrays():
+    frames = np.array([0, 1, 1, 1, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1])
+    begins, ends = get_initial_segmentation_array(frames, 0.1)
+    assert np.allclose(begins, [0.1, 0.6, 1.6])
+    assert np.allclose(ends, [0.3, 0.7, 2.0])
+    intervals = get_initial_segmentation(frames, 0.1)
+    assert [(x.begin, x.end) for x in intervals] == list(zip(begins.tolist(), ends.tolist()))
+
+    merged_begins, merged_ends = merge_segments_array(
+        begins, ends, 0.5, 30, 0.05, snap_boundaries=False
+    )
+    assert np.allclose(merged_begins, [0.1, 1.6])
+    assert np.allclose(merged_ends, [0.7, 2.0])
+    merged = merge_segments(intervals, 0.5, 30, 0.05, snap_boundaries=False)
+    assert [(x.begin, x.end) for x in merged] == list(
+        zip(merged_begins.tolist(), merged_ends.tolist())
+    )
+
+    merged_begins, merged_ends = merge_segments_array(begins, ends, 0.5, 30, 0.05)
+    assert np.allclose(merged_begins, [0.1, 1.475])
+    assert np.allclose(merged_ends, [0.825, 2.0])
+
+    merged_begins, merged_ends = merge_segments_array(
+        begins, ends, 0.5, 0.5, 0.05, snap_boundaries=False
+    )
+    assert np.allclose(merged_begins, [0.1, 0.6, 1.6])
+    assert np.allclose(merged_ends, [0.3, 0.7, 2.0])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 20])
+def test_streaming_segmenter(chunk_size):
+    frames = np.array([0, 1, 1, 1, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1])
+    for options in [(0.5, 30, 0.05), (0.5, 0.5, 0.05), (0.1, 30, 0.15)]:
+        expected_begins, expected_ends = merge_segments_array(
+            *get_initial_segmentation_array(frames, 0.1), *options
+        )
+        segmenter = StreamingSegmenter(0.1, *options)
+        begins = []
+        ends = []
+        for i in range(0, frames.shape[0], chunk_size):
+            chunk_begins, chunk_ends = segmenter.process_frames(frames[i : i + chunk_size])
+            begins.append(chunk_begins)
+            ends.append(chunk_ends)
+        chunk_begins, chunk_ends = segmenter.flush()
+        begins.append(chunk_begins)
+        ends.append(chunk_ends)
+        assert np.array_equal(np.concatenate(begins), expected_begins)
+        assert np.array_equal(np.concatenate(ends), expected_ends)